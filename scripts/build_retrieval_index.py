@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Build a BM25 retrieval index from a document directory, or query one.
+
+Build mode reads every markdown and JSON document under a directory and
+writes a memory-mappable index file. Query mode opens an index and prints
+the top-k hits with their scores and timing.
+
+Usage:
+    python scripts/build_retrieval_index.py build docs/larsson_thesis --output thesis.bm25
+    python scripts/build_retrieval_index.py query thesis.bm25 "question accommodation" --top-k 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from ibdm.retrieval import BM25Index, build_index
+
+
+def main() -> int:
+    """Run build or query mode."""
+    parser = argparse.ArgumentParser(description="BM25 retrieval index builder")
+    subparsers = parser.add_subparsers(dest="mode", required=True)
+
+    build = subparsers.add_parser("build", help="Index a document directory")
+    build.add_argument("directory", type=Path, help="Directory of .md/.json documents")
+    build.add_argument("--output", type=Path, required=True, help="Index file to write")
+    build.add_argument("--k1", type=float, default=1.5, help="BM25 k1 parameter")
+    build.add_argument("--b", type=float, default=0.75, help="BM25 b parameter")
+    build.add_argument("--passage-words", type=int, default=300, help="Markdown passage size")
+
+    query = subparsers.add_parser("query", help="Search an index file")
+    query.add_argument("index", type=Path, help="Index file written by build")
+    query.add_argument("query", help="Query text")
+    query.add_argument("--top-k", type=int, default=5, help="Number of hits")
+
+    args = parser.parse_args()
+
+    if args.mode == "build":
+        start = time.perf_counter()
+        index = build_index(
+            args.directory, args.output, k1=args.k1, b=args.b, passage_words=args.passage_words
+        )
+        print(
+            f"Indexed {len(index)} documents, {len(index.vocabulary)} terms "
+            f"in {time.perf_counter() - start:.2f}s -> {args.output} "
+            f"({args.output.stat().st_size / 1024:.0f} KB)"
+        )
+        return 0
+
+    start = time.perf_counter()
+    with BM25Index.load(args.index) as index:
+        loaded = time.perf_counter()
+        hits = index.search(args.query, top_k=args.top_k)
+        searched = time.perf_counter()
+        print(
+            f"Loaded {len(index)} documents in {(loaded - start) * 1000:.1f}ms, "
+            f"searched in {(searched - loaded) * 1000:.2f}ms"
+        )
+        for hit in hits:
+            print(
+                f"{hit.rank + 1:>3}. {hit.score:7.3f}  {hit.document.doc_id}  {hit.document.title}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
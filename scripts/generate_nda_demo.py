@@ -15,6 +15,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from ibdm.services.nda_generator import NDAGenerator, NDAParameters
+from ibdm.services.nda_sections import GeneratedSection, assemble_document
 
 
 def extract_nda_params_from_scenario() -> NDAParameters:
@@ -70,10 +71,15 @@ def main() -> int:
     print()
 
     # Generate NDA
-    print("📝 Generating NDA document (this may take 10-30 seconds)...")
+    print("📝 Generating NDA document section by section...")
     print()
     try:
-        nda_text = generator.generate_nda(params)
+        sections: list[GeneratedSection] = []
+        for section in generator.stream_nda(params):
+            sections.append(section)
+            source = "cached" if section.cached else f"{section.tokens_used} tokens"
+            print(f"   ✓ {section.section.title} ({source})")
+        nda_text = assemble_document(sections)
         print("   ✓ NDA generated successfully!")
         print()
     except Exception as e:
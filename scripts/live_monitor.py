@@ -6,26 +6,26 @@ in real-time as you interact with the Scenario Explorer.
 
 import argparse
 
-from ibdm.visualization.monitor import StateMonitor
+from ibdm.visualization.monitor import DEFAULT_SOCKET_PATH, StateMonitor
 
 
 def main():
     """Run the state monitor."""
     parser = argparse.ArgumentParser(description="IBDM State Monitor")
     parser.add_argument(
-        "--file",
-        default=".ibdm_monitor_state.json",
-        help="Path to the state file to monitor",
+        "--socket",
+        default=DEFAULT_SOCKET_PATH,
+        help="Path of the publisher's monitor socket",
     )
     parser.add_argument(
         "--interval",
         type=float,
         default=0.5,
-        help="Polling interval in seconds",
+        help="Seconds between connection attempts while no publisher is running",
     )
     args = parser.parse_args()
 
-    monitor = StateMonitor(filepath=args.file, poll_interval=args.interval)
+    monitor = StateMonitor(socket_path=args.socket, retry_interval=args.interval)
     monitor.start()
 
 
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Record and replay LLM traffic, and load-test the NLU/NLG pipeline offline.
+
+Record mode runs one session of a scenario's user turns against the live
+API (needs IBDM_API_KEY) and captures every LLM exchange in a cassette.
+Replay mode serves the cassette with synthetic latency and fires N
+concurrent sessions through the same pipeline, with no network access.
+
+Usage:
+    python scripts/llm_load_test.py record nda_basic --cassette cassettes/nda_basic.jsonl
+    python scripts/llm_load_test.py replay nda_basic --cassette cassettes/nda_basic.jsonl \\
+        --sessions 100 --concurrency 16 --latency 0.4 --jitter 0.2
+    python scripts/llm_load_test.py replay nda_basic --cassette ... --output reports/load.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from ibdm.demo.scenario_loader import load_scenario
+from ibdm.nlu.llm_adapter import set_default_backend
+from ibdm.nlu.llm_cassette import Cassette, RecordingBackend, ReplayBackend, ReplayConfig
+from ibdm.nlu.llm_load import pipeline_session, run_load_test
+from ibdm.rules import (
+    RuleSet,
+    create_generation_rules,
+    create_integration_rules,
+    create_selection_rules,
+)
+
+
+def build_rules() -> RuleSet:
+    """Build the core integration/selection/generation rule set."""
+    rules = RuleSet()
+    for factory in (create_integration_rules, create_selection_rules, create_generation_rules):
+        for rule in factory():
+            rules.add_rule(rule)
+    return rules
+
+
+def main() -> int:
+    """Run record or replay mode."""
+    parser = argparse.ArgumentParser(description="LLM record/replay load tester")
+    parser.add_argument("mode", choices=["record", "replay"])
+    parser.add_argument("scenario", help="Scenario whose user turns drive each session")
+    parser.add_argument("--cassette", type=Path, required=True, help="Cassette JSONL file")
+    parser.add_argument("--sessions", type=int, default=10, help="Sessions to run (replay)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Sessions in flight (replay)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds per LLM call")
+    parser.add_argument("--latency-per-token", type=float, default=0.0)
+    parser.add_argument(
+        "--recorded-latency-scale",
+        type=float,
+        default=0.0,
+        help="Multiplier on latency observed while recording (1.0 reproduces it)",
+    )
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random +/- latency fraction")
+    parser.add_argument("--nlg-strategy", default="llm", help="NLGEngine strategy")
+    parser.add_argument("--output", type=Path, help="Write JSON results here")
+    args = parser.parse_args()
+
+    scenario = load_scenario(args.scenario)
+    utterances = [turn.utterance for turn in scenario.turns if turn.speaker == "user"]
+    session = pipeline_session(utterances, build_rules, nlg_strategy=args.nlg_strategy)
+
+    if args.mode == "record":
+        backend = RecordingBackend(Cassette(args.cassette))
+        set_default_backend(backend)
+        result = run_load_test(session, sessions=1, concurrency=1)
+        print(f"Recorded {len(backend.cassette)} LLM interactions to {args.cassette}")
+    else:
+        if not args.cassette.exists():
+            print(f"Cassette not found: {args.cassette}")
+            return 1
+        backend = ReplayBackend(
+            Cassette.load(args.cassette),
+            ReplayConfig(
+                latency=args.latency,
+                latency_per_token=args.latency_per_token,
+                recorded_latency_scale=args.recorded_latency_scale,
+                jitter=args.jitter,
+            ),
+        )
+        set_default_backend(backend)
+        result = run_load_test(
+            session, sessions=args.sessions, concurrency=args.concurrency, backend=backend
+        )
+
+    print(result.summary())
+    for message in result.errors[:5]:
+        print(f"  error: {message}")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        data = {"mode": args.mode, "scenario": args.scenario, **result.to_dict()}
+        args.output.write_text(json.dumps(data, indent=2))
+        print(f"Results written to {args.output}")
+
+    return 0 if not result.errors else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Headless regression gate: run every scenario against its golden trace.
+
+Runs the scenario directory across worker processes with no rendering and
+compares each run's state trace with the golden trace. Scenarios whose
+inputs are unchanged since their last green run are skipped. Exits non-zero
+if any scenario fails, errors or has no golden trace.
+
+Usage:
+    python scripts/run_regression.py                    # Run changed scenarios
+    python scripts/run_regression.py --no-cache         # Run every scenario
+    python scripts/run_regression.py --update-golden    # Re-record golden traces
+    python scripts/run_regression.py --workers 4        # Limit worker processes
+"""
+
+import argparse
+import sys
+
+from ibdm.demo.regression import DEFAULT_CACHE_PATH, run_regression
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Run all scenarios against golden traces")
+    parser.add_argument("--scenarios-dir", help="Scenario directory (default: demos/scenarios)")
+    parser.add_argument(
+        "--golden-dir", help="Golden trace directory (default: demos/golden_traces)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: one per CPU; 1 runs serially)",
+    )
+    parser.add_argument(
+        "--cache",
+        default=DEFAULT_CACHE_PATH,
+        help=f"File recording green runs (default: {DEFAULT_CACHE_PATH})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Run every scenario, even if unchanged since its last green run",
+    )
+    parser.add_argument(
+        "--update-golden",
+        action="store_true",
+        help="Record the current traces as the golden traces",
+    )
+    args = parser.parse_args()
+
+    report = run_regression(
+        scenarios_dir=args.scenarios_dir,
+        golden_dir=args.golden_dir,
+        workers=args.workers,
+        cache_path=args.cache,
+        use_cache=not args.no_cache,
+        update_golden=args.update_golden,
+    )
+    print(report.summary())
+    sys.exit(0 if report.ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -175,9 +175,9 @@ def main():
     print("  • initialize → nlu (start)")
     print("  • nlu → interpret → integrate → select (pipeline)")
     print("  • select → nlg [if has_response] → generate → nlu (response loop)")
-    print("  • select [if not has_response] → HALT (wait for next input)")
+    print("  • select → nlu [if not has_response] (halts for next input)")
     print("\nControl Flow:")
-    print("  • process_utterance() uses halt_after=['generate', 'select']")
+    print("  • process_utterance() halts after select, then after generate")
     print("  • With response: halts after generate")
     print("  • No response: halts at select, waits for next utterance")
 
@@ -1,15 +1,17 @@
 """Burr actions for IBDM control loop.
 
 This module defines the Burr actions that implement the four stages of
-the IBDM control loop: interpret, integrate, select, and generate.
+the IBDM control loop: interpret, integrate, select, and generate, plus the
+nlu and nlg stages around them and the optional speculative prefetch stage.
 """
 
 from typing import TYPE_CHECKING, Any
 
 from burr.core import State, action
 
-from ibdm.core import DialogueMove, InformationState
+from ibdm.core import DialogueMove, DomainModel, InformationState, Question
 from ibdm.engine.dialogue_engine import DialogueMoveEngine
+from ibdm.nlu.answer_prefetch import AnswerPrefetch
 from ibdm.nlu.nlu_context import NLUContext
 
 if TYPE_CHECKING:
@@ -20,18 +22,21 @@ if TYPE_CHECKING:
 
 
 @action(
-    reads=["information_state", "nlu_engine", "nlu_context"],
-    writes=["utterance", "speaker", "nlu_result", "nlu_context"],
+    reads=["information_state", "nlu_engine", "nlu_context", "nlu_prefetch"],
+    writes=["utterance", "speaker", "nlu_result", "nlu_context", "nlu_prefetch"],
 )
 def nlu(state: "State[Any]", utterance: str, speaker: str) -> tuple[dict[str, Any], "State[Any]"]:
     """Process utterance through NLU engine.
 
     This is the entry point for the 6-stage pipeline. It receives user input
     as parameters (not from state), processes through NLU, and writes both
-    the input and results to state for subsequent actions.
+    the input and results to state for subsequent actions. If the prefetch
+    action predicted this reply to the system's last question, the prepared
+    answer is used instead of calling the NLU engine.
 
     Args:
-        state: Current Burr state with information_state, nlu_engine, and nlu_context
+        state: Current Burr state with information_state, nlu_engine, nlu_context
+            and (optionally) nlu_prefetch
         utterance: User utterance (input parameter)
         speaker: Speaker ID (input parameter)
 
@@ -40,20 +45,32 @@ def nlu(state: "State[Any]", utterance: str, speaker: str) -> tuple[dict[str, An
     """
     info_state_dict: dict[str, Any] = state["information_state"]  # type: ignore[index]
     nlu_engine: NLUEngine = state["nlu_engine"]  # type: ignore[index]
+    prefetch_dict: dict[str, Any] | None = state.get("nlu_prefetch")  # type: ignore[assignment, attr-defined]
 
     # Get NLU context from state (or create empty if not present)
     nlu_context_dict: dict[str, Any] = state.get("nlu_context", NLUContext.create_empty().to_dict())  # type: ignore[assignment, attr-defined]
     nlu_context = NLUContext.from_dict(nlu_context_dict)
 
-    # Convert dict to InformationState object
-    info_state = InformationState.from_dict(info_state_dict)
+    # Speculative path: the reply was predicted while the question was being sent
+    predicted: NLUResult | None = None
+    if prefetch_dict is not None and speaker != info_state_dict.get("agent_id"):
+        predicted = AnswerPrefetch.from_dict(prefetch_dict).match(utterance)
 
-    # Process utterance through NLU engine
     nlu_result: NLUResult
     updated_nlu_context: NLUContext
-    nlu_result, updated_nlu_context = nlu_engine.process(
-        utterance, speaker, info_state, nlu_context
-    )
+    if predicted is not None:
+        nlu_result = predicted
+        nlu_context.last_interpretation_tokens = 0
+        nlu_context.last_interpretation_latency = predicted.latency
+        updated_nlu_context = nlu_context
+    else:
+        # Convert dict to InformationState object
+        info_state = InformationState.from_dict(info_state_dict)
+
+        # Process utterance through NLU engine
+        nlu_result, updated_nlu_context = nlu_engine.process(
+            utterance, speaker, info_state, nlu_context
+        )
 
     # Convert to dicts for Burr State storage
     nlu_result_dict = nlu_result.to_dict()
@@ -64,14 +81,17 @@ def nlu(state: "State[Any]", utterance: str, speaker: str) -> tuple[dict[str, An
         "dialogue_act": nlu_result.dialogue_act,
         "confidence": nlu_result.confidence,
         "latency": nlu_result.latency,
+        "speculative": predicted is not None,
     }
 
-    # Write inputs to state for subsequent actions, along with NLU results
+    # Write inputs to state for subsequent actions, along with NLU results.
+    # A prefetch only covers the turn right after its question.
     return result, state.update(
         utterance=utterance,
         speaker=speaker,
         nlu_result=nlu_result_dict,
         nlu_context=updated_nlu_context_dict,
+        nlu_prefetch=None,
     )
 
 
@@ -318,6 +338,45 @@ def generate(state: "State[Any]") -> tuple[dict[str, Any], "State[Any]"]:
     return result, state.update(information_state=updated_info_state_dict)
 
 
+@action(
+    reads=["response_move", "information_state"],
+    writes=["nlu_prefetch"],
+)
+def prefetch(state: "State[Any]") -> tuple[dict[str, Any], "State[Any]"]:
+    """Predict the user's reply to the question the system just asked.
+
+    Runs between generate and the next nlu. If the system's move was an ask,
+    the expected answers (alternatives, yes/no, or the values of the
+    predicate's sort in the domain model) are expanded into an AnswerPrefetch
+    that the nlu action consults before calling the NLU engine.
+
+    Args:
+        state: Current Burr state containing response_move and information_state
+
+    Returns:
+        Tuple of (result dict, updated state with nlu_prefetch)
+    """
+    response_move_dict: dict[str, Any] | None = state.get("response_move")  # type: ignore[assignment, attr-defined]
+    info_state_dict: dict[str, Any] = state["information_state"]  # type: ignore[index]
+
+    response_move = DialogueMove.from_dict(response_move_dict) if response_move_dict else None
+    if response_move is None or response_move.move_type != "ask":
+        return {"predictions": 0}, state.update(nlu_prefetch=None)
+    if not isinstance(response_move.content, Question):
+        return {"predictions": 0}, state.update(nlu_prefetch=None)
+
+    info_state = InformationState.from_dict(info_state_dict)
+    belief = info_state.private.beliefs.get("domain")
+    domain = belief if isinstance(belief, DomainModel) else None
+
+    answer_prefetch = AnswerPrefetch.for_question(response_move.content, domain)
+    if not answer_prefetch.predictions:
+        return {"predictions": 0}, state.update(nlu_prefetch=None)
+
+    result = {"predictions": len(answer_prefetch.predictions)}
+    return result, state.update(nlu_prefetch=answer_prefetch.to_dict())
+
+
 @action(reads=[], writes=["information_state", "engine", "nlu_context", "ready"])
 def initialize(state: "State[Any]") -> tuple[dict[str, Any], "State[Any]"]:
     """Initialize the dialogue engine, information state, and NLU context.
@@ -0,0 +1,45 @@
+"""Burr lifecycle hook feeding the aggregate session dashboard.
+
+The hook is attached to every dialogue application and reports each pipeline
+step to the process-wide SessionAggregator (ibdm.visualization.dashboard):
+the step's name as the session's phase, failures, and after each step the
+plan type, QUD depth and action queue of the updated information state. It
+does nothing while no aggregator is installed.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+from burr.lifecycle import PostRunStepHook, PreRunStepHook
+
+from ibdm.visualization.dashboard import get_session_aggregator
+
+if TYPE_CHECKING:
+    from burr.core import Action, State
+
+
+class SessionMonitorHook(PreRunStepHook, PostRunStepHook):
+    """Reports pipeline steps to the installed SessionAggregator."""
+
+    def pre_run_step(self, *, app_id: str, action: "Action", **future_kwargs: Any) -> None:
+        """Record the step as the session's current phase."""
+        aggregator = get_session_aggregator()
+        if aggregator is not None:
+            aggregator.enter_phase(app_id, action.name)
+
+    def post_run_step(
+        self,
+        *,
+        app_id: str,
+        state: "State[Any]",
+        exception: Exception | None,
+        **future_kwargs: Any,
+    ) -> None:
+        """Record a failure, or the state the step produced."""
+        aggregator = get_session_aggregator()
+        if aggregator is None:
+            return
+        if exception is not None:
+            aggregator.step_failed(app_id)
+            return
+        if "information_state" in state:
+            aggregator.observe_state(app_id, state["information_state"])
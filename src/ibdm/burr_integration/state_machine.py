@@ -15,10 +15,14 @@ from ibdm.burr_integration.actions import (
     interpret,
     nlg,
     nlu,
+    prefetch,
     select,
 )
+from ibdm.burr_integration.monitoring import SessionMonitorHook
 from ibdm.core import InformationState
+from ibdm.nlu.llm_telemetry import telemetry_session
 from ibdm.rules import RuleSet
+from ibdm.visualization.dashboard import get_session_aggregator
 
 if TYPE_CHECKING:
     from ibdm.nlg import NLGEngine
@@ -34,12 +38,17 @@ def create_dialogue_application(
     nlg_engine: "NLGEngine | None" = None,
     app_id: str | None = None,
     storage_dir: str | None = None,
+    speculative_nlu: bool = False,
 ) -> Any:
     """Create a Burr application for dialogue management.
 
     The state machine implements the 6-stage IBDM control loop:
     initialize → nlu → interpret → integrate → select → nlg → generate → nlu (loop)
 
+    With speculative_nlu, a prefetch stage runs between generate and the next
+    nlu: when the system has just asked a question, it predicts the expected
+    replies so that nlu can answer them without calling the NLU engine.
+
     User input (utterance, speaker) is passed as inputs to app.run(), which are
     received by the nlu action and written to state for subsequent actions.
 
@@ -52,6 +61,7 @@ def create_dialogue_application(
         nlg_engine: NLG engine for generating responses
         app_id: Optional application ID for tracking
         storage_dir: Optional directory for state persistence
+        speculative_nlu: Add the prefetch stage between generate and nlu
 
     Returns:
         Burr Application instance
@@ -72,21 +82,28 @@ def create_dialogue_application(
     if nlg_engine is not None:
         initial_state["nlg_engine"] = nlg_engine
 
+    actions: dict[str, Any] = {
+        # Initialization
+        "initialize": initialize,
+        # 6-stage control loop actions
+        "nlu": nlu,
+        "interpret": interpret,
+        "integrate": integrate,
+        "select": select,
+        "nlg": nlg,
+        "generate": generate,
+    }
+    # Response path ends generate → nlu, or generate → prefetch → nlu
+    response_loop: list[tuple[str, str, Any]] = [("generate", "nlu", default)]
+    if speculative_nlu:
+        actions["prefetch"] = prefetch
+        response_loop = [("generate", "prefetch", default), ("prefetch", "nlu", default)]
+
     # 6-stage pipeline: initialize → nlu → interpret → integrate → select → nlg → generate → nlu
     # Loop back to nlu for next input
     builder = (
         ApplicationBuilder()
-        .with_actions(
-            # Initialization
-            initialize=initialize,
-            # 6-stage control loop actions
-            nlu=nlu,
-            interpret=interpret,
-            integrate=integrate,
-            select=select,
-            nlg=nlg,
-            generate=generate,
-        )
+        .with_actions(**actions)
         .with_transitions(
             # Initialization
             ("initialize", "nlu", default),
@@ -97,13 +114,15 @@ def create_dialogue_application(
             # Response path: select → nlg → generate → nlu (loop)
             ("select", "nlg", expr("has_response")),
             ("nlg", "generate", default),
-            ("generate", "nlu", default),
-            # No response path: halt at select (controlled by halt_after in process_utterance)
-            # When has_response=False, halt_after=["select"] stops execution
-            # Next process_utterance() call provides new inputs and resumes at nlu
+            *response_loop,
+            # No response path: select → nlu, halting at select (halt_after in
+            # process_utterance) so the next call provides new inputs to nlu
+            ("select", "nlu", default),
         )
         .with_entrypoint("initialize")
         .with_state(**initial_state)
+        # Reports steps to the aggregate session dashboard, when one is installed
+        .with_hooks(SessionMonitorHook())
     )
 
     # Add tracking if app_id is provided
@@ -143,6 +162,7 @@ class DialogueStateMachine:
         nlg_engine: "NLGEngine | None" = None,
         app_id: str | None = None,
         storage_dir: str | None = None,
+        speculative_nlu: bool = False,
     ):
         """Initialize the dialogue state machine.
 
@@ -155,7 +175,10 @@ class DialogueStateMachine:
             nlg_engine: Optional NLG engine for 6-stage pipeline
             app_id: Optional application ID for tracking
             storage_dir: Optional directory for state persistence
+            speculative_nlu: Predict replies to the system's questions so that
+                expected answers skip the NLU engine
         """
+        self.speculative_nlu = speculative_nlu
         self.app = create_dialogue_application(
             agent_id=agent_id,
             rules=rules,
@@ -165,6 +188,7 @@ class DialogueStateMachine:
             nlg_engine=nlg_engine,
             app_id=app_id,
             storage_dir=storage_dir,
+            speculative_nlu=speculative_nlu,
         )
         self._initialized = False
 
@@ -202,18 +226,34 @@ class DialogueStateMachine:
         if not self._initialized:
             self.initialize()
 
-        # Run through the pipeline with inputs, halt after response generated or no response
-        # halt_after=["generate", "select"] stops after:
-        #   - "generate": response path (select→nlg→generate)
-        #   - "select": no response path (select→nlu)
-        action, result, state = self.app.run(
-            halt_after=["generate", "select"], inputs={"utterance": utterance, "speaker": speaker}
-        )
-
-        # Extract response from final state
+        aggregator = get_session_aggregator()
+        if aggregator is not None:
+            aggregator.turn_started(self.app.uid)
+        failed = True
+        try:
+            # LLM calls made during the turn are attributed to this application
+            with telemetry_session(self.app.uid):
+                # Run the input through nlu → interpret → integrate → select
+                action, result, state = self.app.run(
+                    halt_after=["select"], inputs={"utterance": utterance, "speaker": speaker}
+                )
+
+                # Response path: continue select → nlg → generate (→ prefetch) before
+                # waiting for input
+                if state.get("has_response", False):
+                    last_stage = "prefetch" if self.speculative_nlu else "generate"
+                    action, result, state = self.app.run(halt_after=[last_stage])
+            failed = False
+        finally:
+            if aggregator is not None:
+                aggregator.turn_finished(self.app.uid, error=failed)
+
+        # Extract response from final state; utterance_text still holds the last
+        # response's text after a turn without one
+        has_response = state.get("has_response", False)
         return {
-            "has_response": state.get("has_response", False),
-            "utterance_text": state.get("utterance_text", ""),
+            "has_response": has_response,
+            "utterance_text": state.get("utterance_text", "") if has_response else "",
         }
 
     def get_state(self) -> State:
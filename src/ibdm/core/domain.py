@@ -8,6 +8,7 @@ Based on:
 - py-trindikit: https://github.com/heatherleaf/py-trindikit
 """
 
+import hashlib
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
@@ -16,6 +17,8 @@ from ibdm.core.actions import Action, Proposition
 from ibdm.core.answers import Answer
 from ibdm.core.plans import Plan
 from ibdm.core.questions import Question
+from ibdm.utils.fingerprint import code_digest
+from ibdm.utils.similarity import similarity_index
 
 
 @dataclass
@@ -94,6 +97,56 @@ class DomainModel:
         self._precond_functions: dict[
             str, Callable[[Action, set[str]], tuple[bool, str]]
         ] = {}  # action_name -> precond check function
+        self._fingerprint: str | None = None
+
+    def fingerprint(self) -> str:
+        """Content hash identifying this domain.
+
+        Covers the name, predicates, sorts, dependencies and the code of the
+        registered plan builders and precondition, postcondition and
+        dominance functions (see ibdm.utils.fingerprint). Domains with the
+        same fingerprint behave the same, so it can key caches, golden traces
+        and persisted sessions.
+
+        Computed on first use and recomputed after any add_* or register_*
+        call; mutating predicates or sorts directly is not detected.
+
+        Returns:
+            Hex digest
+        """
+        if self._fingerprint is None:
+            functions = {
+                "plan_builder": self._plan_builders,
+                "precond": self._precond_functions,
+                "postcond": self._postcond_functions,
+                "dominance": getattr(self, "_dominance_functions", {}),
+            }
+            parts = [f"domain:{self.name}"]
+            parts.extend(
+                f"predicate:{p.name}:{p.arity}:{p.arg_types}:{p.description}"
+                for p in sorted(self.predicates.values(), key=lambda p: p.name)
+            )
+            parts.extend(f"sort:{name}:{self.sorts[name]}" for name in sorted(self.sorts))
+            parts.extend(
+                f"depends:{predicate}:{sorted(self._dependencies[predicate])}"
+                for predicate in sorted(self._dependencies)
+            )
+            for kind, registry in functions.items():
+                parts.extend(
+                    f"{kind}:{key}:{code_digest(registry[key])}" for key in sorted(registry)
+                )
+            self._fingerprint = hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+        return self._fingerprint
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "DomainModel":
+        """Share the domain instead of copying it.
+
+        Domains are configuration, not dialogue state. InformationState.clone()
+        deep-copies beliefs, which may hold the domain; copying its predicates,
+        sorts and plan builders on every rule application would dominate the
+        cost of the clone.
+        """
+        return self
 
     def add_predicate(
         self,
@@ -124,6 +177,7 @@ class DomainModel:
             arg_types=arg_types or [],
             description=description,
         )
+        self._fingerprint = None
 
     def add_sort(self, name: str, individuals: list[str]):
         """Register semantic sort with valid values.
@@ -139,6 +193,31 @@ class DomainModel:
             >>> domain.add_sort("us_state", ["California", "Delaware", "New York"])
         """
         self.sorts[name] = individuals
+        self._fingerprint = None
+
+    def match_individual(self, sort_name: str, value: str) -> str | None:
+        """Map a free-text value to the sort individual it refers to.
+
+        Exact (case-insensitive) matches win; otherwise the individual with the
+        highest character n-gram similarity is returned if it clears the match
+        threshold, so "californa" and "new-york" map to "California" and
+        "New York". The sort's n-gram index is built on first use and shared.
+
+        Args:
+            sort_name: Sort name (e.g., "us_state")
+            value: Value to match
+
+        Returns:
+            The matching individual, or None if the sort is unknown or nothing
+            is similar enough
+        """
+        individuals = self.sorts.get(sort_name)
+        if individuals is None:
+            return None
+        for individual in individuals:
+            if individual.lower() == value.strip().lower():
+                return individual
+        return similarity_index(tuple(individuals)).match(value)
 
     def register_plan_builder(self, task: str, builder: Callable[[dict[str, Any]], Plan]):
         """Register plan builder function for task.
@@ -155,6 +234,7 @@ class DomainModel:
             >>> domain.register_plan_builder("nda_drafting", build_nda_plan)
         """
         self._plan_builders[task] = builder
+        self._fingerprint = None
 
     def create_proposition(self, predicate: str, value: Any) -> str:
         """Create semantic proposition from predicate and value.
@@ -286,22 +366,10 @@ class DomainModel:
         # First check: AltQuestion with alternatives
         # Validate answer matches one of the expected alternatives
         if isinstance(question, AltQuestion) and question.alternatives:
-            answer_text = str(answer.content).strip().lower()
-            alternatives_lower = [alt.lower() for alt in question.alternatives]
-
-            # Check if answer is one of the alternatives
-            if answer_text not in alternatives_lower:
-                # Try fuzzy matching: is any alternative contained in the answer?
-                # This supports NLU answers like "I think mutual makes sense"
-                found = False
-                for alt in alternatives_lower:
-                    if alt in answer_text:
-                        found = True
-                        break
-
-                if not found:
-                    # Not a valid alternative - needs clarification
-                    return False
+            # Exact, contained ("I think mutual makes sense") or similar ("mutal")
+            if question.match_alternative(str(answer.content)) is None:
+                # Not a valid alternative - needs clarification
+                return False
 
         # Second check: Predicate-specific semantic validation
         if not hasattr(question, "predicate"):
@@ -388,6 +456,7 @@ class DomainModel:
             self._dependencies[predicate] = set()
 
         self._dependencies[predicate].update(depends_on)
+        self._fingerprint = None
 
     def depends(self, question1: Question, question2: Question) -> bool:
         """Check if question1 depends on question2.
@@ -573,6 +642,7 @@ class DomainModel:
             >>> domain.register_precond_function("book_hotel", book_hotel_precond)
         """
         self._precond_functions[action_name] = precond_fn
+        self._fingerprint = None
 
     def has_precond_function(self, action_name: str) -> bool:
         """Check if a precondition function is registered for an action.
@@ -699,6 +769,7 @@ class DomainModel:
             >>> domain.register_postcond_function("book_hotel", book_hotel_postconds)
         """
         self._postcond_functions[action_name] = postcond_fn
+        self._fingerprint = None
 
     def has_postcond_function(self, action_name: str) -> bool:
         """Check if a postcondition function is registered for an action.
@@ -833,6 +904,7 @@ class DomainModel:
         if not hasattr(self, "_dominance_functions"):
             self._dominance_functions: dict[str, Callable[[Proposition, Proposition], bool]] = {}
         self._dominance_functions[predicate] = fn
+        self._fingerprint = None
 
     def dominates(self, prop1: Proposition, prop2: Proposition) -> bool:
         """Check if prop1 dominates prop2.
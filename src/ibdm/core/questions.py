@@ -10,6 +10,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
 
+from ibdm.utils.similarity import similarity_index
+
 
 @dataclass
 class Question(ABC):
@@ -191,7 +193,31 @@ class AltQuestion(Question):
             return False
         # An answer resolves an alternative question if it selects one alternative
         content = str(answer.content).lower()
-        return any(alt.lower() in content or content in alt.lower() for alt in self.alternatives)
+        if any(content in alt.lower() for alt in self.alternatives):
+            return True
+        return self.match_alternative(content) is not None
+
+    def match_alternative(self, text: str) -> str | None:
+        """Find the alternative an answer selects.
+
+        Tries an exact match, then an alternative mentioned in the answer
+        ("I think mutual makes sense"), then character n-gram similarity,
+        which catches typos and spelling variants ("mutal", "one way").
+
+        Args:
+            text: Answer text
+
+        Returns:
+            The selected alternative, or None if the answer selects none
+        """
+        answer_text = text.strip().lower()
+        for alt in self.alternatives:
+            if alt.lower() == answer_text:
+                return alt
+        for alt in self.alternatives:
+            if alt.lower() in answer_text:
+                return alt
+        return similarity_index(tuple(self.alternatives)).match(answer_text)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to JSON-serializable dict."""
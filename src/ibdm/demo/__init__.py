@@ -1,34 +1,80 @@
 """Interactive demo application for IBDM.
 
 Showcases IBiS3 question accommodation and IBiS2 grounding in action.
+
+Exports are imported on first access (PEP 562): loading scenario definitions does
+not pull in the Rich-based runner, the NLG engine or the interactive demo.
 """
 
-from ibdm.demo.execution_controller import ExecutionController, ExecutionMode
-from ibdm.demo.interactive_demo import InteractiveDemo
-from ibdm.demo.orchestrator import DemoDialogueOrchestrator
-from ibdm.demo.scenario_loader import (
-    Scenario,
-    ScenarioLoader,
-    ScenarioMetadata,
-    ScenarioTurn,
-    get_loader,
-    list_scenarios_by_category,
-    load_scenario,
-    search_scenarios,
-)
-from ibdm.demo.scenario_loader import (
-    list_scenarios as list_json_scenarios,
-)
-from ibdm.demo.scenario_runner import ScenarioRunner, run_scenario
-from ibdm.demo.scenarios import (
-    DemoScenario,
-    ScenarioStep,
-    get_ibis2_scenarios,
-    get_ibis3_scenarios,
-    get_scenario,
-    list_scenarios,
+from typing import TYPE_CHECKING
+
+from ibdm.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from ibdm.demo.execution_controller import (
+        ExecutionController,
+        ExecutionMode,
+    )
+    from ibdm.demo.interactive_demo import InteractiveDemo
+    from ibdm.demo.orchestrator import DemoDialogueOrchestrator
+    from ibdm.demo.scenario_loader import (
+        Scenario,
+        ScenarioLoader,
+        ScenarioMetadata,
+        ScenarioTurn,
+        get_loader,
+        list_scenarios_by_category,
+        load_scenario,
+        search_scenarios,
+    )
+    from ibdm.demo.scenario_loader import list_scenarios as list_json_scenarios
+    from ibdm.demo.scenario_runner import (
+        ScenarioRunner,
+        run_scenario,
+    )
+    from ibdm.demo.scenarios import (
+        DemoScenario,
+        ScenarioStep,
+        get_ibis2_scenarios,
+        get_ibis3_scenarios,
+        get_scenario,
+        list_scenarios,
+    )
+    from ibdm.demo.visualization import (
+        DialogueHistory,
+        DialogueVisualizer,
+        TurnRecord,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ExecutionController": "ibdm.demo.execution_controller",
+        "ExecutionMode": "ibdm.demo.execution_controller",
+        "InteractiveDemo": "ibdm.demo.interactive_demo",
+        "DemoDialogueOrchestrator": "ibdm.demo.orchestrator",
+        "Scenario": "ibdm.demo.scenario_loader",
+        "ScenarioLoader": "ibdm.demo.scenario_loader",
+        "ScenarioMetadata": "ibdm.demo.scenario_loader",
+        "ScenarioTurn": "ibdm.demo.scenario_loader",
+        "get_loader": "ibdm.demo.scenario_loader",
+        "list_scenarios_by_category": "ibdm.demo.scenario_loader",
+        "load_scenario": "ibdm.demo.scenario_loader",
+        "search_scenarios": "ibdm.demo.scenario_loader",
+        "list_json_scenarios": "ibdm.demo.scenario_loader:list_scenarios",
+        "ScenarioRunner": "ibdm.demo.scenario_runner",
+        "run_scenario": "ibdm.demo.scenario_runner",
+        "DemoScenario": "ibdm.demo.scenarios",
+        "ScenarioStep": "ibdm.demo.scenarios",
+        "get_ibis2_scenarios": "ibdm.demo.scenarios",
+        "get_ibis3_scenarios": "ibdm.demo.scenarios",
+        "get_scenario": "ibdm.demo.scenarios",
+        "list_scenarios": "ibdm.demo.scenarios",
+        "DialogueHistory": "ibdm.demo.visualization",
+        "DialogueVisualizer": "ibdm.demo.visualization",
+        "TurnRecord": "ibdm.demo.visualization",
+    },
 )
-from ibdm.demo.visualization import DialogueHistory, DialogueVisualizer, TurnRecord
 
 __all__ = [
     # Execution Control
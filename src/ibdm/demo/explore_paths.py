@@ -3,6 +3,7 @@
 Run scenario exploration using beam search to discover high-quality dialogue paths.
 """
 
+import os
 import sys
 from typing import Any
 
@@ -159,11 +160,31 @@ def main() -> None:
         else:
             print("Invalid input. Please enter 1 or 2")
 
+    # Select simulation
+    while True:
+        simulation_choice = input(
+            "\nSimulation:\n"
+            "  1. Snapshot (fast approximation)\n"
+            "  2. Dialogue engine (real rules, uses all cores)\n"
+            "Select (1-2, default: 1): "
+        ).strip()
+        if not simulation_choice or simulation_choice == "1":
+            simulation = "snapshot"
+            break
+        elif simulation_choice == "2":
+            simulation = "engine"
+            break
+        else:
+            print("Invalid input. Please enter 1 or 2")
+    cpus = os.cpu_count() or 1
+    workers = cpus if simulation == "engine" and cpus > 1 else 0
+
     print(f"\n✓ Selected: {selected_scenario.name}")
     print(f"✓ Max depth: {max_depth}")
     print(f"✓ Beam size: {beam_size}")
     print(f"✓ Turn penalty: {turn_penalty}")
     print(f"✓ Mode: {'Expected path only' if expected_only else 'Full exploration'}")
+    print(f"✓ Simulation: {simulation} ({workers or 'no'} worker processes)")
     print()
 
     # Determine domain
@@ -190,6 +211,8 @@ def main() -> None:
         beam_size=beam_size,
         turn_penalty=turn_penalty,
         expected_only=expected_only,
+        simulation=simulation,
+        workers=workers,
     )
     result = explorer.explore_paths(max_depth=max_depth)
 
@@ -1,9 +1,12 @@
 """Interactive Scenario Explorer CLI.
 
-Run scenarios with user-controlled choice-based navigation.
+Run scenarios with user-controlled choice-based navigation. Each chosen user
+move is run through a DialogueMoveEngine whose rule set is profiled, so the
+explorer's rule traces show the rules that actually ran.
 """
 
 import sys
+from pathlib import Path
 from typing import Any
 
 from ibdm.core import InformationState
@@ -16,21 +19,26 @@ from ibdm.demo.scenarios import (
 )
 from ibdm.domains.nda_domain import get_nda_domain
 from ibdm.domains.travel_domain import get_travel_domain
-
-# Note: Not using DialogueMoveEngine or RuleSets in this version
-# This is a visualization-focused tool for exploring scenarios
-# from ibdm.engine.dialogue_engine import DialogueMoveEngine
-# from ibdm.rules import create_integration_rules, create_selection_rules, RuleSet
+from ibdm.engine.dialogue_engine import DialogueMoveEngine
+from ibdm.engine.image import build_rule_set
+from ibdm.rules import RuleProfiler
 
 
 class InteractiveExplorerCLI:
     """CLI for interactive scenario exploration."""
 
-    def __init__(self) -> None:
-        """Initialize the interactive explorer CLI."""
+    def __init__(self, report_dir: str | Path | None = None) -> None:
+        """Initialize the interactive explorer CLI.
+
+        Args:
+            report_dir: Directory for the explorer's HTML reports (default: a
+                new temporary directory)
+        """
+        self.report_dir = report_dir
         self.scenario: DemoScenario | None = None
         self.explorer: ScenarioExplorer | None = None
-        # self.engine: DialogueMoveEngine | None = None  # Not used in visualization mode
+        self.engine: DialogueMoveEngine | None = None
+        self.profiler: RuleProfiler | None = None
         self.domain: Any = None
         self.state: InformationState | None = None
 
@@ -51,13 +59,16 @@ class InteractiveExplorerCLI:
         # Step 3: Create explorer
         assert self.state is not None
         assert self.domain is not None
-        self.explorer = ScenarioExplorer(scenario, self.state, self.domain)
+        self.explorer = ScenarioExplorer(
+            scenario, self.state, self.domain, profiler=self.profiler, report_dir=self.report_dir
+        )
 
-        # Step 4: Run exploration loop
-        self._exploration_loop()
+        with self.explorer:
+            # Step 4: Run exploration loop
+            self._exploration_loop()
 
-        # Step 5: Display summary
-        self._display_summary()
+            # Step 5: Display summary
+            self._display_summary()
 
     def _display_welcome(self) -> None:
         """Display welcome message."""
@@ -139,10 +150,11 @@ class InteractiveExplorerCLI:
         # Create initial state
         self.state = InformationState(agent_id="system")
         self.state.private.beliefs["domain"] = self.domain
+        self.state.private.beliefs["domain_model"] = self.domain
 
-        # Note: Not creating full engine in visualization mode
-        # We're focusing on exploring scenarios through choices
-        # Full engine integration can be added later
+        # A private rule set, so profiling it leaves other engines uninstrumented
+        self.engine = DialogueMoveEngine(agent_id="system", rules=build_rule_set())
+        self.profiler = self.engine.rules.enable_profiling()
 
         print(f"\n✓ Domain initialized: {self.domain.__class__.__name__}")
 
@@ -281,9 +293,14 @@ class InteractiveExplorerCLI:
             choice: The selected choice option
         """
         assert self.state is not None
+        assert self.engine is not None
 
         print(f"\n[Simulating move: {choice.category.value}]")
 
+        self.state, response = self.engine.process_input(choice.utterance, "user", self.state)
+        if response is not None:
+            print(f"  → Engine selected: {response.move_type}")
+
         # Extract commitment from utterance (simple pattern matching for demo)
         commitment = self._extract_commitment_from_utterance(choice.utterance)
         if commitment:
@@ -309,6 +326,7 @@ class InteractiveExplorerCLI:
 
         # Capture snapshot after move
         assert self.explorer is not None
+        self.explorer.state = self.state
         self.explorer.capture_snapshot(f"After user move: {choice.category.value}")
 
     def _extract_commitment_from_utterance(self, utterance: str) -> str | None:
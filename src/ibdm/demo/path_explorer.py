@@ -4,6 +4,22 @@ Uses best-first beam search with configurable beam size (default: 200) to explor
 the most promising dialogue paths. Prioritizes complete paths (those with commitments
 and progress toward scenario goals).
 
+Converged states are merged through a transposition table: a child that reaches
+the same scenario position and state signature as an existing node becomes an
+extra back-pointer on that node instead of a new subtree, so the search space is
+a DAG and each distinct state is expanded once.
+
+Two simulation modes are available:
+- "snapshot" (default): a fast approximation that restores only commitments
+  and adds one parsed from the utterance by pattern matching.
+- "engine": runs every choice through the real DialogueMoveEngine from the
+  parent's stored state (see ibdm.demo.path_simulation). Expansions can be
+  spread over a process pool; results are merged in submission order, so the
+  explored tree does not depend on the number of workers. In-process
+  simulation (workers=0) is profiled unless trace_rules is off: every
+  simulated choice is captured on the ScenarioExplorer with the rule traces
+  that produced it.
+
 Useful for:
 - Finding high-quality dialogue paths efficiently
 - Testing scenario coverage with resource constraints
@@ -14,12 +30,26 @@ Useful for:
 from __future__ import annotations
 
 import heapq
+import itertools
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
 from ibdm.core import InformationState
+from ibdm.demo.path_simulation import (
+    EngineSimulator,
+    capture_snapshot,
+    decode_state,
+    expand_in_worker,
+)
 from ibdm.demo.scenario_explorer import ChoiceOption, ScenarioExplorer
 from ibdm.demo.scenarios import DemoScenario
+from ibdm.engine.prefork import WorkerPool
+from ibdm.rules import RuleProfiler
+from ibdm.visualization.state_snapshot import StateSnapshot
+
+#: Simulation modes accepted by PathExplorer
+SIMULATION_MODES = ("snapshot", "engine")
 
 
 def _extract_commitment_from_utterance(utterance: str) -> str | None:
@@ -69,6 +99,10 @@ class PathNode:
         path_id: String representation of path (e.g., "1→3→2")
         children: Child nodes (filled during exploration)
         score: Quality score for beam search (higher is better)
+        merged_parents: Back-pointers (parent, choice, score) of other paths that
+            converged on this node via the transposition table
+        expanded: Whether this node's children have been generated
+        engine_state: Encoded InformationState (engine simulation mode only)
     """
 
     depth: int
@@ -80,6 +114,12 @@ class PathNode:
     path_id: str
     children: list[PathNode] = field(default_factory=lambda: [])
     score: float = 0.0
+    merged_parents: list[tuple[PathNode, ChoiceOption, float]] = field(default_factory=lambda: [])
+    expanded: bool = False
+    engine_state: bytes | None = field(default=None, repr=False)
+    _signature: frozenset[tuple[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def get_path(self) -> list[PathNode]:
         """Get the sequence of nodes that led to this node.
@@ -97,21 +137,141 @@ class PathNode:
     def get_state_signature(self) -> frozenset[tuple[str, Any]]:
         """Get a hashable signature of the dialogue state.
 
+        The signature is computed once; state snapshots are not modified after
+        a node is created.
+
         Returns:
             Frozenset of state key-value pairs for comparison
         """
-        # Extract key state components
-        commitments = frozenset(self.state_snapshot.get("commitments", set()))
-        qud_size = self.state_snapshot.get("qud_size", 0)
-        issues_size = self.state_snapshot.get("issues_size", 0)
-
-        return frozenset(
-            [
-                ("commitments", commitments),
-                ("qud_size", qud_size),
-                ("issues_size", issues_size),
-            ]
-        )
+        if self._signature is None:
+            # Extract key state components
+            commitments = frozenset(self.state_snapshot.get("commitments", set()))
+            qud_size = self.state_snapshot.get("qud_size", 0)
+            issues_size = self.state_snapshot.get("issues_size", 0)
+
+            self._signature = frozenset(
+                [
+                    ("commitments", commitments),
+                    ("qud_size", qud_size),
+                    ("issues_size", issues_size),
+                ]
+            )
+        return self._signature
+
+    def transposition_key(self) -> tuple[int, int, frozenset[tuple[str, Any]]]:
+        """Key under which converged nodes are merged.
+
+        Nodes at the same scenario position and depth with the same state
+        signature have identical futures, so only one needs expanding.
+
+        Returns:
+            Tuple of (step_index, depth, state signature)
+        """
+        return (self.step_index, self.depth, self.get_state_signature())
+
+    @property
+    def path_count(self) -> int:
+        """Number of distinct paths that reach this node (1 + merged paths)."""
+        return 1 + len(self.merged_parents)
+
+    def merge(self, parent: PathNode, choice: ChoiceOption, score: float, path_id: str) -> bool:
+        """Record another path converging on this node.
+
+        The best-scoring path becomes the primary parent as long as the node has
+        not been expanded yet; afterwards alternatives are only recorded, since
+        the subtree below was scored from the original path.
+
+        Args:
+            parent: Parent of the converging path
+            choice: Choice made from that parent
+            score: Score of the converging path
+            path_id: Path ID of the converging path
+
+        Returns:
+            True if the converging path replaced the primary path (score improved)
+        """
+        if self.expanded or score <= self.score:
+            self.merged_parents.append((parent, choice, score))
+            return False
+
+        assert self.parent is not None and self.choice_made is not None
+        self.merged_parents.append((self.parent, self.choice_made, self.score))
+        self.parent = parent
+        self.choice_made = choice
+        self.score = score
+        self.path_id = path_id
+        return True
+
+
+class BoundedFrontier:
+    """Best-first frontier holding at most ``capacity`` nodes.
+
+    Push and pop are O(log n): the best node is popped from a max-heap and,
+    when full, the worst node is evicted from a parallel min-heap. Entries
+    removed from one heap are dropped lazily from the other. A node holds at
+    most one live entry: pushing a queued node again (e.g. after its score
+    improved) replaces its entry rather than adding a second one.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize an empty frontier.
+
+        Args:
+            capacity: Maximum number of live entries
+        """
+        self.capacity = capacity
+        self._best: list[tuple[float, int, PathNode]] = []  # (-score, id, node)
+        self._worst: list[tuple[float, int]] = []  # (score, id)
+        self._live: dict[int, PathNode] = {}  # entry id -> node
+        self._entries: dict[int, int] = {}  # id(node) -> its live entry id
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def __iter__(self) -> Iterator[PathNode]:
+        return iter(self._live.values())
+
+    def push(self, node: PathNode, score: float) -> int:
+        """Add or re-prioritize a node, evicting the lowest-scoring nodes if over capacity.
+
+        Args:
+            node: Node to add; if already queued, its old entry is invalidated
+            score: Priority (higher is better)
+
+        Returns:
+            Number of nodes evicted
+        """
+        stale_id = self._entries.get(id(node))
+        if stale_id is not None:
+            del self._live[stale_id]
+        entry_id = next(self._counter)
+        self._live[entry_id] = node
+        self._entries[id(node)] = entry_id
+        heapq.heappush(self._best, (-score, entry_id, node))
+        heapq.heappush(self._worst, (score, entry_id))
+
+        evicted = 0
+        while len(self._live) > self.capacity:
+            _, worst_id = heapq.heappop(self._worst)
+            worst = self._live.pop(worst_id, None)
+            if worst is not None:
+                del self._entries[id(worst)]
+                evicted += 1
+        return evicted
+
+    def pop(self) -> PathNode:
+        """Remove and return the highest-scoring node.
+
+        Raises:
+            IndexError: If the frontier is empty
+        """
+        while self._best:
+            _, entry_id, node = heapq.heappop(self._best)
+            if self._live.pop(entry_id, None) is not None:
+                del self._entries[id(node)]
+                return node
+        raise IndexError("pop from empty frontier")
 
 
 def _empty_beam_metrics() -> dict[str, Any]:
@@ -221,6 +381,10 @@ class PathExplorer:
         beam_size: int = 200,
         turn_penalty: float = 5.0,
         expected_only: bool = False,
+        simulation: str = "snapshot",
+        workers: int = 0,
+        batch_size: int | None = None,
+        trace_rules: bool = True,
     ) -> None:
         """Initialize path explorer.
 
@@ -230,13 +394,33 @@ class PathExplorer:
             beam_size: Maximum number of paths to maintain (default: 200)
             turn_penalty: Penalty per turn to favor shorter dialogues (default: 5.0)
             expected_only: If True, only follow expected choices (no distractors)
+            simulation: "snapshot" (pattern-matching approximation) or "engine"
+                (real DialogueMoveEngine)
+            workers: Worker processes for engine simulation (0 = in-process)
+            batch_size: Frontier nodes expanded per round (default: 1 for
+                snapshot mode, 16 for engine mode). Independent of workers, so
+                results are the same however many processes run them.
+            trace_rules: Profile in-process engine simulation and capture each
+                simulated choice with its rule traces on the explorer
+
+        Raises:
+            ValueError: If the simulation mode is unknown
         """
+        if simulation not in SIMULATION_MODES:
+            raise ValueError(
+                f"Unknown simulation mode {simulation!r}; expected one of {SIMULATION_MODES}"
+            )
         self.scenario = scenario
         self.domain = domain
         self.beam_size = beam_size
         self.turn_penalty = turn_penalty
         self.expected_only = expected_only
+        self.simulation = simulation
+        self.workers = workers
+        self.batch_size = batch_size or (16 if simulation == "engine" else 1)
+        self.trace_rules = trace_rules
         self.explorer: ScenarioExplorer | None = None
+        self._simulator: EngineSimulator | None = None
 
     def explore_paths(self, max_depth: int = 3) -> ExplorationResult:
         """Explore dialogue paths using best-first beam search.
@@ -254,7 +438,18 @@ class PathExplorer:
         # Initialize state and explorer
         initial_state = InformationState(agent_id="system")
         initial_state.private.beliefs["domain"] = self.domain
-        self.explorer = ScenarioExplorer(self.scenario, initial_state, self.domain)
+        profiler: RuleProfiler | None = None
+        if self.simulation == "engine":
+            if self._simulator is None:
+                # Worker engines cannot report back, so only in-process runs are profiled
+                traced = self.trace_rules and self.workers == 0
+                self._simulator = EngineSimulator(
+                    self.domain.name, profiler=RuleProfiler() if traced else None
+                )
+            profiler = self._simulator.engine.rules.profiler
+        self.explorer = ScenarioExplorer(
+            self.scenario, initial_state, self.domain, profiler=profiler
+        )
 
         # Create root node
         root = PathNode(
@@ -268,93 +463,138 @@ class PathExplorer:
             score=0.0,
         )
 
-        # Best-first beam search
+        pool: WorkerPool | None = None
+        if self.simulation == "engine":
+            assert self._simulator is not None
+            root.engine_state = self._simulator.initial_state()
+            if self.workers > 0:
+                pool = WorkerPool(self._simulator.image, workers=self.workers)
+
+        try:
+            return self._search(root, initial_state, max_depth, pool)
+        finally:
+            if pool is not None:
+                pool.close()
+
+    def _search(
+        self,
+        root: PathNode,
+        initial_state: InformationState,
+        max_depth: int,
+        pool: WorkerPool | None,
+    ) -> ExplorationResult:
+        """Run the beam search from the root node.
+
+        Args:
+            root: Root node
+            initial_state: Base information state
+            max_depth: Maximum depth to explore
+            pool: Process pool for engine simulation (None = in-process)
+
+        Returns:
+            ExplorationResult with explored paths and metrics
+        """
+
+        # Best-first beam search over a DAG of converged states
         paths_by_depth: dict[int, list[PathNode]] = {0: [root]}
-        # Priority queue: (negative_score, counter, node)
-        # Use negative score because heapq is a min-heap
-        counter = 0  # Tie-breaker for nodes with same score
-        heap: list[tuple[float, int, PathNode]] = [(-root.score, counter, root)]
-        counter += 1
+        frontier = BoundedFrontier(self.beam_size)
+        frontier.push(root, root.score)
 
         all_paths: list[PathNode] = [root]
         unique_states: set[frozenset[tuple[str, Any]]] = {root.get_state_signature()}
         state_convergence: dict[frozenset[tuple[str, Any]], list[PathNode]] = {}
+        transpositions: dict[tuple[int, int, frozenset[tuple[str, Any]]], PathNode] = {
+            root.transposition_key(): root
+        }
 
         # Beam search metrics
         total_generated = 0
         total_pruned = 0
+        total_merged = 0
+        total_expanded = 0
         scores_tracked: list[float] = []
-
-        while heap:
-            # Get highest-scoring node (lowest negative score)
-            _, _, node = heapq.heappop(heap)
-
-            # Stop if we've reached max depth
-            if node.depth >= max_depth:
-                continue
-
-            # Get available choices at this node
-            choices, user_turn_index = self._get_choices_at_node(node, initial_state)
-            if not choices:
-                continue
-
-            # Generate all children
-            children: list[PathNode] = []
-            for choice in choices:
-                # Create child node
-                child_state = self._simulate_choice(node, choice, initial_state)
-                child_path_id = (
-                    f"{node.path_id}→{choice.id}" if node.path_id != "root" else str(choice.id)
-                )
-
-                child = PathNode(
-                    depth=node.depth + 1,
-                    step_index=user_turn_index + 1,
-                    user_turn_index=user_turn_index,
-                    choice_made=choice,
-                    state_snapshot=self._capture_state(child_state),
-                    parent=node,
-                    path_id=child_path_id,
-                )
-
-                # Calculate score for child
-                child.score = _calculate_path_score(child, self.scenario, self.turn_penalty)
-                scores_tracked.append(child.score)
-
-                # Track state
-                state_sig = child.get_state_signature()
-                unique_states.add(state_sig)
-
-                # Track convergence
-                if state_sig not in state_convergence:
-                    state_convergence[state_sig] = []
-                state_convergence[state_sig].append(child)
-
-                # Add to tree
-                node.children.append(child)
-                all_paths.append(child)
-                children.append(child)
-
-                # Add to depth tracking
-                if child.depth not in paths_by_depth:
-                    paths_by_depth[child.depth] = []
-                paths_by_depth[child.depth].append(child)
-
-                total_generated += 1
-
-            # Add children to heap
-            for child in children:
-                heapq.heappush(heap, (-child.score, counter, child))
-                counter += 1
-
-            # Beam pruning: keep only top beam_size paths
-            if len(heap) > self.beam_size:
-                # Keep top beam_size
-                top_paths = heapq.nsmallest(self.beam_size, heap)
-                pruned_count = len(heap) - self.beam_size
-                total_pruned += pruned_count
-                heap = top_paths
-                heapq.heapify(heap)  # Restore heap property
+        state_bytes: list[int] = []
+
+        while frontier:
+            # Take the highest-scoring nodes for this round
+            batch: list[tuple[PathNode, list[ChoiceOption], int]] = []
+            while frontier and len(batch) < self.batch_size:
+                node = frontier.pop()
+
+                # Stop if we've reached max depth
+                if node.depth >= max_depth:
+                    continue
+
+                node.expanded = True
+                total_expanded += 1
+
+                # Get available choices at this node
+                choices, user_turn_index = self._get_choices_at_node(node, initial_state)
+                if choices:
+                    batch.append((node, choices, user_turn_index))
+
+            # Simulate every choice of the round, then merge results in order
+            outcomes = self._expand_batch(batch, initial_state, pool)
+
+            for (node, choices, user_turn_index), results in zip(batch, outcomes, strict=True):
+                for choice, (snapshot, engine_state) in zip(choices, results, strict=True):
+                    # Create child node
+                    child_path_id = (
+                        f"{node.path_id}→{choice.id}" if node.path_id != "root" else str(choice.id)
+                    )
+
+                    child = PathNode(
+                        depth=node.depth + 1,
+                        step_index=user_turn_index + 1,
+                        user_turn_index=user_turn_index,
+                        choice_made=choice,
+                        state_snapshot=snapshot,
+                        parent=node,
+                        path_id=child_path_id,
+                        engine_state=engine_state,
+                    )
+                    if engine_state is not None:
+                        state_bytes.append(len(engine_state))
+
+                    # Calculate score for child
+                    child.score = _calculate_path_score(child, self.scenario, self.turn_penalty)
+                    scores_tracked.append(child.score)
+                    total_generated += 1
+
+                    # Transposition: merge into an existing node for the same state
+                    key = child.transposition_key()
+                    existing = transpositions.get(key)
+                    if existing is not None:
+                        total_merged += 1
+                        if (
+                            existing.merge(node, choice, child.score, child_path_id)
+                            and not existing.expanded
+                        ):
+                            # Better score: re-queue at the new priority
+                            total_pruned += frontier.push(existing, existing.score)
+                        continue
+                    transpositions[key] = child
+
+                    # Track state
+                    state_sig = child.get_state_signature()
+                    unique_states.add(state_sig)
+
+                    # Track convergence
+                    if state_sig not in state_convergence:
+                        state_convergence[state_sig] = []
+                    state_convergence[state_sig].append(child)
+
+                    # Add to tree
+                    node.children.append(child)
+                    all_paths.append(child)
+
+                    # Add to depth tracking
+                    if child.depth not in paths_by_depth:
+                        paths_by_depth[child.depth] = []
+                    paths_by_depth[child.depth].append(child)
+
+                    # Beam pruning happens incrementally as the frontier overflows
+                    total_pruned += frontier.push(child, child.score)
 
         # Calculate coverage metrics
         coverage_metrics = self._calculate_coverage(all_paths)
@@ -362,12 +602,18 @@ class PathExplorer:
         # Calculate beam metrics
         beam_metrics = {
             "beam_size": self.beam_size,
+            "simulation": self.simulation,
+            "workers": self.workers,
             "total_generated": total_generated,
             "total_pruned": total_pruned,
+            "total_merged": total_merged,
+            "total_expanded": total_expanded,
             "avg_score": sum(scores_tracked) / len(scores_tracked) if scores_tracked else 0.0,
             "max_score": max(scores_tracked) if scores_tracked else 0.0,
             "min_score": min(scores_tracked) if scores_tracked else 0.0,
         }
+        if state_bytes:
+            beam_metrics["avg_state_bytes"] = sum(state_bytes) / len(state_bytes)
 
         return ExplorationResult(
             scenario_name=self.scenario.name,
@@ -423,10 +669,84 @@ class PathExplorer:
 
         return choices, step_index
 
+    def _expand_batch(
+        self,
+        batch: list[tuple[PathNode, list[ChoiceOption], int]],
+        base_state: InformationState,
+        pool: WorkerPool | None,
+    ) -> list[list[tuple[dict[str, Any], bytes | None]]]:
+        """Simulate every choice at each node of a round.
+
+        Args:
+            batch: (node, choices, user turn index) for each node being expanded
+            base_state: Base information state
+            pool: Process pool for engine simulation (None = in-process)
+
+        Returns:
+            For each node, one (state snapshot, encoded engine state) per choice,
+            in the order of the batch and its choices
+        """
+        if self.simulation == "snapshot":
+            return [
+                [
+                    (self._capture_state(self._simulate_choice(node, choice, base_state)), None)
+                    for choice in choices
+                ]
+                for node, choices, _ in batch
+            ]
+
+        expansions: list[list[tuple[bytes, dict[str, Any]]]] = []
+        if pool is not None:
+            tasks: list[tuple[str, bytes, tuple[str, ...]]] = []
+            for node, choices, _ in batch:
+                assert node.engine_state is not None
+                utterances = tuple(choice.utterance for choice in choices)
+                tasks.append((self.domain.name, node.engine_state, utterances))
+            # map() yields results in submission order, keeping the search deterministic
+            expansions = pool.map(expand_in_worker, tasks)
+        elif self.explorer is not None and self.explorer.profiler is not None:
+            expansions = [self._expand_traced(node, choices) for node, choices, _ in batch]
+        else:
+            assert self._simulator is not None
+            for node, choices, _ in batch:
+                assert node.engine_state is not None
+                utterances = [choice.utterance for choice in choices]
+                expansions.append(self._simulator.expand(node.engine_state, utterances))
+
+        return [
+            [(snapshot, engine_state) for engine_state, snapshot in expansion]
+            for expansion in expansions
+        ]
+
+    def _expand_traced(
+        self, node: PathNode, choices: list[ChoiceOption]
+    ) -> list[tuple[bytes, dict[str, Any]]]:
+        """Simulate a node's choices in-process, capturing each on the explorer.
+
+        Args:
+            node: Node being expanded (its engine state is the starting point)
+            choices: Choices available at the node
+
+        Returns:
+            One (encoded state, snapshot) per choice, as EngineSimulator.expand()
+        """
+        assert self._simulator is not None and self.explorer is not None
+        assert node.engine_state is not None
+        parent = StateSnapshot.from_state(
+            decode_state(node.engine_state), len(self.explorer.snapshots), node.path_id
+        )
+        expansion: list[tuple[bytes, dict[str, Any]]] = []
+        for choice in choices:
+            result = self._simulator.simulate(node.engine_state, choice.utterance)
+            self.explorer.state = decode_state(result[0])
+            self.explorer.capture_snapshot(f"{node.path_id} → {choice.utterance}", parent)
+            expansion.append(result)
+        return expansion
+
     def _simulate_choice(
         self, node: PathNode, choice: ChoiceOption, base_state: InformationState
     ) -> InformationState:
-        """Simulate making a choice and return the resulting state.
+        """Simulate making a choice and return the resulting state (snapshot mode).
 
         Args:
             node: Current node
@@ -445,7 +765,7 @@ class PathExplorer:
             new_state.shared.commitments.add(commitment)
 
         # Apply the choice (simple simulation for demo)
-        # In a real system, this would run the dialogue engine
+        # Engine mode runs the dialogue engine instead (see _expand_batch)
         commitment = _extract_commitment_from_utterance(choice.utterance)
         if commitment:
             new_state.shared.commitments.add(commitment)
@@ -461,11 +781,7 @@ class PathExplorer:
         Returns:
             Dictionary with state snapshot
         """
-        return {
-            "commitments": set(state.shared.commitments),
-            "qud_size": len(state.shared.qud),
-            "issues_size": len(state.private.issues),
-        }
+        return capture_snapshot(state)
 
     def _calculate_coverage(self, all_paths: list[PathNode]) -> dict[str, Any]:
         """Calculate distractor coverage metrics.
@@ -482,9 +798,13 @@ class PathExplorer:
         distractor_count = 0
 
         for path in all_paths:
+            # Include choices of paths merged into this node by the transposition table
+            choices = [choice for _, choice, _ in path.merged_parents]
             if path.choice_made:
-                unique_choices.add(path.choice_made.utterance)
-                if path.choice_made.category.value == "expected":
+                choices.append(path.choice_made)
+            for choice in choices:
+                unique_choices.add(choice.utterance)
+                if choice.category.value == "expected":
                     expected_count += 1
                 else:
                     distractor_count += 1
@@ -533,7 +853,11 @@ def generate_exploration_report(result: ExplorationResult) -> str:
     lines.append("-" * 70)
     lines.append(f"Total paths explored: {result.total_paths}")
     lines.append(f"Unique states reached: {len(result.unique_states)}")
-    convergence_count = sum(1 for nodes in result.state_convergence.values() if len(nodes) > 1)
+    convergence_count = sum(
+        1
+        for nodes in result.state_convergence.values()
+        if sum(node.path_count for node in nodes) > 1
+    )
     lines.append(f"State convergence instances: {convergence_count}")
 
     # Count paths with results
@@ -549,6 +873,8 @@ def generate_exploration_report(result: ExplorationResult) -> str:
         lines.append(f"Beam size: {result.beam_metrics.get('beam_size', 'N/A')}")
         lines.append(f"Total paths generated: {result.beam_metrics.get('total_generated', 0)}")
         lines.append(f"Paths pruned: {result.beam_metrics.get('total_pruned', 0)}")
+        lines.append(f"Paths merged (converged): {result.beam_metrics.get('total_merged', 0)}")
+        lines.append(f"Nodes expanded: {result.beam_metrics.get('total_expanded', 0)}")
         pruned = result.beam_metrics.get("total_pruned", 0)
         generated = result.beam_metrics.get("total_generated", 1)
         prune_rate = (pruned / generated * 100) if generated > 0 else 0
@@ -596,7 +922,9 @@ def generate_exploration_report(result: ExplorationResult) -> str:
 
     # State convergence (paths that lead to same state)
     convergent_states = [
-        (sig, nodes) for sig, nodes in result.state_convergence.items() if len(nodes) > 1
+        (sig, nodes)
+        for sig, nodes in result.state_convergence.items()
+        if sum(node.path_count for node in nodes) > 1
     ]
     if convergent_states:
         lines.append("State Convergence")
@@ -606,11 +934,13 @@ def generate_exploration_report(result: ExplorationResult) -> str:
 
         # Show first 5 convergent states
         for i, (_sig, nodes) in enumerate(convergent_states[:5], 1):
-            lines.append(f"State {i}: {len(nodes)} paths converge")
+            path_total = sum(node.path_count for node in nodes)
+            lines.append(f"State {i}: {path_total} paths converge")
             for node in nodes[:3]:
-                lines.append(f"  - Path: {node.path_id}")
+                merged = f" (+{len(node.merged_parents)} merged)" if node.merged_parents else ""
+                lines.append(f"  - Path: {node.path_id}{merged}")
             if len(nodes) > 3:
-                lines.append(f"  ... and {len(nodes) - 3} more paths")
+                lines.append(f"  ... and {len(nodes) - 3} more nodes")
             lines.append("")
 
     lines.append("=" * 70)
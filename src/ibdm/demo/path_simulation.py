@@ -0,0 +1,185 @@
+"""Dialogue-engine simulation backend for PathExplorer.
+
+Runs each explored choice through the real DialogueMoveEngine: the user
+utterance is interpreted by the rule-based interpretation rules, integrated,
+and the system's next move is selected and integrated, starting from the
+parent node's stored state.
+
+States travel between processes in a compact form: the InformationState
+dict, JSON-encoded and zlib-compressed, with domain models replaced by their
+names (every worker process resolves them to its own domain singletons).
+Engines come from the shared EngineImage, so worker processes reuse the
+parent's prebuilt rule set. A simulator given a RuleProfiler runs a private
+copy of the rules instead, so profiling one simulator does not instrument
+every engine sharing the image.
+
+Example:
+    >>> simulator = EngineSimulator("nda_drafting")
+    >>> root = simulator.initial_state()
+    >>> child, snapshot = simulator.simulate(root, "I need to draft an NDA")
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+from collections.abc import Sequence
+from typing import Any
+
+from ibdm.core import DomainModel, InformationState
+from ibdm.domains.registry import get_domain
+from ibdm.engine.dialogue_engine import DialogueMoveEngine
+from ibdm.engine.image import EngineImage, get_engine_image
+from ibdm.rules import FrozenRuleSet, RuleProfiler
+
+#: Speaker ID used for simulated user turns
+USER_ID = "user"
+
+_DOMAIN_KEY = "__domain__"
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, DomainModel):
+        return {_DOMAIN_KEY: value.name}
+    to_dict = getattr(value, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    if isinstance(value, (set, frozenset)):
+        return sorted(str(item) for item in value)  # type: ignore[misc]
+    return str(value)
+
+
+def _decode_object(data: dict[str, Any]) -> Any:
+    if len(data) == 1 and _DOMAIN_KEY in data:
+        return get_domain(data[_DOMAIN_KEY])
+    return data
+
+
+def encode_state(state: InformationState) -> bytes:
+    """Serialize a state to compact bytes.
+
+    Domain models in beliefs are stored by name; other non-JSON belief values
+    fall back to their to_dict() or string form.
+
+    Args:
+        state: State to serialize
+
+    Returns:
+        zlib-compressed JSON
+    """
+    payload = json.dumps(state.to_dict(), default=_encode_value, separators=(",", ":"))
+    return zlib.compress(payload.encode("utf-8"), 1)
+
+
+def decode_state(data: bytes) -> InformationState:
+    """Deserialize a state produced by encode_state().
+
+    Args:
+        data: Encoded state
+
+    Returns:
+        Reconstructed InformationState with domain models re-attached
+    """
+    payload = json.loads(zlib.decompress(data), object_hook=_decode_object)
+    return InformationState.from_dict(payload)
+
+
+def capture_snapshot(state: InformationState) -> dict[str, Any]:
+    """Summarize a state for scoring and transposition signatures.
+
+    Args:
+        state: Information state to summarize
+
+    Returns:
+        Dict with commitments, qud_size and issues_size
+    """
+    return {
+        "commitments": set(state.shared.commitments),
+        "qud_size": len(state.shared.qud),
+        "issues_size": len(state.private.issues),
+    }
+
+
+class EngineSimulator:
+    """Applies user utterances to encoded states with a real DialogueMoveEngine."""
+
+    def __init__(
+        self,
+        domain_name: str,
+        image: EngineImage | None = None,
+        profiler: RuleProfiler | None = None,
+    ):
+        """Initialize the simulator.
+
+        Args:
+            domain_name: Name of the domain to attach to states
+            image: Engine image providing rules and domains (default: the
+                process-wide image)
+            profiler: Profiler recording this simulator's rule evaluations
+        """
+        self.image = image or get_engine_image()
+        self.domain_name = domain_name
+        self.domain = self.image.domain(domain_name)
+        if profiler is None:
+            self.engine = self.image.create_engine()
+        else:
+            rules = FrozenRuleSet(self.image.rules)
+            rules.enable_profiling(profiler)
+            self.engine = DialogueMoveEngine(agent_id=self.image.agent_id, rules=rules)
+
+    def initial_state(self) -> bytes:
+        """Encoded initial state with the domain attached."""
+        return encode_state(self.image.create_initial_state(self.domain_name))
+
+    def simulate(self, parent: bytes, utterance: str) -> tuple[bytes, dict[str, Any]]:
+        """Run one user utterance and the system's reply through the engine.
+
+        Args:
+            parent: Encoded state to start from
+            utterance: User utterance
+
+        Returns:
+            Tuple of (encoded resulting state, snapshot of the resulting state)
+        """
+        state = decode_state(parent)
+        if self.engine.rules.profiler is not None:
+            self.engine.rules.profiler.begin_turn()
+        for move in self.engine.interpret(utterance, USER_ID, state):
+            state = self.engine.integrate(move, state)
+
+        response, state = self.engine.select_action(state)
+        if response is not None:
+            response.content = self.engine.generate(response, state)
+            state = self.engine.integrate(response, state)
+
+        return encode_state(state), capture_snapshot(state)
+
+    def expand(
+        self, parent: bytes, utterances: Sequence[str]
+    ) -> list[tuple[bytes, dict[str, Any]]]:
+        """Simulate every choice available at one node.
+
+        Args:
+            parent: Encoded state of the node
+            utterances: Utterance of each choice, in order
+
+        Returns:
+            One (encoded state, snapshot) per utterance, in the same order
+        """
+        return [self.simulate(parent, utterance) for utterance in utterances]
+
+
+def expand_in_worker(
+    image: EngineImage, task: tuple[str, bytes, tuple[str, ...]]
+) -> list[tuple[bytes, dict[str, Any]]]:
+    """WorkerPool handler: expand one node with an engine from the worker's image.
+
+    Args:
+        image: The worker's engine image
+        task: Tuple of (domain name, encoded parent state, choice utterances)
+
+    Returns:
+        Result of EngineSimulator.expand()
+    """
+    domain_name, parent, utterances = task
+    return EngineSimulator(domain_name, image).expand(parent, utterances)
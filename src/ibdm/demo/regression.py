@@ -0,0 +1,301 @@
+"""Headless regression runs of a scenario directory against golden traces.
+
+Every scenario is run through the real engine with ScenarioRunner.run_headless
+(no rendering, no pauses, no NLG) across a pool of worker processes. The
+StateTraceRecorder trace of each run is compared turn by turn with the
+scenario's golden trace, a JSONL file of TraceRecord dictionaries named after
+the scenario in the golden directory.
+
+Runs are cached: after a scenario passes, a hash of its inputs (scenario file,
+golden trace, rule-set fingerprint, domain fingerprint and a digest of the
+ibdm package's source files) is stored, and later runs skip the scenario while
+that hash is unchanged. The rule-set and domain fingerprints (RuleSet.fingerprint(),
+DomainModel.fingerprint()) cover the rule and domain functions themselves; the
+source digest covers everything they call, so editing any engine module reruns
+every scenario.
+
+Example:
+    >>> report = run_regression()
+    >>> print(report.summary())
+    >>> raise SystemExit(0 if report.ok else 1)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from rich.console import Console
+
+import ibdm
+from ibdm.demo.scenario_loader import ScenarioLoader
+from ibdm.demo.scenario_runner import ScenarioRunner
+from ibdm.domains.legal_domain import get_legal_domain
+from ibdm.domains.nda_domain import get_nda_domain
+from ibdm.engine.image import DIALOGUE_RULE_FACTORIES, build_rule_set
+
+DEFAULT_CACHE_PATH = ".ibdm_regression_cache.json"
+
+# Outcome statuses
+PASSED = "passed"
+FAILED = "failed"
+MISSING = "missing"  # no golden trace to compare with
+ERROR = "error"
+SKIPPED = "skipped"  # inputs unchanged since the last green run
+UPDATED = "updated"  # golden trace (re)written
+
+GREEN_STATUSES = frozenset({PASSED, SKIPPED, UPDATED})
+
+
+def default_golden_dir() -> Path:
+    """Golden traces directory next to the default scenarios directory."""
+    return ScenarioLoader().scenarios_dir.parent / "golden_traces"
+
+
+def source_fingerprint(root: Path | None = None) -> str:
+    """Hash every Python source file in a package directory.
+
+    Args:
+        root: Package directory (default: the installed ibdm package)
+
+    Returns:
+        Hex digest over the files' relative paths and contents
+    """
+    root = root if root is not None else Path(ibdm.__file__).parent
+    digest = hashlib.sha256()
+    for path in sorted(root.rglob("*.py")):
+        digest.update(path.relative_to(root).as_posix().encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def engine_fingerprints() -> tuple[str, str, str]:
+    """Fingerprints of the engine scenarios are run against.
+
+    Returns:
+        (rule-set fingerprint, domain fingerprint, ibdm source fingerprint)
+    """
+    rules = build_rule_set(DIALOGUE_RULE_FACTORIES).fingerprint()
+    domains = hashlib.sha256(
+        f"{get_nda_domain().fingerprint()}\n{get_legal_domain().fingerprint()}".encode()
+    ).hexdigest()
+    return rules, domains, source_fingerprint()
+
+
+def compare_traces(actual: list[dict[str, Any]], golden: list[dict[str, Any]]) -> list[str]:
+    """Describe the differences between a trace and its golden trace.
+
+    Args:
+        actual: Trace records of the run
+        golden: Golden trace records
+
+    Returns:
+        One line per differing field (empty if the traces match)
+    """
+    mismatches: list[str] = []
+    for record, expected in zip(actual, golden, strict=False):
+        for key in sorted(set(record) | set(expected)):
+            if record.get(key) != expected.get(key):
+                mismatches.append(
+                    f"turn {expected.get('turn')}: {key} is {record.get(key)!r}, "
+                    f"expected {expected.get(key)!r}"
+                )
+    if len(actual) != len(golden):
+        mismatches.append(f"{len(actual)} turns traced, expected {len(golden)}")
+    return mismatches
+
+
+def read_trace(path: Path) -> list[dict[str, Any]]:
+    """Read a JSONL trace as written by StateTraceRecorder.flush().
+
+    Args:
+        path: Trace file
+
+    Returns:
+        Trace records as dictionaries
+    """
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line]
+
+
+@dataclass
+class ScenarioOutcome:
+    """Result of one scenario in a regression run."""
+
+    scenario_id: str
+    status: str
+    input_hash: str
+    mismatches: list[str] = field(default_factory=lambda: [])
+    error: str | None = None
+    duration: float = 0.0
+
+    @property
+    def green(self) -> bool:
+        """Whether the scenario passed (or was skipped as unchanged)."""
+        return self.status in GREEN_STATUSES
+
+
+@dataclass
+class RegressionReport:
+    """Aggregated outcome of a regression run."""
+
+    outcomes: list[ScenarioOutcome]
+    wall_time: float
+
+    @property
+    def ok(self) -> bool:
+        """Whether every scenario is green."""
+        return all(outcome.green for outcome in self.outcomes)
+
+    def count(self, status: str) -> int:
+        """Number of scenarios with the given status."""
+        return sum(1 for outcome in self.outcomes if outcome.status == status)
+
+    def summary(self) -> str:
+        """Multi-line summary listing every scenario that is not green."""
+        counts = ", ".join(
+            f"{self.count(status)} {status}"
+            for status in (PASSED, SKIPPED, UPDATED, FAILED, MISSING, ERROR)
+            if self.count(status)
+        )
+        lines = [f"{len(self.outcomes)} scenarios in {self.wall_time:.2f}s: {counts or 'none'}"]
+        for outcome in self.outcomes:
+            if outcome.green:
+                continue
+            lines.append(f"✗ {outcome.scenario_id} ({outcome.status})")
+            if outcome.error:
+                lines.append(f"    {outcome.error}")
+            lines.extend(f"    {mismatch}" for mismatch in outcome.mismatches)
+        return "\n".join(lines)
+
+
+@cache
+def _loader(scenarios_dir: Path) -> ScenarioLoader:
+    """One loader (and parsed-scenario cache) per worker process."""
+    return ScenarioLoader(scenarios_dir)
+
+
+def _input_hash(scenario_path: Path, golden_path: Path, fingerprints: tuple[str, str, str]) -> str:
+    """Hash everything a scenario's result depends on."""
+    digest = hashlib.sha256()
+    digest.update(scenario_path.read_bytes())
+    digest.update(golden_path.read_bytes() if golden_path.exists() else b"")
+    for fingerprint in fingerprints:
+        digest.update(fingerprint.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _run_scenario(
+    task: tuple[Path, str, Path, str, bool],
+) -> ScenarioOutcome:
+    """Run one scenario headless and check it against its golden trace (runs in a worker)."""
+    scenarios_dir, scenario_id, golden_dir, input_hash, update_golden = task
+    golden_path = golden_dir / f"{scenario_id}.jsonl"
+    started = time.perf_counter()
+    try:
+        scenario = _loader(scenarios_dir).load_scenario(scenario_id)
+        runner = ScenarioRunner(scenario, console=Console(quiet=True))
+        trace = [record.to_dict() for record in runner.run_headless()]
+    except Exception as e:
+        return ScenarioOutcome(
+            scenario_id,
+            ERROR,
+            input_hash,
+            error=f"{type(e).__name__}: {e}",
+            duration=time.perf_counter() - started,
+        )
+
+    if update_golden:
+        golden_path.write_text("\n".join(json.dumps(record) for record in trace), encoding="utf-8")
+        status, mismatches = UPDATED, []
+    elif not golden_path.exists():
+        status, mismatches = MISSING, [f"no golden trace at {golden_path}"]
+    else:
+        mismatches = compare_traces(trace, read_trace(golden_path))
+        status = FAILED if mismatches else PASSED
+    return ScenarioOutcome(
+        scenario_id, status, input_hash, mismatches, duration=time.perf_counter() - started
+    )
+
+
+def run_regression(
+    scenarios_dir: str | Path | None = None,
+    golden_dir: str | Path | None = None,
+    workers: int | None = None,
+    cache_path: str | Path | None = DEFAULT_CACHE_PATH,
+    use_cache: bool = True,
+    update_golden: bool = False,
+) -> RegressionReport:
+    """Run every scenario in a directory headless and compare with golden traces.
+
+    Args:
+        scenarios_dir: Directory of JSON scenarios (default: demos/scenarios)
+        golden_dir: Directory of golden traces (default: demos/golden_traces)
+        workers: Worker processes (default: one per CPU); 1 runs in this process
+        cache_path: File recording the inputs of green runs (None disables it)
+        use_cache: Skip scenarios whose inputs match their last green run
+        update_golden: Write the traces as the new golden traces instead of comparing
+
+    Returns:
+        Report with one outcome per scenario, in scenario ID order
+    """
+    started = time.perf_counter()
+    loader = ScenarioLoader(Path(scenarios_dir) if scenarios_dir is not None else None)
+    golden = Path(golden_dir) if golden_dir is not None else default_golden_dir()
+    golden.mkdir(parents=True, exist_ok=True)
+    cache_file = Path(cache_path) if cache_path is not None else None
+
+    green_runs: dict[str, str] = {}
+    if cache_file is not None and cache_file.exists():
+        try:
+            green_runs = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            green_runs = {}  # unreadable cache: run everything
+
+    fingerprints = engine_fingerprints()
+    outcomes: dict[str, ScenarioOutcome] = {}
+    tasks: list[tuple[Path, str, Path, str, bool]] = []
+    for scenario_id in loader.list_scenarios():
+        input_hash = _input_hash(
+            loader.scenarios_dir / f"{scenario_id}.json",
+            golden / f"{scenario_id}.jsonl",
+            fingerprints,
+        )
+        if use_cache and not update_golden and green_runs.get(scenario_id) == input_hash:
+            outcomes[scenario_id] = ScenarioOutcome(scenario_id, SKIPPED, input_hash)
+        else:
+            tasks.append((loader.scenarios_dir, scenario_id, golden, input_hash, update_golden))
+
+    if workers == 1 or len(tasks) <= 1:
+        results = [_run_scenario(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_run_scenario, tasks))
+
+    for outcome in results:
+        if outcome.status == UPDATED:
+            # The golden trace changed, so the hash of the passing inputs did too
+            outcome.input_hash = _input_hash(
+                loader.scenarios_dir / f"{outcome.scenario_id}.json",
+                golden / f"{outcome.scenario_id}.jsonl",
+                fingerprints,
+            )
+        outcomes[outcome.scenario_id] = outcome
+
+    if cache_file is not None:
+        green_runs = {
+            scenario_id: outcome.input_hash
+            for scenario_id, outcome in outcomes.items()
+            if outcome.green
+        }
+        cache_file.write_text(json.dumps(green_runs, indent=2, sort_keys=True), encoding="utf-8")
+
+    return RegressionReport(
+        outcomes=[outcomes[scenario_id] for scenario_id in sorted(outcomes)],
+        wall_time=time.perf_counter() - started,
+    )
@@ -5,14 +5,16 @@ Allows users to explore IBiS scenarios by choosing between:
 - Distractors (alternative moves that lead to different trajectories)
 """
 
+import tempfile
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
 from typing import Any
 
 from ibdm.core import InformationState
 from ibdm.demo.scenarios import DemoScenario, ScenarioStep
+from ibdm.rules import PhaseProfile, RuleProfiler
 from ibdm.visualization import (
-    RuleEvaluation,
     RuleTrace,
     StateSnapshot,
     TerminalRenderer,
@@ -293,13 +295,24 @@ class TrajectoryTracker:
 class ScenarioExplorer:
     """Interactive scenario explorer with choice-based navigation."""
 
-    def __init__(self, scenario: DemoScenario, state: InformationState, domain: Any) -> None:
+    def __init__(
+        self,
+        scenario: DemoScenario,
+        state: InformationState,
+        domain: Any,
+        profiler: RuleProfiler | None = None,
+        report_dir: str | Path | None = None,
+    ) -> None:
         """Initialize explorer with scenario and initial state.
 
         Args:
             scenario: The scenario to explore
             state: Initial information state
             domain: Domain for validation and distractor generation
+            profiler: Profiler attached to the engine's RuleSet (via
+                ``RuleSet.enable_profiling()``); its phases become rule traces
+            report_dir: Directory for the HTML timeline and rule traces
+                (default: a new temporary directory, made on the first report)
         """
         self.scenario = scenario
         self.state = state
@@ -312,6 +325,11 @@ class ScenarioExplorer:
         self.renderer = TerminalRenderer()
         self.snapshots: list[StateSnapshot] = []
         self.rule_traces: list[RuleTrace] = []
+        self.profiler = profiler
+        self._traced_phases = 0
+        self._publisher: Any = None  # StatePublisher, created on first publish
+        self.report_dir = Path(report_dir) if report_dir is not None else None
+        self._timeline: Any = None  # TimelineWriter, created on first HTML report
 
         # Capture initial state
         self.capture_snapshot("Initial State")
@@ -393,64 +411,61 @@ class ScenarioExplorer:
         """Display the current trajectory path."""
         print("\n" + self.tracker.format_path())
 
-    def capture_snapshot(self, label: str) -> None:
+    def capture_snapshot(self, label: str, before: StateSnapshot | None = None) -> None:
         """Capture a snapshot of the current state.
 
         Args:
             label: Label for the snapshot
+            before: State the rules started from (default: the previous snapshot)
         """
         timestamp = len(self.snapshots)
         snapshot = StateSnapshot.from_state(self.state, timestamp, label)
         self.snapshots.append(snapshot)
-        # Also capture a dummy rule trace for this snapshot
-        self._capture_rule_trace(label, timestamp)
+        # Also capture the rule traces that led to this snapshot
+        self._capture_rule_trace(label, timestamp, before)
 
-    def _capture_rule_trace(self, label: str, timestamp: int) -> None:
-        """Create a placeholder RuleTrace for visualization.
+    def _capture_rule_trace(
+        self, label: str, timestamp: int, before: StateSnapshot | None = None
+    ) -> None:
+        """Record rule traces for the phases run since the previous snapshot.
 
-        This dummy implementation creates a few example RuleEvaluation objects.
-        In a full system this would be populated by the actual rule engine.
+        Traces come from the RuleProfiler attached to the engine's RuleSet.
+        Without a profiler (or when no rules ran) a single trace with no
+        evaluations is recorded so snapshots and traces stay aligned.
         """
-        from ibdm.visualization import RuleTrace
-
-        # Example evaluations
-        evals = [
-            RuleEvaluation(
-                rule_name="RuleA", priority=1, preconditions_met=True, was_selected=False, reason=""
-            ),
-            RuleEvaluation(
-                rule_name="RuleB",
-                priority=2,
-                preconditions_met=True,
-                was_selected=True,
-                reason="selected",
-            ),
-            RuleEvaluation(
-                rule_name="RuleC",
-                priority=3,
-                preconditions_met=False,
-                was_selected=False,
-                reason="",
-            ),
-        ]
-
-        # Use previous and current snapshots for diff
         current_snapshot = self.snapshots[-1]
-        before = self.snapshots[-2] if len(self.snapshots) >= 2 else current_snapshot
-        after = current_snapshot
-        diff = compute_diff(before, after)
-
-        trace = RuleTrace(
-            phase="integration",
-            timestamp=timestamp,
-            label=label,
-            evaluations=evals,
-            selected_rule="RuleB",
-            state_before=before,
-            state_after=after,
-            diff=diff,
-        )
-        self.rule_traces.append(trace)
+        if before is None:
+            before = self.snapshots[-2] if len(self.snapshots) >= 2 else current_snapshot
+        diff = compute_diff(before, current_snapshot)
+
+        phases: list[PhaseProfile] = []
+        if self.profiler is not None:
+            new_count = min(
+                len(self.profiler.phases), self.profiler.phase_count - self._traced_phases
+            )
+            if new_count > 0:
+                phases = list(self.profiler.phases)[-new_count:]
+            self._traced_phases = self.profiler.phase_count
+
+        if not phases:
+            self.rule_traces.append(
+                RuleTrace(
+                    phase="integration",
+                    timestamp=timestamp,
+                    label=label,
+                    state_before=before,
+                    state_after=current_snapshot,
+                    diff=diff,
+                )
+            )
+            return
+
+        for profile in phases:
+            trace = RuleTrace.from_phase_profile(profile, timestamp, f"{label} ({profile.phase})")
+            trace.state_before = before
+            trace.state_after = current_snapshot
+            trace.diff = diff
+            self.rule_traces.append(trace)
 
     def display_state(self) -> None:
         """Display current dialogue state using rich visualization."""
@@ -532,32 +547,56 @@ class ScenarioExplorer:
         """Generate HTML report for current state."""
         try:
             from ibdm.visualization.html_export import HtmlExporter
+            from ibdm.visualization.timeline_writer import TimelineWriter
 
             exporter = HtmlExporter()
 
-            # Export snapshot
-            html = exporter.export_snapshot(snapshot)
-            with open(f"state_turn_{snapshot.timestamp}.html", "w") as f:
-                f.write(html)
+            if self.report_dir is None:
+                self.report_dir = Path(tempfile.mkdtemp(prefix="ibdm_report_"))
+
+            # Append the snapshot to the session timeline (one entry per turn)
+            if self._timeline is None:
+                self._timeline = TimelineWriter(
+                    self.report_dir / "timeline",
+                    title=f"Scenario: {self.scenario.name}",
+                    exporter=exporter,
+                )
+            self._timeline.append(snapshot)
 
             # If we have rule traces, try to export the latest one too
             if self.rule_traces:
                 trace = self.rule_traces[-1]
                 trace_html = exporter.export_rule_trace(trace)
-                with open(f"trace_turn_{snapshot.timestamp}.html", "w") as f:
-                    f.write(trace_html)
+                trace_path = self.report_dir / f"trace_turn_{snapshot.timestamp}.html"
+                trace_path.write_text(trace_html, encoding="utf-8")
 
-            print(f"[Visualizer] Generated HTML reports for Turn {snapshot.timestamp}")
+            print(
+                f"[Visualizer] Generated HTML reports for Turn {snapshot.timestamp} "
+                f"in {self.report_dir}"
+            )
         except Exception as e:
             print(f"[Visualizer] Failed to generate HTML report: {e}")
 
+    def close(self) -> None:
+        """Finish the HTML timeline, if one was started."""
+        if self._timeline is not None:
+            self._timeline.close()
+            self._timeline = None
+
+    def __enter__(self) -> "ScenarioExplorer":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def _publish_state(self, snapshot: Any) -> None:
         """Publish state to monitor."""
         try:
-            from ibdm.visualization.monitor import StatePublisher
+            if self._publisher is None:
+                from ibdm.visualization.monitor import StatePublisher
 
-            publisher = StatePublisher()
-            publisher.publish(snapshot)
+                self._publisher = StatePublisher()
+            self._publisher.publish(snapshot)
         except Exception as e:
             print(f"[Visualizer] Failed to publish state: {e}")
 
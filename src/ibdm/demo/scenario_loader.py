@@ -3,11 +3,19 @@
 This module provides a single, clean interface for loading and managing
 all demo scenarios. All scenarios are stored in JSON format in the
 demos/scenarios/ directory.
+
+The loader keeps a catalog of the directory so that large scenario libraries
+are not re-read on every query: parsed scenarios are cached and reused until
+their file's modification time or size changes, the scenario list is reused
+until the directory itself changes, and search_scenarios answers from an
+inverted index over scenario text that is updated only for changed files.
 """
 
 from __future__ import annotations
 
 import json
+import re
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -16,6 +24,14 @@ from ibdm.core import Answer, DialogueMove, WhQuestion
 from ibdm.core.grounding import ActionLevel
 from ibdm.core.moves import Polarity
 
+# Word tokens of the searchable scenario text
+_WORD = re.compile(r"\w+")
+
+# File timestamps advance in clock ticks, so a file changed within this window
+# of being read could change again without its timestamp moving. Such reads
+# are not cached (the same "racy" rule git applies to its index).
+_RACY_WINDOW_NS = 1_000_000_000
+
 
 @dataclass
 class ScenarioTurn:
@@ -227,6 +243,9 @@ class ScenarioLoader:
 
     This class provides the single, canonical way to load scenarios.
     All scenarios are stored in JSON format.
+
+    Loaded scenarios are cached and shared between callers until their file
+    changes, so they must be treated as read-only.
     """
 
     def __init__(self, scenarios_dir: Path | None = None):
@@ -249,15 +268,31 @@ class ScenarioLoader:
         if not self.scenarios_dir.exists():
             raise ValueError(f"Scenarios directory not found: {self.scenarios_dir}")
 
+        # Directory listing, valid while the directory's mtime is unchanged
+        self._scenario_ids: list[str] | None = None
+        self._listed_mtime_ns = 0
+        # Parsed scenarios keyed by ID, with the (mtime_ns, size) they were parsed at
+        self._cache: dict[str, tuple[tuple[int, int], Scenario]] = {}
+        # Inverted index: word token -> IDs of scenarios whose searchable text contains it
+        self._index: dict[str, set[str]] = {}
+        # Indexed scenarios with their lower-cased searchable fields
+        self._indexed: dict[str, tuple[Scenario, list[str]]] = {}
+
     def list_scenarios(self) -> list[str]:
         """List all available scenario IDs.
 
         Returns:
             Sorted list of scenario IDs
         """
-        scenario_files = self.scenarios_dir.glob("*.json")
-        scenario_ids = [f.stem for f in scenario_files]
-        return sorted(scenario_ids)
+        mtime_ns = self.scenarios_dir.stat().st_mtime_ns
+        if self._scenario_ids is None or mtime_ns != self._listed_mtime_ns:
+            scenario_ids = sorted(f.stem for f in self.scenarios_dir.glob("*.json"))
+            if time.time_ns() - mtime_ns > _RACY_WINDOW_NS:
+                self._scenario_ids, self._listed_mtime_ns = scenario_ids, mtime_ns
+            else:
+                self._scenario_ids = None
+            return scenario_ids
+        return list(self._scenario_ids)
 
     def list_scenarios_by_category(self) -> dict[str, list[str]]:
         """List scenarios grouped by category.
@@ -288,6 +323,9 @@ class ScenarioLoader:
     def load_scenario(self, scenario_id: str) -> Scenario:
         """Load a scenario by ID.
 
+        The scenario is parsed once and then served from the cache until its
+        file's modification time or size changes.
+
         Args:
             scenario_id: Scenario identifier (without .json extension)
 
@@ -300,12 +338,39 @@ class ScenarioLoader:
         """
         scenario_path = self.scenarios_dir / f"{scenario_id}.json"
 
-        if not scenario_path.exists():
+        try:
+            stat = scenario_path.stat()
+        except FileNotFoundError:
+            self._cache.pop(scenario_id, None)
             available = ", ".join(self.list_scenarios())
             raise FileNotFoundError(
                 f"Scenario '{scenario_id}' not found.\nAvailable scenarios: {available}"
-            )
+            ) from None
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(scenario_id)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        scenario = self._parse_scenario(scenario_path)
+        if time.time_ns() - stat.st_mtime_ns > _RACY_WINDOW_NS:
+            self._cache[scenario_id] = (signature, scenario)
+        else:
+            self._cache.pop(scenario_id, None)
+        return scenario
+
+    def _parse_scenario(self, scenario_path: Path) -> Scenario:
+        """Read and parse a scenario file.
+
+        Args:
+            scenario_path: Path of the JSON file
+
+        Returns:
+            Parsed Scenario object
 
+        Raises:
+            ValueError: If JSON is invalid or missing required fields
+        """
         try:
             with open(scenario_path) as f:
                 data = json.load(f)
@@ -382,6 +447,12 @@ class ScenarioLoader:
     def search_scenarios(self, query: str) -> list[str]:
         """Search scenarios by keyword.
 
+        Matches scenarios whose ID, title, description, business narrative or
+        Larsson algorithms contain the query. Candidates come from the inverted
+        index: every word of the query must occur inside some indexed word of a
+        matching scenario. Only the candidates are then checked for the full
+        query, and only scenarios whose files changed are re-indexed.
+
         Args:
             query: Search term (case-insensitive)
 
@@ -389,29 +460,68 @@ class ScenarioLoader:
             List of matching scenario IDs
         """
         query_lower = query.lower()
-        matches: list[str] = []
+        self._refresh_index()
+
+        candidates: set[str] | None = None
+        for word in set(_WORD.findall(query_lower)):
+            matching: set[str] = set()
+            for token, scenario_ids in self._index.items():
+                if word in token:
+                    matching |= scenario_ids
+            candidates = matching if candidates is None else candidates & matching
+            if not candidates:
+                return []
+        if candidates is None:
+            # No word characters in the query: check every scenario
+            candidates = set(self._indexed)
+
+        return sorted(
+            scenario_id
+            for scenario_id in candidates
+            if any(query_lower in text for text in self._indexed[scenario_id][1])
+        )
 
-        for scenario_id in self.list_scenarios():
+    def _refresh_index(self) -> None:
+        """Bring the search index up to date with the scenarios directory."""
+        scenario_ids = self.list_scenarios()
+        for scenario_id in set(self._indexed) - set(scenario_ids):
+            self._unindex(scenario_id)
+
+        for scenario_id in scenario_ids:
             try:
                 scenario = self.load_scenario(scenario_id)
-
-                # Search in metadata
-                searchable = [
-                    scenario_id,
-                    scenario.title,
-                    scenario.metadata.description,
-                    scenario.metadata.business_narrative,
-                    " ".join(scenario.metadata.larsson_algorithms),
-                ]
-
-                if any(query_lower in text.lower() for text in searchable):
-                    matches.append(scenario_id)
-
             except Exception:
                 # Skip scenarios that fail to load
+                self._unindex(scenario_id)
                 continue
 
-        return sorted(matches)
+            indexed = self._indexed.get(scenario_id)
+            if indexed is not None and indexed[0] is scenario:
+                continue  # served from the cache, so unchanged since indexing
+            self._unindex(scenario_id)
+
+            searchable = [
+                scenario_id,
+                scenario.title,
+                scenario.metadata.description,
+                scenario.metadata.business_narrative,
+                " ".join(scenario.metadata.larsson_algorithms),
+            ]
+            fields = [text.lower() for text in searchable]
+            self._indexed[scenario_id] = (scenario, fields)
+            for token in {token for text in fields for token in _WORD.findall(text)}:
+                self._index.setdefault(token, set()).add(scenario_id)
+
+    def _unindex(self, scenario_id: str) -> None:
+        """Remove a scenario from the search index."""
+        indexed = self._indexed.pop(scenario_id, None)
+        if indexed is None:
+            return
+        for token in {token for text in indexed[1] for token in _WORD.findall(text)}:
+            scenario_ids = self._index[token]
+            scenario_ids.discard(scenario_id)
+            if not scenario_ids:
+                del self._index[token]
 
     def validate_scenario(self, scenario_id: str) -> tuple[bool, list[str]]:
         """Validate a scenario's structure and content.
@@ -25,23 +25,21 @@ from ibdm.core.actions import Action
 from ibdm.demo.execution_controller import ExecutionController, ExecutionMode
 from ibdm.demo.orchestrator import DemoDialogueOrchestrator
 from ibdm.demo.scenario_loader import Scenario, ScenarioTurn, load_scenario
-from ibdm.demo.state_trace import StateTraceRecorder
+from ibdm.demo.state_trace import StateTraceRecorder, TraceRecord
 from ibdm.domains.legal_domain import get_legal_domain
 from ibdm.domains.nda_domain import get_doc_actions, get_nda_domain
-from ibdm.rules import (
-    RuleSet,
-    create_action_integration_rules,
-    create_action_selection_rules,
-    create_generation_rules,
-    create_integration_rules,
-    create_negotiation_rules,
-    create_negotiation_selection_rules,
-    create_selection_rules,
-)
+from ibdm.engine.image import DIALOGUE_RULE_FACTORIES, build_rule_set
+from ibdm.utils.similarity import text_similarity
 
 if TYPE_CHECKING:
     from ibdm.nlg import NLGEngine
 
+# N-gram similarity above which compare mode skips the LLM judge ("equivalent")
+LEXICAL_EQUIVALENCE_THRESHOLD = 0.9
+
+# N-gram similarity treated as "similar" when the LLM judge is unavailable
+LEXICAL_SIMILARITY_THRESHOLD = 0.5
+
 
 class ScenarioRunner:
     """Runs and displays dialogue scenarios with the real Larsson engine.
@@ -144,21 +142,7 @@ class ScenarioRunner:
             self.nlg_engine = NLGEngine(config)
 
         # Initialize Real Dialogue Engine
-        rules = RuleSet()
-        for rule in create_integration_rules():
-            rules.add_rule(rule)
-        for rule in create_action_integration_rules():
-            rules.add_rule(rule)
-        for rule in create_negotiation_rules():
-            rules.add_rule(rule)
-        for rule in create_selection_rules():
-            rules.add_rule(rule)
-        for rule in create_action_selection_rules():
-            rules.add_rule(rule)
-        for rule in create_negotiation_selection_rules():
-            rules.add_rule(rule)
-        for rule in create_generation_rules():
-            rules.add_rule(rule)
+        rules = build_rule_set(DIALOGUE_RULE_FACTORIES)
 
         self.orchestrator = DemoDialogueOrchestrator(
             agent_id="system",
@@ -193,6 +177,26 @@ class ScenarioRunner:
         if self.trace_recorder is not None:
             self.trace_recorder.flush()
 
+    def run_headless(self) -> list[TraceRecord]:
+        """Run the scenario through the engine without rendering, pauses or NLG.
+
+        Used for batch regression runs: every turn goes through the same
+        engine steps as run(), but nothing is displayed and the controller
+        is not consulted.
+
+        Returns:
+            Trace records, one per turn
+        """
+        if self.trace_recorder is None:
+            self.trace_recorder = StateTraceRecorder()
+
+        for turn in self.scenario.turns:
+            self._advance_engine(turn)
+            self._finish_turn(turn)
+
+        self.trace_recorder.flush()
+        return self.trace_recorder.records
+
     def _display_banner(self) -> None:
         """Display scenario banner with metadata."""
         # Title panel
@@ -242,27 +246,7 @@ class ScenarioRunner:
             turn: Turn to display and execute
         """
         # REAL ENGINE LOGIC: Process through Larsson engine
-        if turn.speaker == "user":
-            # 1. Mock NLU: Create DialogueMove(s) from JSON
-            user_moves = self._create_user_dialogue_move(turn)
-            if not isinstance(user_moves, list):
-                user_moves = [user_moves]
-
-            # 2-3. Integrate and select via orchestrator (Larsson cycle)
-            self.orchestrator.process_user_turn(user_moves)
-
-        elif turn.speaker == "system":
-            # Ensure engine has prepared a system move
-            engine_move = self.orchestrator.ensure_system_move()
-            if engine_move is None:
-                # Fall back to the scripted move to keep the dialogue advancing
-                fallback_move = DialogueMove(
-                    move_type=turn.move_type, content=turn.utterance, speaker="system"
-                )
-                self.console.print(
-                    "[yellow]⚠️  Engine had no system move; using scripted turn[/yellow]"
-                )
-                engine_move = self.orchestrator.use_scripted_system_move(fallback_move)
+        self._advance_engine(turn)
 
         # Determine speaker styling
         if turn.speaker == "user":
@@ -321,6 +305,10 @@ class ScenarioRunner:
                 similarity = comparison["similarity"]
                 confidence = comparison["confidence"]
                 explanation = comparison["explanation"]
+                if comparison.get("method") == "heuristic":
+                    verdict_source = "heuristic, LLM judge unavailable"
+                else:
+                    verdict_source = f"confidence: {confidence}"
 
                 # Display comparison result with color coding
                 if similarity == "equivalent":
@@ -338,7 +326,7 @@ class ScenarioRunner:
 
                 content_parts.append(
                     Text(
-                        f"{icon} SIMILARITY: {similarity.upper()} (confidence: {confidence})",
+                        f"{icon} SIMILARITY: {similarity.upper()} ({verdict_source})",
                         style=sim_style,
                     )
                 )
@@ -435,13 +423,53 @@ class ScenarioRunner:
         )
 
         # After presentation, integrate the system move so state reflects the turn
+        self._finish_turn(turn)
+        if self.show_state_changes:
+            self._verify_state_changes(turn)
+
+    def _advance_engine(self, turn: ScenarioTurn) -> None:
+        """Run the engine up to the point where the turn can be presented.
+
+        User turns are integrated and the next system move selected; system
+        turns make sure a system move is pending (falling back to the scripted
+        move if the engine has none).
+
+        Args:
+            turn: Turn being executed
+        """
+        if turn.speaker == "user":
+            # 1. Mock NLU: Create DialogueMove(s) from JSON
+            user_moves = self._create_user_dialogue_move(turn)
+            if not isinstance(user_moves, list):
+                user_moves = [user_moves]
+
+            # 2-3. Integrate and select via orchestrator (Larsson cycle)
+            self.orchestrator.process_user_turn(user_moves)
+
+        elif turn.speaker == "system":
+            # Ensure engine has prepared a system move
+            engine_move = self.orchestrator.ensure_system_move()
+            if engine_move is None:
+                # Fall back to the scripted move to keep the dialogue advancing
+                fallback_move = DialogueMove(
+                    move_type=turn.move_type, content=turn.utterance, speaker="system"
+                )
+                self.console.print(
+                    "[yellow]⚠️  Engine had no system move; using scripted turn[/yellow]"
+                )
+                self.orchestrator.use_scripted_system_move(fallback_move)
+
+    def _finish_turn(self, turn: ScenarioTurn) -> None:
+        """Integrate the presented system move, apply declared side effects and trace.
+
+        Args:
+            turn: Turn being executed
+        """
         if turn.speaker == "system":
             self.orchestrator.complete_system_turn()
 
         self._apply_declared_state_changes(turn)
         self._record_trace(turn)
-        if self.show_state_changes:
-            self._verify_state_changes(turn)
 
     def _display_summary(self) -> None:
         """Display scenario summary and metrics."""
@@ -745,9 +773,25 @@ class ScenarioRunner:
             scripted: Gold standard scripted text
             nlg_generated: NLG-generated text
 
+        Near-identical texts are judged locally by character n-gram similarity
+        without an LLM call; the same score is the fallback verdict when the
+        LLM judge is unavailable.
+
         Returns:
-            Dictionary with similarity, confidence, and explanation
+            Dictionary with similarity, confidence, and explanation, plus the
+            ``method`` that produced the verdict: ``"ngram"``, ``"llm"``, or
+            ``"heuristic"`` when the LLM judge failed
         """
+        score = text_similarity(scripted, nlg_generated)
+        if score >= LEXICAL_EQUIVALENCE_THRESHOLD:
+            return {
+                "similarity": "equivalent",
+                "confidence": "high",
+                "explanation": f"Near-identical wording (n-gram similarity {score:.2f})",
+                "score": score,
+                "method": "ngram",
+            }
+
         try:
             import litellm
 
@@ -794,6 +838,7 @@ Guidelines (err on "equivalent"/"similar" unless conversation derails):
                 result = json.loads(response_text)  # type: ignore[reportUnknownArgumentType]
                 if not all(k in result for k in ["similarity", "confidence", "explanation"]):
                     raise ValueError("Missing required fields in LLM response")
+                result["method"] = "llm"
                 return result
             except json.JSONDecodeError:
                 # Fallback: extract from text
@@ -807,14 +852,20 @@ Guidelines (err on "equivalent"/"similar" unless conversation derails):
                     "similarity": similarity,
                     "confidence": "medium",
                     "explanation": text_content[:100],
+                    "method": "llm",
                 }
 
         except Exception as exc:
+            similarity = "similar" if score >= LEXICAL_SIMILARITY_THRESHOLD else "different"
             return {
-                "similarity": "error",
+                "similarity": similarity,
                 "confidence": "low",
-                "explanation": f"Comparison failed: {str(exc)[:50]}",
+                "explanation": (
+                    f"LLM judge failed ({str(exc)[:50]}); n-gram similarity {score:.2f}"
+                ),
+                "score": score,
                 "error": str(exc),
+                "method": "heuristic",
             }
 
 
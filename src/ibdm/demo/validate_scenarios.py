@@ -1,14 +1,19 @@
 """Automated scenario validation for all demo scenarios.
 
 Validates that all scenarios reach their payoff states using expected-path-only mode.
-Generates comprehensive validation report.
+Scenarios are explored in parallel across a process pool and the results are
+aggregated into one comprehensive validation report.
 """
 
 from __future__ import annotations
 
+import argparse
 import subprocess
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cache
 from typing import Any
 
 from ibdm.demo.path_explorer import PathExplorer, PathNode
@@ -21,6 +26,13 @@ from ibdm.demo.scenarios import (
 from ibdm.domains.nda_domain import get_nda_domain
 from ibdm.domains.travel_domain import get_travel_domain
 
+# Scenario factories per IBiS category, in report order
+SCENARIO_CATEGORIES: dict[str, Callable[[], list[DemoScenario]]] = {
+    "IBiS-3": get_ibis3_scenarios,
+    "IBiS-2": get_ibis2_scenarios,
+    "IBiS-4": get_ibis4_scenarios,
+}
+
 
 @dataclass
 class ScenarioTestResult:
@@ -150,37 +162,50 @@ def validate_scenario(
     )
 
 
-def validate_all_scenarios() -> list[ScenarioTestResult]:
+@cache
+def _category_scenarios(category: str) -> tuple[DemoScenario, ...]:
+    """Build a category's scenarios once per process."""
+    return tuple(SCENARIO_CATEGORIES[category]())
+
+
+def _validate_task(task: tuple[str, int]) -> ScenarioTestResult:
+    """Validate one scenario, identified by category and position (runs in a worker)."""
+    category, index = task
+    return validate_scenario(_category_scenarios(category)[index], category)
+
+
+def validate_all_scenarios(workers: int | None = None) -> list[ScenarioTestResult]:
     """Validate all demo scenarios.
 
+    Scenarios are explored in parallel, each worker process building the
+    scenario definitions once. Results are returned in category order
+    regardless of which worker finishes first.
+
+    Args:
+        workers: Number of worker processes (default: one per CPU);
+            1 validates serially in this process
+
     Returns:
         List of test results for all scenarios
     """
-    results: list[ScenarioTestResult] = []
-
-    # IBiS-3 scenarios
-    for scenario in get_ibis3_scenarios():
-        print(f"Testing {scenario.name}...")
-        result = validate_scenario(scenario, "IBiS-3")
-        results.append(result)
-        status = "✓" if result.reaches_payoff else "✗"
-        print(f"  {status} {result.demo_quality} - Score: {result.max_score:.1f}")
-
-    # IBiS-2 scenarios
-    for scenario in get_ibis2_scenarios():
-        print(f"Testing {scenario.name}...")
-        result = validate_scenario(scenario, "IBiS-2")
-        results.append(result)
-        status = "✓" if result.reaches_payoff else "✗"
-        print(f"  {status} {result.demo_quality} - Score: {result.max_score:.1f}")
-
-    # IBiS-4 scenarios
-    for scenario in get_ibis4_scenarios():
-        print(f"Testing {scenario.name}...")
-        result = validate_scenario(scenario, "IBiS-4")
-        results.append(result)
-        status = "✓" if result.reaches_payoff else "✗"
-        print(f"  {status} {result.demo_quality} - Score: {result.max_score:.1f}")
+    tasks = [
+        (category, index)
+        for category in SCENARIO_CATEGORIES
+        for index in range(len(_category_scenarios(category)))
+    ]
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers != 1 and len(tasks) > 1 else None
+    try:
+        outcomes = pool.map(_validate_task, tasks) if pool else map(_validate_task, tasks)
+        results: list[ScenarioTestResult] = []
+        for result in outcomes:
+            status = "✓" if result.reaches_payoff else "✗"
+            print(f"Tested {result.scenario_name}...")
+            print(f"  {status} {result.demo_quality} - Score: {result.max_score:.1f}")
+            results.append(result)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
 
     return results
 
@@ -234,7 +259,7 @@ def generate_validation_report(results: list[ScenarioTestResult]) -> str:
     lines.append("")
 
     # Group by category
-    for category in ["IBiS-3", "IBiS-2", "IBiS-4"]:
+    for category in SCENARIO_CATEGORIES:
         category_results = [r for r in results if r.category == category]
         if not category_results:
             continue
@@ -290,15 +315,28 @@ def generate_validation_report(results: list[ScenarioTestResult]) -> str:
     return "\n".join(lines)
 
 
-def main() -> None:
-    """Main entry point for automated validation."""
+def main(argv: list[str] | None = None) -> None:
+    """Main entry point for automated validation.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Validate all demo scenarios")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: one per CPU; 1 runs serially)",
+    )
+    args = parser.parse_args(argv)
+
     print("\n" + "=" * 80)
     print("  AUTOMATED SCENARIO VALIDATION")
     print("=" * 80)
     print()
 
     # Run validation
-    results = validate_all_scenarios()
+    results = validate_all_scenarios(workers=args.workers)
 
     # Generate report
     print("\n" + "=" * 80)
@@ -7,9 +7,13 @@ Each domain provides:
 """
 
 from ibdm.domains.nda_domain import get_nda_domain
+from ibdm.domains.registry import get_domain, install_domain, list_domains
 from ibdm.domains.travel_domain import get_travel_domain
 
 __all__ = [
     "get_nda_domain",
     "get_travel_domain",
+    "get_domain",
+    "install_domain",
+    "list_domains",
 ]
@@ -2,7 +2,7 @@
 
 Demonstrates RAG pattern for legal question answering:
 - Query formulation from user questions
-- Document retrieval (mocked with realistic legal documents)
+- Document retrieval (BM25 over a small collection of legal authorities)
 - Relevance filtering (some relevant, some not)
 - Answer synthesis from retrieved documents
 
@@ -11,12 +11,13 @@ like "what is the controlling law?" and the system retrieves and presents
 relevant legal information.
 """
 
-from typing import Any, cast
+from typing import Any
 
 from ibdm.core.actions import Action, Proposition
 from ibdm.core.domain import DomainModel
 from ibdm.core.plans import Plan
 from ibdm.core.questions import WhQuestion
+from ibdm.retrieval import BM25Index, Document, RetrievalDevice, relevance_ranked
 
 
 def create_legal_domain() -> DomainModel:
@@ -73,8 +74,7 @@ def create_legal_domain() -> DomainModel:
     domain.register_precond_function("query_legal_database", _check_query_legal_database_precond)
     domain.register_postcond_function("query_legal_database", _query_legal_database_postcond)
 
-    # Note: Action executor (_execute_rag_query) is called directly from demo scripts
-    # Domain model doesn't have register_action_executor method yet
+    # The executor (_execute_rag_query) is served by create_legal_rag_device()
 
     return domain
 
@@ -191,18 +191,125 @@ def _query_legal_database_postcond(action: Action) -> list[Proposition]:
     ]
 
 
-def _execute_rag_query(action: Action, state: Any) -> dict[str, Any]:
-    """Execute RAG query (MOCKED implementation showing the pattern).
+# ============================================================================
+# Legal Document Collection
+# ============================================================================
+
+#: Built-in legal authorities indexed for query_legal_database
+LEGAL_DOCUMENTS: tuple[dict[str, Any], ...] = (
+    {
+        "doc_id": "CAL_CIVIL_CODE_1646",
+        "title": "California Civil Code § 1646 - Choice of Law",
+        "content": (
+            "A contract is to be interpreted according to the law and usage "
+            "of the place where it is to be performed; or, if it does not "
+            "indicate a place of performance, according to the law and usage "
+            "of the place where it is made."
+        ),
+        "jurisdiction": "California",
+        "tags": ["choice_of_law", "governing_law", "contract_interpretation"],
+    },
+    {
+        "doc_id": "DEL_CODE_T6_2708",
+        "title": "Delaware Code Title 6 § 2708 - Governing Law",
+        "content": (
+            "The parties may choose the law that will govern their contract. "
+            "If they do not choose, the law of the state with the most "
+            "significant relationship to the transaction governs."
+        ),
+        "jurisdiction": "Delaware",
+        "tags": ["choice_of_law", "governing_law", "party_autonomy"],
+    },
+    {
+        "doc_id": "NY_GEN_OBLIG_5_1401",
+        "title": "New York General Obligations Law § 5-1401 - Choice of Law",
+        "content": (
+            "The parties to any contract may agree that the law of New York "
+            "shall govern their rights and duties in whole or in part. "
+            "Such an agreement is valid if the contract involves at least $250,000."
+        ),
+        "jurisdiction": "New York",
+        "tags": ["choice_of_law", "governing_law", "minimum_amount"],
+    },
+    {
+        "doc_id": "RESTATEMENT_2D_CONTRACTS_187",
+        "title": "Restatement (Second) of Contracts § 187 - Law of State Chosen by Parties",
+        "content": (
+            "The law of the state chosen by the parties to govern their "
+            "contractual rights and duties will be applied, except where "
+            "the chosen state has no substantial relationship to the parties "
+            "or the transaction."
+        ),
+        "jurisdiction": "General",
+        "tags": ["choice_of_law", "governing_law", "restatement"],
+    },
+    {
+        "doc_id": "CAL_LAB_CODE_2802",
+        "title": "California Labor Code § 2802 - Employer Reimbursement",
+        "content": (
+            "An employer shall indemnify their employee for all necessary "
+            "expenditures or losses incurred by the employee in direct "
+            "consequence of the discharge of their duties."
+        ),
+        "jurisdiction": "California",
+        "tags": ["employment", "reimbursement", "labor_law"],
+    },
+)
+
+#: Number of documents retrieved per query
+RAG_TOP_K = 5
+
+#: Documents scoring at least this fraction of the top hit count as relevant
+RELEVANCE_THRESHOLD = 0.5
+
+#: Documents must contain at least this fraction of the query terms to count as relevant
+MIN_QUERY_COVERAGE = 0.5
+
+_legal_index: BM25Index | None = None
+
+
+def get_legal_index() -> BM25Index:
+    """Get or build the BM25 index over LEGAL_DOCUMENTS.
+
+    Returns:
+        Shared in-memory index
+    """
+    global _legal_index
+    if _legal_index is None:
+        _legal_index = BM25Index.from_documents(Document.from_dict(doc) for doc in LEGAL_DOCUMENTS)
+    return _legal_index
+
+
+def create_legal_rag_device(index: BM25Index | None = None) -> RetrievalDevice:
+    """Create a device serving query_legal_database from a BM25 index.
+
+    Args:
+        index: Index to serve, e.g. one built offline from a document directory
+            and opened with BM25Index.load() (default: index over LEGAL_DOCUMENTS)
+
+    Returns:
+        RetrievalDevice to install as the "device_interface" belief
+    """
+    device = RetrievalDevice(domain=get_legal_domain())
+    device.register("query_legal_database", index or get_legal_index(), _execute_rag_query)
+    return device
+
+
+def _execute_rag_query(
+    action: Action, state: Any, index: BM25Index | None = None
+) -> dict[str, Any]:
+    """Execute RAG query against the legal document index.
 
     This demonstrates the RAG pattern:
     1. Query formulation from user's legal question
-    2. Document retrieval (returns multiple documents)
+    2. Document retrieval (BM25 top-k over the legal collection)
     3. Relevance scoring (some relevant, some not)
     4. Answer synthesis from relevant documents
 
     Args:
         action: query_legal_database action with query parameters
         state: Current information state
+        index: Index to search (default: index over LEGAL_DOCUMENTS)
 
     Returns:
         Dictionary with retrieved documents and synthesized answer
@@ -212,85 +319,14 @@ def _execute_rag_query(action: Action, state: Any) -> dict[str, Any]:
     jurisdiction = action.parameters.get("jurisdiction", "unknown")
     legal_question = action.parameters.get("legal_question", "unknown")
 
-    # Mock document database
-    mock_legal_documents = [
-        {
-            "doc_id": "CAL_CIVIL_CODE_1646",
-            "title": "California Civil Code § 1646 - Choice of Law",
-            "content": (
-                "A contract is to be interpreted according to the law and usage "
-                "of the place where it is to be performed; or, if it does not "
-                "indicate a place of performance, according to the law and usage "
-                "of the place where it is made."
-            ),
-            "jurisdiction": "California",
-            "relevance_score": 0.95
-            if jurisdiction.lower() == "california" and "governing_law" in legal_question.lower()
-            else 0.3,
-            "tags": ["choice_of_law", "governing_law", "contract_interpretation"],
-        },
-        {
-            "doc_id": "DEL_CODE_T6_2708",
-            "title": "Delaware Code Title 6 § 2708 - Governing Law",
-            "content": (
-                "The parties may choose the law that will govern their contract. "
-                "If they do not choose, the law of the state with the most "
-                "significant relationship to the transaction governs."
-            ),
-            "jurisdiction": "Delaware",
-            "relevance_score": 0.92
-            if jurisdiction.lower() == "delaware" and "governing_law" in legal_question.lower()
-            else 0.25,
-            "tags": ["choice_of_law", "governing_law", "party_autonomy"],
-        },
-        {
-            "doc_id": "NY_GEN_OBLIG_5_1401",
-            "title": "New York General Obligations Law § 5-1401 - Choice of Law",
-            "content": (
-                "The parties to any contract may agree that the law of New York "
-                "shall govern their rights and duties in whole or in part. "
-                "Such an agreement is valid if the contract involves at least $250,000."
-            ),
-            "jurisdiction": "New York",
-            "relevance_score": 0.90
-            if jurisdiction.lower() == "new york" and "governing_law" in legal_question.lower()
-            else 0.20,
-            "tags": ["choice_of_law", "governing_law", "minimum_amount"],
-        },
-        {
-            "doc_id": "RESTATEMENT_2D_CONTRACTS_187",
-            "title": "Restatement (Second) of Contracts § 187 - Law of State Chosen by Parties",
-            "content": (
-                "The law of the state chosen by the parties to govern their "
-                "contractual rights and duties will be applied, except where "
-                "the chosen state has no substantial relationship to the parties "
-                "or the transaction."
-            ),
-            "jurisdiction": "General",
-            "relevance_score": 0.88 if "governing_law" in legal_question.lower() else 0.15,
-            "tags": ["choice_of_law", "governing_law", "restatement"],
-        },
-        {
-            "doc_id": "CAL_LAB_CODE_2802",
-            "title": "California Labor Code § 2802 - Employer Reimbursement",
-            "content": (
-                "An employer shall indemnify their employee for all necessary "
-                "expenditures or losses incurred by the employee in direct "
-                "consequence of the discharge of their duties."
-            ),
-            "jurisdiction": "California",
-            "relevance_score": 0.10,  # Not relevant to governing law questions
-            "tags": ["employment", "reimbursement", "labor_law"],
-        },
-    ]
-
-    # Filter and rank documents by relevance
-    relevant_threshold = 0.5
-    retrieved_docs = sorted(
-        mock_legal_documents, key=lambda d: cast(float, d["relevance_score"]), reverse=True
-    )
+    # Retrieve and rank documents on the question; jurisdiction filters relevance
+    query = " ".join(term for term in (legal_question, contract_type) if term != "unknown")
+    hits = (index or get_legal_index()).search(query, top_k=RAG_TOP_K)
+    retrieved_docs = relevance_ranked(hits, MIN_QUERY_COVERAGE)
     relevant_docs = [
-        doc for doc in retrieved_docs if cast(float, doc["relevance_score"]) >= relevant_threshold
+        doc
+        for doc in retrieved_docs
+        if doc["relevance_score"] >= RELEVANCE_THRESHOLD and _applies_in(doc, jurisdiction)
     ]
 
     # Synthesize answer from relevant documents
@@ -319,6 +355,16 @@ def _execute_rag_query(action: Action, state: Any) -> dict[str, Any]:
     }
 
 
+def _applies_in(doc: dict[str, Any], jurisdiction: str) -> bool:
+    """Check whether a document's authority covers the queried jurisdiction."""
+    doc_jurisdiction = str(doc.get("jurisdiction", "General"))
+    return (
+        jurisdiction == "unknown"
+        or doc_jurisdiction == "General"
+        or doc_jurisdiction.lower() == jurisdiction.lower()
+    )
+
+
 def _synthesize_answer_from_docs(
     docs: list[dict[str, Any]], question: str, jurisdiction: str
 ) -> str:
@@ -9,12 +9,13 @@ This domain model provides semantic grounding for:
 - Jurisdiction selection (governing law)
 """
 
-from typing import Any, cast
+from typing import Any
 
 from ibdm.core.actions import Action, ActionType, Proposition
 from ibdm.core.domain import DomainModel
 from ibdm.core.plans import Plan
 from ibdm.core.questions import AltQuestion, WhQuestion
+from ibdm.retrieval import BM25Index, Document, RetrievalDevice, relevance_ranked
 
 
 def create_nda_domain() -> DomainModel:
@@ -509,101 +510,127 @@ def _query_nda_guidance_postcond(action: Action) -> list[Proposition]:
     ]
 
 
-def execute_nda_rag_query(action: Action, state: Any) -> dict[str, Any]:
-    """Execute RAG query for NDA guidance (MOCKED implementation).
+#: Built-in NDA drafting guidance indexed for query_nda_guidance
+NDA_GUIDANCE_DOCUMENTS: tuple[dict[str, Any], ...] = (
+    {
+        "doc_id": "NDA_BP_001",
+        "title": "Standard Confidentiality Periods - Industry Survey 2024",
+        "content": (
+            "Based on a survey of 500 NDAs across tech, finance, and healthcare sectors: "
+            "• 2-3 years: 45% (most common for general business relationships) "
+            "• 5 years: 35% (common for strategic partnerships) "
+            "• 7-10 years: 15% (trade secrets and highly sensitive IP) "
+            "• Perpetual: 5% (rare, mainly for truly permanent secrets)"
+        ),
+        "source": "LegalTech Industry Report 2024",
+        "tags": ["duration", "confidentiality_period", "best_practices"],
+    },
+    {
+        "doc_id": "NDA_BP_002",
+        "title": "Choosing Between Mutual and One-Way NDAs",
+        "content": (
+            "Mutual NDAs (both parties protect information): "
+            "• Use when: Both parties will share confidential information "
+            "• Common scenarios: Strategic partnerships, M&A discussions, joint ventures "
+            "One-Way NDAs (only one party protects): "
+            "• Use when: Only one party shares sensitive information "
+            "• Common scenarios: Vendor relationships, employment, consultants"
+        ),
+        "source": "Practical Law Company",
+        "tags": ["nda_type", "mutual_vs_oneway", "selection_criteria"],
+    },
+    {
+        "doc_id": "NDA_BP_003",
+        "title": "Jurisdiction Selection for NDAs",
+        "content": (
+            "Key considerations for choosing governing law: "
+            "• Delaware: Business-friendly, well-established corporate law "
+            "• California: Strong employee protections, limits on non-competes "
+            "• New York: Preferred for financial transactions "
+            "• General rule: Choose jurisdiction where primary business occurs "
+            "or where enforcement is most likely needed"
+        ),
+        "source": "American Bar Association Guide",
+        "tags": ["jurisdiction", "governing_law", "enforcement"],
+    },
+    {
+        "doc_id": "NDA_BP_004",
+        "title": "Standard Exclusions in NDAs",
+        "content": (
+            "Information typically excluded from confidentiality obligations: "
+            "• Public domain information (at time of disclosure or later) "
+            "• Information independently developed "
+            "• Information lawfully received from third parties "
+            "• Information disclosed with written permission "
+            "• Information required by law to be disclosed"
+        ),
+        "source": "Model NDA Templates Collection",
+        "tags": ["exclusions", "standard_terms", "carve_outs"],
+    },
+)
+
+#: Number of guidance documents retrieved per query
+RAG_TOP_K = 4
+
+#: Documents scoring at least this fraction of the top hit count as relevant
+RELEVANCE_THRESHOLD = 0.5
+
+#: Documents must contain at least this fraction of the query terms to count as relevant
+MIN_QUERY_COVERAGE = 0.5
+
+_nda_guidance_index: BM25Index | None = None
+
+
+def get_nda_guidance_index() -> BM25Index:
+    """Get or build the BM25 index over NDA_GUIDANCE_DOCUMENTS.
+
+    Returns:
+        Shared in-memory index
+    """
+    global _nda_guidance_index
+    if _nda_guidance_index is None:
+        _nda_guidance_index = BM25Index.from_documents(
+            Document.from_dict(doc) for doc in NDA_GUIDANCE_DOCUMENTS
+        )
+    return _nda_guidance_index
+
+
+def create_nda_rag_device(index: BM25Index | None = None) -> RetrievalDevice:
+    """Create a device serving query_nda_guidance from a BM25 index.
+
+    Args:
+        index: Index to serve, e.g. a clause library built offline and opened
+            with BM25Index.load() (default: index over NDA_GUIDANCE_DOCUMENTS)
+
+    Returns:
+        RetrievalDevice to install as the "device_interface" belief
+    """
+    device = RetrievalDevice(domain=get_nda_domain())
+    device.register("query_nda_guidance", index or get_nda_guidance_index(), execute_nda_rag_query)
+    return device
+
+
+def execute_nda_rag_query(
+    action: Action, state: Any, index: BM25Index | None = None
+) -> dict[str, Any]:
+    """Execute RAG query for NDA guidance against the guidance index.
 
     Retrieves best practices, standard terms, and guidance for NDA drafting.
 
     Args:
         action: query_nda_guidance action with topic
         state: Current information state
+        index: Index to search (default: index over NDA_GUIDANCE_DOCUMENTS)
 
     Returns:
         Dictionary with retrieved documents and synthesized guidance
     """
     topic = action.parameters.get("topic", "unknown")
 
-    # Mock NDA guidance database
-    mock_nda_guidance_docs = [
-        {
-            "doc_id": "NDA_BP_001",
-            "title": "Standard Confidentiality Periods - Industry Survey 2024",
-            "content": (
-                "Based on a survey of 500 NDAs across tech, finance, and healthcare sectors: "
-                "• 2-3 years: 45% (most common for general business relationships) "
-                "• 5 years: 35% (common for strategic partnerships) "
-                "• 7-10 years: 15% (trade secrets and highly sensitive IP) "
-                "• Perpetual: 5% (rare, mainly for truly permanent secrets)"
-            ),
-            "source": "LegalTech Industry Report 2024",
-            "relevance_score": 0.95
-            if "duration" in topic.lower() or "period" in topic.lower()
-            else 0.2,
-            "tags": ["duration", "confidentiality_period", "best_practices"],
-        },
-        {
-            "doc_id": "NDA_BP_002",
-            "title": "Choosing Between Mutual and One-Way NDAs",
-            "content": (
-                "Mutual NDAs (both parties protect information): "
-                "• Use when: Both parties will share confidential information "
-                "• Common scenarios: Strategic partnerships, M&A discussions, joint ventures "
-                "One-Way NDAs (only one party protects): "
-                "• Use when: Only one party shares sensitive information "
-                "• Common scenarios: Vendor relationships, employment, consultants"
-            ),
-            "source": "Practical Law Company",
-            "relevance_score": 0.90
-            if "type" in topic.lower() or "mutual" in topic.lower()
-            else 0.15,
-            "tags": ["nda_type", "mutual_vs_oneway", "selection_criteria"],
-        },
-        {
-            "doc_id": "NDA_BP_003",
-            "title": "Jurisdiction Selection for NDAs",
-            "content": (
-                "Key considerations for choosing governing law: "
-                "• Delaware: Business-friendly, well-established corporate law "
-                "• California: Strong employee protections, limits on non-competes "
-                "• New York: Preferred for financial transactions "
-                "• General rule: Choose jurisdiction where primary business occurs "
-                "or where enforcement is most likely needed"
-            ),
-            "source": "American Bar Association Guide",
-            "relevance_score": 0.88
-            if "jurisdiction" in topic.lower() or "law" in topic.lower()
-            else 0.10,
-            "tags": ["jurisdiction", "governing_law", "enforcement"],
-        },
-        {
-            "doc_id": "NDA_BP_004",
-            "title": "Standard Exclusions in NDAs",
-            "content": (
-                "Information typically excluded from confidentiality obligations: "
-                "• Public domain information (at time of disclosure or later) "
-                "• Information independently developed "
-                "• Information lawfully received from third parties "
-                "• Information disclosed with written permission "
-                "• Information required by law to be disclosed"
-            ),
-            "source": "Model NDA Templates Collection",
-            "relevance_score": 0.85
-            if "exclusion" in topic.lower() or "standard" in topic.lower()
-            else 0.05,
-            "tags": ["exclusions", "standard_terms", "carve_outs"],
-        },
-    ]
-
-    # Filter and rank by relevance
-    relevant_threshold = 0.5
-    retrieved_docs = sorted(
-        mock_nda_guidance_docs,
-        key=lambda d: cast(float, d["relevance_score"]),
-        reverse=True,
-    )
-    relevant_docs = [
-        doc for doc in retrieved_docs if cast(float, doc["relevance_score"]) >= relevant_threshold
-    ]
+    # Retrieve and rank by relevance
+    hits = (index or get_nda_guidance_index()).search(topic, top_k=RAG_TOP_K)
+    retrieved_docs = relevance_ranked(hits, MIN_QUERY_COVERAGE)
+    relevant_docs = [doc for doc in retrieved_docs if doc["relevance_score"] >= RELEVANCE_THRESHOLD]
 
     # Synthesize guidance
     if relevant_docs:
@@ -0,0 +1,63 @@
+"""Registry of the built-in domains by name.
+
+Maps DomainModel.name to the domain's singleton accessor, so code that only
+knows a domain's name (serialized states, worker processes, CLI flags) can get
+the shared instance.
+"""
+
+from collections.abc import Callable
+from types import ModuleType
+
+from ibdm.core import DomainModel
+from ibdm.domains import legal_domain, nda_domain, travel_domain
+
+# name -> (defining module, singleton attribute, accessor)
+_DOMAINS: dict[str, tuple[ModuleType, str, Callable[[], DomainModel]]] = {
+    "nda_drafting": (nda_domain, "_nda_domain", nda_domain.get_nda_domain),
+    "travel_booking": (travel_domain, "_travel_domain", travel_domain.get_travel_domain),
+    "legal_consultation": (legal_domain, "_legal_domain", legal_domain.get_legal_domain),
+}
+
+
+def list_domains() -> list[str]:
+    """List the names of the built-in domains.
+
+    Returns:
+        Domain names, sorted
+    """
+    return sorted(_DOMAINS)
+
+
+def get_domain(name: str) -> DomainModel:
+    """Get a built-in domain singleton by name.
+
+    Args:
+        name: DomainModel.name (e.g. "nda_drafting")
+
+    Returns:
+        The domain singleton
+
+    Raises:
+        ValueError: If no built-in domain has that name
+    """
+    if name not in _DOMAINS:
+        raise ValueError(f"Unknown domain {name!r}; expected one of {list_domains()}")
+    return _DOMAINS[name][2]()
+
+
+def install_domain(domain: DomainModel) -> None:
+    """Make a domain instance the process-wide singleton for its name.
+
+    Used when a prebuilt domain arrives in a process by pickling, so that
+    get_nda_domain() and friends return it instead of building another copy.
+
+    Args:
+        domain: Domain to install
+
+    Raises:
+        ValueError: If the domain's name is not a built-in domain
+    """
+    if domain.name not in _DOMAINS:
+        raise ValueError(f"Unknown domain {domain.name!r}; expected one of {list_domains()}")
+    module, attribute, _ = _DOMAINS[domain.name]
+    setattr(module, attribute, domain)
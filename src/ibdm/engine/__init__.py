@@ -2,14 +2,53 @@
 
 This module provides the core dialogue processing engine that orchestrates
 the IBDM control loop, including NLU-enhanced interpretation.
+
+The NLU-enhanced engine, the prebuilt engine image and the prefork worker
+pool are loaded on first use, so rule-only deployments importing
+DialogueMoveEngine do not pay for the NLU stack and litellm.
 """
 
+from typing import TYPE_CHECKING
+
 from ibdm.engine.dialogue_engine import DialogueMoveEngine
-from ibdm.engine.nlu_engine import NLUDialogueEngine, NLUEngineConfig, create_nlu_engine
+from ibdm.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from ibdm.engine.image import (
+        EngineImage,
+        build_engine_image,
+        get_engine_image,
+        set_engine_image,
+    )
+    from ibdm.engine.nlu_engine import NLUDialogueEngine, NLUEngineConfig, create_nlu_engine
+    from ibdm.engine.prefork import DialogueResult, WorkerPool, run_dialogue
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "NLUDialogueEngine": "ibdm.engine.nlu_engine",
+        "NLUEngineConfig": "ibdm.engine.nlu_engine",
+        "create_nlu_engine": "ibdm.engine.nlu_engine",
+        "EngineImage": "ibdm.engine.image",
+        "build_engine_image": "ibdm.engine.image",
+        "get_engine_image": "ibdm.engine.image",
+        "set_engine_image": "ibdm.engine.image",
+        "DialogueResult": "ibdm.engine.prefork",
+        "WorkerPool": "ibdm.engine.prefork",
+        "run_dialogue": "ibdm.engine.prefork",
+    },
+)
 
 __all__ = [
     "DialogueMoveEngine",
     "NLUDialogueEngine",
     "NLUEngineConfig",
     "create_nlu_engine",
+    "EngineImage",
+    "build_engine_image",
+    "get_engine_image",
+    "set_engine_image",
+    "DialogueResult",
+    "WorkerPool",
+    "run_dialogue",
 ]
@@ -60,6 +60,8 @@ class DialogueMoveEngine:
         logger.info(
             f"Processing input from {speaker}: {utterance[:50]}{'...' if len(utterance) > 50 else ''}"
         )
+        if self.rules.profiler is not None:
+            self.rules.profiler.begin_turn()
 
         # 1. Interpretation: utterance → dialogue moves
         logger.debug("[INTERPRET] Starting interpretation phase")
@@ -0,0 +1,268 @@
+"""Prebuilt, immutable engine image shared by dialogue workers.
+
+An EngineImage holds everything a dialogue worker needs that does not change
+between dialogues: the compiled rule set, the domain registry and, optionally,
+the NLU prompt templates and structured-output schemas. Build it once in a
+parent process; forked workers inherit it copy-on-write, and it pickles to a
+process pool when workers are spawned instead (see ibdm.engine.prefork).
+
+Example:
+    >>> image = build_engine_image()
+    >>> engine = image.create_engine()
+    >>> state = image.create_initial_state("nda_drafting")
+    >>> state, response = engine.process_input("I need to draft an NDA", "user", state)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import logging
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from ibdm.core import DomainModel, InformationState
+from ibdm.domains.registry import get_domain, install_domain, list_domains
+from ibdm.engine.dialogue_engine import DialogueMoveEngine
+from ibdm.rules import (
+    FrozenRuleSet,
+    RuleSet,
+    UpdateRule,
+    create_action_integration_rules,
+    create_action_selection_rules,
+    create_generation_rules,
+    create_integration_rules,
+    create_interpretation_rules,
+    create_negotiation_rules,
+    create_negotiation_selection_rules,
+    create_selection_rules,
+)
+
+if TYPE_CHECKING:
+    from ibdm.nlu.prompts import PromptTemplate
+
+logger = logging.getLogger(__name__)
+
+RuleFactory = Callable[[], list[UpdateRule]]
+
+#: Integration, selection and generation rules (as used by ScenarioRunner)
+DIALOGUE_RULE_FACTORIES: tuple[RuleFactory, ...] = (
+    create_integration_rules,
+    create_action_integration_rules,
+    create_negotiation_rules,
+    create_selection_rules,
+    create_action_selection_rules,
+    create_negotiation_selection_rules,
+    create_generation_rules,
+)
+
+#: Full pipeline including rule-based interpretation of raw utterances
+DEFAULT_RULE_FACTORIES: tuple[RuleFactory, ...] = (
+    create_interpretation_rules,
+    *DIALOGUE_RULE_FACTORIES,
+)
+
+#: Pydantic models used with LLMAdapter.call_structured, as "module:Class"
+STRUCTURED_RESPONSE_MODELS: tuple[str, ...] = (
+    "ibdm.nlg.nlg_result:StructuredNLGResponse",
+    "ibdm.nlu.answer_parser:AnswerAnalysis",
+    "ibdm.nlu.dialogue_act_classifier:DialogueActResult",
+    "ibdm.nlu.entity_extractor:EntityExtractionResult",
+    "ibdm.nlu.question_analyzer:QuestionAnalysis",
+    "ibdm.nlu.semantic_parser:SemanticParse",
+    "ibdm.nlu.task_classifier:TaskClassificationResult",
+)
+
+
+def build_rule_set(factories: Iterable[RuleFactory] = DEFAULT_RULE_FACTORIES) -> RuleSet:
+    """Build a mutable rule set from rule factories, sorting each phase once.
+
+    Args:
+        factories: Functions returning lists of update rules
+
+    Returns:
+        RuleSet containing every rule from the factories
+    """
+    rules = RuleSet()
+    rules.add_rules(rule for factory in factories for rule in factory())
+    return rules
+
+
+@dataclass(frozen=True)
+class EngineImage:
+    """Immutable bundle of prebuilt engine resources.
+
+    Attributes:
+        rules: Compiled, frozen rule set shared by every engine
+        domains: Domain models by name
+        templates: NLU prompt templates by name (empty unless built with NLU)
+        schemas: Structured-output schema instructions by model name (empty
+            unless built with NLU)
+        agent_id: System agent ID for engines created from the image
+        build_seconds: Wall-clock time spent building the image
+    """
+
+    rules: FrozenRuleSet
+    domains: Mapping[str, DomainModel]
+    templates: Mapping[str, PromptTemplate]
+    schemas: Mapping[str, str]
+    agent_id: str = "system"
+    build_seconds: float = 0.0
+
+    def fingerprint(self) -> str:
+        """Content hash of the image's rules, domains and agent ID.
+
+        Returns:
+            Hex digest combining RuleSet.fingerprint() and each domain's
+            DomainModel.fingerprint()
+        """
+        parts = [f"agent:{self.agent_id}", f"rules:{self.rules.fingerprint()}"]
+        parts.extend(
+            f"domain:{name}:{self.domains[name].fingerprint()}" for name in sorted(self.domains)
+        )
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def domain(self, name: str) -> DomainModel:
+        """Get a domain from the image.
+
+        Args:
+            name: Domain name
+
+        Returns:
+            The image's domain model
+
+        Raises:
+            KeyError: If the image does not contain the domain
+        """
+        if name not in self.domains:
+            raise KeyError(f"Domain {name!r} not in engine image; have {sorted(self.domains)}")
+        return self.domains[name]
+
+    def create_engine(self) -> DialogueMoveEngine:
+        """Create a dialogue engine sharing the image's rule set.
+
+        Returns:
+            DialogueMoveEngine using the frozen rules
+        """
+        return DialogueMoveEngine(agent_id=self.agent_id, rules=self.rules)
+
+    def create_initial_state(self, domain: str) -> InformationState:
+        """Create an initial dialogue state with a domain attached.
+
+        Args:
+            domain: Domain name
+
+        Returns:
+            Fresh InformationState whose beliefs reference the domain
+        """
+        model = self.domain(domain)
+        state = InformationState(agent_id=self.agent_id)
+        state.private.beliefs["domain"] = model
+        state.private.beliefs["domain_model"] = model
+        return state
+
+    def install(self) -> None:
+        """Make this image the process's source of domains and schemas.
+
+        Installs the image's domains as the domain singletons and primes the
+        schema cache. Needed after unpickling an image in a spawned process;
+        forked workers already share the parent's singletons.
+        """
+        for model in self.domains.values():
+            install_domain(model)
+        if self.schemas:
+            _prime_schema_cache()
+
+
+def _structured_models() -> list[Any]:
+    models: list[Any] = []
+    for target in STRUCTURED_RESPONSE_MODELS:
+        module_name, _, class_name = target.partition(":")
+        models.append(getattr(importlib.import_module(module_name), class_name))
+    return models
+
+
+def _prime_schema_cache() -> dict[str, str]:
+    from ibdm.nlu.llm_adapter import schema_instruction
+
+    return {model.__name__: schema_instruction(model) for model in _structured_models()}
+
+
+def build_engine_image(
+    factories: Sequence[RuleFactory] = DEFAULT_RULE_FACTORIES,
+    domains: Sequence[str] | None = None,
+    include_nlu: bool = False,
+    agent_id: str = "system",
+) -> EngineImage:
+    """Build an engine image.
+
+    Args:
+        factories: Rule factories to compile into the frozen rule set
+        domains: Domain names to include (default: all built-in domains)
+        include_nlu: Also load prompt templates and precompute structured-output
+            schemas (imports the NLU stack and pydantic)
+        agent_id: System agent ID
+
+    Returns:
+        The built EngineImage
+    """
+    start = time.perf_counter()
+    rules = build_rule_set(factories).freeze()
+    models = {name: get_domain(name) for name in (domains or list_domains())}
+
+    templates: dict[str, PromptTemplate] = {}
+    schemas: dict[str, str] = {}
+    if include_nlu:
+        from ibdm.nlu.prompts import TEMPLATE_REGISTRY
+
+        templates = dict(TEMPLATE_REGISTRY)
+        schemas = _prime_schema_cache()
+
+    image = EngineImage(
+        rules=rules,
+        domains=models,
+        templates=templates,
+        schemas=schemas,
+        agent_id=agent_id,
+        build_seconds=time.perf_counter() - start,
+    )
+    logger.info(
+        f"Built engine image: {rules.rule_count()} rules, {len(models)} domains, "
+        f"{len(templates)} templates in {image.build_seconds * 1000:.1f}ms"
+    )
+    return image
+
+
+_default_image: EngineImage | None = None
+
+
+def get_engine_image() -> EngineImage:
+    """Get the process-wide default engine image, building it on first use.
+
+    The default image has the full rule pipeline and every built-in domain,
+    without the NLU stack.
+
+    Returns:
+        Shared EngineImage
+    """
+    global _default_image
+    if _default_image is None:
+        _default_image = build_engine_image()
+    return _default_image
+
+
+def set_engine_image(image: EngineImage | None) -> EngineImage | None:
+    """Replace the process-wide default engine image.
+
+    Args:
+        image: Image to install (None to rebuild lazily on next use)
+
+    Returns:
+        The previously installed image
+    """
+    global _default_image
+    previous = _default_image
+    _default_image = image
+    return previous
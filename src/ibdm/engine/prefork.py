@@ -0,0 +1,194 @@
+"""Prefork worker pool serving dialogues off a shared EngineImage.
+
+The parent builds (or reuses) an EngineImage before starting the workers.
+With the "fork" start method the workers inherit it copy-on-write, so
+spin-up costs nothing beyond the fork itself; with "spawn" the image is
+pickled once per worker and installed in the child.
+
+Example:
+    >>> image = build_engine_image(domains=["nda_drafting"])
+    >>> with WorkerPool(image, workers=4) as pool:
+    ...     results = pool.run_dialogues([("nda_drafting", ["I need to draft an NDA"])] * 100)
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from ibdm.engine.image import EngineImage
+
+logger = logging.getLogger(__name__)
+
+J = TypeVar("J")
+R = TypeVar("R")
+
+#: Speaker ID for user turns in served dialogues
+USER_ID = "user"
+
+# Image served by this worker process (inherited on fork, installed on spawn)
+_worker_image: EngineImage | None = None
+
+
+@dataclass
+class DialogueResult:
+    """Outcome of one dialogue served by a worker.
+
+    Attributes:
+        domain: Domain name
+        responses: System response text per user turn (None when the system
+            did not respond)
+        commitments: Shared commitments at the end of the dialogue, sorted
+        seconds: Wall-clock time spent on the dialogue
+        worker_pid: Process that served the dialogue
+    """
+
+    domain: str
+    responses: list[str | None] = field(default_factory=lambda: [])
+    commitments: list[str] = field(default_factory=lambda: [])
+    seconds: float = 0.0
+    worker_pid: int = 0
+
+
+def run_dialogue(image: EngineImage, job: tuple[str, Sequence[str]]) -> DialogueResult:
+    """Run one scripted dialogue through an engine built from the image.
+
+    Args:
+        image: Engine image
+        job: Tuple of (domain name, user utterances)
+
+    Returns:
+        DialogueResult for the dialogue
+    """
+    domain, utterances = job
+    start = time.perf_counter()
+    engine = image.create_engine()
+    state = image.create_initial_state(domain)
+
+    result = DialogueResult(domain=domain, worker_pid=os.getpid())
+    for utterance in utterances:
+        state, response = engine.process_input(utterance, USER_ID, state)
+        result.responses.append(str(response.content) if response is not None else None)
+
+    result.commitments = sorted(state.shared.commitments)
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def _init_worker(image: EngineImage | None) -> None:
+    """Worker initializer: adopt the pickled image, or keep the inherited one."""
+    global _worker_image
+    if image is not None:
+        image.install()
+        _worker_image = image
+    if _worker_image is None:
+        raise RuntimeError("Worker started without an engine image")
+
+
+def _call_in_worker(task: tuple[Callable[[EngineImage, Any], Any], Any]) -> Any:
+    handler, job = task
+    assert _worker_image is not None
+    return handler(_worker_image, job)
+
+
+def _ping(_: int) -> int:
+    return os.getpid()
+
+
+class WorkerPool:
+    """Pool of worker processes that serve jobs off one EngineImage."""
+
+    def __init__(
+        self, image: EngineImage, workers: int | None = None, start_method: str | None = None
+    ):
+        """Initialize the pool (processes start on start() or entering the context).
+
+        Args:
+            image: Engine image to serve
+            workers: Number of worker processes (default: CPU count)
+            start_method: "fork" or "spawn" (default: fork where available)
+        """
+        self.image = image
+        self.workers = workers or os.cpu_count() or 1
+        if start_method is None:
+            methods = multiprocessing.get_all_start_methods()
+            start_method = "fork" if "fork" in methods else "spawn"
+        self.start_method = start_method
+        self.spin_up_seconds = 0.0
+        self._executor: ProcessPoolExecutor | None = None
+
+    def start(self) -> float:
+        """Start the workers and wait until they are serving.
+
+        Returns:
+            Seconds from launch until every worker answered
+        """
+        global _worker_image
+        if self._executor is not None:
+            return self.spin_up_seconds
+
+        start = time.perf_counter()
+        if self.start_method == "fork":
+            # Children inherit the image through the module global, nothing is pickled
+            _worker_image = self.image
+            initargs: tuple[EngineImage | None] = (None,)
+        else:
+            initargs = (self.image,)
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context(self.start_method),
+            initializer=_init_worker,
+            initargs=initargs,
+        )
+        pids = set(self._executor.map(_ping, range(self.workers)))
+        self.spin_up_seconds = time.perf_counter() - start
+        logger.info(
+            f"Started {self.workers} {self.start_method} workers "
+            f"({len(pids)} answered) in {self.spin_up_seconds * 1000:.1f}ms"
+        )
+        return self.spin_up_seconds
+
+    def map(self, handler: Callable[[EngineImage, J], R], jobs: Iterable[J]) -> list[R]:
+        """Run a handler over jobs in the workers.
+
+        Args:
+            handler: Module-level function (image, job) -> result
+            jobs: Jobs to distribute
+
+        Returns:
+            Results in job order
+        """
+        self.start()
+        assert self._executor is not None
+        return list(self._executor.map(_call_in_worker, [(handler, job) for job in jobs]))
+
+    def run_dialogues(self, dialogues: Iterable[tuple[str, Sequence[str]]]) -> list[DialogueResult]:
+        """Serve scripted dialogues.
+
+        Args:
+            dialogues: (domain name, user utterances) per dialogue
+
+        Returns:
+            DialogueResult per dialogue, in order
+        """
+        return self.map(run_dialogue, dialogues)
+
+    def close(self) -> None:
+        """Shut the workers down."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> WorkerPool:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -23,7 +23,13 @@ from ibdm.core import (
 )
 from ibdm.core.domain import DomainModel
 from ibdm.nlg.nlg_result import NLGResult, StructuredNLGResponse
-from ibdm.nlu.llm_adapter import LLMAdapter, LLMConfig, ModelType
+from ibdm.nlu.context_builder import (
+    ContextBudget,
+    ContextBuilder,
+    format_move,
+    format_move_content,
+)
+from ibdm.nlu.llm_adapter import LLMAdapter, LLMConfig, ModelType, get_default_backend
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +46,8 @@ class NLGEngineConfig:
         temperature: LLM temperature for generation
         verbose_logging: Whether to enable verbose console logging (default: False)
         use_structured_output: Whether to use structured LLM responses (default: True)
+        context_token_budget: Estimated token budget for the dialogue context in
+            LLM prompts (see ContextBuilder)
     """
 
     default_strategy: str = "plan_aware"
@@ -49,6 +57,7 @@ class NLGEngineConfig:
     temperature: float = 0.7
     verbose_logging: bool = False
     use_structured_output: bool = True
+    context_token_budget: int = 600
 
 
 class NLGEngine:
@@ -80,16 +89,21 @@ class NLGEngine:
             config: NLG configuration (uses defaults if None)
         """
         self.config = config or NLGEngineConfig()
+        self.context_builder = ContextBuilder(
+            ContextBudget(max_tokens=self.config.context_token_budget)
+        )
 
         # Initialize LLM adapter if using LLM strategy
         self.llm_adapter: LLMAdapter | None = None
-        if self.config.default_strategy == "llm" and os.getenv("IBDM_API_KEY"):
+        backend = get_default_backend()
+        offline_backend = backend is not None and not backend.requires_api_key
+        if self.config.default_strategy == "llm" and (os.getenv("IBDM_API_KEY") or offline_backend):
             llm_config = LLMConfig(
                 model=self.config.llm_model,
                 temperature=self.config.temperature,
                 max_tokens=500,  # NLG responses should be concise
             )
-            self.llm_adapter = LLMAdapter(llm_config)
+            self.llm_adapter = LLMAdapter(llm_config, component="nlg")
             logger.info(f"Initialized NLG engine with LLM strategy ({self.config.llm_model.value})")
         else:
             logger.info(f"Initialized NLG engine with {self.config.default_strategy} strategy")
@@ -258,9 +272,13 @@ class NLGEngine:
             text, rule = self._generate_template(move, state)
             return (text, rule, 0, None)
 
-        # Build prompt based on move type and context
-        system_prompt = self._build_nlg_system_prompt(move, state)
+        # Stable instructions go in the system prompt so the provider can cache them;
+        # dialogue context and the move itself vary per call and go in the user prompt
+        system_prompt = self._build_nlg_system_prompt()
         user_prompt = self._build_nlg_user_prompt(move, state)
+        context = self._build_nlg_context(state, move)
+        if context:
+            user_prompt = f"{context}\n\n{user_prompt}"
 
         # Optional verbose tracing
         if self.config.verbose_logging:
@@ -354,25 +372,8 @@ class NLGEngine:
         if not recent_moves:
             return "(no prior dialogue)"
 
-        lines: list[str] = []
-        for i, move in enumerate(recent_moves, 1):
-            # Format: "User: ask - What is your name?"
-            speaker = move.speaker.capitalize()
-            move_type = move.move_type
-
-            # Extract readable content
-            content_str = self._format_move_content_for_history(move.content)
-
-            # Add grounding status if available (useful context)
-            grounding_info = ""
-            if move.metadata.get("grounding_status"):
-                status = move.metadata["grounding_status"]
-                if status != "grounded":  # Only show non-grounded states
-                    grounding_info = f" [{status}]"
-
-            lines.append(f"{i}. {speaker}: {move_type} - {content_str}{grounding_info}")
-
-        return "\n".join(lines)
+        # Format: "1. User: ask - What is your name?"
+        return "\n".join(f"{i}. {format_move(move)}" for i, move in enumerate(recent_moves, 1))
 
     def _format_move_content_for_history(self, content: Any) -> str:
         """Format move content for dialogue history display.
@@ -383,34 +384,18 @@ class NLGEngine:
         Returns:
             Formatted string representation
         """
-        # Handle different content types
-        if isinstance(content, (WhQuestion, YNQuestion, AltQuestion)):
-            return str(content)
-        elif isinstance(content, Answer):
-            return f"{content.content}"
-        elif isinstance(content, str):
-            # Limit string length
-            if len(content) > 80:
-                return content[:77] + "..."
-            return content
-        else:
-            # Generic string conversion with length limit
-            content_str = str(content)
-            if len(content_str) > 80:
-                return content_str[:77] + "..."
-            return content_str
+        return format_move_content(content)
 
-    def _build_nlg_system_prompt(self, move: DialogueMove, state: InformationState) -> str:
+    def _build_nlg_system_prompt(self) -> str:
         """Build system prompt for NLG LLM call.
 
-        Args:
-            move: Dialogue move
-            state: Information state
+        The system prompt holds no dialogue state, so it is identical on every
+        call and forms the cacheable prompt prefix.
 
         Returns:
             System prompt string
         """
-        base_prompt = (
+        return (
             "You are a natural language generation system for a dialogue management system. "
             "Generate natural, professional responses based on dialogue moves and context. "
             "Whenever the move metadata or dialogue history shows that a question was accommodated, "
@@ -421,23 +406,21 @@ class NLGEngine:
             "explain why it matters for mission success, and give a precise next action."
         )
 
-        # Add dialogue history for context
-        if state.shared.moves:
-            history_str = self._format_dialogue_history(state.shared.moves)
-            base_prompt += f"\n\nDialogue history:\n{history_str}"
+    def _build_nlg_context(self, state: InformationState, move: DialogueMove | None = None) -> str:
+        """Build the dialogue context block for the NLG user prompt.
 
-        # Add context from state
-        if state.shared.qud:
-            qud_str = ", ".join(str(q) for q in state.shared.qud[-3:])  # Last 3 questions
-            base_prompt += f"\n\nCurrent questions under discussion: {qud_str}"
+        The most relevant questions under discussion, recent moves, commitments
+        and active plans are packed into config.context_token_budget, so the
+        prompt stays bounded however long the dialogue runs.
 
-        if state.private.plan:
-            active_plans = [p for p in state.private.plan if p.is_active()]
-            if active_plans:
-                plan_str = ", ".join(p.plan_type for p in active_plans)
-                base_prompt += f"\n\nActive plans: {plan_str}"
+        Args:
+            state: Information state
+            move: Move being generated (focuses the selection)
 
-        return base_prompt
+        Returns:
+            Context text (empty string if there is no context)
+        """
+        return self.context_builder.build(state, move).text
 
     def _build_nlg_user_prompt(self, move: DialogueMove, state: InformationState) -> str:
         """Build user prompt for NLG LLM call.
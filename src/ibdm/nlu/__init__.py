@@ -2,6 +2,8 @@
 
 This module provides LLM-based natural language understanding capabilities including:
 - LLM adapter interface for unified model access
+- Record/replay LLM backends for offline runs and load testing
+- Per-call cost and latency telemetry with pluggable sinks
 - Prompt templates for NLU tasks
 - Semantic parsing
 - Dialogue act classification
@@ -10,114 +12,260 @@ This module provides LLM-based natural language understanding capabilities inclu
 - Context-aware interpretation pipeline
 - Implicature detection and topic tracking
 - Entity extraction and reference resolution
-"""
 
-from ibdm.nlu.answer_parser import (
-    AnswerAnalysis,
-    AnswerParser,
-    AnswerParserConfig,
-    AnswerType,
-)
-from ibdm.nlu.answer_parser import (
-    create_parser as create_answer_parser,
-)
+Submodules are imported on first access to one of their names (PEP 562), so
+importing one NLU component loads only the modules it needs. litellm itself is
+imported on the first live LLM call.
+"""
 
-# Import base NLU service interface
-from ibdm.nlu.base_nlu_service import (  # noqa: I001
-    ActionRequest,
-    AmbiguityInfo,
-    BaseNLUService,
-    ExtractedFact,
-    MultiFact,
-    NLUConfidence,
-    RequestType,
-    UserPreference,
-)
-from ibdm.nlu.context_interpreter import (
-    ContextInterpreter,
-    ContextInterpreterConfig,
-    ContextualInterpretation,
-    ImplicatureType,
-    TopicShiftType,
-    create_interpreter,
-)
-from ibdm.nlu.dialogue_act_classifier import (
-    DialogueActClassifier,
-    DialogueActClassifierConfig,
-    DialogueActResult,
-    DialogueActType,
-    create_classifier,
-)
-from ibdm.nlu.entity_extractor import (
-    Entity,
-    EntityExtractionResult,
-    EntityExtractor,
-    EntityExtractorConfig,
-    EntityTracker,
-    EntityTrackerConfig,
-    EntityType,
-    create_extractor,
-    create_tracker,
-)
-from ibdm.nlu.llm_adapter import (
-    LLMAdapter,
-    LLMAPIError,
-    LLMConfig,
-    LLMError,
-    LLMParsingError,
-    LLMResponse,
-    ModelType,
-    create_adapter,
-)
-from ibdm.nlu.nlu_context import NLUContext
+from typing import TYPE_CHECKING
 
-# Import at end to avoid circular import with nlu_engine
-from ibdm.nlu.nlu_engine import NLUEngine, NLUEngineConfig, create_nlu_engine  # noqa: E402, I001
+from ibdm.utils.lazy_imports import lazy_exports
 
-# Import nlu_result first (nlu_engine import moved to end to avoid circular import)
-from ibdm.nlu.nlu_result import NLUResult  # noqa: I001
+if TYPE_CHECKING:
+    from ibdm.nlu.answer_parser import (
+        AnswerAnalysis,
+        AnswerParser,
+        AnswerParserConfig,
+        AnswerType,
+    )
+    from ibdm.nlu.answer_parser import create_parser as create_answer_parser
+    from ibdm.nlu.answer_prefetch import AnswerPrefetch
+    from ibdm.nlu.base_nlu_service import (
+        ActionRequest,
+        AmbiguityInfo,
+        BaseNLUService,
+        ExtractedFact,
+        MultiFact,
+        NLUConfidence,
+        RequestType,
+        UserPreference,
+    )
+    from ibdm.nlu.context_builder import (
+        BuiltContext,
+        ContextBudget,
+        ContextBuilder,
+        estimate_tokens,
+    )
+    from ibdm.nlu.context_interpreter import (
+        ContextInterpreter,
+        ContextInterpreterConfig,
+        ContextualInterpretation,
+        ImplicatureType,
+        TopicShiftType,
+        create_interpreter,
+    )
+    from ibdm.nlu.dialogue_act_classifier import (
+        DialogueActClassifier,
+        DialogueActClassifierConfig,
+        DialogueActResult,
+        DialogueActType,
+        create_classifier,
+    )
+    from ibdm.nlu.entity_extractor import (
+        Entity,
+        EntityExtractionResult,
+        EntityExtractor,
+        EntityExtractorConfig,
+        EntityTracker,
+        EntityTrackerConfig,
+        EntityType,
+        create_extractor,
+        create_tracker,
+    )
+    from ibdm.nlu.llm_adapter import (
+        LiteLLMBackend,
+        LLMAdapter,
+        LLMAPIError,
+        LLMBackend,
+        LLMConfig,
+        LLMError,
+        LLMParsingError,
+        LLMRequest,
+        LLMResponse,
+        ModelType,
+        create_adapter,
+        get_default_backend,
+        set_default_backend,
+    )
+    from ibdm.nlu.llm_cassette import (
+        Cassette,
+        CassetteEntry,
+        CassetteMissError,
+        RecordingBackend,
+        ReplayBackend,
+        ReplayConfig,
+    )
+    from ibdm.nlu.llm_telemetry import (
+        CallAggregate,
+        JSONLSink,
+        LLMCallEvent,
+        LLMTelemetry,
+        MemorySink,
+        PrometheusSink,
+        TelemetrySink,
+        get_telemetry,
+        set_telemetry,
+        telemetry_session,
+    )
+    from ibdm.nlu.model_router import ModelRouter, RoutingPolicy, TaskRoutingStats
+    from ibdm.nlu.nlu_context import NLUContext
+    from ibdm.nlu.nlu_engine import (
+        NLUEngine,
+        NLUEngineConfig,
+        create_nlu_engine,
+    )
+    from ibdm.nlu.nlu_result import NLUResult
+    from ibdm.nlu.nlu_service_adapter import (
+        NLUServiceAdapter,
+        create_nlu_service,
+    )
+    from ibdm.nlu.prompts import (
+        Example,
+        PromptParts,
+        PromptTemplate,
+        create_answer_parsing_template,
+        create_dialogue_act_template,
+        create_entity_extraction_template,
+        create_question_understanding_template,
+        create_reference_resolution_template,
+        create_semantic_parsing_template,
+        get_template,
+        list_templates,
+    )
+    from ibdm.nlu.question_analyzer import (
+        QuestionAnalysis,
+        QuestionAnalyzer,
+        QuestionAnalyzerConfig,
+        QuestionType,
+        create_analyzer,
+    )
+    from ibdm.nlu.reference_resolver import (
+        Reference,
+        ReferenceResolution,
+        ReferenceResolver,
+        ReferenceResolverConfig,
+        ReferenceType,
+        create_resolver,
+    )
+    from ibdm.nlu.semantic_parser import (
+        SemanticArgument,
+        SemanticModifier,
+        SemanticParse,
+        SemanticParser,
+        SemanticParserConfig,
+    )
+    from ibdm.nlu.semantic_parser import create_parser as create_semantic_parser
 
-# Import NLU service adapter
-from ibdm.nlu.nlu_service_adapter import (  # noqa: I001, E402
-    NLUServiceAdapter,
-    create_nlu_service,
-)
-from ibdm.nlu.prompts import (
-    Example,
-    PromptTemplate,
-    create_answer_parsing_template,
-    create_dialogue_act_template,
-    create_entity_extraction_template,
-    create_question_understanding_template,
-    create_reference_resolution_template,
-    create_semantic_parsing_template,
-    get_template,
-    list_templates,
-)
-from ibdm.nlu.question_analyzer import (
-    QuestionAnalysis,
-    QuestionAnalyzer,
-    QuestionAnalyzerConfig,
-    QuestionType,
-    create_analyzer,
-)
-from ibdm.nlu.reference_resolver import (
-    Reference,
-    ReferenceResolution,
-    ReferenceResolver,
-    ReferenceResolverConfig,
-    ReferenceType,
-    create_resolver,
-)
-from ibdm.nlu.semantic_parser import (
-    SemanticArgument,
-    SemanticModifier,
-    SemanticParse,
-    SemanticParser,
-    SemanticParserConfig,
-)
-from ibdm.nlu.semantic_parser import (
-    create_parser as create_semantic_parser,
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AnswerAnalysis": "ibdm.nlu.answer_parser",
+        "AnswerParser": "ibdm.nlu.answer_parser",
+        "AnswerParserConfig": "ibdm.nlu.answer_parser",
+        "AnswerType": "ibdm.nlu.answer_parser",
+        "create_answer_parser": "ibdm.nlu.answer_parser:create_parser",
+        "AnswerPrefetch": "ibdm.nlu.answer_prefetch",
+        "ActionRequest": "ibdm.nlu.base_nlu_service",
+        "AmbiguityInfo": "ibdm.nlu.base_nlu_service",
+        "BaseNLUService": "ibdm.nlu.base_nlu_service",
+        "ExtractedFact": "ibdm.nlu.base_nlu_service",
+        "MultiFact": "ibdm.nlu.base_nlu_service",
+        "NLUConfidence": "ibdm.nlu.base_nlu_service",
+        "RequestType": "ibdm.nlu.base_nlu_service",
+        "UserPreference": "ibdm.nlu.base_nlu_service",
+        "BuiltContext": "ibdm.nlu.context_builder",
+        "ContextBudget": "ibdm.nlu.context_builder",
+        "ContextBuilder": "ibdm.nlu.context_builder",
+        "estimate_tokens": "ibdm.nlu.context_builder",
+        "ContextInterpreter": "ibdm.nlu.context_interpreter",
+        "ContextInterpreterConfig": "ibdm.nlu.context_interpreter",
+        "ContextualInterpretation": "ibdm.nlu.context_interpreter",
+        "ImplicatureType": "ibdm.nlu.context_interpreter",
+        "TopicShiftType": "ibdm.nlu.context_interpreter",
+        "create_interpreter": "ibdm.nlu.context_interpreter",
+        "DialogueActClassifier": "ibdm.nlu.dialogue_act_classifier",
+        "DialogueActClassifierConfig": "ibdm.nlu.dialogue_act_classifier",
+        "DialogueActResult": "ibdm.nlu.dialogue_act_classifier",
+        "DialogueActType": "ibdm.nlu.dialogue_act_classifier",
+        "create_classifier": "ibdm.nlu.dialogue_act_classifier",
+        "Entity": "ibdm.nlu.entity_extractor",
+        "EntityExtractionResult": "ibdm.nlu.entity_extractor",
+        "EntityExtractor": "ibdm.nlu.entity_extractor",
+        "EntityExtractorConfig": "ibdm.nlu.entity_extractor",
+        "EntityTracker": "ibdm.nlu.entity_extractor",
+        "EntityTrackerConfig": "ibdm.nlu.entity_extractor",
+        "EntityType": "ibdm.nlu.entity_extractor",
+        "create_extractor": "ibdm.nlu.entity_extractor",
+        "create_tracker": "ibdm.nlu.entity_extractor",
+        "LiteLLMBackend": "ibdm.nlu.llm_adapter",
+        "LLMAdapter": "ibdm.nlu.llm_adapter",
+        "LLMAPIError": "ibdm.nlu.llm_adapter",
+        "LLMBackend": "ibdm.nlu.llm_adapter",
+        "LLMConfig": "ibdm.nlu.llm_adapter",
+        "LLMError": "ibdm.nlu.llm_adapter",
+        "LLMParsingError": "ibdm.nlu.llm_adapter",
+        "LLMRequest": "ibdm.nlu.llm_adapter",
+        "LLMResponse": "ibdm.nlu.llm_adapter",
+        "ModelType": "ibdm.nlu.llm_adapter",
+        "create_adapter": "ibdm.nlu.llm_adapter",
+        "get_default_backend": "ibdm.nlu.llm_adapter",
+        "set_default_backend": "ibdm.nlu.llm_adapter",
+        "Cassette": "ibdm.nlu.llm_cassette",
+        "CassetteEntry": "ibdm.nlu.llm_cassette",
+        "CassetteMissError": "ibdm.nlu.llm_cassette",
+        "RecordingBackend": "ibdm.nlu.llm_cassette",
+        "ReplayBackend": "ibdm.nlu.llm_cassette",
+        "ReplayConfig": "ibdm.nlu.llm_cassette",
+        "CallAggregate": "ibdm.nlu.llm_telemetry",
+        "JSONLSink": "ibdm.nlu.llm_telemetry",
+        "LLMCallEvent": "ibdm.nlu.llm_telemetry",
+        "LLMTelemetry": "ibdm.nlu.llm_telemetry",
+        "MemorySink": "ibdm.nlu.llm_telemetry",
+        "PrometheusSink": "ibdm.nlu.llm_telemetry",
+        "TelemetrySink": "ibdm.nlu.llm_telemetry",
+        "get_telemetry": "ibdm.nlu.llm_telemetry",
+        "set_telemetry": "ibdm.nlu.llm_telemetry",
+        "telemetry_session": "ibdm.nlu.llm_telemetry",
+        "ModelRouter": "ibdm.nlu.model_router",
+        "RoutingPolicy": "ibdm.nlu.model_router",
+        "TaskRoutingStats": "ibdm.nlu.model_router",
+        "NLUContext": "ibdm.nlu.nlu_context",
+        "NLUEngine": "ibdm.nlu.nlu_engine",
+        "NLUEngineConfig": "ibdm.nlu.nlu_engine",
+        "create_nlu_engine": "ibdm.nlu.nlu_engine",
+        "NLUResult": "ibdm.nlu.nlu_result",
+        "NLUServiceAdapter": "ibdm.nlu.nlu_service_adapter",
+        "create_nlu_service": "ibdm.nlu.nlu_service_adapter",
+        "Example": "ibdm.nlu.prompts",
+        "PromptParts": "ibdm.nlu.prompts",
+        "PromptTemplate": "ibdm.nlu.prompts",
+        "create_answer_parsing_template": "ibdm.nlu.prompts",
+        "create_dialogue_act_template": "ibdm.nlu.prompts",
+        "create_entity_extraction_template": "ibdm.nlu.prompts",
+        "create_question_understanding_template": "ibdm.nlu.prompts",
+        "create_reference_resolution_template": "ibdm.nlu.prompts",
+        "create_semantic_parsing_template": "ibdm.nlu.prompts",
+        "get_template": "ibdm.nlu.prompts",
+        "list_templates": "ibdm.nlu.prompts",
+        "QuestionAnalysis": "ibdm.nlu.question_analyzer",
+        "QuestionAnalyzer": "ibdm.nlu.question_analyzer",
+        "QuestionAnalyzerConfig": "ibdm.nlu.question_analyzer",
+        "QuestionType": "ibdm.nlu.question_analyzer",
+        "create_analyzer": "ibdm.nlu.question_analyzer",
+        "Reference": "ibdm.nlu.reference_resolver",
+        "ReferenceResolution": "ibdm.nlu.reference_resolver",
+        "ReferenceResolver": "ibdm.nlu.reference_resolver",
+        "ReferenceResolverConfig": "ibdm.nlu.reference_resolver",
+        "ReferenceType": "ibdm.nlu.reference_resolver",
+        "create_resolver": "ibdm.nlu.reference_resolver",
+        "SemanticArgument": "ibdm.nlu.semantic_parser",
+        "SemanticModifier": "ibdm.nlu.semantic_parser",
+        "SemanticParse": "ibdm.nlu.semantic_parser",
+        "SemanticParser": "ibdm.nlu.semantic_parser",
+        "SemanticParserConfig": "ibdm.nlu.semantic_parser",
+        "create_semantic_parser": "ibdm.nlu.semantic_parser:create_parser",
+    },
 )
 
 __all__ = [
@@ -142,8 +290,36 @@ __all__ = [
     "LLMParsingError",
     "ModelType",
     "create_adapter",
+    # LLM telemetry
+    "CallAggregate",
+    "JSONLSink",
+    "LLMCallEvent",
+    "LLMTelemetry",
+    "MemorySink",
+    "PrometheusSink",
+    "TelemetrySink",
+    "get_telemetry",
+    "set_telemetry",
+    "telemetry_session",
+    # Adaptive model routing
+    "ModelRouter",
+    "RoutingPolicy",
+    "TaskRoutingStats",
+    # LLM Backends (live, record/replay)
+    "LLMBackend",
+    "LLMRequest",
+    "LiteLLMBackend",
+    "get_default_backend",
+    "set_default_backend",
+    "Cassette",
+    "CassetteEntry",
+    "CassetteMissError",
+    "RecordingBackend",
+    "ReplayBackend",
+    "ReplayConfig",
     # Prompt Templates
     "Example",
+    "PromptParts",
     "PromptTemplate",
     "create_answer_parsing_template",
     "create_dialogue_act_template",
@@ -178,6 +354,8 @@ __all__ = [
     "AnswerAnalysis",
     "AnswerType",
     "create_answer_parser",
+    # Speculative answer prefetch
+    "AnswerPrefetch",
     # Context Interpreter
     "ContextInterpreter",
     "ContextInterpreterConfig",
@@ -185,6 +363,11 @@ __all__ = [
     "ImplicatureType",
     "TopicShiftType",
     "create_interpreter",
+    # Context Builder
+    "ContextBuilder",
+    "ContextBudget",
+    "BuiltContext",
+    "estimate_tokens",
     # Entity Extraction and Tracking
     "Entity",
     "EntityExtractor",
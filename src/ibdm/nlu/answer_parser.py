@@ -107,7 +107,7 @@ class AnswerParser:
             max_tokens=2000,
         )
 
-        self.llm = LLMAdapter(llm_config)
+        self.llm = LLMAdapter(llm_config, component="answer_parser")
         self.template = get_template("answer_parsing")
         self.template.include_reasoning = self.config.include_reasoning
 
@@ -133,15 +133,16 @@ class AnswerParser:
         input_text = f'Question: "{question_text}"\nAnswer: "{answer_text}"'
 
         # Format the prompt
-        system_prompt, user_prompt = self.template.format(
-            input_text=input_text, include_examples=True
-        )
+        prompt = self.template.render(input_text=input_text, include_examples=True)
 
         logger.debug(f"Parsing answer: Q='{question_text}' A='{answer_text}'")
 
         # Call LLM with structured output
         result = self.llm.call_structured(
-            prompt=user_prompt, response_model=AnswerAnalysis, system_prompt=system_prompt
+            prompt=prompt.suffix,
+            response_model=AnswerAnalysis,
+            system_prompt=prompt.system,
+            prompt_prefix=prompt.prefix,
         )
 
         logger.info(
@@ -166,14 +167,15 @@ class AnswerParser:
         """
         input_text = f'Question: "{question_text}"\nAnswer: "{answer_text}"'
 
-        system_prompt, user_prompt = self.template.format(
-            input_text=input_text, include_examples=True
-        )
+        prompt = self.template.render(input_text=input_text, include_examples=True)
 
         logger.debug(f"Async parsing answer: Q='{question_text}' A='{answer_text}'")
 
         result = await self.llm.acall_structured(
-            prompt=user_prompt, response_model=AnswerAnalysis, system_prompt=system_prompt
+            prompt=prompt.suffix,
+            response_model=AnswerAnalysis,
+            system_prompt=prompt.system,
+            prompt_prefix=prompt.prefix,
         )
 
         logger.info(
@@ -0,0 +1,175 @@
+"""Speculative NLU for replies to the system's own questions.
+
+When the system asks a question, the user's next utterance is almost always
+an answer to it, and for alternative questions, yes/no questions and
+wh-questions over an enumerated sort the possible answers are known before
+the user types. AnswerPrefetch is computed from the question while the system
+utterance is being rendered and sent: every expected value is expanded through
+a few short reply templates ("mutual", "mutual please", "the mutual one") into
+a table mapping each normalized reply to the answer it carries. If the reply
+is in the table, the nlu stage returns an answer NLUResult straight from it
+and integration starts without an LLM call; anything else falls through to
+the NLU engine.
+
+Only exact (normalized) matches are accepted, so a speculative result never
+replaces an interpretation the engine would have made differently for an
+unexpected reply.
+
+Example:
+    >>> prefetch = AnswerPrefetch.for_question(
+    ...     AltQuestion(alternatives=["mutual", "one-way"], predicate="nda_type")
+    ... )
+    >>> prefetch.match("Mutual, please!").answer_content
+    {'content': 'mutual', 'answer_type': 'direct'}
+    >>> prefetch.match("What is the difference?") is None
+    True
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from ibdm.core.answers import Answer
+from ibdm.core.domain import DomainModel
+from ibdm.core.questions import AltQuestion, Question, WhQuestion, YNQuestion
+from ibdm.nlu.nlu_result import NLUResult
+from ibdm.utils.similarity import normalize_text
+
+#: Reply templates each expected value is expanded through ("{}" is the value)
+REPLY_TEMPLATES = (
+    "{}",
+    "{} please",
+    "the {} one",
+    "{} is fine",
+    "i think {}",
+    "lets go with {}",
+    "i d like {}",
+)
+
+#: Replies predicted for yes/no questions, by answer content
+YES_NO_REPLIES = {
+    "yes": ("yes", "yes please", "yeah", "yep", "sure", "correct", "that s right"),
+    "no": ("no", "no thanks", "no thank you", "nope", "not really"),
+}
+
+#: Most sort individuals expanded for a wh-question
+MAX_PREDICTED_VALUES = 200
+
+#: Confidence reported on a speculative NLUResult
+PREDICTED_CONFIDENCE = 0.95
+
+
+def expected_values(question: Question, domain: DomainModel | None = None) -> list[str]:
+    """Answer values a reply to the question is likely to carry.
+
+    Args:
+        question: Question the system is asking
+        domain: Domain supplying sorts for wh-question predicates
+
+    Returns:
+        Alternatives for an AltQuestion, "yes"/"no" for a YNQuestion, the
+        individuals of the predicate's sort for a WhQuestion (empty if the
+        domain does not enumerate them)
+    """
+    if isinstance(question, AltQuestion):
+        return list(question.alternatives)
+    if isinstance(question, YNQuestion):
+        return list(YES_NO_REPLIES)
+    if isinstance(question, WhQuestion) and domain is not None:
+        sort_name = question.predicate
+        spec = domain.predicates.get(question.predicate)
+        if spec is not None and spec.arg_types:
+            sort_name = spec.arg_types[0]
+        return list(domain.sorts.get(sort_name, []))[:MAX_PREDICTED_VALUES]
+    return []
+
+
+@dataclass
+class AnswerPrefetch:
+    """Prepared NLU results for the expected replies to one question.
+
+    Attributes:
+        question: The question (serialized as a dict)
+        predictions: Normalized reply text -> answer value it carries
+    """
+
+    question: dict[str, Any]
+    predictions: dict[str, str] = field(default_factory=lambda: {})
+
+    @classmethod
+    def for_question(cls, question: Question, domain: DomainModel | None = None) -> AnswerPrefetch:
+        """Predict the replies to a question.
+
+        Args:
+            question: Question the system is asking
+            domain: Domain supplying sorts for wh-question predicates
+
+        Returns:
+            AnswerPrefetch (with no predictions if the answers are open-ended)
+        """
+        predictions: dict[str, str] = {}
+        if isinstance(question, YNQuestion):
+            for value, replies in YES_NO_REPLIES.items():
+                for reply in replies:
+                    predictions.setdefault(reply, value)
+        else:
+            for value in expected_values(question, domain):
+                for template in REPLY_TEMPLATES:
+                    predictions.setdefault(normalize_text(template.format(value)), value)
+        return cls(question=question.to_dict(), predictions=predictions)
+
+    def answers(self) -> list[Answer]:
+        """Candidate Answer objects, one per expected value."""
+        question = Question.from_dict(self.question)
+        values = dict.fromkeys(self.predictions.values())
+        return [Answer(content=value, question_ref=question) for value in values]
+
+    def match(self, utterance: str) -> NLUResult | None:
+        """Look up the prepared NLU result for a reply.
+
+        Args:
+            utterance: User utterance
+
+        Returns:
+            NLUResult for an expected reply, else None
+        """
+        start_time = time.time()
+        reply = normalize_text(utterance)
+        value = self.predictions.get(reply)
+        if value is None:
+            return None
+        return NLUResult(
+            dialogue_act="answer",
+            confidence=PREDICTED_CONFIDENCE,
+            answer_content={"content": value, "answer_type": "direct"},
+            raw_interpretation={"speculative": True, "question": self.question, "reply": reply},
+            latency=time.time() - start_time,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dict for Burr state storage.
+
+        Returns:
+            Dictionary representation suitable for JSON serialization
+        """
+        return {
+            "question": self.question,
+            "predictions": self.predictions,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> AnswerPrefetch:
+        """Create from dict loaded from Burr state.
+
+        Args:
+            data: Dictionary representation
+
+        Returns:
+            AnswerPrefetch instance
+        """
+        return cls(
+            question=data["question"],
+            predictions=data.get("predictions", {}),
+        )
@@ -0,0 +1,410 @@
+"""Token-budgeted dialogue context for NLU and NLG prompts.
+
+Prompts that dump every commitment, the whole QUD stack and the full move
+history grow with dialogue length and domain size. ContextBuilder instead
+turns the information state into small fragments (questions under
+discussion, recent moves, commitments, active plans), ranks them by
+relevance to the top QUD and the move being generated, and packs the best
+ones into a fixed token budget:
+
+- the top QUD always ranks first, lower QUD entries decay with depth
+- commitments on focus predicates (the top QUD's and the move's predicates
+  plus the domain's dependencies between them) outrank unrelated ones
+- recent moves outrank older ones, with a bonus for mentioning a focus predicate
+- active plans are shown with their progress
+
+Token counts come from estimate_tokens(), a fast local approximation, and
+rendered move and commitment fragments are cached across turns, so only
+new state is formatted on each call.
+
+Example:
+    >>> builder = ContextBuilder(ContextBudget(max_tokens=300))
+    >>> context = builder.build(state, move)
+    >>> prompt = f"{context.text}\\n\\n{instruction}"
+"""
+
+from __future__ import annotations
+
+import re
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from ibdm.core.answers import Answer
+from ibdm.core.domain import DomainModel
+from ibdm.core.information_state import InformationState
+from ibdm.core.moves import DialogueMove
+from ibdm.core.plans import Plan
+from ibdm.core.questions import AltQuestion, Question, WhQuestion, YNQuestion
+
+_PIECE_RE = re.compile(r"\w+|[^\w\s]")
+
+#: Maximum characters of move content shown in history
+MAX_CONTENT_CHARS = 80
+
+#: Section headings in render order, keyed by fragment kind
+SECTION_TITLES = {
+    "move": "Dialogue history:",
+    "qud": "Current questions under discussion:",
+    "commitment": "Relevant commitments:",
+    "plan": "Active plans:",
+}
+
+# Tokens a fragment adds to its section beyond its text: the "N. " numbering
+# of history lines, or the separator between inline items
+_SEPARATOR_TOKENS = {"move": 2, "qud": 1, "commitment": 1, "plan": 1}
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of model tokens in text without a tokenizer.
+
+    Words and punctuation marks count as one token each, long words as one
+    token per four characters, which tracks BPE tokenizers closely enough for
+    budgeting English prompts.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+    """
+    return sum((len(piece) + 3) // 4 for piece in _PIECE_RE.findall(text))
+
+
+def format_move_content(content: Any) -> str:
+    """Format move content for dialogue history display.
+
+    Args:
+        content: Move content (Question, Answer, string, etc.)
+
+    Returns:
+        Readable string, truncated to MAX_CONTENT_CHARS unless it is a question
+    """
+    if isinstance(content, (WhQuestion, YNQuestion, AltQuestion)):
+        return str(content)
+    if isinstance(content, Answer):
+        return f"{content.content}"
+    content_str = content if isinstance(content, str) else str(content)
+    if len(content_str) > MAX_CONTENT_CHARS:
+        return content_str[: MAX_CONTENT_CHARS - 3] + "..."
+    return content_str
+
+
+def format_move(move: DialogueMove) -> str:
+    """Format a move as a history line ("User: ask - ?x.city").
+
+    Non-grounded moves carry their grounding status ("[perceived]").
+
+    Args:
+        move: Dialogue move
+
+    Returns:
+        History line without numbering
+    """
+    grounding_info = ""
+    status = move.metadata.get("grounding_status")
+    if status and status != "grounded":
+        grounding_info = f" [{status}]"
+    content_str = format_move_content(move.content)
+    return f"{move.speaker.capitalize()}: {move.move_type} - {content_str}{grounding_info}"
+
+
+def question_predicate(question: Any) -> str | None:
+    """The predicate a question is about, if it has one."""
+    if isinstance(question, YNQuestion):
+        return question.proposition.split("(")[0] or None
+    predicate = getattr(question, "predicate", None)
+    if isinstance(predicate, str) and predicate:
+        return predicate.split("(")[0]
+    return None
+
+
+def commitment_predicate(commitment: str) -> str:
+    """The predicate of a commitment ("jurisdiction(Delaware)" -> "jurisdiction")."""
+    for separator in ("(", ":"):
+        if separator in commitment:
+            return commitment.split(separator, 1)[0].strip()
+    return commitment.strip()
+
+
+@dataclass(frozen=True)
+class ContextFragment:
+    """One rendered piece of dialogue state.
+
+    Attributes:
+        kind: "move", "qud", "commitment" or "plan"
+        text: Rendered text
+        tokens: Estimated tokens of text
+        score: Relevance; higher fragments are packed first
+        position: Order within its section when rendered
+    """
+
+    kind: str
+    text: str
+    tokens: int
+    score: float
+    position: int
+
+
+@dataclass
+class BuiltContext:
+    """Context packed into a token budget.
+
+    Attributes:
+        fragments: Selected fragments in render order
+        text: Rendered context (empty string when nothing was selected)
+        tokens: Estimated tokens of text
+        dropped: Number of candidate fragments that did not fit
+        focus: Predicates the ranking favoured
+    """
+
+    fragments: list[ContextFragment] = field(default_factory=lambda: [])
+    text: str = ""
+    tokens: int = 0
+    dropped: int = 0
+    focus: frozenset[str] = frozenset()
+
+    def texts(self, kind: str) -> list[str]:
+        """Texts of the selected fragments of one kind, in render order."""
+        return [fragment.text for fragment in self.fragments if fragment.kind == kind]
+
+
+@dataclass
+class ContextBudget:
+    """Limits and weights for context packing.
+
+    Attributes:
+        max_tokens: Estimated token budget for the whole context block
+        max_moves: Most recent moves considered for the history
+        max_qud: Topmost QUD entries considered
+        qud_weight: Score of the top QUD (lower entries decay by qud_decay)
+        qud_decay: Score multiplier per level below the top of the QUD
+        focus_commitment_weight: Score of a commitment on a focus predicate
+        commitment_weight: Score of any other commitment
+        move_weight: Score of the most recent move (older moves decay by move_decay)
+        move_decay: Score multiplier per move further back in the history
+        focus_move_bonus: Added to a move that mentions a focus predicate
+        plan_weight: Score of an active plan
+    """
+
+    max_tokens: int = 600
+    max_moves: int = 10
+    max_qud: int = 3
+    qud_weight: float = 100.0
+    qud_decay: float = 0.5
+    focus_commitment_weight: float = 40.0
+    commitment_weight: float = 5.0
+    move_weight: float = 30.0
+    move_decay: float = 0.8
+    focus_move_bonus: float = 10.0
+    plan_weight: float = 20.0
+
+
+class ContextBuilder:
+    """Ranks information-state fragments by relevance and packs them into a budget."""
+
+    def __init__(
+        self,
+        budget: ContextBudget | None = None,
+        domain: DomainModel | None = None,
+        cache_size: int = 2048,
+    ):
+        """Initialize the builder.
+
+        Args:
+            budget: Token budget and ranking weights
+            domain: Domain supplying predicate dependencies. Defaults to the
+                DomainModel in the state's beliefs, if any.
+            cache_size: Rendered move/commitment fragments kept between turns
+        """
+        self.budget = budget or ContextBudget()
+        self.domain = domain
+        self.cache_size = cache_size
+        self._rendered: OrderedDict[Any, tuple[str, int, str]] = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def build(self, state: InformationState, move: DialogueMove | None = None) -> BuiltContext:
+        """Select and render the most relevant context within the budget.
+
+        Args:
+            state: Current information state
+            move: Move being interpreted or generated (sharpens the focus)
+
+        Returns:
+            BuiltContext with the rendered text and the selected fragments
+        """
+        focus = self.focus_predicates(state, move)
+        candidates = [
+            *self._qud_fragments(state),
+            *self._commitment_fragments(state.shared.commitments, focus),
+            *self._move_fragments(state.shared.moves, focus),
+            *self._plan_fragments(state.private.plan),
+        ]
+
+        selected: list[ContextFragment] = []
+        used = 0
+        opened: set[str] = set()
+        for fragment in sorted(candidates, key=lambda f: (-f.score, f.kind, f.position)):
+            cost = fragment.tokens + _SEPARATOR_TOKENS[fragment.kind]
+            if fragment.kind not in opened:
+                cost += estimate_tokens(SECTION_TITLES[fragment.kind])
+            if used + cost > self.budget.max_tokens:
+                continue
+            selected.append(fragment)
+            opened.add(fragment.kind)
+            used += cost
+
+        kind_order = list(SECTION_TITLES)
+        selected.sort(key=lambda f: (kind_order.index(f.kind), f.position))
+        text = self._render(selected)
+        return BuiltContext(
+            fragments=selected,
+            text=text,
+            tokens=estimate_tokens(text),
+            dropped=len(candidates) - len(selected),
+            focus=frozenset(focus),
+        )
+
+    def focus_predicates(self, state: InformationState, move: DialogueMove | None) -> set[str]:
+        """Predicates of the top QUD and the move, plus their domain dependencies.
+
+        Args:
+            state: Current information state
+            move: Move being interpreted or generated
+
+        Returns:
+            Set of predicate names
+        """
+        questions: list[Any] = []
+        if state.shared.qud:
+            questions.append(state.shared.qud[-1])
+        if move is not None and isinstance(move.content, Question):
+            questions.append(move.content)
+
+        domain = self.domain
+        if domain is None:
+            belief = state.private.beliefs.get("domain")
+            domain = belief if isinstance(belief, DomainModel) else None
+
+        focus: set[str] = set()
+        for question in questions:
+            predicate = question_predicate(question)
+            if predicate:
+                focus.add(predicate)
+            if domain is not None:
+                focus.update(domain.get_dependencies(question))
+        return focus
+
+    def cache_info(self) -> dict[str, int]:
+        """Fragment cache statistics (hits, misses, size, maxsize)."""
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self._rendered),
+            "maxsize": self.cache_size,
+        }
+
+    def _cached(self, key: Any, render: Callable[[], tuple[str, str]]) -> tuple[str, int, str]:
+        entry = self._rendered.get(key)
+        if entry is not None:
+            self._rendered.move_to_end(key)
+            self.cache_hits += 1
+            return entry
+        self.cache_misses += 1
+        text, predicate = render()
+        entry = (text, estimate_tokens(text), predicate)
+        self._rendered[key] = entry
+        if len(self._rendered) > self.cache_size:
+            self._rendered.popitem(last=False)
+        return entry
+
+    def _qud_fragments(self, state: InformationState) -> list[ContextFragment]:
+        budget = self.budget
+        top = state.shared.qud[-budget.max_qud :] if budget.max_qud > 0 else []
+        fragments: list[ContextFragment] = []
+        for depth, question in enumerate(reversed(top)):
+            text = str(question)
+            fragments.append(
+                ContextFragment(
+                    kind="qud",
+                    text=text,
+                    tokens=estimate_tokens(text),
+                    score=budget.qud_weight * budget.qud_decay**depth,
+                    position=len(top) - 1 - depth,
+                )
+            )
+        return fragments
+
+    def _commitment_fragments(
+        self, commitments: Iterable[str], focus: set[str]
+    ) -> list[ContextFragment]:
+        budget = self.budget
+        fragments: list[ContextFragment] = []
+        for position, commitment in enumerate(sorted(commitments)):
+            text, tokens, predicate = self._cached(
+                ("commitment", commitment),
+                lambda c=commitment: (c, commitment_predicate(c)),
+            )
+            weight = (
+                budget.focus_commitment_weight if predicate in focus else budget.commitment_weight
+            )
+            fragments.append(ContextFragment("commitment", text, tokens, weight, position))
+        return fragments
+
+    def _move_fragments(self, moves: list[DialogueMove], focus: set[str]) -> list[ContextFragment]:
+        budget = self.budget
+        recent = moves[-budget.max_moves :] if budget.max_moves > 0 else []
+        offset = len(moves) - len(recent)
+        fragments: list[ContextFragment] = []
+        for position, move in enumerate(recent):
+            # History is append-only, so a move's index and timestamp identify it
+            key = (
+                "move",
+                offset + position,
+                move.speaker,
+                move.move_type,
+                move.timestamp,
+                move.metadata.get("grounding_status"),
+            )
+            text, tokens, predicate = self._cached(
+                key, lambda m=move: (format_move(m), question_predicate(m.content) or "")
+            )
+            age = len(recent) - 1 - position
+            score = budget.move_weight * budget.move_decay**age
+            if focus and (predicate in focus or any(name in text for name in focus)):
+                score += budget.focus_move_bonus
+            fragments.append(ContextFragment("move", text, tokens, score, position))
+        return fragments
+
+    def _plan_fragments(self, plans: list[Plan]) -> list[ContextFragment]:
+        fragments: list[ContextFragment] = []
+        for position, plan in enumerate(plans):
+            if not plan.is_active():
+                continue
+            text = plan.plan_type
+            if plan.subplans:
+                done = sum(1 for subplan in plan.subplans if subplan.status == "completed")
+                text = f"{plan.plan_type} ({done}/{len(plan.subplans)} steps done)"
+            fragments.append(
+                ContextFragment(
+                    "plan", text, estimate_tokens(text), self.budget.plan_weight, position
+                )
+            )
+        return fragments
+
+    def _render(self, fragments: list[ContextFragment]) -> str:
+        sections: list[str] = []
+        for kind, title in SECTION_TITLES.items():
+            texts = [fragment.text for fragment in fragments if fragment.kind == kind]
+            if not texts:
+                continue
+            if kind == "move":
+                lines = "\n".join(f"{i}. {text}" for i, text in enumerate(texts, 1))
+                sections.append(f"{title}\n{lines}")
+            elif kind == "commitment":
+                sections.append(f"{title} {'; '.join(texts)}")
+            else:
+                sections.append(f"{title} {', '.join(texts)}")
+        return "\n\n".join(sections)
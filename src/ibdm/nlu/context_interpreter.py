@@ -14,6 +14,7 @@ from pydantic import BaseModel, Field
 
 from ibdm.core.information_state import InformationState
 from ibdm.nlu.answer_parser import AnswerParser, AnswerParserConfig
+from ibdm.nlu.context_builder import ContextBudget, ContextBuilder
 from ibdm.nlu.dialogue_act_classifier import DialogueActClassifier, DialogueActClassifierConfig
 from ibdm.nlu.llm_adapter import LLMAdapter, LLMConfig, ModelType
 from ibdm.nlu.question_analyzer import QuestionAnalyzer, QuestionAnalyzerConfig
@@ -84,6 +85,7 @@ class ContextInterpreterConfig:
         detect_implicatures: Enable implicature detection
         track_topics: Enable topic tracking
         confidence_threshold: Minimum confidence for interpretations
+        context_budget: Token budget for the QUD and commitments in the context summary
     """
 
     llm_config: LLMConfig | None = None
@@ -94,6 +96,7 @@ class ContextInterpreterConfig:
     detect_implicatures: bool = True
     track_topics: bool = True
     confidence_threshold: float = 0.5
+    context_budget: ContextBudget | None = None
 
 
 class ContextInterpreter:
@@ -125,6 +128,9 @@ class ContextInterpreter:
             config: Interpreter configuration. Uses defaults if not provided.
         """
         self.config = config or ContextInterpreterConfig()
+        self.context_builder = ContextBuilder(
+            self.config.context_budget or ContextBudget(max_tokens=300, max_moves=0)
+        )
 
         # Initialize LLM adapter
         llm_config = self.config.llm_config or LLMConfig(
@@ -132,7 +138,7 @@ class ContextInterpreter:
             temperature=0.5,
             max_tokens=4000,
         )
-        self.llm = LLMAdapter(llm_config)
+        self.llm = LLMAdapter(llm_config, component="context_interpreter")
 
         # Track token usage for cost optimization
         self.last_tokens_used: int = 0
@@ -235,24 +241,28 @@ class ContextInterpreter:
     def _extract_context_summary(self, state: InformationState) -> dict[str, Any]:
         """Extract relevant context from information state.
 
+        The QUD stack and commitments are those the context builder selects
+        within the configured token budget, most relevant to the top QUD first.
+
         Args:
             state: Current information state
 
         Returns:
             Dictionary with context summary including QUD stack, commitments, history
         """
-        context = {
-            "qud_stack": [],
+        built = self.context_builder.build(state)
+        context: dict[str, Any] = {
+            "qud_stack": built.texts("qud"),
             "qud_top": None,
-            "commitments": list(state.shared.commitments),
+            "commitments": built.texts("commitment"),
             "recent_moves": [],
             "current_topic": self.current_topic,
             "topic_history": self.topic_history[-5:],  # Last 5 topics
+            "context_tokens": built.tokens,
         }
 
         # Extract QUD information
         if state.shared.qud:
-            context["qud_stack"] = [str(q) for q in state.shared.qud]
             context["qud_top"] = str(state.shared.qud[-1])
 
         # Extract recent dialogue moves
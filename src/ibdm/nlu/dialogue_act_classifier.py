@@ -99,7 +99,7 @@ class DialogueActClassifier:
             max_tokens=500,  # Short responses for classification
         )
 
-        self.llm = LLMAdapter(llm_config)
+        self.llm = LLMAdapter(llm_config, component="dialogue_act_classifier")
         self.template = get_template("dialogue_act")
 
         logger.info(
@@ -120,15 +120,16 @@ class DialogueActClassifier:
             LLMError: If classification fails
         """
         # Format the prompt
-        system_prompt, user_prompt = self.template.format(
-            input_text=utterance, include_examples=True
-        )
+        prompt = self.template.render(input_text=utterance, include_examples=True)
 
         logger.debug(f"Classifying utterance: {utterance}")
 
         # Call LLM with structured output
         result = self.llm.call_structured(
-            prompt=user_prompt, response_model=DialogueActResult, system_prompt=system_prompt
+            prompt=prompt.suffix,
+            response_model=DialogueActResult,
+            system_prompt=prompt.system,
+            prompt_prefix=prompt.prefix,
         )
 
         logger.info(f"Classified '{utterance}' as {result.act} (confidence: {result.confidence})")
@@ -147,14 +148,15 @@ class DialogueActClassifier:
         Raises:
             LLMError: If classification fails
         """
-        system_prompt, user_prompt = self.template.format(
-            input_text=utterance, include_examples=True
-        )
+        prompt = self.template.render(input_text=utterance, include_examples=True)
 
         logger.debug(f"Async classifying utterance: {utterance}")
 
         result = await self.llm.acall_structured(
-            prompt=user_prompt, response_model=DialogueActResult, system_prompt=system_prompt
+            prompt=prompt.suffix,
+            response_model=DialogueActResult,
+            system_prompt=prompt.system,
+            prompt_prefix=prompt.prefix,
         )
 
         logger.info(
@@ -125,7 +125,7 @@ class EntityExtractor:
             temperature=0.2,  # Low temperature for consistent extraction
             max_tokens=1000,
         )
-        self.llm = LLMAdapter(llm_config)
+        self.llm = LLMAdapter(llm_config, component="entity_extractor")
 
         # Mention counter for unique IDs
         self._mention_counter = 0
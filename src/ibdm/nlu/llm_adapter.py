@@ -4,27 +4,85 @@ This module provides a unified interface to interact with LLMs (primarily Claude
 through LiteLLM. It handles API key management, model selection, error handling, and response
 parsing.
 
+The transport is pluggable: every adapter sends its requests through an LLMBackend. The
+default LiteLLMBackend calls the live API; ibdm.nlu.llm_cassette provides record/replay
+backends for offline runs. Install one process-wide with set_default_backend(), or select
+it with the IBDM_LLM_MODE / IBDM_LLM_CASSETTE environment variables.
+
+Prompts are laid out for provider-side prompt caching: the system prompt and an optional
+static prompt_prefix (task description, output format, few-shot examples) come first and
+the per-call input last. The adapter marks the end of that stable prefix with a cache
+breakpoint, LiteLLMBackend sends it as a cache-control marker, and LLMResponse reports the
+cached prompt tokens.
+
+Every request is reported to the process-wide LLMTelemetry hub, if one is installed (see
+ibdm.nlu.llm_telemetry), tagged with the adapter's component name.
+
 Model Selection Guidelines:
 - claude-sonnet-4-5-20250929: Large-scale generation, complex reasoning, extended responses
 - claude-haiku-4-5-20251001: Control flow, analytics, classification, structured data
 """
 
 import asyncio
+import functools
+import hashlib
 import json
 import logging
 import os
-from dataclasses import dataclass
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Generator
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Literal, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
 
-from litellm import acompletion, completion  # type: ignore[import-untyped]
 from pydantic import BaseModel, ValidationError
 
+from ibdm.nlu.llm_telemetry import LLMCallEvent, ValidationOutcome, get_telemetry
+
+if TYPE_CHECKING:
+    from ibdm.nlu.model_router import ModelRouter
+
 logger = logging.getLogger(__name__)
 
+
+# litellm takes seconds to import, so it is loaded on the first live call rather than
+# with this module. These wrappers are also the patch points for tests.
+def completion(**kwargs: Any) -> Any:
+    """Call litellm.completion, importing litellm on first use."""
+    from litellm import completion as litellm_completion  # type: ignore[import-untyped]
+
+    return litellm_completion(**kwargs)  # type: ignore[no-any-return]
+
+
+async def acompletion(**kwargs: Any) -> Any:
+    """Call litellm.acompletion, importing litellm on first use."""
+    from litellm import acompletion as litellm_acompletion  # type: ignore[import-untyped]
+
+    return await litellm_acompletion(**kwargs)  # type: ignore[no-any-return]
+
+
 T = TypeVar("T", bound=BaseModel)
 
 
+@functools.cache
+def schema_instruction(response_model: type[BaseModel]) -> str:
+    """System-prompt suffix asking for JSON matching a response model's schema.
+
+    Generating a pydantic JSON schema is slow relative to building a prompt, so
+    the instruction is computed once per model (see EngineImage for prewarming).
+
+    Args:
+        response_model: Pydantic model the response must match
+
+    Returns:
+        Instruction text to append to the system prompt
+    """
+    schema_str = json.dumps(response_model.model_json_schema(), indent=2)
+    return f"\n\nRespond with valid JSON matching this schema:\n{schema_str}"
+
+
 class ModelType(str, Enum):
     """Supported Claude model types."""
 
@@ -42,6 +100,9 @@ class LLMConfig:
         max_tokens: Maximum tokens in response
         timeout: Request timeout in seconds
         max_retries: Maximum number of retry attempts
+        prompt_caching: Mark the stable prompt prefix for provider-side caching
+        router: Adaptive router for structured calls (fast model first, escalating
+            when needed; see ibdm.nlu.model_router). None sends every call to model.
     """
 
     model: ModelType = ModelType.SONNET
@@ -49,6 +110,8 @@ class LLMConfig:
     max_tokens: int = 8000
     timeout: int = 60
     max_retries: int = 3
+    prompt_caching: bool = True
+    router: "ModelRouter | None" = None
 
 
 @dataclass
@@ -61,6 +124,8 @@ class LLMResponse:
         tokens_used: Total tokens consumed
         prompt_tokens: Tokens in the prompt
         completion_tokens: Tokens in the completion
+        cached_tokens: Prompt tokens read from the provider's prompt cache
+        cache_creation_tokens: Prompt tokens written to the provider's prompt cache
     """
 
     content: str
@@ -68,6 +133,8 @@ class LLMResponse:
     tokens_used: int
     prompt_tokens: int
     completion_tokens: int
+    cached_tokens: int = 0
+    cache_creation_tokens: int = 0
 
 
 class LLMError(Exception):
@@ -88,6 +155,271 @@ class LLMParsingError(LLMError):
     pass
 
 
+@dataclass
+class LLMRequest:
+    """A single completion request as sent to an LLMBackend.
+
+    Attributes:
+        model: Model identifier
+        messages: Chat messages (role/content dicts)
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens in response
+        timeout: Request timeout in seconds
+        cache_breakpoint: (message index, character offset) where the stable prompt
+            prefix ends, or None to send no cache-control marker
+    """
+
+    model: str
+    messages: list[dict[str, str]] = field(default_factory=lambda: [])
+    temperature: float = 0.7
+    max_tokens: int = 8000
+    timeout: int = 60
+    cache_breakpoint: tuple[int, int] | None = None
+
+    def key(self) -> str:
+        """Stable hash of everything that determines the response.
+
+        The timeout and cache breakpoint are excluded: neither changes what the
+        model returns.
+        """
+        payload = json.dumps(
+            {
+                "model": self.model,
+                "messages": self.messages,
+                "temperature": self.temperature,
+                "max_tokens": self.max_tokens,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict."""
+        return {
+            "model": self.model,
+            "messages": self.messages,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "cache_breakpoint": list(self.cache_breakpoint) if self.cache_breakpoint else None,
+        }
+
+    def prefix_text(self) -> str:
+        """The text of the stable prompt prefix (empty without a cache breakpoint)."""
+        if self.cache_breakpoint is None:
+            return ""
+        index, offset = self.cache_breakpoint
+        parts = [message["content"] for message in self.messages[:index]]
+        parts.append(self.messages[index]["content"][:offset])
+        return "".join(parts)
+
+    def wire_messages(self) -> list[dict[str, Any]]:
+        """Messages with the cache breakpoint expressed as a cache-control marker.
+
+        The message holding the breakpoint is split into two text blocks; the
+        first ends the stable prefix and carries {"cache_control": {"type":
+        "ephemeral"}}. Without a breakpoint the messages are returned as is.
+        """
+        if self.cache_breakpoint is None:
+            return list(self.messages)
+        index, offset = self.cache_breakpoint
+        message = self.messages[index]
+        content = message["content"]
+        blocks: list[dict[str, Any]] = [
+            {"type": "text", "text": content[:offset], "cache_control": {"type": "ephemeral"}}
+        ]
+        if content[offset:]:
+            blocks.append({"type": "text", "text": content[offset:]})
+        wire: list[dict[str, Any]] = list(self.messages)
+        wire[index] = {**message, "content": blocks}
+        return wire
+
+
+class LLMBackend(ABC):
+    """Transport that turns an LLMRequest into an LLMResponse.
+
+    Backends raise LLMError subclasses for failures that retrying cannot fix;
+    any other exception is treated as transient and retried by LLMAdapter.
+    """
+
+    #: Whether adapters using this backend need IBDM_API_KEY
+    requires_api_key: bool = False
+
+    @abstractmethod
+    def complete(self, request: LLMRequest) -> LLMResponse:
+        """Perform a synchronous completion."""
+
+    async def acomplete(self, request: LLMRequest) -> LLMResponse:
+        """Perform an asynchronous completion (defaults to a worker thread)."""
+        return await asyncio.to_thread(self.complete, request)
+
+    def stream(self, request: LLMRequest) -> Generator[str, None, LLMResponse | None]:
+        """Yield the completion text in chunks as it is generated.
+
+        A stream that runs to the end returns the LLMResponse with the token
+        usage the provider reported, or None if it reported none. Backends
+        without streaming yield the whole completion as one chunk.
+        """
+        response = self.complete(request)
+        yield response.content
+        return response
+
+
+class LiteLLMBackend(LLMBackend):
+    """Live backend calling the model API through LiteLLM."""
+
+    requires_api_key = True
+
+    def __init__(self, api_key: str):
+        """Initialize the backend.
+
+        Args:
+            api_key: API key passed to LiteLLM
+        """
+        self.api_key = api_key
+
+    def complete(self, request: LLMRequest) -> LLMResponse:
+        response = completion(
+            model=request.model,
+            messages=request.wire_messages(),
+            api_key=self.api_key,
+            temperature=request.temperature,
+            max_tokens=request.max_tokens,
+            timeout=request.timeout,
+        )
+        return self._to_response(response, request.model)
+
+    def stream(self, request: LLMRequest) -> Generator[str, None, LLMResponse | None]:
+        chunks = completion(
+            model=request.model,
+            messages=request.wire_messages(),
+            api_key=self.api_key,
+            temperature=request.temperature,
+            max_tokens=request.max_tokens,
+            timeout=request.timeout,
+            stream=True,
+            # The provider sends the usage in a final chunk without choices
+            stream_options={"include_usage": True},
+        )
+        parts: list[str] = []
+        usage: Any = None
+        try:
+            for chunk in chunks:
+                text = chunk.choices[0].delta.content if chunk.choices else None
+                if text:
+                    parts.append(text)
+                    yield cast(str, text)
+                usage = getattr(chunk, "usage", None) or usage
+        finally:
+            # Closing this generator only stops the loop; the HTTP response
+            # keeps generating (and billing) until the stream itself is closed
+            _close_stream(chunks)
+        if usage is None:
+            return None
+        return self._usage_response("".join(parts), usage, request.model)
+
+    async def acomplete(self, request: LLMRequest) -> LLMResponse:
+        response = await acompletion(
+            model=request.model,
+            messages=request.wire_messages(),
+            api_key=self.api_key,
+            temperature=request.temperature,
+            max_tokens=request.max_tokens,
+            timeout=request.timeout,
+        )
+        return self._to_response(response, request.model)
+
+    @staticmethod
+    def _to_response(response: Any, model: str) -> LLMResponse:
+        content = response.choices[0].message.content
+        return LiteLLMBackend._usage_response(cast(str, content or ""), response.usage, model)
+
+    @staticmethod
+    def _usage_response(content: str, usage: Any, model: str) -> LLMResponse:
+        # Anthropic reports cache reads/writes directly; OpenAI-style usage nests reads
+        cached = _usage_count(usage, "cache_read_input_tokens") or _usage_count(
+            getattr(usage, "prompt_tokens_details", None), "cached_tokens"
+        )
+        return LLMResponse(
+            content=content,
+            model=model,
+            tokens_used=usage.total_tokens,
+            prompt_tokens=usage.prompt_tokens,
+            completion_tokens=usage.completion_tokens,
+            cached_tokens=cached,
+            cache_creation_tokens=_usage_count(usage, "cache_creation_input_tokens"),
+        )
+
+
+def _usage_count(usage: Any, name: str) -> int:
+    value = getattr(usage, name, None)
+    return value if isinstance(value, int) else 0
+
+
+def _close_stream(chunks: Any) -> None:
+    """Close a LiteLLM stream wrapper and the provider stream it reads from."""
+    for stream in (getattr(chunks, "completion_stream", None), chunks):
+        close = getattr(stream, "close", None)
+        if callable(close):
+            close()
+
+
+def _estimate_usage(request: LLMRequest, content: str) -> LLMResponse:
+    """Response with token counts estimated locally, for streams without a usage report."""
+    from ibdm.nlu.context_builder import estimate_tokens
+
+    prompt_tokens = sum(estimate_tokens(message["content"]) for message in request.messages)
+    completion_tokens = estimate_tokens(content)
+    return LLMResponse(
+        content=content,
+        model=request.model,
+        tokens_used=prompt_tokens + completion_tokens,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+    )
+
+
+_default_backend: LLMBackend | None = None
+
+
+def set_default_backend(backend: LLMBackend | None) -> LLMBackend | None:
+    """Install a process-wide backend used by adapters created without one.
+
+    Every NLU component and the NLG engine build their own LLMAdapter, so this
+    is how a whole pipeline is switched to record/replay.
+
+    Args:
+        backend: Backend to install, or None to restore the environment default
+
+    Returns:
+        The previously installed backend
+    """
+    global _default_backend
+    previous = _default_backend
+    _default_backend = backend
+    return previous
+
+
+def get_default_backend() -> LLMBackend | None:
+    """Return the process-wide backend, if any.
+
+    Falls back to IBDM_LLM_MODE ("record" or "replay") with IBDM_LLM_CASSETTE
+    naming the cassette file. Returns None for the live LiteLLM default.
+    """
+    global _default_backend
+    if _default_backend is not None:
+        return _default_backend
+
+    mode = os.getenv("IBDM_LLM_MODE", "live").lower()
+    if mode == "live":
+        return None
+
+    from ibdm.nlu.llm_cassette import backend_from_env
+
+    # Build once so every adapter in the process shares one cassette
+    _default_backend = backend_from_env(mode)
+    return _default_backend
+
+
 class LLMAdapter:
     """Unified interface for LLM interactions in IBDM.
 
@@ -96,7 +428,7 @@ class LLMAdapter:
     - Automatic retry logic with exponential backoff
     - Structured output parsing and validation
     - Both sync and async operation modes
-    - Token usage tracking
+    - Token usage tracking and per-call telemetry
 
     Example:
         >>> adapter = LLMAdapter(LLMConfig(model=ModelType.HAIKU))
@@ -113,23 +445,37 @@ class LLMAdapter:
         4
     """
 
-    def __init__(self, config: LLMConfig | None = None):
+    def __init__(
+        self,
+        config: LLMConfig | None = None,
+        backend: LLMBackend | None = None,
+        component: str = "llm",
+    ):
         """Initialize the LLM adapter.
 
         Args:
             config: Configuration for the adapter. Uses defaults if not provided.
+            backend: Transport for requests. Defaults to the process-wide backend
+                (see set_default_backend), else live LiteLLM.
+            component: Name of the component using the adapter, reported in telemetry
 
         Raises:
-            ValueError: If IBDM_API_KEY environment variable is not set.
+            ValueError: If the backend needs IBDM_API_KEY and it is not set.
         """
         self.config = config or LLMConfig()
+        self.component = component
         self.api_key = os.getenv("IBDM_API_KEY")
 
-        if not self.api_key:
-            raise ValueError(
-                "IBDM_API_KEY not found in environment. "
-                "Please set the IBDM_API_KEY environment variable."
-            )
+        backend = backend or get_default_backend()
+        if backend is None or backend.requires_api_key:
+            if not self.api_key:
+                raise ValueError(
+                    "IBDM_API_KEY not found in environment. "
+                    "Please set the IBDM_API_KEY environment variable."
+                )
+        if backend is None:
+            backend = LiteLLMBackend(cast(str, self.api_key))
+        self.backend: LLMBackend = backend
 
         # Track last response for token usage monitoring
         self.last_response: LLMResponse | None = None
@@ -142,6 +488,8 @@ class LLMAdapter:
         system_prompt: str | None = None,
         temperature: float | None = None,
         max_tokens: int | None = None,
+        prompt_prefix: str | None = None,
+        model: ModelType | None = None,
     ) -> LLMResponse:
         """Make a synchronous call to the LLM.
 
@@ -150,6 +498,9 @@ class LLMAdapter:
             system_prompt: Optional system prompt to set context
             temperature: Override default temperature
             max_tokens: Override default max_tokens
+            prompt_prefix: Static part of the user message placed before the prompt
+                (instructions, examples) so it joins the cacheable prefix
+            model: Override default model
 
         Returns:
             LLMResponse with the model's response and metadata
@@ -157,135 +508,130 @@ class LLMAdapter:
         Raises:
             LLMAPIError: If the API call fails after retries
         """
-        messages: list[dict[str, str]] = []
+        request = self._build_request(
+            prompt, system_prompt, prompt_prefix, temperature, max_tokens, model
+        )
+        response, retries, latency = self._complete(request)
+        self._report(request, response, retries, latency)
+        return response
 
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
+    async def acall(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        prompt_prefix: str | None = None,
+        model: ModelType | None = None,
+    ) -> LLMResponse:
+        """Make an asynchronous call to the LLM.
+
+        Args:
+            prompt: The user prompt/question
+            system_prompt: Optional system prompt to set context
+            temperature: Override default temperature
+            max_tokens: Override default max_tokens
+            prompt_prefix: Static part of the user message placed before the prompt
+                (instructions, examples) so it joins the cacheable prefix
+            model: Override default model
+
+        Returns:
+            LLMResponse with the model's response and metadata
+
+        Raises:
+            LLMAPIError: If the API call fails after retries
+        """
+        request = self._build_request(
+            prompt, system_prompt, prompt_prefix, temperature, max_tokens, model
+        )
+        response, retries, latency = await self._acomplete(request)
+        self._report(request, response, retries, latency)
+        return response
 
-        messages.append({"role": "user", "content": prompt})
+    def _complete(self, request: LLMRequest) -> tuple[LLMResponse, int, float]:
+        """Send a request, retrying transient failures with exponential backoff.
 
-        temp = temperature if temperature is not None else self.config.temperature
-        max_tok = max_tokens if max_tokens is not None else self.config.max_tokens
+        Returns:
+            The response, the number of retries, and the latency in seconds
 
+        Raises:
+            LLMAPIError: If the API call fails after retries
+        """
+        start_time = time.perf_counter()
         for attempt in range(self.config.max_retries):
             try:
-                response = completion(
-                    model=self.config.model.value,
-                    messages=messages,
-                    api_key=self.api_key,
-                    temperature=temp,
-                    max_tokens=max_tok,
-                    timeout=self.config.timeout,
-                )
-
-                content = response.choices[0].message.content  # type: ignore[union-attr]
-                usage = response.usage  # type: ignore[attr-defined]
+                with self._in_flight():
+                    llm_response = self.backend.complete(request)
 
                 logger.debug(
-                    f"LLM call successful. Tokens: {usage.total_tokens} "  # type: ignore[attr-defined]
-                    f"(prompt: {usage.prompt_tokens}, completion: {usage.completion_tokens})"  # type: ignore[attr-defined]
-                )
-
-                llm_response = LLMResponse(
-                    content=cast(str, content or ""),
-                    model=self.config.model.value,
-                    tokens_used=usage.total_tokens,  # type: ignore[attr-defined]
-                    prompt_tokens=usage.prompt_tokens,  # type: ignore[attr-defined]
-                    completion_tokens=usage.completion_tokens,  # type: ignore[attr-defined]
+                    f"LLM call successful. Tokens: {llm_response.tokens_used} "
+                    f"(prompt: {llm_response.prompt_tokens}, "
+                    f"cached: {llm_response.cached_tokens}, "
+                    f"completion: {llm_response.completion_tokens})"
                 )
 
                 # Store last response for token tracking
                 self.last_response = llm_response
 
-                return llm_response
+                return llm_response, attempt, time.perf_counter() - start_time
+
+            except LLMError as e:
+                # Backend-classified failures (e.g. cassette miss) are not transient
+                self._report(request, None, attempt, time.perf_counter() - start_time, error=e)
+                raise
 
             except Exception as e:
                 logger.warning(f"LLM call attempt {attempt + 1} failed: {e}")
 
                 if attempt == self.config.max_retries - 1:
-                    raise LLMAPIError(
+                    error = LLMAPIError(
                         f"LLM API call failed after {self.config.max_retries} attempts: {e}"
                     )
+                    latency = time.perf_counter() - start_time
+                    self._report(request, None, attempt, latency, error=error)
+                    raise error
 
                 # Exponential backoff
                 wait_time = 2**attempt
                 logger.info(f"Retrying in {wait_time} seconds...")
-                import time
-
                 time.sleep(wait_time)
 
         raise LLMAPIError("Unexpected error in retry loop")
 
-    async def acall(
-        self,
-        prompt: str,
-        system_prompt: str | None = None,
-        temperature: float | None = None,
-        max_tokens: int | None = None,
-    ) -> LLMResponse:
-        """Make an asynchronous call to the LLM.
-
-        Args:
-            prompt: The user prompt/question
-            system_prompt: Optional system prompt to set context
-            temperature: Override default temperature
-            max_tokens: Override default max_tokens
-
-        Returns:
-            LLMResponse with the model's response and metadata
-
-        Raises:
-            LLMAPIError: If the API call fails after retries
-        """
-        messages: list[dict[str, str]] = []
-
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-
-        messages.append({"role": "user", "content": prompt})
-
-        temp = temperature if temperature is not None else self.config.temperature
-        max_tok = max_tokens if max_tokens is not None else self.config.max_tokens
-
+    async def _acomplete(self, request: LLMRequest) -> tuple[LLMResponse, int, float]:
+        """Async version of _complete()."""
+        start_time = time.perf_counter()
         for attempt in range(self.config.max_retries):
             try:
-                response = await acompletion(
-                    model=self.config.model.value,
-                    messages=messages,
-                    api_key=self.api_key,
-                    temperature=temp,
-                    max_tokens=max_tok,
-                    timeout=self.config.timeout,
-                )
-
-                content = response.choices[0].message.content  # type: ignore[union-attr]
-                usage = response.usage  # type: ignore[attr-defined]
+                with self._in_flight():
+                    llm_response = await self.backend.acomplete(request)
 
                 logger.debug(
-                    f"Async LLM call successful. Tokens: {usage.total_tokens} "  # type: ignore[attr-defined]
-                    f"(prompt: {usage.prompt_tokens}, completion: {usage.completion_tokens})"  # type: ignore[attr-defined]
-                )
-
-                llm_response = LLMResponse(
-                    content=cast(str, content or ""),
-                    model=self.config.model.value,
-                    tokens_used=usage.total_tokens,  # type: ignore[attr-defined]
-                    prompt_tokens=usage.prompt_tokens,  # type: ignore[attr-defined]
-                    completion_tokens=usage.completion_tokens,  # type: ignore[attr-defined]
+                    f"Async LLM call successful. Tokens: {llm_response.tokens_used} "
+                    f"(prompt: {llm_response.prompt_tokens}, "
+                    f"cached: {llm_response.cached_tokens}, "
+                    f"completion: {llm_response.completion_tokens})"
                 )
 
                 # Store last response for token tracking
                 self.last_response = llm_response
 
-                return llm_response
+                return llm_response, attempt, time.perf_counter() - start_time
+
+            except LLMError as e:
+                self._report(request, None, attempt, time.perf_counter() - start_time, error=e)
+                raise
 
             except Exception as e:
                 logger.warning(f"Async LLM call attempt {attempt + 1} failed: {e}")
 
                 if attempt == self.config.max_retries - 1:
-                    raise LLMAPIError(
+                    error = LLMAPIError(
                         f"Async LLM API call failed after {self.config.max_retries} attempts: {e}"
                     )
+                    latency = time.perf_counter() - start_time
+                    self._report(request, None, attempt, latency, error=error)
+                    raise error
 
                 # Exponential backoff
                 wait_time = 2**attempt
@@ -294,6 +640,72 @@ class LLMAdapter:
 
         raise LLMAPIError("Unexpected error in retry loop")
 
+    def _in_flight(self) -> AbstractContextManager[None]:
+        """Context counting a backend request as in flight on the telemetry hub."""
+        telemetry = get_telemetry()
+        return telemetry.track_call() if telemetry is not None else nullcontext()
+
+    def _report(
+        self,
+        request: LLMRequest,
+        response: LLMResponse | None,
+        retries: int,
+        latency: float,
+        validation: ValidationOutcome | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        """Send one call event to the installed telemetry hub, if any."""
+        telemetry = get_telemetry()
+        if telemetry is None:
+            return
+        telemetry.record(
+            LLMCallEvent(
+                component=self.component,
+                model=response.model if response else request.model,
+                prompt_tokens=response.prompt_tokens if response else 0,
+                completion_tokens=response.completion_tokens if response else 0,
+                cached_tokens=response.cached_tokens if response else 0,
+                latency=latency,
+                retries=retries,
+                validation=validation,
+                error=str(error) if error is not None else None,
+            )
+        )
+
+    def _build_request(
+        self,
+        prompt: str,
+        system_prompt: str | None,
+        prompt_prefix: str | None,
+        temperature: float | None,
+        max_tokens: int | None,
+        model: ModelType | None = None,
+    ) -> LLMRequest:
+        """Lay out the messages as stable prefix first, per-call input last."""
+        messages: list[dict[str, str]] = []
+
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+
+        user_content = f"{prompt_prefix}\n{prompt}" if prompt_prefix else prompt
+        messages.append({"role": "user", "content": user_content})
+
+        cache_breakpoint: tuple[int, int] | None = None
+        if self.config.prompt_caching:
+            if prompt_prefix:
+                cache_breakpoint = (len(messages) - 1, len(prompt_prefix))
+            elif system_prompt:
+                cache_breakpoint = (0, len(system_prompt))
+
+        return LLMRequest(
+            model=(model or self.config.model).value,
+            messages=messages,
+            temperature=temperature if temperature is not None else self.config.temperature,
+            max_tokens=max_tokens if max_tokens is not None else self.config.max_tokens,
+            timeout=self.config.timeout,
+            cache_breakpoint=cache_breakpoint,
+        )
+
     def call_structured(
         self,
         prompt: str,
@@ -301,6 +713,8 @@ class LLMAdapter:
         system_prompt: str | None = None,
         temperature: float | None = None,
         max_tokens: int | None = None,
+        prompt_prefix: str | None = None,
+        model: ModelType | None = None,
     ) -> T:
         """Make an LLM call and parse the response into a structured Pydantic model.
 
@@ -313,6 +727,9 @@ class LLMAdapter:
             system_prompt: Optional system prompt to set context
             temperature: Override default temperature
             max_tokens: Override default max_tokens
+            prompt_prefix: Static part of the user message (see call())
+            model: Override default model. Without one, a configured router
+                picks the model.
 
         Returns:
             Instance of response_model populated with parsed data
@@ -321,22 +738,21 @@ class LLMAdapter:
             LLMParsingError: If response cannot be parsed after retries
             LLMAPIError: If the API call fails
         """
-        # Add JSON schema instruction to system prompt
-        schema_json = response_model.model_json_schema()
-        schema_str = json.dumps(schema_json, indent=2)
-        schema_instruction = f"\n\nRespond with valid JSON matching this schema:\n{schema_str}"
+        if model is None and self.config.router is not None:
+            return self.config.router.route_structured(
+                self, prompt, response_model, system_prompt, temperature, max_tokens, prompt_prefix
+            )
 
-        enhanced_system_prompt = (system_prompt or "") + schema_instruction
+        # Add JSON schema instruction to system prompt
+        enhanced_system_prompt = (system_prompt or "") + schema_instruction(response_model)
 
         max_parse_attempts = 2
 
         for parse_attempt in range(max_parse_attempts):
-            response = self.call(
-                prompt=prompt,
-                system_prompt=enhanced_system_prompt,
-                temperature=temperature,
-                max_tokens=max_tokens,
+            request = self._build_request(
+                prompt, enhanced_system_prompt, prompt_prefix, temperature, max_tokens, model
             )
+            response, retries, latency = self._complete(request)
 
             try:
                 # Try to extract JSON from response (may be wrapped in markdown code blocks)
@@ -363,9 +779,10 @@ class LLMAdapter:
                 data = json.loads(content)
 
                 # Validate against Pydantic model
-                return response_model.model_validate(data)
+                result = response_model.model_validate(data)
 
             except (json.JSONDecodeError, ValidationError) as e:
+                self._report(request, response, retries, latency, validation="invalid")
                 logger.warning(f"Parse attempt {parse_attempt + 1} failed: {e}")
 
                 if parse_attempt == max_parse_attempts - 1:
@@ -382,6 +799,10 @@ class LLMAdapter:
                     f"Please respond with valid JSON only, no markdown formatting."
                 )
 
+            else:
+                self._report(request, response, retries, latency, validation="valid")
+                return result
+
         raise LLMParsingError("Unexpected error in parse loop")
 
     async def acall_structured(
@@ -391,6 +812,8 @@ class LLMAdapter:
         system_prompt: str | None = None,
         temperature: float | None = None,
         max_tokens: int | None = None,
+        prompt_prefix: str | None = None,
+        model: ModelType | None = None,
     ) -> T:
         """Make an async LLM call and parse the response into a structured Pydantic model.
 
@@ -400,6 +823,9 @@ class LLMAdapter:
             system_prompt: Optional system prompt to set context
             temperature: Override default temperature
             max_tokens: Override default max_tokens
+            prompt_prefix: Static part of the user message (see call())
+            model: Override default model. Without one, a configured router
+                picks the model.
 
         Returns:
             Instance of response_model populated with parsed data
@@ -408,22 +834,21 @@ class LLMAdapter:
             LLMParsingError: If response cannot be parsed after retries
             LLMAPIError: If the API call fails
         """
-        # Add JSON schema instruction to system prompt
-        schema_json = response_model.model_json_schema()
-        schema_str = json.dumps(schema_json, indent=2)
-        schema_instruction = f"\n\nRespond with valid JSON matching this schema:\n{schema_str}"
+        if model is None and self.config.router is not None:
+            return await self.config.router.aroute_structured(
+                self, prompt, response_model, system_prompt, temperature, max_tokens, prompt_prefix
+            )
 
-        enhanced_system_prompt = (system_prompt or "") + schema_instruction
+        # Add JSON schema instruction to system prompt
+        enhanced_system_prompt = (system_prompt or "") + schema_instruction(response_model)
 
         max_parse_attempts = 2
 
         for parse_attempt in range(max_parse_attempts):
-            response = await self.acall(
-                prompt=prompt,
-                system_prompt=enhanced_system_prompt,
-                temperature=temperature,
-                max_tokens=max_tokens,
+            request = self._build_request(
+                prompt, enhanced_system_prompt, prompt_prefix, temperature, max_tokens, model
             )
+            response, retries, latency = await self._acomplete(request)
 
             try:
                 # Try to extract JSON from response
@@ -449,9 +874,10 @@ class LLMAdapter:
                 data = json.loads(content)
 
                 # Validate against Pydantic model
-                return response_model.model_validate(data)
+                result = response_model.model_validate(data)
 
             except (json.JSONDecodeError, ValidationError) as e:
+                self._report(request, response, retries, latency, validation="invalid")
                 logger.warning(f"Async parse attempt {parse_attempt + 1} failed: {e}")
 
                 if parse_attempt == max_parse_attempts - 1:
@@ -468,14 +894,115 @@ class LLMAdapter:
                     f"Please respond with valid JSON only, no markdown formatting."
                 )
 
+            else:
+                self._report(request, response, retries, latency, validation="valid")
+                return result
+
         raise LLMParsingError("Unexpected error in parse loop")
 
+    def stream_structured(
+        self,
+        prompt: str,
+        response_model: type[T],
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        prompt_prefix: str | None = None,
+        model: ModelType | None = None,
+        on_field: Callable[[str, Any], None] | None = None,
+    ) -> T:
+        """Stream a structured response, handing over each field as it completes.
+
+        The response is parsed incrementally (see ibdm.nlu.validation.streaming):
+        on_field is called with each top-level field as soon as its value is
+        complete and valid, so callers can act on early fields (a dialogue act,
+        a confidence) before later ones have been generated. A field failing
+        validation stops the stream at once instead of paying for the rest of it.
+        Streamed calls are not retried and not routed. Their telemetry carries
+        the usage the provider reports at the end of the stream; a stream
+        stopped early (or a backend reporting no usage) is reported with token
+        counts estimated from the prompt and the text received.
+
+        Args:
+            prompt: The user prompt/question
+            response_model: Pydantic model class to parse response into
+            system_prompt: Optional system prompt to set context
+            temperature: Override default temperature
+            max_tokens: Override default max_tokens
+            prompt_prefix: Static part of the user message (see call())
+            model: Override default model
+            on_field: Callback receiving (field name, validated value)
+
+        Returns:
+            Instance of response_model populated with parsed data
+
+        Raises:
+            LLMParsingError: If the response is malformed or fails validation
+            LLMAPIError: If the stream fails
+        """
+        # The validation package is loaded on the first streamed call
+        from ibdm.nlu.validation.streaming import StreamingValidator
+
+        enhanced_system_prompt = (system_prompt or "") + schema_instruction(response_model)
+        request = self._build_request(
+            prompt, enhanced_system_prompt, prompt_prefix, temperature, max_tokens, model
+        )
+        validator = StreamingValidator(response_model)
+        start_time = time.perf_counter()
+        reported: LLMResponse | None = None
+        received: list[str] = []
+
+        with self._in_flight():
+            chunks = self.backend.stream(request)
+            try:
+                # Once the object is complete the rest of the stream is only read
+                # for the closing fence and the provider's usage report
+                while validator.error is None:
+                    try:
+                        chunk = next(chunks)
+                    except StopIteration as end:
+                        reported = cast(LLMResponse | None, end.value)
+                        break
+                    except LLMError:
+                        raise
+                    except Exception as e:
+                        error = LLMAPIError(f"LLM stream failed: {e}")
+                        partial = _estimate_usage(request, "".join(received))
+                        latency = time.perf_counter() - start_time
+                        self._report(request, partial, 0, latency, error=error)
+                        raise error from e
+                    received.append(chunk)
+                    if validator.done:
+                        continue
+                    for name, value in validator.feed(chunk):
+                        if on_field is not None:
+                            on_field(name, value)
+            finally:
+                # Stop generation once the object is known to be invalid
+                close = getattr(chunks, "close", None)
+                if close is not None:
+                    close()
+
+        latency = time.perf_counter() - start_time
+        response = reported or _estimate_usage(request, "".join(received))
+        self.last_response = response
+        try:
+            result = validator.result()
+        except (ValueError, ValidationError) as e:
+            self._report(request, response, 0, latency, validation="invalid")
+            raise LLMParsingError(
+                f"Failed to parse streamed LLM response into {response_model.__name__}: {e}"
+            ) from e
+        self._report(request, response, 0, latency, validation="valid")
+        return result
+
     async def batch_call(
         self,
         prompts: list[str],
         system_prompt: str | None = None,
         temperature: float | None = None,
         max_tokens: int | None = None,
+        prompt_prefix: str | None = None,
     ) -> list[LLMResponse]:
         """Make multiple LLM calls in parallel.
 
@@ -484,6 +1011,7 @@ class LLMAdapter:
             system_prompt: Optional system prompt for all calls
             temperature: Override default temperature
             max_tokens: Override default max_tokens
+            prompt_prefix: Static part of every user message (see call())
 
         Returns:
             List of LLMResponse objects in the same order as prompts
@@ -497,6 +1025,7 @@ class LLMAdapter:
                 system_prompt=system_prompt,
                 temperature=temperature,
                 max_tokens=max_tokens,
+                prompt_prefix=prompt_prefix,
             )
             for prompt in prompts
         ]
@@ -0,0 +1,375 @@
+"""Record/replay LLM backends for offline runs and load testing.
+
+A cassette is a JSONL file with one recorded interaction per line: the
+request (model, messages, temperature, max_tokens), the response and the
+latency observed when it was recorded.
+
+- RecordingBackend forwards requests to a live backend and appends every
+  exchange to the cassette.
+- ReplayBackend serves recorded responses deterministically, with
+  configurable synthetic latency and token counts, and never touches the
+  network. Identical requests recorded several times are served in
+  recorded order, cycling. It also simulates provider prompt caching, so
+  the effect of a request's cache breakpoint shows up in cached_tokens
+  offline.
+
+Example:
+    >>> from ibdm.nlu.llm_adapter import set_default_backend
+    >>> set_default_backend(RecordingBackend(Cassette("nda.jsonl")))  # live + capture
+    >>> set_default_backend(ReplayBackend(Cassette.load("nda.jsonl")))  # offline
+
+The same switch is available through the environment:
+    IBDM_LLM_MODE=replay IBDM_LLM_CASSETTE=nda.jsonl IBDM_LLM_REPLAY_LATENCY=0.4
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ibdm.nlu.llm_adapter import (
+    LiteLLMBackend,
+    LLMBackend,
+    LLMError,
+    LLMRequest,
+    LLMResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CassetteMissError(LLMError):
+    """Replay was asked for a request that is not in the cassette."""
+
+    pass
+
+
+@dataclass
+class CassetteEntry:
+    """One recorded request/response exchange.
+
+    Attributes:
+        key: LLMRequest.key() of the request
+        request: Serialized request
+        response: Recorded response
+        latency: Wall-clock seconds the live call took
+    """
+
+    key: str
+    request: dict[str, Any]
+    response: LLMResponse
+    latency: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict."""
+        return {
+            "key": self.key,
+            "request": self.request,
+            "response": {
+                "content": self.response.content,
+                "model": self.response.model,
+                "tokens_used": self.response.tokens_used,
+                "prompt_tokens": self.response.prompt_tokens,
+                "completion_tokens": self.response.completion_tokens,
+                "cached_tokens": self.response.cached_tokens,
+                "cache_creation_tokens": self.response.cache_creation_tokens,
+            },
+            "latency": self.latency,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CassetteEntry:
+        """Deserialize from a dict produced by to_dict()."""
+        return cls(
+            key=data["key"],
+            request=data.get("request", {}),
+            response=LLMResponse(**data["response"]),
+            latency=data.get("latency", 0.0),
+        )
+
+
+class Cassette:
+    """Thread-safe collection of recorded exchanges, optionally backed by a file."""
+
+    def __init__(self, path: str | Path | None = None):
+        """Initialize an empty cassette.
+
+        Args:
+            path: JSONL file that recorded entries are appended to (None keeps
+                the cassette in memory)
+        """
+        self.path = Path(path) if path is not None else None
+        self._entries: dict[str, list[CassetteEntry]] = {}
+        self._cursors: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str | Path) -> Cassette:
+        """Load a cassette from a JSONL file.
+
+        Args:
+            path: Cassette file
+
+        Returns:
+            Cassette containing every entry in the file
+        """
+        cassette = cls(path)
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    cassette._add(CassetteEntry.from_dict(json.loads(line)))
+        logger.info(f"Loaded {len(cassette)} LLM interactions from {path}")
+        return cassette
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    def __contains__(self, request: LLMRequest) -> bool:
+        return request.key() in self._entries
+
+    def _add(self, entry: CassetteEntry) -> None:
+        self._entries.setdefault(entry.key, []).append(entry)
+
+    def record(self, request: LLMRequest, response: LLMResponse, latency: float) -> CassetteEntry:
+        """Add an exchange, appending it to the cassette file if there is one.
+
+        Args:
+            request: Request that was sent
+            response: Response that came back
+            latency: Seconds the call took
+
+        Returns:
+            The recorded entry
+        """
+        entry = CassetteEntry(
+            key=request.key(), request=request.to_dict(), response=response, latency=latency
+        )
+        with self._lock:
+            self._add(entry)
+            if self.path is not None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry.to_dict()) + "\n")
+        return entry
+
+    def next_entry(self, request: LLMRequest) -> CassetteEntry:
+        """Return the next recorded entry for a request, cycling through repeats.
+
+        Raises:
+            CassetteMissError: If the request was never recorded
+        """
+        key = request.key()
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                raise CassetteMissError(
+                    f"No recorded response for request {key[:12]} "
+                    f"(model {request.model}) in cassette {self.path or '<memory>'}"
+                )
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = cursor + 1
+            return entries[cursor % len(entries)]
+
+    def rewind(self) -> None:
+        """Restart every request's replay sequence from its first recording."""
+        with self._lock:
+            self._cursors.clear()
+
+
+class RecordingBackend(LLMBackend):
+    """Forwards requests to a live backend and records every exchange."""
+
+    requires_api_key = True
+
+    def __init__(self, cassette: Cassette, inner: LLMBackend | None = None):
+        """Initialize the recorder.
+
+        Args:
+            cassette: Cassette to record into
+            inner: Backend that serves the requests (default: live LiteLLM)
+
+        Raises:
+            ValueError: If no inner backend is given and IBDM_API_KEY is not set
+        """
+        if inner is None:
+            api_key = os.getenv("IBDM_API_KEY")
+            if not api_key:
+                raise ValueError("RecordingBackend needs IBDM_API_KEY to call the live API.")
+            inner = LiteLLMBackend(api_key)
+        self.cassette = cassette
+        self.inner = inner
+        self.requires_api_key = inner.requires_api_key
+
+    def complete(self, request: LLMRequest) -> LLMResponse:
+        start = time.perf_counter()
+        response = self.inner.complete(request)
+        self.cassette.record(request, response, time.perf_counter() - start)
+        return response
+
+    async def acomplete(self, request: LLMRequest) -> LLMResponse:
+        start = time.perf_counter()
+        response = await self.inner.acomplete(request)
+        self.cassette.record(request, response, time.perf_counter() - start)
+        return response
+
+
+@dataclass
+class ReplayConfig:
+    """Synthetic timing and usage for replayed responses.
+
+    Attributes:
+        latency: Fixed seconds added to every response
+        latency_per_token: Seconds added per completion token
+        recorded_latency_scale: Multiplier on the latency observed at record
+            time (0.0 ignores it, 1.0 reproduces it)
+        jitter: Random +/- fraction applied to the total latency
+        seed: Seed for the jitter generator (deterministic by default)
+        prompt_tokens: Override the recorded prompt token count
+        completion_tokens: Override the recorded completion token count
+        prompt_cache: Simulate provider prompt caching. The first request with a
+            given cached prefix reports the prefix's share of its prompt tokens
+            as cache_creation_tokens, later ones as cached_tokens. When False,
+            the recorded cache counts are replayed.
+    """
+
+    latency: float = 0.0
+    latency_per_token: float = 0.0
+    recorded_latency_scale: float = 0.0
+    jitter: float = 0.0
+    seed: int | None = 0
+    prompt_tokens: int | None = None
+    completion_tokens: int | None = None
+    prompt_cache: bool = True
+
+
+class ReplayBackend(LLMBackend):
+    """Serves recorded responses from a cassette, with no network access."""
+
+    requires_api_key = False
+
+    def __init__(self, cassette: Cassette, config: ReplayConfig | None = None):
+        """Initialize the replayer.
+
+        Args:
+            cassette: Recorded exchanges to serve
+            config: Synthetic latency and token settings
+        """
+        self.cassette = cassette
+        self.config = config or ReplayConfig()
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.misses = 0
+        self.tokens_served = 0
+        self.cached_tokens_served = 0
+        self._cached_prefixes: set[str] = set()
+
+    def _respond(self, request: LLMRequest) -> tuple[LLMResponse, float]:
+        try:
+            entry = self.cassette.next_entry(request)
+        except CassetteMissError:
+            with self._lock:
+                self.misses += 1
+            raise
+
+        cfg = self.config
+        recorded = entry.response
+        prompt_tokens = (
+            cfg.prompt_tokens if cfg.prompt_tokens is not None else recorded.prompt_tokens
+        )
+        completion_tokens = (
+            cfg.completion_tokens
+            if cfg.completion_tokens is not None
+            else recorded.completion_tokens
+        )
+        if cfg.prompt_cache:
+            cached_tokens, cache_creation_tokens = self._simulate_prompt_cache(
+                request, prompt_tokens
+            )
+        else:
+            cached_tokens = recorded.cached_tokens
+            cache_creation_tokens = recorded.cache_creation_tokens
+        response = LLMResponse(
+            content=recorded.content,
+            model=recorded.model,
+            tokens_used=prompt_tokens + completion_tokens,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cached_tokens=cached_tokens,
+            cache_creation_tokens=cache_creation_tokens,
+        )
+
+        delay = (
+            cfg.latency
+            + cfg.latency_per_token * completion_tokens
+            + cfg.recorded_latency_scale * entry.latency
+        )
+        with self._lock:
+            self.calls += 1
+            self.tokens_served += response.tokens_used
+            self.cached_tokens_served += response.cached_tokens
+            if cfg.jitter and delay > 0:
+                delay *= 1 + self._rng.uniform(-cfg.jitter, cfg.jitter)
+        return response, max(delay, 0.0)
+
+    def _simulate_prompt_cache(self, request: LLMRequest, prompt_tokens: int) -> tuple[int, int]:
+        """Return (cached_tokens, cache_creation_tokens) for a replayed request."""
+        prefix = request.prefix_text()
+        if not prefix:
+            return 0, 0
+        total_chars = sum(len(message["content"]) for message in request.messages)
+        prefix_tokens = prompt_tokens * len(prefix) // max(total_chars, 1)
+        digest = hashlib.sha256(f"{request.model}\0{prefix}".encode()).hexdigest()
+        with self._lock:
+            if digest in self._cached_prefixes:
+                return prefix_tokens, 0
+            self._cached_prefixes.add(digest)
+        return 0, prefix_tokens
+
+    def complete(self, request: LLMRequest) -> LLMResponse:
+        response, delay = self._respond(request)
+        if delay:
+            time.sleep(delay)
+        return response
+
+    async def acomplete(self, request: LLMRequest) -> LLMResponse:
+        response, delay = self._respond(request)
+        if delay:
+            await asyncio.sleep(delay)
+        return response
+
+
+def backend_from_env(mode: str) -> LLMBackend:
+    """Build a record or replay backend from environment variables.
+
+    Reads IBDM_LLM_CASSETTE (required) and, for replay, IBDM_LLM_REPLAY_LATENCY
+    (fixed seconds per call).
+
+    Args:
+        mode: "record" or "replay"
+
+    Returns:
+        Configured backend
+
+    Raises:
+        ValueError: If the mode is unknown or no cassette path is set
+    """
+    path = os.getenv("IBDM_LLM_CASSETTE")
+    if not path:
+        raise ValueError(f"IBDM_LLM_MODE={mode} requires IBDM_LLM_CASSETTE to name a cassette")
+
+    if mode == "record":
+        return RecordingBackend(Cassette(path))
+    if mode == "replay":
+        latency = float(os.getenv("IBDM_LLM_REPLAY_LATENCY", "0"))
+        return ReplayBackend(Cassette.load(path), ReplayConfig(latency=latency))
+    raise ValueError(f"Unknown IBDM_LLM_MODE: {mode!r} (expected live, record or replay)")
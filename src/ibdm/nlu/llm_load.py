@@ -0,0 +1,181 @@
+"""Load generator for the NLU/NLG pipeline.
+
+Runs N dialogue sessions concurrently and reports throughput and per-turn
+latency. Combined with a ReplayBackend this measures the full pipeline's
+concurrency behaviour on a laptop with no network; with the live backend it
+measures the real thing.
+
+Example:
+    >>> set_default_backend(ReplayBackend(Cassette.load("nda.jsonl"), ReplayConfig(latency=0.3)))
+    >>> session = pipeline_session(["I need an NDA", "Acme and Beta", "mutual"])
+    >>> result = run_load_test(session, sessions=50, concurrency=10)
+    >>> print(result.summary())
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any
+
+from ibdm.rules import RuleSet
+from ibdm.rules.profiling import percentile
+
+logger = logging.getLogger(__name__)
+
+#: A session takes its index and returns the latency (seconds) of each turn
+SessionFn = Callable[[int], list[float]]
+
+
+@dataclass
+class LoadTestResult:
+    """Aggregate measurements from a load test.
+
+    Attributes:
+        sessions: Number of sessions started
+        concurrency: Maximum sessions running at once
+        wall_time: Seconds from first session start to last session end
+        turn_latencies: Latency of every completed turn, in seconds
+        errors: Error messages from sessions that raised
+        backend_stats: Counters reported by the backend, if any
+    """
+
+    sessions: int
+    concurrency: int
+    wall_time: float = 0.0
+    turn_latencies: list[float] = field(default_factory=lambda: [])
+    errors: list[str] = field(default_factory=lambda: [])
+    backend_stats: dict[str, Any] = field(default_factory=lambda: {})
+
+    @property
+    def turns(self) -> int:
+        """Number of completed turns."""
+        return len(self.turn_latencies)
+
+    @property
+    def throughput(self) -> float:
+        """Completed turns per second."""
+        return self.turns / self.wall_time if self.wall_time > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict (latencies in milliseconds)."""
+        latencies = self.turn_latencies
+        return {
+            "sessions": self.sessions,
+            "concurrency": self.concurrency,
+            "turns": self.turns,
+            "errors": len(self.errors),
+            "error_messages": self.errors[:10],
+            "wall_time_s": self.wall_time,
+            "throughput_turns_per_s": self.throughput,
+            "latency_ms": {
+                "mean": sum(latencies) / len(latencies) * 1000 if latencies else 0.0,
+                "p50": percentile(latencies, 50) * 1000,
+                "p95": percentile(latencies, 95) * 1000,
+                "p99": percentile(latencies, 99) * 1000,
+            },
+            "backend": self.backend_stats,
+        }
+
+    def summary(self) -> str:
+        """One-line human-readable summary."""
+        data = self.to_dict()
+        latency = data["latency_ms"]
+        return (
+            f"{self.sessions} sessions x{self.concurrency}: {self.turns} turns in "
+            f"{self.wall_time:.2f}s ({self.throughput:.1f} turns/s), "
+            f"p50={latency['p50']:.1f}ms p99={latency['p99']:.1f}ms, errors={len(self.errors)}"
+        )
+
+
+def run_load_test(
+    session: SessionFn,
+    sessions: int,
+    concurrency: int,
+    backend: Any | None = None,
+) -> LoadTestResult:
+    """Run sessions concurrently on a thread pool.
+
+    The pipeline is synchronous and spends its time waiting on the LLM
+    backend, so threads give realistic concurrency.
+
+    Args:
+        session: Function running one session (see pipeline_session)
+        sessions: Number of sessions to run
+        concurrency: Maximum sessions in flight
+        backend: Optional backend whose calls/misses/tokens counters are reported
+
+    Returns:
+        LoadTestResult with throughput and latency distribution
+    """
+    result = LoadTestResult(sessions=sessions, concurrency=concurrency)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(session, index) for index in range(sessions)]
+        for future in as_completed(futures):
+            try:
+                result.turn_latencies.extend(future.result())
+            except Exception as e:
+                logger.warning(f"Load-test session failed: {e}")
+                result.errors.append(f"{type(e).__name__}: {e}")
+    result.wall_time = time.perf_counter() - start
+
+    if backend is not None:
+        result.backend_stats = {
+            name: getattr(backend, name)
+            for name in ("calls", "misses", "tokens_served", "cached_tokens_served")
+            if hasattr(backend, name)
+        }
+    return result
+
+
+def pipeline_session(
+    utterances: Sequence[str],
+    rules_factory: Callable[[], RuleSet] | None = None,
+    nlg_strategy: str = "llm",
+) -> SessionFn:
+    """Build a session that runs utterances through NLU, the engine and NLG.
+
+    Each session constructs its own NLUEngine and NLGEngine, as a separate
+    user would, so every LLM-backed component goes through the process-wide
+    backend (see set_default_backend).
+
+    Args:
+        utterances: User utterances for one session
+        rules_factory: Builds the engine's rule set (default: no rules)
+        nlg_strategy: NLGEngine strategy for system responses
+
+    Returns:
+        Session function for run_load_test
+    """
+    from ibdm.engine import DialogueMoveEngine
+    from ibdm.nlg import NLGEngine, NLGEngineConfig
+    from ibdm.nlu.nlu_context import NLUContext
+    from ibdm.nlu.nlu_engine import NLUEngine
+
+    def run(index: int) -> list[float]:
+        nlu = NLUEngine()
+        nlg = NLGEngine(NLGEngineConfig(default_strategy=nlg_strategy))
+        engine = DialogueMoveEngine(
+            agent_id="system", rules=rules_factory() if rules_factory else None
+        )
+        state = engine.create_initial_state()
+        context = NLUContext.create_empty()
+
+        latencies: list[float] = []
+        for utterance in utterances:
+            start = time.perf_counter()
+            nlu_result, context = nlu.process(utterance, f"user{index}", state, context)
+            for move in engine.interpret_from_nlu_result(nlu_result, f"user{index}", state):
+                state = engine.integrate(move, state)
+            response, state = engine.select_action(state)
+            if response is not None:
+                nlg.generate(response, state)
+                state = engine.integrate(response, state)
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    return run
@@ -0,0 +1,450 @@
+"""Cost and latency telemetry for LLM calls.
+
+Every request an LLMAdapter sends produces one LLMCallEvent: the component
+that made it, the model, prompt/completion/cached token counts, latency,
+transport retries, whether the prompt cache was hit, the outcome of parsing a
+structured reply, and the dialogue session it belongs to. Events go to an
+LLMTelemetry hub, which keeps running per-session and per-component
+aggregates and forwards each event to its sinks:
+
+- MemorySink: bounded ring buffer of the most recent events
+- JSONLSink: one JSON object per line, appended to a file
+- PrometheusSink: counters rendered in the Prometheus text exposition format
+
+Other metrics can share the same sinks: JSONLSink.write_record() appends any
+JSON-serializable record, and PrometheusSink.register() adds a collector (for
+example the validation framework's ValidationMetrics) whose lines are
+rendered after the LLM call counters.
+
+Telemetry is process-wide, like the default LLM backend: install a hub with
+set_telemetry() and every adapter reports to it. The session id is taken
+from the surrounding telemetry_session() block (DialogueStateMachine opens
+one per turn with its application id). Per-session aggregates idle for
+longer than session_ttl are dropped, oldest first, as new events arrive.
+
+Example:
+    >>> telemetry = LLMTelemetry([MemorySink(), JSONLSink("llm_calls.jsonl")])
+    >>> set_telemetry(telemetry)
+    >>> with telemetry_session("demo-1"):
+    ...     engine.process("I need an NDA", "user", state, context)
+    >>> telemetry.by_component()["dialogue_act_classifier"].calls
+    1
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Literal, Protocol
+
+ValidationOutcome = Literal["valid", "invalid"]
+
+_session_id: ContextVar[str | None] = ContextVar("ibdm_llm_session", default=None)
+
+
+@dataclass
+class LLMCallEvent:
+    """One LLM request as seen by the adapter.
+
+    Attributes:
+        component: Component that made the call (e.g. "dialogue_act_classifier")
+        model: Model identifier
+        prompt_tokens: Tokens in the prompt
+        completion_tokens: Tokens in the completion
+        cached_tokens: Prompt tokens read from the provider's prompt cache
+        latency: Wall-clock seconds including retries
+        retries: Transport attempts beyond the first
+        validation: Outcome of parsing a structured reply (None for plain calls)
+        session_id: Dialogue session the call belongs to
+        error: Error message if the call failed
+        timestamp: Unix time the call finished
+    """
+
+    component: str
+    model: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    latency: float = 0.0
+    retries: int = 0
+    validation: ValidationOutcome | None = None
+    session_id: str | None = None
+    error: str | None = None
+    timestamp: float = field(default_factory=time.time)
+
+    @property
+    def cache_hit(self) -> bool:
+        """Whether part of the prompt was served from the provider's cache."""
+        return self.cached_tokens > 0
+
+    @property
+    def total_tokens(self) -> int:
+        """Prompt plus completion tokens."""
+        return self.prompt_tokens + self.completion_tokens
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {**asdict(self), "cache_hit": self.cache_hit}
+
+
+@dataclass
+class CallAggregate:
+    """Running totals over a group of LLM calls.
+
+    Attributes:
+        calls: Calls recorded
+        errors: Calls that failed
+        prompt_tokens: Prompt tokens
+        completion_tokens: Completion tokens
+        cached_tokens: Prompt tokens read from the cache
+        cache_hits: Calls with at least one cached prompt token
+        retries: Transport retries
+        validation_failures: Structured replies that failed to parse
+        latency: Summed latency in seconds
+    """
+
+    calls: int = 0
+    errors: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    cache_hits: int = 0
+    retries: int = 0
+    validation_failures: int = 0
+    latency: float = 0.0
+
+    def add(self, event: LLMCallEvent) -> None:
+        """Fold one event into the totals."""
+        self.calls += 1
+        self.errors += event.error is not None
+        self.prompt_tokens += event.prompt_tokens
+        self.completion_tokens += event.completion_tokens
+        self.cached_tokens += event.cached_tokens
+        self.cache_hits += event.cache_hit
+        self.retries += event.retries
+        self.validation_failures += event.validation == "invalid"
+        self.latency += event.latency
+
+    @property
+    def total_tokens(self) -> int:
+        """Prompt plus completion tokens."""
+        return self.prompt_tokens + self.completion_tokens
+
+    @property
+    def mean_latency(self) -> float:
+        """Average latency per call in seconds."""
+        return self.latency / self.calls if self.calls else 0.0
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of calls that hit the prompt cache."""
+        return self.cache_hits / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            **asdict(self),
+            "total_tokens": self.total_tokens,
+            "mean_latency": self.mean_latency,
+            "cache_hit_rate": self.cache_hit_rate,
+        }
+
+
+class PrometheusCollector(Protocol):
+    """Source of extra lines for PrometheusSink.render()."""
+
+    def prometheus_lines(self) -> list[str]:
+        """Metrics in the Prometheus text exposition format."""
+        ...
+
+
+class TelemetrySink(ABC):
+    """Destination for LLM call events."""
+
+    @abstractmethod
+    def emit(self, event: LLMCallEvent) -> None:
+        """Receive one event."""
+
+    def close(self) -> None:
+        """Release any resources held by the sink."""
+
+
+class MemorySink(TelemetrySink):
+    """Keeps the most recent events in a ring buffer."""
+
+    def __init__(self, capacity: int = 1000):
+        """Initialize the sink.
+
+        Args:
+            capacity: Events kept; older ones are discarded
+        """
+        self._events: deque[LLMCallEvent] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def emit(self, event: LLMCallEvent) -> None:
+        """Append an event, evicting the oldest when full."""
+        with self._lock:
+            self._events.append(event)
+
+    def events(self) -> list[LLMCallEvent]:
+        """Buffered events, oldest first."""
+        with self._lock:
+            return list(self._events)
+
+    def clear(self) -> None:
+        """Drop all buffered events."""
+        with self._lock:
+            self._events.clear()
+
+
+class JSONLSink(TelemetrySink):
+    """Appends each event as one JSON line to a file."""
+
+    def __init__(self, path: str | Path):
+        """Initialize the sink.
+
+        Args:
+            path: File to append to (created with its parent directories)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def emit(self, event: LLMCallEvent) -> None:
+        """Write one line and flush it."""
+        self.write_record(event.to_dict())
+
+    def write_record(self, record: dict[str, Any]) -> None:
+        """Write an arbitrary JSON-serializable record as one line and flush it."""
+        line = json.dumps(record, sort_keys=True)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        """Close the file."""
+        with self._lock:
+            self._file.close()
+
+
+class PrometheusSink(TelemetrySink):
+    """Counters by component and model in the Prometheus text format.
+
+    Serve render() from a /metrics endpoint or write it to a node-exporter
+    textfile directory with write().
+    """
+
+    #: Metric name -> (help text, aggregate field)
+    METRICS = {
+        "ibdm_llm_calls_total": ("LLM calls", "calls"),
+        "ibdm_llm_errors_total": ("LLM calls that failed", "errors"),
+        "ibdm_llm_prompt_tokens_total": ("Prompt tokens", "prompt_tokens"),
+        "ibdm_llm_completion_tokens_total": ("Completion tokens", "completion_tokens"),
+        "ibdm_llm_cached_tokens_total": ("Prompt tokens read from cache", "cached_tokens"),
+        "ibdm_llm_cache_hits_total": ("Calls hitting the prompt cache", "cache_hits"),
+        "ibdm_llm_retries_total": ("Transport retries", "retries"),
+        "ibdm_llm_validation_failures_total": (
+            "Structured replies that failed to parse",
+            "validation_failures",
+        ),
+        "ibdm_llm_latency_seconds_total": ("Summed call latency", "latency"),
+    }
+
+    def __init__(self, collectors: list[PrometheusCollector] | None = None) -> None:
+        """Initialize empty counters.
+
+        Args:
+            collectors: Additional metric sources rendered after the call counters
+        """
+        self._totals: dict[tuple[str, str], CallAggregate] = {}
+        self._collectors: list[PrometheusCollector] = list(collectors or [])
+        self._lock = threading.Lock()
+
+    def register(self, collector: PrometheusCollector) -> None:
+        """Render a collector's lines after the call counters."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def emit(self, event: LLMCallEvent) -> None:
+        """Add an event to its (component, model) counters."""
+        with self._lock:
+            self._totals.setdefault((event.component, event.model), CallAggregate()).add(event)
+
+    def render(self) -> str:
+        """Current counters in the Prometheus text exposition format."""
+        with self._lock:
+            totals = sorted(self._totals.items())
+            lines: list[str] = []
+            for name, (help_text, attribute) in self.METRICS.items():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} counter")
+                for (component, model), aggregate in totals:
+                    labels = f'component="{component}",model="{model}"'
+                    lines.append(f"{name}{{{labels}}} {getattr(aggregate, attribute)}")
+            collectors = list(self._collectors)
+        for collector in collectors:
+            lines.extend(collector.prometheus_lines())
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str | Path) -> None:
+        """Write render() to a file, replacing it atomically."""
+        target = Path(path)
+        partial = target.with_suffix(target.suffix + ".tmp")
+        partial.write_text(self.render(), encoding="utf-8")
+        partial.replace(target)
+
+
+class LLMTelemetry:
+    """Collects LLM call events, aggregates them and fans them out to sinks."""
+
+    def __init__(self, sinks: list[TelemetrySink] | None = None, session_ttl: float = 3600.0):
+        """Initialize the hub.
+
+        Args:
+            sinks: Sinks receiving every event
+            session_ttl: Seconds without events after which a session's
+                aggregate is dropped
+        """
+        self.sinks: list[TelemetrySink] = list(sinks or [])
+        self.session_ttl = session_ttl
+        self._sessions: OrderedDict[str, CallAggregate] = OrderedDict()
+        self._last_seen: dict[str, float] = {}
+        self._components: dict[str, CallAggregate] = {}
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of LLM requests currently waiting for the backend."""
+        return self._in_flight
+
+    @contextmanager
+    def track_call(self) -> Generator[None, None, None]:
+        """Count the enclosed backend request as in flight."""
+        with self._lock:
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def record(self, event: LLMCallEvent) -> None:
+        """Aggregate an event and pass it to every sink.
+
+        An event without a session id is stamped with the current
+        telemetry_session(), if any.
+        """
+        if event.session_id is None:
+            event.session_id = _session_id.get()
+        with self._lock:
+            self._components.setdefault(event.component, CallAggregate()).add(event)
+            if event.session_id is not None:
+                self._touch(event.session_id).add(event)
+        for sink in self.sinks:
+            sink.emit(event)
+
+    def by_session(self) -> dict[str, CallAggregate]:
+        """Aggregates per session id (copies)."""
+        with self._lock:
+            return {key: CallAggregate(**asdict(value)) for key, value in self._sessions.items()}
+
+    def by_component(self) -> dict[str, CallAggregate]:
+        """Aggregates per component (copies)."""
+        with self._lock:
+            return {key: CallAggregate(**asdict(value)) for key, value in self._components.items()}
+
+    def report(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Per-session and per-component aggregates as plain dicts."""
+        return {
+            "sessions": {key: value.to_dict() for key, value in self.by_session().items()},
+            "components": {key: value.to_dict() for key, value in self.by_component().items()},
+        }
+
+    def reset(self) -> None:
+        """Clear the aggregates (sinks keep what they already received)."""
+        with self._lock:
+            self._sessions.clear()
+            self._last_seen.clear()
+            self._components.clear()
+
+    def close(self) -> None:
+        """Close every sink."""
+        for sink in self.sinks:
+            sink.close()
+
+    def _touch(self, session_id: str) -> CallAggregate:
+        """Get or create a session's aggregate and mark it recently seen (lock held)."""
+        now = time.monotonic()
+        aggregate = self._sessions.get(session_id)
+        if aggregate is None:
+            aggregate = CallAggregate()
+            self._sessions[session_id] = aggregate
+        else:
+            self._sessions.move_to_end(session_id)
+        self._last_seen[session_id] = now
+        self._expire(now)
+        return aggregate
+
+    def _expire(self, now: float) -> None:
+        """Drop session aggregates idle for longer than the TTL, oldest first (lock held)."""
+        while self._sessions:
+            session_id = next(iter(self._sessions))
+            if now - self._last_seen[session_id] < self.session_ttl:
+                return
+            del self._sessions[session_id]
+            del self._last_seen[session_id]
+
+
+_telemetry: LLMTelemetry | None = None
+
+
+def set_telemetry(telemetry: LLMTelemetry | None) -> LLMTelemetry | None:
+    """Install the process-wide telemetry hub every LLMAdapter reports to.
+
+    Args:
+        telemetry: Hub to install, or None to stop collecting
+
+    Returns:
+        The previously installed hub
+    """
+    global _telemetry
+    previous = _telemetry
+    _telemetry = telemetry
+    return previous
+
+
+def get_telemetry() -> LLMTelemetry | None:
+    """Return the process-wide telemetry hub, if any."""
+    return _telemetry
+
+
+def current_session() -> str | None:
+    """Session id of the enclosing telemetry_session() block."""
+    return _session_id.get()
+
+
+@contextmanager
+def telemetry_session(session_id: str) -> Generator[None, None, None]:
+    """Attribute LLM calls made inside the block to a session.
+
+    The id is held in a context variable, so it follows asyncio tasks started
+    inside the block and does not leak between threads.
+
+    Args:
+        session_id: Dialogue session identifier
+    """
+    token = _session_id.set(session_id)
+    try:
+        yield
+    finally:
+        _session_id.reset(token)
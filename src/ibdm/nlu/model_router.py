@@ -0,0 +1,272 @@
+"""Adaptive model routing for structured LLM calls.
+
+Each NLU component used to be pinned to one model (Sonnet for interpretation,
+Haiku for dialogue acts). A ModelRouter instead sends every structured call to
+the fast model first and escalates it to the strong model only when
+
+- the per-call input is long or spans several sentences ("long", "complex"),
+- the fast model's reply fails the validation pipeline ("validation"), or
+- the parsed result reports a confidence below the threshold ("low_confidence").
+
+The fast reply is checked with an ibdm.nlu.validation ValidationPipeline (the
+same parse-and-validate step used elsewhere for LLM output), so a malformed
+reply costs one escalation instead of a corrective retry on the fast model.
+Calls and escalations are counted per task, where the task is the name of the
+response model (e.g. "DialogueActResult").
+
+Install a router through LLMConfig.router; every adapter built from that
+config routes its call_structured()/acall_structured() calls. Calls that pass
+an explicit model are not routed.
+
+Example:
+    >>> router = ModelRouter(RoutingPolicy(confidence_threshold=0.8))
+    >>> config = LLMConfig(router=router)
+    >>> classifier = DialogueActClassifier(DialogueActClassifierConfig(llm_config=config))
+    >>> classifier.classify("Tea, please")
+    >>> router.escalation_rates()
+    {'DialogueActResult': 0.0}
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from pydantic import BaseModel
+
+from ibdm.nlu.context_builder import estimate_tokens
+from ibdm.nlu.llm_adapter import ModelType, schema_instruction
+from ibdm.nlu.validation import ValidationMetrics, ValidationPipeline, create_pipeline
+
+if TYPE_CHECKING:
+    from ibdm.nlu.llm_adapter import LLMAdapter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+_SENTENCE_END_RE = re.compile(r"[.!?]+(?=\s|$)")
+
+
+@dataclass
+class RoutingPolicy:
+    """When to escalate a structured call from the fast to the strong model.
+
+    Attributes:
+        fast_model: Model every call tries first
+        strong_model: Model a call escalates to
+        confidence_threshold: Fast results reporting a lower confidence escalate
+        confidence_field: Result field holding the confidence (results without
+            it are judged on validation only)
+        max_fast_tokens: Longer per-call inputs go straight to the strong model
+        max_fast_sentences: Inputs with more sentences go straight to the strong model
+    """
+
+    fast_model: ModelType = ModelType.HAIKU
+    strong_model: ModelType = ModelType.SONNET
+    confidence_threshold: float = 0.7
+    confidence_field: str = "confidence"
+    max_fast_tokens: int = 150
+    max_fast_sentences: int = 3
+
+    def complexity_reason(self, prompt: str) -> str | None:
+        """Why an input is too hard for the fast model, if it is.
+
+        Args:
+            prompt: Per-call part of the prompt (the input, not the static prefix)
+
+        Returns:
+            "long", "complex" or None
+        """
+        if estimate_tokens(prompt) > self.max_fast_tokens:
+            return "long"
+        if len(_SENTENCE_END_RE.findall(prompt)) > self.max_fast_sentences:
+            return "complex"
+        return None
+
+
+@dataclass
+class TaskRoutingStats:
+    """Routing counts for one task.
+
+    Attributes:
+        calls: Structured calls routed
+        escalations: Calls answered by the strong model
+        reasons: Escalation count by reason
+    """
+
+    calls: int = 0
+    escalations: int = 0
+    reasons: dict[str, int] = field(default_factory=lambda: {})
+
+    @property
+    def escalation_rate(self) -> float:
+        """Fraction of calls that escalated."""
+        return self.escalations / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "calls": self.calls,
+            "escalations": self.escalations,
+            "escalation_rate": self.escalation_rate,
+            "reasons": dict(self.reasons),
+        }
+
+
+class ModelRouter:
+    """Routes structured calls to the fast model first, escalating hard ones."""
+
+    def __init__(
+        self,
+        policy: RoutingPolicy | None = None,
+        pipeline: ValidationPipeline | None = None,
+        metrics: ValidationMetrics | None = None,
+    ):
+        """Initialize the router.
+
+        Args:
+            policy: Escalation policy
+            pipeline: Pipeline validating fast replies (the response model's
+                PydanticValidator is added per call). Defaults to
+                create_pipeline(), which auto-detects the reply format.
+            metrics: Optional metrics recorder for fast-reply validations
+        """
+        self.policy = policy or RoutingPolicy()
+        self.pipeline = pipeline or create_pipeline()
+        self.metrics = metrics
+        self.stats: dict[str, TaskRoutingStats] = {}
+        self._lock = threading.Lock()
+
+    def route_structured(
+        self,
+        adapter: LLMAdapter,
+        prompt: str,
+        response_model: type[T],
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        prompt_prefix: str | None = None,
+    ) -> T:
+        """Run a structured call, escalating it if the fast model is not good enough.
+
+        Args:
+            adapter: Adapter sending the requests
+            prompt: Per-call part of the user prompt
+            response_model: Pydantic model to parse the reply into
+            system_prompt: Optional system prompt
+            temperature: Override default temperature
+            max_tokens: Override default max_tokens
+            prompt_prefix: Static part of the user message
+
+        Returns:
+            Parsed result from the fast model, or from the strong model on escalation
+
+        Raises:
+            LLMParsingError: If the strong model's reply cannot be parsed
+            LLMAPIError: If a call fails
+        """
+        task = response_model.__name__
+        reason = self.policy.complexity_reason(prompt)
+        if reason is None:
+            response = adapter.call(
+                prompt=prompt,
+                system_prompt=(system_prompt or "") + schema_instruction(response_model),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                prompt_prefix=prompt_prefix,
+                model=self.policy.fast_model,
+            )
+            result, reason = self._accept(response.content, response_model)
+            if result is not None:
+                self._record(task, None)
+                return result
+
+        self._record(task, reason)
+        return adapter.call_structured(
+            prompt=prompt,
+            response_model=response_model,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            prompt_prefix=prompt_prefix,
+            model=self.policy.strong_model,
+        )
+
+    async def aroute_structured(
+        self,
+        adapter: LLMAdapter,
+        prompt: str,
+        response_model: type[T],
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        prompt_prefix: str | None = None,
+    ) -> T:
+        """Async version of route_structured()."""
+        task = response_model.__name__
+        reason = self.policy.complexity_reason(prompt)
+        if reason is None:
+            response = await adapter.acall(
+                prompt=prompt,
+                system_prompt=(system_prompt or "") + schema_instruction(response_model),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                prompt_prefix=prompt_prefix,
+                model=self.policy.fast_model,
+            )
+            result, reason = self._accept(response.content, response_model)
+            if result is not None:
+                self._record(task, None)
+                return result
+
+        self._record(task, reason)
+        return await adapter.acall_structured(
+            prompt=prompt,
+            response_model=response_model,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            prompt_prefix=prompt_prefix,
+            model=self.policy.strong_model,
+        )
+
+    def escalation_rates(self) -> dict[str, float]:
+        """Escalation rate per task."""
+        with self._lock:
+            return {task: stats.escalation_rate for task, stats in self.stats.items()}
+
+    def report(self) -> dict[str, dict[str, Any]]:
+        """Routing statistics per task (calls, escalations, rate, reasons)."""
+        with self._lock:
+            return {task: stats.to_dict() for task, stats in self.stats.items()}
+
+    def reset(self) -> None:
+        """Clear the routing statistics."""
+        with self._lock:
+            self.stats.clear()
+
+    def _accept(self, content: str, response_model: type[T]) -> tuple[T | None, str | None]:
+        """Validate a fast reply; return it, or the reason it must escalate."""
+        parse_result, validation = self.pipeline.validate_structured(content, response_model)
+        if self.metrics is not None:
+            self.metrics.record_validation(parse_result, validation)
+        if not validation.valid or not isinstance(validation.data, response_model):
+            return None, "validation"
+        confidence = getattr(validation.data, self.policy.confidence_field, None)
+        if isinstance(confidence, (int, float)) and confidence < self.policy.confidence_threshold:
+            return None, "low_confidence"
+        return validation.data, None
+
+    def _record(self, task: str, reason: str | None) -> None:
+        with self._lock:
+            stats = self.stats.setdefault(task, TaskRoutingStats())
+            stats.calls += 1
+            if reason is not None:
+                stats.escalations += 1
+                stats.reasons[reason] = stats.reasons.get(reason, 0) + 1
+        if reason is not None:
+            logger.debug(f"Escalated {task} to {self.policy.strong_model.value}: {reason}")
@@ -21,6 +21,7 @@ from ibdm.nlu.dialogue_act_classifier import (
     DialogueActType,
 )
 from ibdm.nlu.llm_adapter import LLMConfig, ModelType
+from ibdm.nlu.model_router import ModelRouter, RoutingPolicy
 from ibdm.nlu.nlu_context import NLUContext
 from ibdm.nlu.nlu_result import NLUResult
 from ibdm.nlu.question_analyzer import QuestionAnalyzer, QuestionAnalyzerConfig
@@ -37,12 +38,17 @@ class NLUEngineConfig:
         confidence_threshold: Minimum confidence for NLU results
         temperature: LLM temperature for generation
         max_tokens: Maximum tokens for LLM responses
+        adaptive_routing: Send structured calls to the fast model first and escalate
+            hard ones (see ibdm.nlu.model_router) instead of always using llm_model
+        routing_policy: Escalation policy for adaptive routing (defaults apply if None)
     """
 
     llm_model: ModelType = ModelType.SONNET
     confidence_threshold: float = 0.5
     temperature: float = 0.3
     max_tokens: int = 2000
+    adaptive_routing: bool = False
+    routing_policy: RoutingPolicy | None = None
 
 
 class NLUEngine:
@@ -77,11 +83,17 @@ class NLUEngine:
         """
         self.config = config or NLUEngineConfig()
 
+        # Shared by every component, so escalation rates cover all NLU tasks
+        self.router: ModelRouter | None = (
+            ModelRouter(self.config.routing_policy) if self.config.adaptive_routing else None
+        )
+
         # Store LLM config for creating components
         self.llm_config = LLMConfig(
             model=self.config.llm_model,
             temperature=self.config.temperature,
             max_tokens=self.config.max_tokens,
+            router=self.router,
         )
 
         # Initialize stateless NLU components
@@ -13,6 +13,11 @@ Templates support:
 - Few-shot examples
 - Chain-of-thought reasoning
 - Structured output formatting
+
+A rendered prompt is split into a static prefix (system prompt, task
+description, output format, examples) and a per-call suffix (the input), so
+the prefix can be served from the provider's prompt cache (see
+LLMAdapter.call's prompt_prefix).
 """
 
 from dataclasses import dataclass, field
@@ -52,6 +57,26 @@ class Example:
         return "\n".join(parts)
 
 
+@dataclass(frozen=True)
+class PromptParts:
+    """A rendered prompt, split where the stable text ends.
+
+    Attributes:
+        system: System prompt
+        prefix: Static part of the user message (task, output format, examples)
+        suffix: Per-call part of the user message (the input)
+    """
+
+    system: str
+    prefix: str
+    suffix: str
+
+    @property
+    def user(self) -> str:
+        """The complete user message."""
+        return f"{self.prefix}\n{self.suffix}"
+
+
 def _example_list_factory() -> list[Example]:
     """Factory function for creating empty example lists."""
     return []
@@ -100,6 +125,28 @@ class PromptTemplate:
         Returns:
             Tuple of (system_prompt, user_prompt)
         """
+        parts = self.render(input_text, variables, include_examples)
+        return parts.system, parts.user
+
+    def render(
+        self,
+        input_text: str,
+        variables: dict[str, Any] | None = None,
+        include_examples: bool = True,
+    ) -> PromptParts:
+        """Render the template as a static prefix and a per-call suffix.
+
+        Everything except the input goes into the prefix, so consecutive calls
+        with the same variables share it byte for byte.
+
+        Args:
+            input_text: The input text to process
+            variables: Optional variables to interpolate into template
+            include_examples: Whether to include few-shot examples
+
+        Returns:
+            PromptParts whose user message equals format()'s user prompt
+        """
         vars_dict = variables or {}
 
         # Format system prompt
@@ -124,11 +171,11 @@ class PromptTemplate:
                 user_parts.append(example.format(self.include_reasoning))
 
         # Add the actual input
-        user_parts.append("\n## Your Task")
-        user_parts.append(f"Input: {input_text}")
-        user_parts.append("Output:")
+        task_parts = ["\n## Your Task", f"Input: {input_text}", "Output:"]
 
-        return system, "\n".join(user_parts)
+        return PromptParts(
+            system=system, prefix="\n".join(user_parts), suffix="\n".join(task_parts)
+        )
 
     def add_example(self, input: str, output: str, reasoning: str | None = None) -> None:
         """Add a few-shot example to the template.
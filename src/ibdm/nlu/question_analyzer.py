@@ -100,7 +100,7 @@ class QuestionAnalyzer:
             max_tokens=2000,
         )
 
-        self.llm = LLMAdapter(llm_config)
+        self.llm = LLMAdapter(llm_config, component="question_analyzer")
         self.template = get_template("question_understanding")
         self.template.include_reasoning = self.config.include_reasoning
 
@@ -122,15 +122,16 @@ class QuestionAnalyzer:
             LLMError: If analysis fails
         """
         # Format the prompt
-        system_prompt, user_prompt = self.template.format(
-            input_text=question_text, include_examples=True
-        )
+        prompt = self.template.render(input_text=question_text, include_examples=True)
 
         logger.debug(f"Analyzing question: {question_text}")
 
         # Call LLM with structured output
         result = self.llm.call_structured(
-            prompt=user_prompt, response_model=QuestionAnalysis, system_prompt=system_prompt
+            prompt=prompt.suffix,
+            response_model=QuestionAnalysis,
+            system_prompt=prompt.system,
+            prompt_prefix=prompt.prefix,
         )
 
         logger.info(
@@ -152,14 +153,15 @@ class QuestionAnalyzer:
         Raises:
             LLMError: If analysis fails
         """
-        system_prompt, user_prompt = self.template.format(
-            input_text=question_text, include_examples=True
-        )
+        prompt = self.template.render(input_text=question_text, include_examples=True)
 
         logger.debug(f"Async analyzing question: {question_text}")
 
         result = await self.llm.acall_structured(
-            prompt=user_prompt, response_model=QuestionAnalysis, system_prompt=system_prompt
+            prompt=prompt.suffix,
+            response_model=QuestionAnalysis,
+            system_prompt=prompt.system,
+            prompt_prefix=prompt.prefix,
         )
 
         logger.info(
@@ -131,7 +131,7 @@ class ReferenceResolver:
                     temperature=0.3,
                     max_tokens=500,
                 )
-                self.llm = LLMAdapter(llm_config)
+                self.llm = LLMAdapter(llm_config, component="reference_resolver")
             except ValueError as e:
                 logger.warning(f"LLM initialization failed, using rule-based only: {e}")
                 self.llm = None
@@ -101,7 +101,7 @@ class SemanticParser:
             max_tokens=2000,
         )
 
-        self.llm = LLMAdapter(llm_config)
+        self.llm = LLMAdapter(llm_config, component="semantic_parser")
         self.template = get_template("semantic_parsing")
         self.template.include_reasoning = self.config.include_reasoning
 
@@ -124,7 +124,7 @@ class SemanticParser:
             LLMError: If parsing fails
         """
         # Format the prompt with the template
-        system_prompt, user_prompt = self.template.format(
+        prompt = self.template.render(
             input_text=utterance, variables=context, include_examples=True
         )
 
@@ -132,7 +132,10 @@ class SemanticParser:
 
         # Call LLM with structured output
         result = self.llm.call_structured(
-            prompt=user_prompt, response_model=SemanticParse, system_prompt=system_prompt
+            prompt=prompt.suffix,
+            response_model=SemanticParse,
+            system_prompt=prompt.system,
+            prompt_prefix=prompt.prefix,
         )
 
         logger.info(
@@ -155,14 +158,17 @@ class SemanticParser:
         Raises:
             LLMError: If parsing fails
         """
-        system_prompt, user_prompt = self.template.format(
+        prompt = self.template.render(
             input_text=utterance, variables=context, include_examples=True
         )
 
         logger.debug(f"Async parsing utterance: {utterance}")
 
         result = await self.llm.acall_structured(
-            prompt=user_prompt, response_model=SemanticParse, system_prompt=system_prompt
+            prompt=prompt.suffix,
+            response_model=SemanticParse,
+            system_prompt=prompt.system,
+            prompt_prefix=prompt.prefix,
         )
 
         logger.info(
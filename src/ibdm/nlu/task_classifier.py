@@ -191,7 +191,7 @@ class TaskClassifier:
             max_tokens=500,
         )
 
-        self.llm = LLMAdapter(llm_config)
+        self.llm = LLMAdapter(llm_config, component="task_classifier")
 
         logger.info(
             f"Initialized task classifier with {len(self.config.domains)} domains: "
@@ -2,11 +2,12 @@
 Response parsing and validation framework for LLM outputs.
 
 This module provides comprehensive parsing, validation, and error recovery
-for structured LLM responses in various formats (JSON, XML, structured text).
+for structured LLM responses in various formats (JSON, XML, structured text),
+including incremental parsing of streamed JSON responses.
 """
 
 from .extractors import FieldExtractor, PartialExtractor, extract_partial_response
-from .metrics import ValidationMetrics, ValidationStats
+from .metrics import LatencyHistogram, ValidationMetrics, ValidationStats
 from .parsers import (
     AutoParser,
     JSONParser,
@@ -23,6 +24,7 @@ from .pipeline import (
     create_pipeline,
 )
 from .retry import AdaptiveRetry, ExponentialBackoff, RetryContext, RetryStrategy
+from .streaming import StreamingJSONParser, StreamingValidator
 from .validators import (
     CustomValidator,
     EnumValidator,
@@ -64,11 +66,15 @@ __all__ = [
     "ExponentialBackoff",
     "AdaptiveRetry",
     "RetryContext",
+    # Streaming
+    "StreamingJSONParser",
+    "StreamingValidator",
     # Extractors
     "PartialExtractor",
     "FieldExtractor",
     "extract_partial_response",
     # Metrics
+    "LatencyHistogram",
     "ValidationMetrics",
     "ValidationStats",
 ]
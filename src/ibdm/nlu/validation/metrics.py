@@ -2,17 +2,126 @@
 Metrics and statistics for validation framework.
 
 Tracks success rates, error patterns, and performance metrics.
+
+ValidationMetrics is safe to share between threads and sessions: each thread
+records into its own shard (a ValidationStats behind an uncontended lock) and
+readers merge the shards into a snapshot. Shards of threads that have exited
+are folded into a single retired total, so short-lived threads (one per
+request in a thread pool that recycles workers) do not accumulate. Latency goes into a fixed-size,
+log-bucketed histogram, so percentiles cost constant memory; the error-code
+and validator tables keep at most max_table_keys entries and count the rest
+under OTHER_KEY; and validations that are started but never recorded expire
+after pending_ttl seconds instead of accumulating.
 """
 
-from collections import defaultdict
+import itertools
+import math
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass
 from dataclasses import field as dataclass_field
-from datetime import datetime
 from typing import Any
 
 from .parsers import ParseFormat, ParseResult
 from .validators import ValidationResult
 
+#: Key collecting the counts of entries that did not fit in a bounded table
+OTHER_KEY = "<other>"
+
+#: Default maximum number of entries per error table
+DEFAULT_TABLE_KEYS = 100
+
+
+def _bump(
+    table: dict[str, int], key: str, amount: int = 1, limit: int = DEFAULT_TABLE_KEYS
+) -> None:
+    """Add to a bounded count table, folding new keys into OTHER_KEY once it is full."""
+    if key not in table and len(table) >= limit:
+        key = OTHER_KEY
+    table[key] = table.get(key, 0) + amount
+
+
+@dataclass
+class LatencyHistogram:
+    """
+    Fixed-size latency histogram with logarithmic buckets.
+
+    Bucket i holds durations up to MIN_SECONDS * 2 ** (i / BUCKETS_PER_DOUBLING),
+    so a reported percentile is at most ~19% above the true value. Durations
+    beyond the last bucket land in it.
+
+    Attributes:
+        counts: Observations per bucket
+        count: Total observations
+        total: Sum of observed durations (seconds)
+        max: Largest observed duration (seconds)
+    """
+
+    MIN_SECONDS = 1e-4
+    BUCKETS_PER_DOUBLING = 4
+    NUM_BUCKETS = 4 * 22  # up to ~7 minutes
+
+    counts: list[int] = dataclass_field(default_factory=lambda: [0] * LatencyHistogram.NUM_BUCKETS)
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add one observation."""
+        index = 0
+        if seconds > self.MIN_SECONDS:
+            index = math.ceil(math.log2(seconds / self.MIN_SECONDS) * self.BUCKETS_PER_DOUBLING)
+        self.counts[min(index, self.NUM_BUCKETS - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's observations to this one."""
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Upper bound of the bucket holding the given fraction of observations.
+
+        Args:
+            fraction: Between 0 and 1 (0.95 for p95)
+
+        Returns:
+            Duration in seconds (0.0 without observations)
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= rank:
+                upper = self.MIN_SECONDS * 2 ** (index / self.BUCKETS_PER_DOUBLING)
+                return min(upper, self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        """Average observed duration."""
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "max": self.max,
+        }
+
 
 @dataclass
 class ValidationStats:
@@ -29,11 +138,13 @@ class ValidationStats:
         validation_errors: Number of validation errors
         warnings: Number of warnings generated
         retries: Number of retry attempts
+        abandoned: Validations started but never recorded (expired)
         formats: Count by parse format
-        error_codes: Count by error code
-        validator_errors: Count by validator name
+        error_codes: Count by error code (bounded)
+        validator_errors: Count by validator name (bounded)
         total_time: Total time spent in validation (seconds)
-        avg_time: Average time per validation (seconds)
+        avg_time: Average time per timed validation (seconds)
+        latency: Histogram of timed validations
     """
 
     total_attempts: int = 0
@@ -43,11 +154,13 @@ class ValidationStats:
     validation_errors: int = 0
     warnings: int = 0
     retries: int = 0
-    formats: dict[str, int] = dataclass_field(default_factory=lambda: defaultdict(int))
-    error_codes: dict[str, int] = dataclass_field(default_factory=lambda: defaultdict(int))
-    validator_errors: dict[str, int] = dataclass_field(default_factory=lambda: defaultdict(int))
+    abandoned: int = 0
+    formats: dict[str, int] = dataclass_field(default_factory=lambda: {})
+    error_codes: dict[str, int] = dataclass_field(default_factory=lambda: {})
+    validator_errors: dict[str, int] = dataclass_field(default_factory=lambda: {})
     total_time: float = 0.0
     avg_time: float = 0.0
+    latency: LatencyHistogram = dataclass_field(default_factory=LatencyHistogram)
 
     @property
     def success_rate(self) -> float:
@@ -68,6 +181,39 @@ class ValidationStats:
             return 0.0
         return self.retries / self.total_attempts
 
+    def record_time(self, elapsed: float) -> None:
+        """Add the duration of one timed validation."""
+        self.latency.record(elapsed)
+        self.total_time += elapsed
+        self.avg_time = self.total_time / self.latency.count
+
+    def merge(self, other: "ValidationStats", table_limit: int = DEFAULT_TABLE_KEYS) -> None:
+        """
+        Add another set of statistics to this one.
+
+        Args:
+            other: Statistics to add
+            table_limit: Maximum entries kept per error table
+        """
+        self.total_attempts += other.total_attempts
+        self.successful += other.successful
+        self.failed += other.failed
+        self.parse_errors += other.parse_errors
+        self.validation_errors += other.validation_errors
+        self.warnings += other.warnings
+        self.retries += other.retries
+        self.abandoned += other.abandoned
+        for mine, theirs in (
+            (self.formats, other.formats),
+            (self.error_codes, other.error_codes),
+            (self.validator_errors, other.validator_errors),
+        ):
+            for key, count in theirs.items():
+                _bump(mine, key, count, table_limit)
+        self.latency.merge(other.latency)
+        self.total_time += other.total_time
+        self.avg_time = self.total_time / self.latency.count if self.latency.count else 0.0
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -81,25 +227,81 @@ class ValidationStats:
             "warnings": self.warnings,
             "retries": self.retries,
             "retry_rate": self.retry_rate,
+            "abandoned": self.abandoned,
             "formats": dict(self.formats),
             "error_codes": dict(self.error_codes),
             "validator_errors": dict(self.validator_errors),
             "total_time": self.total_time,
             "avg_time": self.avg_time,
+            "latency": self.latency.to_dict(),
         }
 
 
+@dataclass
+class _Shard:
+    """One thread's statistics."""
+
+    owner: "weakref.ref[threading.Thread]"
+    stats: ValidationStats = dataclass_field(default_factory=ValidationStats)
+    lock: threading.Lock = dataclass_field(default_factory=threading.Lock)
+
+    @property
+    def retired(self) -> bool:
+        """Whether the owning thread has exited, so nothing records into the shard."""
+        thread = self.owner()
+        return thread is None or not thread.is_alive()
+
+
 class ValidationMetrics:
     """
     Metrics tracker for validation operations.
 
-    Collects and aggregates validation statistics.
+    Collects and aggregates validation statistics. Safe for concurrent use;
+    see the module docstring.
     """
 
-    def __init__(self):
-        """Initialize metrics tracker."""
-        self.stats = ValidationStats()
-        self._start_times: dict[str, datetime] = {}
+    #: Counters exported by prometheus_lines(): metric name -> (help, stats field)
+    PROMETHEUS_COUNTERS = {
+        "ibdm_validation_attempts_total": ("Validation attempts", "total_attempts"),
+        "ibdm_validation_successful_total": ("Successful validations", "successful"),
+        "ibdm_validation_failed_total": ("Failed validations", "failed"),
+        "ibdm_validation_parse_errors_total": ("Parse errors", "parse_errors"),
+        "ibdm_validation_errors_total": ("Validations with errors", "validation_errors"),
+        "ibdm_validation_warnings_total": ("Validation warnings", "warnings"),
+        "ibdm_validation_retries_total": ("Retry attempts", "retries"),
+        "ibdm_validation_abandoned_total": ("Validations never recorded", "abandoned"),
+    }
+
+    def __init__(
+        self,
+        max_table_keys: int = DEFAULT_TABLE_KEYS,
+        pending_ttl: float = 300.0,
+        max_pending: int = 10_000,
+    ):
+        """
+        Initialize metrics tracker.
+
+        Args:
+            max_table_keys: Maximum entries per error-code/validator table
+            pending_ttl: Seconds after which a started validation is abandoned
+            max_pending: Maximum started validations awaiting a record
+        """
+        self.max_table_keys = max_table_keys
+        self.pending_ttl = pending_ttl
+        self.max_pending = max_pending
+        self._local = threading.local()
+        self._shards: list[_Shard] = []
+        self._retired = ValidationStats()
+        self._shards_lock = threading.Lock()
+        self._start_times: OrderedDict[str, float] = OrderedDict()
+        self._pending_lock = threading.Lock()
+        self._abandoned = 0
+        self._ids = itertools.count()
+
+    @property
+    def stats(self) -> ValidationStats:
+        """Snapshot of the statistics merged across threads."""
+        return self.get_stats()
 
     def start_validation(self, validation_id: str | None = None) -> str:
         """
@@ -112,9 +314,15 @@ class ValidationMetrics:
             Validation ID (generated if not provided)
         """
         if validation_id is None:
-            validation_id = f"val_{datetime.now().timestamp()}"
-
-        self._start_times[validation_id] = datetime.now()
+            validation_id = f"val_{next(self._ids)}"
+
+        with self._pending_lock:
+            now = time.monotonic()
+            self._expire(now)
+            while len(self._start_times) >= self.max_pending:
+                self._start_times.popitem(last=False)
+                self._abandoned += 1
+            self._start_times[validation_id] = now
         return validation_id
 
     def record_validation(
@@ -133,65 +341,130 @@ class ValidationMetrics:
             validation_id: Optional validation ID
             retry_count: Number of retries attempted
         """
-        self.stats.total_attempts += 1
-
-        # Record timing
-        if validation_id and validation_id in self._start_times:
-            start_time = self._start_times[validation_id]
-            elapsed = (datetime.now() - start_time).total_seconds()
-            self.stats.total_time += elapsed
-            self.stats.avg_time = self.stats.total_time / self.stats.total_attempts
-            del self._start_times[validation_id]
-
-        # Record success/failure
-        if parse_result.success and validation_result.valid:
-            self.stats.successful += 1
-        else:
-            self.stats.failed += 1
-
-        # Record parse errors
-        if parse_result.failed:
-            self.stats.parse_errors += 1
-
-        # Record validation errors
-        if validation_result.errors:
-            self.stats.validation_errors += 1
-
-        # Record warnings
-        self.stats.warnings += len(validation_result.warnings)
-
-        # Record retries
-        self.stats.retries += retry_count
-
-        # Record format
-        if parse_result.format != ParseFormat.UNKNOWN:
-            self.stats.formats[parse_result.format.value] += 1
-
-        # Record error codes
-        for issue in validation_result.issues:
-            if issue.code:
-                self.stats.error_codes[issue.code] += 1
-
-        # Record validator errors
-        if "validators_run" in validation_result.metadata:
-            for validator_name in validation_result.metadata["validators_run"]:
-                # Count errors from this validator
-                validator_errors = [
-                    issue
-                    for issue in validation_result.errors
-                    if validator_name in str(issue.metadata)
-                ]
-                if validator_errors:
-                    self.stats.validator_errors[validator_name] += len(validator_errors)
+        elapsed: float | None = None
+        if validation_id:
+            with self._pending_lock:
+                start_time = self._start_times.pop(validation_id, None)
+            if start_time is not None:
+                elapsed = time.monotonic() - start_time
+
+        shard = self._shard()
+        limit = self.max_table_keys
+        with shard.lock:
+            stats = shard.stats
+            stats.total_attempts += 1
+
+            # Record timing
+            if elapsed is not None:
+                stats.record_time(elapsed)
+
+            # Record success/failure
+            if parse_result.success and validation_result.valid:
+                stats.successful += 1
+            else:
+                stats.failed += 1
+
+            # Record parse errors
+            if parse_result.failed:
+                stats.parse_errors += 1
+
+            # Record validation errors
+            if validation_result.errors:
+                stats.validation_errors += 1
+
+            # Record warnings
+            stats.warnings += len(validation_result.warnings)
+
+            # Record retries
+            stats.retries += retry_count
+
+            # Record format
+            if parse_result.format != ParseFormat.UNKNOWN:
+                _bump(stats.formats, parse_result.format.value, limit=limit)
+
+            # Record error codes
+            for issue in validation_result.issues:
+                if issue.code:
+                    _bump(stats.error_codes, issue.code, limit=limit)
+
+            # Record validator errors
+            if "validators_run" in validation_result.metadata:
+                for validator_name in validation_result.metadata["validators_run"]:
+                    # Count errors from this validator
+                    validator_errors = [
+                        issue
+                        for issue in validation_result.errors
+                        if validator_name in str(issue.metadata)
+                    ]
+                    if validator_errors:
+                        _bump(
+                            stats.validator_errors,
+                            validator_name,
+                            len(validator_errors),
+                            limit,
+                        )
 
     def get_stats(self) -> ValidationStats:
-        """Get current statistics."""
-        return self.stats
+        """Get a snapshot of the current statistics, merged across threads."""
+        merged = ValidationStats()
+        with self._shards_lock:
+            self._compact()
+            merged.merge(self._retired, self.max_table_keys)
+            shards = list(self._shards)
+        for shard in shards:
+            with shard.lock:
+                merged.merge(shard.stats, self.max_table_keys)
+        with self._pending_lock:
+            self._expire(time.monotonic())
+            merged.abandoned += self._abandoned
+        return merged
+
+    def pending(self) -> int:
+        """Number of started validations not yet recorded or expired."""
+        with self._pending_lock:
+            self._expire(time.monotonic())
+            return len(self._start_times)
 
     def reset(self) -> None:
         """Reset all metrics."""
-        self.stats = ValidationStats()
-        self._start_times.clear()
+        with self._shards_lock:
+            self._retired = ValidationStats()
+            shards = list(self._shards)
+        for shard in shards:
+            with shard.lock:
+                shard.stats = ValidationStats()
+        with self._pending_lock:
+            self._start_times.clear()
+            self._abandoned = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Snapshot as a dictionary (e.g. for JSONLSink.write_record)."""
+        return self.get_stats().to_dict()
+
+    def prometheus_lines(self) -> list[str]:
+        """
+        Metrics in the Prometheus text exposition format.
+
+        Register the tracker with a PrometheusSink (ibdm.nlu.llm_telemetry) to
+        export it alongside the LLM call counters.
+
+        Returns:
+            Exposition lines (counters and a latency summary)
+        """
+        stats = self.get_stats()
+        lines: list[str] = []
+        for name, (help_text, attribute) in self.PROMETHEUS_COUNTERS.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name} {getattr(stats, attribute)}")
+        name = "ibdm_validation_latency_seconds"
+        lines.append(f"# HELP {name} Validation latency")
+        lines.append(f"# TYPE {name} summary")
+        for quantile in (0.5, 0.95, 0.99):
+            lines.append(f'{name}{{quantile="{quantile}"}} {stats.latency.percentile(quantile)}')
+        lines.append(f"{name}_sum {stats.latency.total}")
+        lines.append(f"{name}_count {stats.latency.count}")
+        return lines
 
     def summary(self) -> str:
         """
@@ -200,43 +473,50 @@ class ValidationMetrics:
         Returns:
             Formatted summary string
         """
+        stats = self.get_stats()
         lines = [
             "=== Validation Metrics Summary ===",
-            f"Total Attempts: {self.stats.total_attempts}",
-            f"Successful: {self.stats.successful} ({self.stats.success_rate:.1%})",
-            f"Failed: {self.stats.failed} ({self.stats.failure_rate:.1%})",
+            f"Total Attempts: {stats.total_attempts}",
+            f"Successful: {stats.successful} ({stats.success_rate:.1%})",
+            f"Failed: {stats.failed} ({stats.failure_rate:.1%})",
             "",
             "Error Breakdown:",
-            f"  Parse Errors: {self.stats.parse_errors}",
-            f"  Validation Errors: {self.stats.validation_errors}",
-            f"  Warnings: {self.stats.warnings}",
+            f"  Parse Errors: {stats.parse_errors}",
+            f"  Validation Errors: {stats.validation_errors}",
+            f"  Warnings: {stats.warnings}",
             "",
-            f"Retries: {self.stats.retries} ({self.stats.retry_rate:.2f} per attempt)",
+            f"Retries: {stats.retries} ({stats.retry_rate:.2f} per attempt)",
             "",
         ]
 
         # Format breakdown
-        if self.stats.formats:
+        if stats.formats:
             lines.append("Formats:")
-            for fmt, count in sorted(self.stats.formats.items(), key=lambda x: x[1], reverse=True):
+            for fmt, count in sorted(stats.formats.items(), key=lambda x: x[1], reverse=True):
                 lines.append(f"  {fmt}: {count}")
             lines.append("")
 
         # Top error codes
-        if self.stats.error_codes:
+        if stats.error_codes:
             lines.append("Top Error Codes:")
-            top_errors = sorted(self.stats.error_codes.items(), key=lambda x: x[1], reverse=True)[
-                :5
-            ]
+            top_errors = sorted(stats.error_codes.items(), key=lambda x: x[1], reverse=True)[:5]
             for code, count in top_errors:
                 lines.append(f"  {code}: {count}")
             lines.append("")
 
         # Performance
-        if self.stats.total_time > 0:
+        if stats.total_time > 0:
             lines.append("Performance:")
-            lines.append(f"  Total Time: {self.stats.total_time:.2f}s")
-            lines.append(f"  Average Time: {self.stats.avg_time:.4f}s")
+            lines.append(f"  Total Time: {stats.total_time:.2f}s")
+            lines.append(f"  Average Time: {stats.avg_time:.4f}s")
+            lines.append(
+                f"  p50/p95/p99: {stats.latency.percentile(0.5):.4f}s / "
+                f"{stats.latency.percentile(0.95):.4f}s / {stats.latency.percentile(0.99):.4f}s"
+            )
+            lines.append("")
+
+        if stats.abandoned:
+            lines.append(f"Abandoned Validations: {stats.abandoned}")
             lines.append("")
 
         return "\n".join(lines)
@@ -248,6 +528,7 @@ class ValidationMetrics:
         Returns:
             Dictionary of error pattern analysis
         """
+        stats = self.get_stats()
         patterns: dict[str, Any] = {
             "most_common_errors": [],
             "problematic_validators": [],
@@ -255,21 +536,21 @@ class ValidationMetrics:
         }
 
         # Most common error codes
-        if self.stats.error_codes:
+        if stats.error_codes:
             patterns["most_common_errors"] = sorted(
-                self.stats.error_codes.items(), key=lambda x: x[1], reverse=True
+                stats.error_codes.items(), key=lambda x: x[1], reverse=True
             )[:10]
 
         # Validators with most errors
-        if self.stats.validator_errors:
+        if stats.validator_errors:
             patterns["problematic_validators"] = sorted(
-                self.stats.validator_errors.items(), key=lambda x: x[1], reverse=True
+                stats.validator_errors.items(), key=lambda x: x[1], reverse=True
             )[:5]
 
         # Format-specific issues
-        for fmt, count in self.stats.formats.items():
+        for fmt, count in stats.formats.items():
             if count > 0:
-                error_rate = self.stats.parse_errors / count if fmt in ["json", "xml"] else 0.0
+                error_rate = stats.parse_errors / count if fmt in ["json", "xml"] else 0.0
                 patterns["format_issues"][fmt] = {
                     "count": count,
                     "error_rate": error_rate,
@@ -277,6 +558,37 @@ class ValidationMetrics:
 
         return patterns
 
+    def _shard(self) -> _Shard:
+        """The calling thread's shard, created on first use."""
+        shard: _Shard | None = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _Shard(weakref.ref(threading.current_thread()))
+            self._local.shard = shard
+            with self._shards_lock:
+                self._compact()
+                self._shards.append(shard)
+        return shard
+
+    def _compact(self) -> None:
+        """Fold the shards of exited threads into the retired total (caller holds the lock)."""
+        live: list[_Shard] = []
+        for shard in self._shards:
+            if shard.retired:
+                with shard.lock:
+                    self._retired.merge(shard.stats, self.max_table_keys)
+            else:
+                live.append(shard)
+        self._shards = live
+
+    def _expire(self, now: float) -> None:
+        """Drop started validations older than pending_ttl (caller holds the lock)."""
+        while self._start_times:
+            validation_id, started = next(iter(self._start_times.items()))
+            if now - started < self.pending_ttl:
+                break
+            del self._start_times[validation_id]
+            self._abandoned += 1
+
 
 # Global metrics instance for convenience
 _global_metrics = ValidationMetrics()
@@ -0,0 +1,226 @@
+"""
+Incremental JSON parsing for streamed LLM responses.
+
+The other parsers wait for the full completion. StreamingJSONParser is fed the
+response chunk by chunk and reports each top-level field of the JSON object
+as soon as its value is complete, so a caller can act on an early field
+(e.g. a dialogue act or confidence) while later, longer fields are still
+being generated. StreamingValidator adds progressive validation: every
+completed field is checked against its Pydantic field definition on arrival,
+so a malformed response can be abandoned without waiting for the rest.
+
+Text before the opening brace (prose, a ```json fence) and after the closing
+brace is ignored.
+"""
+
+import json
+from dataclasses import dataclass
+from dataclasses import field as dataclass_field
+from enum import Enum
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+T = TypeVar("T", bound=BaseModel)
+
+_WHITESPACE = " \t\r\n"
+
+
+class _Position(Enum):
+    """Where the parser is within the top-level object."""
+
+    PREAMBLE = "preamble"  # before the opening brace
+    KEY_WAIT = "key_wait"  # expecting a key or the closing brace
+    KEY = "key"  # inside a key string
+    COLON_WAIT = "colon_wait"  # after a key, expecting ':'
+    VALUE = "value"  # collecting a value
+    DONE = "done"  # after the closing brace
+
+
+@dataclass
+class StreamingJSONParser:
+    """
+    Incremental parser for a streamed top-level JSON object.
+
+    Attributes:
+        fields: Top-level fields completed so far, in arrival order
+        error: Why parsing failed, if it did
+    """
+
+    fields: dict[str, Any] = dataclass_field(default_factory=lambda: {})
+    error: str | None = None
+    _position: _Position = _Position.PREAMBLE
+    _token: list[str] = dataclass_field(default_factory=lambda: [])
+    _key: str = ""
+    _depth: int = 0
+    _in_string: bool = False
+    _escaped: bool = False
+
+    @property
+    def done(self) -> bool:
+        """Whether the closing brace of the object has been seen."""
+        return self._position is _Position.DONE
+
+    @property
+    def failed(self) -> bool:
+        """Whether the stream is not valid JSON."""
+        return self.error is not None
+
+    def feed(self, chunk: str) -> list[tuple[str, Any]]:
+        """
+        Consume the next chunk of the response.
+
+        Args:
+            chunk: Text in stream order
+
+        Returns:
+            (name, value) pairs for the fields completed by this chunk
+        """
+        completed: list[tuple[str, Any]] = []
+        for char in chunk:
+            if self.failed or self.done:
+                break
+            self._step(char, completed)
+        return completed
+
+    def _step(self, char: str, completed: list[tuple[str, Any]]) -> None:
+        position = self._position
+        if position is _Position.PREAMBLE:
+            if char == "{":
+                self._position = _Position.KEY_WAIT
+        elif position is _Position.KEY_WAIT:
+            if char == '"':
+                self._position = _Position.KEY
+                self._token = [char]
+            elif char == "}" and not self.fields:
+                self._position = _Position.DONE
+            elif char not in _WHITESPACE:
+                self.error = f"Expected a field name, got {char!r}"
+        elif position is _Position.KEY:
+            self._token.append(char)
+            if self._string_closed(char):
+                self._key = self._decode("".join(self._token))
+                self._position = _Position.COLON_WAIT
+        elif position is _Position.COLON_WAIT:
+            if char == ":":
+                self._position = _Position.VALUE
+                self._token = []
+            elif char not in _WHITESPACE:
+                self.error = f"Expected ':' after {self._key!r}, got {char!r}"
+        elif position is _Position.VALUE:
+            self._collect_value(char, completed)
+
+    def _collect_value(self, char: str, completed: list[tuple[str, Any]]) -> None:
+        if self._in_string:
+            self._token.append(char)
+            self._string_closed(char)
+            return
+        if self._depth == 0 and char in ",}":
+            value = self._decode("".join(self._token))
+            if self.failed:
+                return
+            self.fields[self._key] = value
+            completed.append((self._key, value))
+            self._position = _Position.KEY_WAIT if char == "," else _Position.DONE
+            return
+        self._token.append(char)
+        if char == '"':
+            self._in_string = True
+        elif char in "{[":
+            self._depth += 1
+        elif char in "}]":
+            self._depth -= 1
+
+    def _string_closed(self, char: str) -> bool:
+        """Track escapes inside a string; return True on its closing quote."""
+        if self._escaped:
+            self._escaped = False
+        elif char == "\\":
+            self._escaped = True
+        elif char == '"' and len(self._token) > 1:
+            self._in_string = False
+            return True
+        return False
+
+    def _decode(self, text: str) -> Any:
+        try:
+            return json.loads(text)
+        except ValueError as e:
+            self.error = f"Invalid JSON value {text.strip()[:50]!r}: {e}"
+            return None
+
+
+class StreamingValidator(Generic[T]):
+    """
+    Streaming parser that validates each field against a Pydantic model.
+
+    Fields the model does not declare are passed through unchecked; whole-model
+    constraints (required fields, model validators) are checked by result().
+    """
+
+    def __init__(self, response_model: type[T]):
+        """
+        Initialize the validator.
+
+        Args:
+            response_model: Pydantic model the complete object must satisfy
+        """
+        self.response_model = response_model
+        self.parser = StreamingJSONParser()
+        # Unvalidated instance that single-field assignments are validated against
+        self._scratch = response_model.model_construct()
+
+    @property
+    def done(self) -> bool:
+        """Whether the whole object has been received."""
+        return self.parser.done
+
+    @property
+    def error(self) -> str | None:
+        """Why parsing or field validation failed, if it did."""
+        return self.parser.error
+
+    def feed(self, chunk: str) -> list[tuple[str, Any]]:
+        """
+        Consume the next chunk, validating the fields it completes.
+
+        Args:
+            chunk: Text in stream order
+
+        Returns:
+            (name, value) pairs for the newly completed, valid fields; empty
+            once a field has failed (see error)
+        """
+        completed: list[tuple[str, Any]] = []
+        for name, value in self.parser.feed(chunk):
+            try:
+                completed.append((name, self._validate_field(name, value)))
+            except ValidationError as e:
+                self.parser.error = f"Field {name!r} failed validation: {e.errors()[0]['msg']}"
+                return []
+        return completed
+
+    def result(self) -> T:
+        """
+        Validate the complete object.
+
+        Returns:
+            Instance of the response model
+
+        Raises:
+            ValueError: If the stream ended early or failed to parse
+            ValidationError: If the object does not satisfy the model
+        """
+        if self.error is not None:
+            raise ValueError(self.error)
+        if not self.done:
+            raise ValueError("Response ended before the JSON object was closed")
+        return self.response_model.model_validate(self.parser.fields)
+
+    def _validate_field(self, name: str, value: Any) -> Any:
+        """Validate one field with its declared type and constraints."""
+        if name not in self.response_model.model_fields:
+            return value
+        validator = self.response_model.__pydantic_validator__
+        validator.validate_assignment(self._scratch, name, value)
+        return getattr(self._scratch, name)
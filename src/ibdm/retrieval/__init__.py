@@ -0,0 +1,22 @@
+"""In-process document retrieval for RAG actions.
+
+Provides a BM25 inverted index with a memory-mapped on-disk format, a loader
+that builds indexes offline from markdown/JSON document directories, and a
+DeviceInterface that serves retrieval actions from those indexes.
+"""
+
+from ibdm.retrieval.bm25 import BM25Index, Document, SearchHit, relevance_ranked, tokenize
+from ibdm.retrieval.corpus import build_index, load_documents
+from ibdm.retrieval.device import RagExecutor, RetrievalDevice
+
+__all__ = [
+    "BM25Index",
+    "Document",
+    "SearchHit",
+    "relevance_ranked",
+    "tokenize",
+    "build_index",
+    "load_documents",
+    "RagExecutor",
+    "RetrievalDevice",
+]
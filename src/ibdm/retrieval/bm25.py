@@ -0,0 +1,423 @@
+"""Okapi BM25 inverted index with a memory-mapped on-disk format.
+
+The index maps each term to a postings list of (document, term frequency)
+pairs and scores queries with BM25 (Robertson & Zaragoza, 2009). Indexes are
+built once from a document collection, saved to a single file, and loaded by
+memory-mapping that file: the postings are read straight from the page cache
+instead of being parsed into Python objects, so opening a large index costs
+little more than reading its vocabulary.
+
+File layout (little-endian):
+    8 bytes   magic
+    8 bytes   length of the metadata block in bytes
+    8 bytes   number of uint32 values in the postings block
+    metadata  UTF-8 JSON: parameters, documents, lengths and vocabulary
+    padding   to an 8-byte boundary
+    postings  uint32 (doc index, term frequency) pairs, grouped by term
+
+Example:
+    >>> index = BM25Index.from_documents(documents)
+    >>> index.save("clauses.bm25")
+    >>> index = BM25Index.load("clauses.bm25")
+    >>> hits = index.search("confidentiality period", top_k=3)
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import math
+import mmap
+import re
+import struct
+import sys
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+_MAGIC = b"IBDMBM25"
+_HEADER = struct.Struct("<8sQQ")
+_ALIGNMENT = 8
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+#: Words too common to help ranking
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to "
+    "was were will with".split()
+)
+
+
+def _stem(token: str) -> str:
+    """Fold simple plurals so "exclusions" matches "exclusion"."""
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into index terms.
+
+    Lowercases, splits on anything that is not a letter or digit (so
+    "governing_law" yields "governing" and "law"), drops stopwords and folds
+    simple plurals.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Terms in order of occurrence
+    """
+    return [_stem(token) for token in _TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+@dataclass
+class Document:
+    """A retrievable document.
+
+    Attributes:
+        doc_id: Unique document ID
+        title: Document title (indexed along with the content)
+        content: Document text
+        metadata: Extra fields returned with the document; string and list
+            values are indexed too (e.g. tags, jurisdiction)
+    """
+
+    doc_id: str
+    title: str
+    content: str
+    metadata: dict[str, Any] = field(default_factory=lambda: {})
+
+    def indexed_text(self) -> str:
+        """Text the index is built from: title, content and metadata values."""
+        parts = [self.title, self.content]
+        for value in self.metadata.values():
+            if isinstance(value, str):
+                parts.append(value)
+            elif isinstance(value, list):
+                parts.extend(str(item) for item in value)  # type: ignore[misc]
+        return " ".join(parts)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Flatten to a dict with doc_id, title, content and the metadata fields."""
+        return {
+            "doc_id": self.doc_id,
+            "title": self.title,
+            "content": self.content,
+            **self.metadata,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Document:
+        """Create a document from a flat dict (inverse of to_dict()).
+
+        Args:
+            data: Dict with doc_id, title and content; other keys become metadata
+
+        Returns:
+            Document instance
+        """
+        fields = dict(data)
+        return cls(
+            doc_id=str(fields.pop("doc_id")),
+            title=str(fields.pop("title", "")),
+            content=str(fields.pop("content", "")),
+            metadata=fields,
+        )
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """One ranked search result.
+
+    Attributes:
+        document: The matching document
+        score: BM25 score
+        rank: Position in the result list (0 = best)
+        coverage: Fraction of the distinct query terms found in the document
+    """
+
+    document: Document
+    score: float
+    rank: int
+    coverage: float = 1.0
+
+
+def relevance_ranked(hits: Sequence[SearchHit], min_coverage: float = 0.0) -> list[dict[str, Any]]:
+    """Flatten hits to document dicts with a normalized relevance score.
+
+    BM25 scores are unbounded, so each hit's "relevance_score" is its score as
+    a fraction of the best hit's (the top hit scores 1.0). Normalizing alone
+    makes the best hit relevant however poorly it matches, so hits covering
+    less than min_coverage of the query terms score 0.0 and the rest are
+    normalized against the best hit that remains.
+
+    Args:
+        hits: Ranked hits from BM25Index.search()
+        min_coverage: Fraction of the query terms a hit must contain to score
+
+    Returns:
+        Document dicts (see Document.to_dict()) with "relevance_score" added
+    """
+    top = max((hit.score for hit in hits if hit.coverage >= min_coverage), default=0.0)
+    return [
+        {
+            **hit.document.to_dict(),
+            "relevance_score": round(hit.score / top, 3) if hit.coverage >= min_coverage else 0.0,
+        }
+        for hit in hits
+    ]
+
+
+class BM25Index:
+    """Inverted index scored with Okapi BM25, with an LRU query-result cache."""
+
+    def __init__(
+        self,
+        documents: Sequence[Document],
+        doc_lengths: Sequence[int],
+        vocabulary: dict[str, tuple[int, int]],
+        postings: Sequence[int],
+        k1: float = 1.5,
+        b: float = 0.75,
+        cache_size: int = 256,
+    ):
+        """Initialize from prebuilt index structures (use from_documents() or load()).
+
+        Args:
+            documents: Documents by index
+            doc_lengths: Term count of each document
+            vocabulary: Term -> (offset into postings, document frequency)
+            postings: Flat (doc index, term frequency) pairs grouped by term
+            k1: Term-frequency saturation parameter
+            b: Length-normalization parameter
+            cache_size: Maximum number of cached queries (0 disables caching)
+        """
+        self.documents = list(documents)
+        self.doc_lengths = list(doc_lengths)
+        self.vocabulary = vocabulary
+        self.k1 = k1
+        self.b = b
+        self.cache_size = cache_size
+        self._postings = postings
+        self._avg_length = sum(self.doc_lengths) / len(self.doc_lengths) if self.doc_lengths else 0
+        self._cache: OrderedDict[tuple[tuple[str, ...], int], list[SearchHit]] = OrderedDict()
+        self._mmap: mmap.mmap | None = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @classmethod
+    def from_documents(
+        cls, documents: Iterable[Document], k1: float = 1.5, b: float = 0.75, cache_size: int = 256
+    ) -> BM25Index:
+        """Build an index from documents.
+
+        Args:
+            documents: Documents to index
+            k1: Term-frequency saturation parameter
+            b: Length-normalization parameter
+            cache_size: Maximum number of cached queries
+
+        Returns:
+            In-memory BM25Index
+        """
+        docs = list(documents)
+        term_postings: dict[str, list[tuple[int, int]]] = {}
+        lengths: list[int] = []
+        for doc_index, doc in enumerate(docs):
+            terms = tokenize(doc.indexed_text())
+            lengths.append(len(terms))
+            counts: dict[str, int] = {}
+            for term in terms:
+                counts[term] = counts.get(term, 0) + 1
+            for term, tf in counts.items():
+                term_postings.setdefault(term, []).append((doc_index, tf))
+
+        postings = array("I")
+        vocabulary: dict[str, tuple[int, int]] = {}
+        for term in sorted(term_postings):
+            vocabulary[term] = (len(postings), len(term_postings[term]))
+            for doc_index, tf in term_postings[term]:
+                postings.append(doc_index)
+                postings.append(tf)
+
+        return cls(docs, lengths, vocabulary, postings, k1=k1, b=b, cache_size=cache_size)
+
+    def __len__(self) -> int:
+        """Number of indexed documents."""
+        return len(self.documents)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> BM25Index:
+        """Share the index: it is read-only and may be backed by a mapped file."""
+        return self
+
+    def _idf(self, df: int) -> float:
+        n = len(self.documents)
+        return math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+
+    def search(self, query: str, top_k: int = 5) -> list[SearchHit]:
+        """Rank documents against a query.
+
+        Args:
+            query: Free-text query
+            top_k: Maximum number of hits to return
+
+        Returns:
+            Hits with a positive score, best first (ties broken by document order)
+        """
+        terms = tuple(dict.fromkeys(tokenize(query)))
+        key = (terms, top_k)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return list(cached)
+
+        self.cache_misses += 1
+        hits = self._score(terms, top_k)
+        if self.cache_size > 0:
+            self._cache[key] = hits
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return list(hits)
+
+    def _score(self, terms: Sequence[str], top_k: int) -> list[SearchHit]:
+        scores: dict[int, float] = {}
+        matched: dict[int, int] = {}
+        k1, b, avg_length = self.k1, self.b, self._avg_length or 1.0
+        postings = self._postings
+        for term in terms:
+            entry = self.vocabulary.get(term)
+            if entry is None:
+                continue
+            offset, df = entry
+            idf = self._idf(df)
+            for position in range(offset, offset + 2 * df, 2):
+                doc_index = postings[position]
+                tf = postings[position + 1]
+                norm = k1 * (1.0 - b + b * self.doc_lengths[doc_index] / avg_length)
+                scores[doc_index] = scores.get(doc_index, 0.0) + idf * tf * (k1 + 1.0) / (tf + norm)
+                matched[doc_index] = matched.get(doc_index, 0) + 1
+
+        best = heapq.nsmallest(top_k, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [
+            SearchHit(
+                document=self.documents[doc_index],
+                score=score,
+                rank=rank,
+                coverage=matched[doc_index] / len(terms),
+            )
+            for rank, (doc_index, score) in enumerate(best)
+        ]
+
+    def cache_info(self) -> dict[str, int]:
+        """Query-cache statistics.
+
+        Returns:
+            Dict with hits, misses, size and maxsize
+        """
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self._cache),
+            "maxsize": self.cache_size,
+        }
+
+    def clear_cache(self) -> None:
+        """Drop all cached query results."""
+        self._cache.clear()
+
+    def save(self, path: str | Path) -> None:
+        """Write the index to a file in the memory-mappable format.
+
+        Args:
+            path: Output file
+        """
+        metadata = {
+            "k1": self.k1,
+            "b": self.b,
+            "documents": [doc.to_dict() for doc in self.documents],
+            "doc_lengths": self.doc_lengths,
+            "vocabulary": self.vocabulary,
+        }
+        meta_bytes = json.dumps(metadata, separators=(",", ":")).encode("utf-8")
+        postings = array("I", self._postings)
+        if sys.byteorder != "little":
+            postings.byteswap()
+
+        padding = -(_HEADER.size + len(meta_bytes)) % _ALIGNMENT
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(meta_bytes), len(postings)))
+            f.write(meta_bytes)
+            f.write(b"\0" * padding)
+            f.write(postings.tobytes())
+
+    @classmethod
+    def load(cls, path: str | Path, cache_size: int = 256) -> BM25Index:
+        """Open an index file written by save(), memory-mapping its postings.
+
+        Args:
+            path: Index file
+            cache_size: Maximum number of cached queries
+
+        Returns:
+            BM25Index backed by the mapped file (call close() to release it)
+
+        Raises:
+            ValueError: If the file is not a BM25 index
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, meta_length, postings_count = _HEADER.unpack_from(mapped)
+        if magic != _MAGIC:
+            mapped.close()
+            raise ValueError(f"{path} is not a BM25 index file")
+
+        meta_end = _HEADER.size + meta_length
+        metadata = json.loads(mapped[_HEADER.size : meta_end])
+        start = meta_end + (-meta_end % _ALIGNMENT)
+        raw = memoryview(mapped)[start : start + 4 * postings_count]
+        postings: Sequence[int]
+        if sys.byteorder == "little":
+            postings = raw.cast("I")
+        else:
+            swapped = array("I", raw.tobytes())
+            swapped.byteswap()
+            raw.release()
+            postings = swapped
+
+        index = cls(
+            documents=[Document.from_dict(doc) for doc in metadata["documents"]],
+            doc_lengths=metadata["doc_lengths"],
+            vocabulary={
+                term: (entry[0], entry[1]) for term, entry in metadata["vocabulary"].items()
+            },
+            postings=postings,
+            k1=metadata["k1"],
+            b=metadata["b"],
+            cache_size=cache_size,
+        )
+        index._mmap = mapped
+        return index
+
+    def close(self) -> None:
+        """Release the memory-mapped file (no-op for in-memory indexes)."""
+        if self._mmap is None:
+            return
+        if isinstance(self._postings, memoryview):
+            self._postings.release()
+        self._postings = array("I")
+        self._mmap.close()
+        self._mmap = None
+
+    def __enter__(self) -> BM25Index:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,140 @@
+"""Load retrieval documents from a directory and build indexes offline.
+
+Markdown files are split at headings and then into passages of at most a few
+hundred words (on paragraph boundaries), so long files such as the thesis
+chapters in docs/larsson_thesis/ yield passages rather than whole chapters.
+JSON files hold either a list of document dicts or an object with a
+"documents" list; each dict needs "content" and may carry "doc_id", "title"
+and any metadata fields (tags, jurisdiction, source, ...).
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Any, cast
+
+from ibdm.retrieval.bm25 import BM25Index, Document
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+
+#: Default maximum passage length for markdown documents, in words
+PASSAGE_WORDS = 300
+
+
+def _passages(text: str, passage_words: int) -> list[str]:
+    """Group paragraphs into passages of at most passage_words words.
+
+    A single paragraph longer than the limit becomes its own passage.
+    """
+    passages: list[str] = []
+    current: list[str] = []
+    words = 0
+    for paragraph in _PARAGRAPH_RE.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        length = len(paragraph.split())
+        if current and words + length > passage_words:
+            passages.append("\n\n".join(current))
+            current, words = [], 0
+        current.append(paragraph)
+        words += length
+    if current:
+        passages.append("\n\n".join(current))
+    return passages
+
+
+def _markdown_documents(path: Path, source: str, passage_words: int) -> list[Document]:
+    documents: list[Document] = []
+    title = path.stem
+    lines: list[str] = []
+
+    def flush() -> None:
+        for passage in _passages("\n".join(lines), passage_words):
+            documents.append(
+                Document(
+                    doc_id=f"{source}#{len(documents)}",
+                    title=title,
+                    content=passage,
+                    metadata={"source": source},
+                )
+            )
+
+    for line in path.read_text(encoding="utf-8").splitlines():
+        match = _HEADING_RE.match(line)
+        if match:
+            flush()
+            title = match.group(2)
+            lines = []
+        else:
+            lines.append(line)
+    flush()
+    return documents
+
+
+def _json_documents(path: Path, source: str) -> list[Document]:
+    data: Any = json.loads(path.read_text(encoding="utf-8"))
+    records = cast(list[dict[str, Any]], data["documents"] if isinstance(data, dict) else data)
+    documents: list[Document] = []
+    for position, record in enumerate(records):
+        fields = {"doc_id": f"{source}:{position}", "title": "", "source": source, **record}
+        documents.append(Document.from_dict(fields))
+    return documents
+
+
+def load_documents(directory: str | Path, passage_words: int = PASSAGE_WORDS) -> list[Document]:
+    """Load every markdown and JSON document under a directory.
+
+    Files are read recursively in sorted path order, so repeated builds give
+    identical indexes.
+
+    Args:
+        directory: Root directory of the collection
+        passage_words: Maximum words per markdown passage
+
+    Returns:
+        Documents in load order
+
+    Raises:
+        FileNotFoundError: If the directory does not exist
+    """
+    root = Path(directory)
+    if not root.is_dir():
+        raise FileNotFoundError(f"Document directory not found: {root}")
+
+    documents: list[Document] = []
+    for path in sorted(root.rglob("*")):
+        source = path.relative_to(root).as_posix()
+        if path.suffix == ".md":
+            documents.extend(_markdown_documents(path, source, passage_words))
+        elif path.suffix == ".json":
+            documents.extend(_json_documents(path, source))
+    return documents
+
+
+def build_index(
+    directory: str | Path,
+    output: str | Path | None = None,
+    k1: float = 1.5,
+    b: float = 0.75,
+    passage_words: int = PASSAGE_WORDS,
+) -> BM25Index:
+    """Build a BM25 index from a document directory, optionally saving it.
+
+    Args:
+        directory: Root directory of the collection
+        output: File to save the index to (skipped if None)
+        k1: Term-frequency saturation parameter
+        b: Length-normalization parameter
+        passage_words: Maximum words per markdown passage
+
+    Returns:
+        The in-memory index
+    """
+    index = BM25Index.from_documents(load_documents(directory, passage_words), k1=k1, b=b)
+    if output is not None:
+        index.save(output)
+    return index
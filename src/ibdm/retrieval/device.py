@@ -0,0 +1,139 @@
+"""Retrieval device: serves RAG actions from BM25 indexes.
+
+Each supported action name is routed to an index and an executor that turns
+the action's parameters into a query and the hits into the action's result.
+The legal and NDA domains provide ready-made devices via
+create_legal_rag_device() and create_nda_rag_device().
+
+Example:
+    >>> device = create_legal_rag_device()
+    >>> state.private.beliefs["device_interface"] = device
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from ibdm.core.actions import Action
+from ibdm.core.domain import DomainModel
+from ibdm.core.information_state import InformationState
+from ibdm.interfaces.device import ActionResult, ActionStatus, DeviceInterface
+from ibdm.retrieval.bm25 import BM25Index
+
+#: Executor for one RAG action: (action, state, index) -> result dict
+RagExecutor = Callable[[Action, Any, BM25Index], dict[str, Any]]
+
+
+class RetrievalDevice(DeviceInterface):
+    """Device executing retrieval actions against in-process BM25 indexes."""
+
+    def __init__(self, domain: DomainModel | None = None):
+        """Initialize the device.
+
+        Args:
+            domain: Domain supplying precondition checks and postconditions
+                for the routed actions (optional)
+        """
+        self.domain = domain
+        self._routes: dict[str, tuple[BM25Index, RagExecutor]] = {}
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> RetrievalDevice:
+        """Share the device when information states holding it are cloned."""
+        return self
+
+    def register(self, action_name: str, index: BM25Index, executor: RagExecutor) -> None:
+        """Route an action to an index.
+
+        Args:
+            action_name: Action name (e.g. "query_legal_database")
+            index: Index to search
+            executor: Function building the query and the action result
+        """
+        self._routes[action_name] = (index, executor)
+
+    def index_for(self, action_name: str) -> BM25Index:
+        """Get the index serving an action.
+
+        Args:
+            action_name: Routed action name
+
+        Returns:
+            The action's index
+
+        Raises:
+            KeyError: If the action is not routed to this device
+        """
+        return self._routes[action_name][0]
+
+    def execute_action(self, action: Action, state: InformationState) -> ActionResult:
+        """Run the retrieval for an action.
+
+        Args:
+            action: Routed RAG action
+            state: Current information state
+
+        Returns:
+            ActionResult whose return_value is the executor's result dict
+        """
+        route = self._routes.get(action.name)
+        if route is None:
+            return ActionResult(
+                status=ActionStatus.FAILURE,
+                action=action,
+                error_message=f"{self.get_name()} does not handle action {action.name!r}",
+            )
+
+        if self.domain is not None:
+            commitments = set(state.shared.commitments)
+            satisfied, error = self.domain.check_preconditions(action, commitments)
+            if not satisfied:
+                return ActionResult(
+                    status=ActionStatus.PRECONDITION_FAILED, action=action, error_message=error
+                )
+
+        index, executor = route
+        start = time.perf_counter()
+        result = executor(action, state, index)
+        return ActionResult(
+            status=ActionStatus.SUCCESS,
+            action=action,
+            return_value=result,
+            postconditions=self.get_postconditions(action),
+            metadata={
+                "device": self.get_name(),
+                "retrieval_seconds": time.perf_counter() - start,
+                "cache": index.cache_info(),
+            },
+        )
+
+    def check_preconditions(self, action: Action, state: InformationState) -> bool:
+        """Check the domain's preconditions for a routed action.
+
+        Args:
+            action: Action to check
+            state: Current information state
+
+        Returns:
+            True if the action is routed here and its preconditions hold
+        """
+        if action.name not in self._routes:
+            return False
+        if self.domain is None:
+            return True
+        satisfied, _ = self.domain.check_preconditions(action, set(state.shared.commitments))
+        return satisfied
+
+    def get_postconditions(self, action: Action) -> list[str]:
+        """Get the domain's postconditions for an action.
+
+        Args:
+            action: Executed action
+
+        Returns:
+            Postcondition propositions as strings (empty without a domain)
+        """
+        if self.domain is None:
+            return []
+        return [str(prop) for prop in self.domain.postcond(action)]
@@ -19,12 +19,18 @@ from ibdm.rules.negotiation_rules import (
     create_negotiation_rules,
     create_negotiation_selection_rules,
 )
+from ibdm.rules.profiling import PhaseProfile, RuleEvaluationRecord, RuleProfiler, RuleStats
 from ibdm.rules.selection_rules import create_selection_rules
-from ibdm.rules.update_rules import RuleSet, UpdateRule
+from ibdm.rules.update_rules import FrozenRuleSet, RuleSet, UpdateRule
 
 __all__ = [
     "UpdateRule",
     "RuleSet",
+    "FrozenRuleSet",
+    "RuleProfiler",
+    "PhaseProfile",
+    "RuleEvaluationRecord",
+    "RuleStats",
     "create_interpretation_rules",
     "create_integration_rules",
     "create_action_integration_rules",
@@ -24,6 +24,7 @@ from ibdm.core import (
     YNQuestion,
 )
 from ibdm.rules.update_rules import UpdateRule
+from ibdm.utils.utterance_features import UtteranceFeatures, extract_features
 
 
 def create_interpretation_rules() -> list[UpdateRule]:
@@ -115,74 +116,46 @@ def create_interpretation_rules() -> list[UpdateRule]:
 # Precondition functions
 
 
+def _features(state: InformationState) -> UtteranceFeatures:
+    """Surface features of the utterance being interpreted (cached per text)."""
+    return extract_features(state.private.beliefs.get("_temp_utterance", ""))
+
+
 def _is_greeting(state: InformationState) -> bool:
     """Check if utterance is a greeting."""
-    utterance = state.private.beliefs.get("_temp_utterance", "").lower()
-    greetings = ["hello", "hi", "hey", "greetings", "good morning", "good afternoon"]
-    return any(greeting in utterance for greeting in greetings)
+    return _features(state).has("greeting")
 
 
 def _is_quit(state: InformationState) -> bool:
     """Check if utterance is a quit command."""
-    utterance = state.private.beliefs.get("_temp_utterance", "").lower().strip()
-    quit_words = ["quit", "exit", "bye", "goodbye", "see you"]
-    return any(quit_word in utterance for quit_word in quit_words)
+    return _features(state).has("quit")
 
 
 def _is_wh_question(state: InformationState) -> bool:
     """Check if utterance is a wh-question."""
-    utterance = state.private.beliefs.get("_temp_utterance", "").lower()
     # Check for wh-words at the beginning
-    wh_words = ["what", "where", "when", "who", "why", "how", "which"]
-    return any(utterance.strip().startswith(wh) for wh in wh_words)
+    return _features(state).starts_with("wh")
 
 
 def _is_yn_question(state: InformationState) -> bool:
     """Check if utterance is a yes/no question."""
-    utterance = state.private.beliefs.get("_temp_utterance", "").strip()
-    if not utterance:
-        return False
-
-    # Check for question mark
-    if not utterance.endswith("?"):
-        return False
-
-    # Check for auxiliary verbs at the beginning (typical Y/N question structure)
-    utterance_lower = utterance.lower()
-    auxiliaries = [
-        "is",
-        "are",
-        "was",
-        "were",
-        "do",
-        "does",
-        "did",
-        "can",
-        "could",
-        "will",
-        "would",
-        "should",
-        "may",
-        "might",
-    ]
-    return any(utterance_lower.startswith(aux + " ") for aux in auxiliaries)
+    features = _features(state)
+    # Question mark plus an auxiliary verb at the beginning (typical Y/N question structure)
+    return features.is_question and features.starts_with("auxiliary")
 
 
 def _is_alt_question(state: InformationState) -> bool:
     """Check if utterance is an alternative question (X or Y?)."""
-    utterance = state.private.beliefs.get("_temp_utterance", "")
+    features = _features(state)
     # Check for "or" pattern with question mark
-    return " or " in utterance.lower() and utterance.strip().endswith("?")
+    return features.is_question and features.has("disjunction")
 
 
 def _is_yn_answer(state: InformationState) -> bool:
     """Check if utterance is a yes/no answer."""
-    utterance = state.private.beliefs.get("_temp_utterance", "").lower().strip()
-    yn_words = ["yes", "no", "yeah", "nope", "yep", "nah", "true", "false"]
+    features = _features(state)
     # Only match if it's a short response (to avoid false positives)
-    return utterance in yn_words or (
-        len(utterance.split()) <= 2 and any(yn in utterance for yn in yn_words)
-    )
+    return features.word_count <= 2 and features.has("yes", "no")
 
 
 def _is_answer(state: InformationState) -> bool:
@@ -199,13 +172,12 @@ def _is_answer(state: InformationState) -> bool:
     if _is_yn_answer(state):
         return False
 
-    utterance = state.private.beliefs.get("_temp_utterance", "")
-    if not utterance or utterance.strip().endswith("?"):
+    features = _features(state)
+    if not features.text or features.is_question:
         return False
 
     # Prefer shorter utterances as answers
-    word_count = len(utterance.split())
-    return word_count <= 20  # Arbitrary threshold
+    return features.word_count <= 20  # Arbitrary threshold
 
 
 def _is_command_request(state: InformationState) -> bool:
@@ -214,24 +186,7 @@ def _is_command_request(state: InformationState) -> bool:
     The check is intentionally shallow - just enough to label the dialogue move so the
     integration phase can perform task accommodation and plan creation.
     """
-    utterance = state.private.beliefs.get("_temp_utterance", "").lower()
-
-    # Check for command/request patterns
-    request_patterns = [
-        "i need to",
-        "i want to",
-        "i'd like to",
-        "can you",
-        "could you",
-        "please",
-        "help me",
-        "draft",
-        "create",
-        "prepare",
-        "make",
-    ]
-
-    return any(pattern in utterance for pattern in request_patterns)
+    return _features(state).has("request")
 
 
 def _is_assertion(state: InformationState) -> bool:
@@ -289,12 +244,8 @@ def _create_wh_question_move(state: InformationState) -> InformationState:
     utterance = new_state.private.beliefs.get("_temp_utterance", "")
 
     # Extract wh-word and create a simple semantic representation
-    utterance_lower = utterance.lower()
-    wh_word = ""
-    for word in ["what", "where", "when", "who", "why", "how", "which"]:
-        if utterance_lower.strip().startswith(word):
-            wh_word = word
-            break
+    features = extract_features(utterance)
+    wh_word = features.first_token if features.starts_with("wh") else ""
 
     # Extract predicate (simplified - just use the rest of the utterance)
     predicate = utterance.strip().rstrip("?").strip()
@@ -356,10 +307,10 @@ def _create_yn_answer_move(state: InformationState) -> InformationState:
     """Create a yes/no answer dialogue move."""
     new_state = state.clone()
     speaker = new_state.private.beliefs.get("_temp_speaker", "user")
-    utterance = new_state.private.beliefs.get("_temp_utterance", "").lower().strip()
+    utterance = new_state.private.beliefs.get("_temp_utterance", "")
 
     # Convert to boolean
-    is_positive = any(word in utterance for word in ["yes", "yeah", "yep", "true"])
+    is_positive = extract_features(utterance).has("yes")
 
     # Reference the top QUD if available
     question_ref = new_state.shared.top_qud() if new_state.shared.qud else None
@@ -0,0 +1,415 @@
+"""Opt-in rule evaluation profiling for RuleSet.
+
+The profiler records, for every phase a RuleSet applies, which rules were
+evaluated, whether their preconditions held, how long the precondition and
+effect functions took, and how many state elements the effect changed.
+
+Records are grouped into PhaseProfile objects (one per ``apply_rules`` /
+``apply_first_matching`` call) that can be turned into visualization
+RuleTraces, and are aggregated into per-rule statistics (calls, fire rate,
+p50/p99 cost) that can be exported as JSON.
+
+Usage:
+    rules = RuleSet()
+    profiler = rules.enable_profiling()
+    ...  # run dialogue turns
+    profiler.export_json("rule_profile.json")
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ibdm.core import InformationState
+    from ibdm.rules.update_rules import UpdateRule
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples.
+
+    Args:
+        samples: Sample values (need not be sorted)
+        pct: Percentile in the range 0-100
+
+    Returns:
+        The percentile value, or 0.0 for an empty sample list
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(len(ordered) * pct / 100))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _state_shape(state: InformationState) -> dict[str, Any]:
+    """Capture a value-based shape of a state for diff sizing.
+
+    Elements are recorded by value (their string form, or the belief value
+    itself), not identity: most effects start with ``state.clone()``, after
+    which every element is a new object even where nothing changed.
+    """
+    private = state.private
+    shared = state.shared
+    control = state.control
+    return {
+        "qud": [str(q) for q in shared.qud],
+        "commitments": set(shared.commitments),
+        "last_moves": [str(m) for m in shared.last_moves],
+        "moves": [str(m) for m in shared.moves],
+        "next_moves": [str(m) for m in shared.next_moves],
+        "shared_actions": [str(a) for a in shared.actions],
+        "plan": [str(p) for p in private.plan],
+        "agenda": [str(m) for m in private.agenda],
+        "issues": [str(q) for q in private.issues],
+        "overridden_questions": [str(q) for q in private.overridden_questions],
+        "private_actions": [str(a) for a in private.actions],
+        "iun": {str(p) for p in private.iun},
+        "beliefs": {k: _belief_token(v) for k, v in private.beliefs.items()},
+        "last_utterance": str(private.last_utterance),
+        "control": (
+            control.speaker,
+            control.next_speaker,
+            control.initiative,
+            control.dialogue_state,
+        ),
+    }
+
+
+def _belief_token(value: Any) -> Any:
+    """Belief value to compare across a clone.
+
+    Values compared by identity only (no ``__eq__``, e.g. a device or domain
+    object) are represented by their type name, since a deep copy is never equal.
+    """
+    if type(value).__eq__ is object.__eq__:
+        return type(value).__qualname__
+    return value
+
+
+def _state_diff_size(before: dict[str, Any], after: dict[str, Any]) -> int:
+    """Count state elements added, removed or replaced between two shapes."""
+    size = 0
+    for key, old in before.items():
+        new = after[key]
+        if isinstance(old, set):
+            size += len(old ^ new)  # type: ignore[operator]
+        elif isinstance(old, dict):
+            old_beliefs: dict[str, Any] = old  # type: ignore[assignment]
+            new_beliefs: dict[str, Any] = new
+            size += len(old_beliefs.keys() ^ new_beliefs.keys())
+            size += sum(
+                1
+                for k, v in old_beliefs.items()
+                if k in new_beliefs and not _same_value(v, new_beliefs[k])
+            )
+        elif isinstance(old, list):
+            old_items = Counter(old)  # type: ignore[arg-type]
+            new_items = Counter(new)  # type: ignore[arg-type]
+            changed = (old_items - new_items).total() + (new_items - old_items).total()
+            # Pure reordering (e.g. stack push/pop of the same items) still counts once
+            if not changed and old != new:
+                changed = 1
+            size += changed
+        elif old != new:
+            size += 1
+    return size
+
+
+def _same_value(old: Any, new: Any) -> bool:
+    """Equality that treats a comparison that raises (e.g. arrays) as a change."""
+    try:
+        return old is new or bool(old == new)
+    except Exception:
+        return False
+
+
+@dataclass
+class RuleEvaluationRecord:
+    """Measurements for one rule evaluated during one phase.
+
+    Attributes:
+        rule_name: Name of the rule
+        rule_type: Phase the rule belongs to ("interpretation", "integration", ...)
+        priority: Rule priority
+        preconditions_met: Whether the precondition function returned True
+        fired: Whether the rule's effects were applied
+        precondition_time: Wall time spent in the precondition (seconds)
+        effect_time: Wall time spent in the effect (seconds, 0.0 if not fired)
+        state_diff_size: Number of state elements changed by the effect
+    """
+
+    rule_name: str
+    rule_type: str
+    priority: int
+    preconditions_met: bool
+    fired: bool = False
+    precondition_time: float = 0.0
+    effect_time: float = 0.0
+    state_diff_size: int = 0
+
+    @property
+    def total_time(self) -> float:
+        """Precondition plus effect time (seconds)."""
+        return self.precondition_time + self.effect_time
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "rule_name": self.rule_name,
+            "rule_type": self.rule_type,
+            "priority": self.priority,
+            "preconditions_met": self.preconditions_met,
+            "fired": self.fired,
+            "precondition_time": self.precondition_time,
+            "effect_time": self.effect_time,
+            "state_diff_size": self.state_diff_size,
+        }
+
+
+@dataclass
+class PhaseProfile:
+    """All rule evaluations from a single rule-application call.
+
+    Attributes:
+        phase: Rule type that was applied
+        turn: Turn counter of the profiler when the phase ran
+        first_match_only: True for ``apply_first_matching`` calls
+        evaluations: Rule evaluations in the order they happened
+        total_time: Wall time for the whole phase (seconds)
+    """
+
+    phase: str
+    turn: int
+    first_match_only: bool = False
+    evaluations: list[RuleEvaluationRecord] = field(default_factory=lambda: [])
+    total_time: float = 0.0
+
+    @property
+    def fired_rules(self) -> list[str]:
+        """Names of rules whose effects were applied, in order."""
+        return [e.rule_name for e in self.evaluations if e.fired]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "phase": self.phase,
+            "turn": self.turn,
+            "first_match_only": self.first_match_only,
+            "total_time": self.total_time,
+            "fired_rules": self.fired_rules,
+            "evaluations": [e.to_dict() for e in self.evaluations],
+        }
+
+
+@dataclass
+class RuleStats:
+    """Aggregated statistics for one rule across all profiled phases.
+
+    Cost samples are kept in a bounded window so long-running processes
+    report recent percentiles without growing without limit.
+    """
+
+    rule_name: str
+    rule_type: str
+    calls: int = 0
+    preconditions_met: int = 0
+    fired: int = 0
+    total_precondition_time: float = 0.0
+    total_effect_time: float = 0.0
+    total_state_diff_size: int = 0
+    samples: deque[float] = field(default_factory=lambda: deque(maxlen=10000))
+
+    @property
+    def fire_rate(self) -> float:
+        """Fraction of evaluations where the rule fired."""
+        if self.calls == 0:
+            return 0.0
+        return self.fired / self.calls
+
+    @property
+    def total_time(self) -> float:
+        """Total precondition plus effect time (seconds)."""
+        return self.total_precondition_time + self.total_effect_time
+
+    def add(self, record: RuleEvaluationRecord) -> None:
+        """Fold one evaluation record into the statistics."""
+        self.calls += 1
+        if record.preconditions_met:
+            self.preconditions_met += 1
+        if record.fired:
+            self.fired += 1
+        self.total_precondition_time += record.precondition_time
+        self.total_effect_time += record.effect_time
+        self.total_state_diff_size += record.state_diff_size
+        self.samples.append(record.total_time)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        samples = list(self.samples)
+        return {
+            "rule_name": self.rule_name,
+            "rule_type": self.rule_type,
+            "calls": self.calls,
+            "preconditions_met": self.preconditions_met,
+            "fired": self.fired,
+            "fire_rate": self.fire_rate,
+            "total_time": self.total_time,
+            "total_precondition_time": self.total_precondition_time,
+            "total_effect_time": self.total_effect_time,
+            "mean_time": self.total_time / self.calls if self.calls else 0.0,
+            "p50_time": percentile(samples, 50),
+            "p99_time": percentile(samples, 99),
+            "mean_state_diff_size": (
+                self.total_state_diff_size / self.fired if self.fired else 0.0
+            ),
+        }
+
+
+class RuleProfiler:
+    """Records rule evaluations from an instrumented RuleSet.
+
+    Attach with ``RuleSet.enable_profiling()``. Call ``begin_turn()`` at the
+    start of each dialogue turn (DialogueMoveEngine.process_input does this)
+    so phase profiles can be grouped per turn.
+    """
+
+    def __init__(self, max_phases: int | None = 1000) -> None:
+        """Initialize the profiler.
+
+        Args:
+            max_phases: Number of recent PhaseProfiles to retain (None = unbounded).
+                Aggregated RuleStats cover all phases regardless.
+        """
+        self.turn = 0
+        self.phase_count = 0
+        self.phases: deque[PhaseProfile] = deque(maxlen=max_phases)
+        self.stats: dict[tuple[str, str], RuleStats] = {}
+        self._current: PhaseProfile | None = None
+        self._phase_start = 0.0
+
+    def begin_turn(self) -> int:
+        """Advance the turn counter.
+
+        Returns:
+            The new turn number
+        """
+        self.turn += 1
+        return self.turn
+
+    def begin_phase(self, phase: str, first_match_only: bool = False) -> PhaseProfile:
+        """Start recording a new phase."""
+        self._current = PhaseProfile(phase=phase, turn=self.turn, first_match_only=first_match_only)
+        self._phase_start = time.perf_counter()
+        return self._current
+
+    def end_phase(self) -> PhaseProfile | None:
+        """Finish the current phase and fold it into the aggregates."""
+        profile = self._current
+        if profile is None:
+            return None
+        profile.total_time = time.perf_counter() - self._phase_start
+        self.phases.append(profile)
+        self.phase_count += 1
+        for record in profile.evaluations:
+            key = (record.rule_type, record.rule_name)
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = RuleStats(rule_name=record.rule_name, rule_type=record.rule_type)
+                self.stats[key] = stats
+            stats.add(record)
+        self._current = None
+        return profile
+
+    def check(self, rule: UpdateRule, state: InformationState) -> RuleEvaluationRecord:
+        """Evaluate a rule's preconditions and record the result and timing."""
+        start = time.perf_counter()
+        met = rule.applies(state)
+        record = RuleEvaluationRecord(
+            rule_name=rule.name,
+            rule_type=rule.rule_type,
+            priority=rule.priority,
+            preconditions_met=met,
+            precondition_time=time.perf_counter() - start,
+        )
+        if self._current is not None:
+            self._current.evaluations.append(record)
+        return record
+
+    def fire(
+        self, rule: UpdateRule, state: InformationState, record: RuleEvaluationRecord
+    ) -> InformationState:
+        """Apply a rule's effects, recording timing and state-diff size."""
+        before = _state_shape(state)
+        start = time.perf_counter()
+        new_state = rule.apply(state)
+        record.effect_time = time.perf_counter() - start
+        record.fired = True
+        record.state_diff_size = _state_diff_size(before, _state_shape(new_state))
+        return new_state
+
+    def phases_for_turn(self, turn: int) -> list[PhaseProfile]:
+        """Get retained phase profiles recorded during a turn."""
+        return [p for p in self.phases if p.turn == turn]
+
+    def histogram(self) -> list[RuleStats]:
+        """Per-rule statistics, most expensive rules first."""
+        return sorted(self.stats.values(), key=lambda s: s.total_time, reverse=True)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert aggregates to a JSON-serializable dictionary."""
+        return {
+            "turns": self.turn,
+            "phases_recorded": self.phase_count,
+            "rules": [s.to_dict() for s in self.histogram()],
+        }
+
+    def export_json(self, path: str | Path, include_phases: bool = False) -> None:
+        """Write the per-rule histogram (and optionally phase profiles) as JSON.
+
+        Args:
+            path: Output file path
+            include_phases: Also include every retained PhaseProfile
+        """
+        data = self.to_dict()
+        if include_phases:
+            data["phases"] = [p.to_dict() for p in self.phases]
+        Path(path).write_text(json.dumps(data, indent=2))
+
+    def reset(self) -> None:
+        """Discard all recorded data."""
+        self.turn = 0
+        self.phase_count = 0
+        self.phases.clear()
+        self.stats.clear()
+        self._current = None
+
+    def summary(self, top: int = 10) -> str:
+        """Generate a human-readable table of the most expensive rules.
+
+        Args:
+            top: Number of rules to include
+
+        Returns:
+            Formatted summary string
+        """
+        lines = [
+            "=== Rule Profile Summary ===",
+            f"Turns: {self.turn}",
+            f"{'rule':<40} {'calls':>7} {'fire%':>6} {'p50 ms':>8} {'p99 ms':>8} {'total ms':>9}",
+        ]
+        for stats in self.histogram()[:top]:
+            samples = list(stats.samples)
+            lines.append(
+                f"{stats.rule_name:<40} {stats.calls:>7} {stats.fire_rate:>6.1%} "
+                f"{percentile(samples, 50) * 1000:>8.3f} "
+                f"{percentile(samples, 99) * 1000:>8.3f} "
+                f"{stats.total_time * 1000:>9.3f}"
+            )
+        return "\n".join(lines)
@@ -183,7 +183,7 @@ def create_selection_rules() -> list[UpdateRule]:
         # Only fires when no other rule has selected an action
         UpdateRule(
             name="select_fallback",
-            preconditions=lambda state: len(state.private.agenda) == 0,
+            preconditions=_agenda_is_empty,
             effects=_select_fallback_response,
             priority=1,
             rule_type="selection",
@@ -194,6 +194,11 @@ def create_selection_rules() -> list[UpdateRule]:
 # Precondition functions (IBiS1)
 
 
+def _agenda_is_empty(state: InformationState) -> bool:
+    """Check if no action has been selected yet."""
+    return len(state.private.agenda) == 0
+
+
 def _has_unanswered_dependency(state: InformationState) -> bool:
     """Check if top QUD question has unanswered dependencies.
 
@@ -6,11 +6,16 @@ They form the core mechanism for dialogue state transitions.
 Based on Larsson (2002) Issue-based Dialogue Management.
 """
 
+import hashlib
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
 
 from ibdm.core import InformationState
+from ibdm.rules.profiling import RuleProfiler
+from ibdm.utils.fingerprint import code_digest
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +91,60 @@ class RuleSet:
             "selection": [],
             "generation": [],
         }
+        self.profiler: RuleProfiler | None = None
+        self._fingerprint: str | None = None
+
+    def fingerprint(self) -> str:
+        """Content hash identifying the rules in this set.
+
+        Covers each rule's type, name, priority and position, and the
+        bytecode of its precondition and effect functions (see
+        ibdm.utils.fingerprint). Two rule sets with the same fingerprint
+        apply the same rules in the same order, so the fingerprint can key
+        caches and stored results across processes and deploys.
+
+        Computed on first use and recomputed after add_rule, add_rules,
+        remove_rule or clear_rules; mutating the rule lists or rules directly
+        is not detected.
+
+        Returns:
+            Hex digest
+        """
+        if self._fingerprint is None:
+            digest = hashlib.sha256()
+            for rule_type in sorted(self.rules):
+                for rule in self.rules[rule_type]:
+                    digest.update(
+                        f"{rule_type}\0{rule.name}\0{rule.priority}\0"
+                        f"{code_digest(rule.preconditions)}\0{code_digest(rule.effects)}\n".encode()
+                    )
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def enable_profiling(self, profiler: RuleProfiler | None = None) -> RuleProfiler:
+        """Start recording per-rule evaluation measurements.
+
+        Profiling is opt-in: with no profiler attached, rule application
+        takes the uninstrumented path.
+
+        Args:
+            profiler: Profiler to record into (creates a new one if None)
+
+        Returns:
+            The attached profiler
+        """
+        self.profiler = profiler if profiler is not None else RuleProfiler()
+        return self.profiler
+
+    def disable_profiling(self) -> RuleProfiler | None:
+        """Stop recording and detach the profiler.
+
+        Returns:
+            The profiler that was attached, if any
+        """
+        profiler = self.profiler
+        self.profiler = None
+        return profiler
 
     def add_rule(self, rule: UpdateRule) -> None:
         """Add a rule to the rule set.
@@ -101,6 +160,32 @@ class RuleSet:
         self.rules[rule.rule_type].append(rule)
         # Sort by priority (highest first)
         self.rules[rule.rule_type].sort(key=lambda r: r.priority, reverse=True)
+        self._fingerprint = None
+
+    def add_rules(self, rules: Iterable[UpdateRule]) -> None:
+        """Add several rules, sorting each affected type once.
+
+        Produces the same order as calling add_rule() for each rule (the sort
+        is stable), without re-sorting after every insert.
+
+        Args:
+            rules: Update rules to add
+        """
+        touched: set[str] = set()
+        for rule in rules:
+            self.rules.setdefault(rule.rule_type, []).append(rule)
+            touched.add(rule.rule_type)
+        for rule_type in touched:
+            self.rules[rule_type].sort(key=lambda r: r.priority, reverse=True)
+        self._fingerprint = None
+
+    def freeze(self) -> "FrozenRuleSet":
+        """Return an immutable copy of this rule set.
+
+        Returns:
+            FrozenRuleSet with the same rules in the same order
+        """
+        return FrozenRuleSet(self)
 
     def remove_rule(self, rule_name: str, rule_type: str | None = None) -> bool:
         """Remove a rule from the rule set.
@@ -119,6 +204,7 @@ class RuleSet:
                 original_length = len(self.rules[rtype])
                 self.rules[rtype] = [r for r in self.rules[rtype] if r.name != rule_name]
                 if len(self.rules[rtype]) < original_length:
+                    self._fingerprint = None
                     return True
 
         return False
@@ -150,6 +236,9 @@ class RuleSet:
         rules_list = self.rules.get(rule_type, [])
         logger.debug(f"Evaluating {len(rules_list)} {rule_type} rules")
 
+        if self.profiler is not None:
+            return self._apply_rules_profiled(rule_type, rules_list, state, self.profiler)
+
         current_state = state
         rules_fired = 0
 
@@ -167,6 +256,32 @@ class RuleSet:
         logger.debug(f"Applied {rules_fired}/{len(rules_list)} {rule_type} rules")
         return current_state
 
+    def _apply_rules_profiled(
+        self,
+        rule_type: str,
+        rules_list: Sequence[UpdateRule],
+        state: InformationState,
+        profiler: RuleProfiler,
+    ) -> InformationState:
+        """Instrumented variant of apply_rules that records into the profiler."""
+        profiler.begin_phase(rule_type)
+        current_state = state
+        rules_fired = 0
+        try:
+            for rule in rules_list:
+                record = profiler.check(rule, current_state)
+                status = "✓" if record.preconditions_met else "✗"
+                logger.debug(f"  {status} {rule.name} (priority={rule.priority})")
+                if record.preconditions_met:
+                    logger.info(f"  → Executing rule: {rule.name}")
+                    current_state = profiler.fire(rule, current_state, record)
+                    rules_fired += 1
+                    logger.debug(f"  ← Rule completed: {rule.name}")
+        finally:
+            profiler.end_phase()
+        logger.debug(f"Applied {rules_fired}/{len(rules_list)} {rule_type} rules")
+        return current_state
+
     def apply_first_matching(
         self, rule_type: str, state: InformationState
     ) -> tuple[InformationState, UpdateRule | None]:
@@ -184,6 +299,9 @@ class RuleSet:
         rules_list = self.rules.get(rule_type, [])
         logger.debug(f"Evaluating {len(rules_list)} {rule_type} rules (first match only)")
 
+        if self.profiler is not None:
+            return self._apply_first_matching_profiled(rule_type, rules_list, state, self.profiler)
+
         for rule in rules_list:
             preconditions_met = rule.applies(state)
             status = "✓" if preconditions_met else "✗"
@@ -198,6 +316,30 @@ class RuleSet:
         logger.debug(f"No matching {rule_type} rules found")
         return state, None
 
+    def _apply_first_matching_profiled(
+        self,
+        rule_type: str,
+        rules_list: Sequence[UpdateRule],
+        state: InformationState,
+        profiler: RuleProfiler,
+    ) -> tuple[InformationState, UpdateRule | None]:
+        """Instrumented variant of apply_first_matching that records into the profiler."""
+        profiler.begin_phase(rule_type, first_match_only=True)
+        try:
+            for rule in rules_list:
+                record = profiler.check(rule, state)
+                status = "✓" if record.preconditions_met else "✗"
+                logger.debug(f"  {status} {rule.name} (priority={rule.priority})")
+                if record.preconditions_met:
+                    logger.info(f"  → Executing first matching rule: {rule.name}")
+                    new_state = profiler.fire(rule, state, record)
+                    logger.debug(f"  ← Rule completed: {rule.name}")
+                    return new_state, rule
+        finally:
+            profiler.end_phase()
+        logger.debug(f"No matching {rule_type} rules found")
+        return state, None
+
     def clear_rules(self, rule_type: str | None = None) -> None:
         """Clear all rules of a specific type, or all rules if type is None.
 
@@ -209,6 +351,7 @@ class RuleSet:
                 self.rules[rtype] = []
         elif rule_type in self.rules:
             self.rules[rule_type] = []
+        self._fingerprint = None
 
     def rule_count(self, rule_type: str | None = None) -> int:
         """Count rules of a specific type, or all rules if type is None.
@@ -232,3 +375,73 @@ class RuleSet:
             f"selection={counts['selection']}, "
             f"generation={counts['generation']})"
         )
+
+
+class FrozenRuleSet(RuleSet):
+    """Immutable rule set that can be shared between engines and processes.
+
+    Built once (e.g. in a parent process), it can be inherited copy-on-write by
+    forked workers or pickled to a process pool. Adding, removing or clearing
+    rules raises TypeError, and ``rules`` is a read-only mapping of tuples, so
+    the cached fingerprint always matches the rules. Profiling can still be
+    enabled; the profiler is instrumentation, not part of the rules, but it is
+    shared by every engine using this instance.
+    """
+
+    rules: Mapping[str, tuple[UpdateRule, ...]]
+
+    def __init__(self, source: RuleSet | None = None) -> None:
+        """Initialize from an existing rule set.
+
+        Args:
+            source: Rule set to copy (None for an empty frozen set)
+        """
+        super().__init__()
+        rules = source.rules if source is not None else self.rules
+        self.rules = MappingProxyType(  # type: ignore[reportIncompatibleVariableOverride]
+            {rule_type: tuple(rules_list) for rule_type, rules_list in rules.items()}
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle the rules as a plain dict (mapping proxies do not pickle)."""
+        state = self.__dict__.copy()
+        state["rules"] = dict(self.rules)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled rule set, making the rules read-only again."""
+        self.__dict__.update(state, rules=MappingProxyType(state["rules"]))
+
+    def _immutable(self) -> TypeError:
+        return TypeError("FrozenRuleSet is immutable; build a RuleSet and freeze() it")
+
+    def add_rule(self, rule: UpdateRule) -> None:
+        """Not supported: frozen rule sets are immutable."""
+        raise self._immutable()
+
+    def add_rules(self, rules: Iterable[UpdateRule]) -> None:
+        """Not supported: frozen rule sets are immutable."""
+        raise self._immutable()
+
+    def remove_rule(self, rule_name: str, rule_type: str | None = None) -> bool:
+        """Not supported: frozen rule sets are immutable."""
+        raise self._immutable()
+
+    def clear_rules(self, rule_type: str | None = None) -> None:
+        """Not supported: frozen rule sets are immutable."""
+        raise self._immutable()
+
+    def get_rules(self, rule_type: str) -> list[UpdateRule]:
+        """Get a copy of the rules of a specific type.
+
+        Args:
+            rule_type: Type of rules to retrieve
+
+        Returns:
+            New list of the rules of that type (sorted by priority)
+        """
+        return list(super().get_rules(rule_type))
+
+    def freeze(self) -> "FrozenRuleSet":
+        """Return self (already frozen)."""
+        return self
@@ -1,14 +1,37 @@
 """NDA Document Generation Service using LLM.
 
 This service consumes information gathered through dialogue and generates
-a professional Non-Disclosure Agreement using Claude Sonnet.
+a professional Non-Disclosure Agreement using Claude Sonnet. The agreement is
+drafted as concurrently generated, individually cached clauses (see
+ibdm.services.nda_sections) and streamed back in document order. Every
+section request is reported to the LLM telemetry hub as component
+"nda_generator".
 """
 
+import asyncio
 import os
+import time
+from collections.abc import AsyncGenerator, Iterator
 from dataclasses import dataclass
-from typing import Any
-
-import litellm
+from typing import Any, cast
+
+from ibdm.nlu.llm_adapter import (
+    LiteLLMBackend,
+    LLMBackend,
+    LLMRequest,
+    LLMResponse,
+    get_default_backend,
+)
+from ibdm.nlu.llm_telemetry import LLMCallEvent, get_telemetry
+from ibdm.services.nda_sections import (
+    NDA_SECTIONS,
+    SECTION_SYSTEM_PROMPT,
+    ClauseCache,
+    GeneratedSection,
+    NDASection,
+    assemble_document,
+    get_clause_cache,
+)
 
 
 @dataclass
@@ -89,13 +112,27 @@ class NDAParameters:
 
 
 class NDAGenerator:
-    """Generate NDA documents using Claude Sonnet LLM."""
+    """Generate NDA documents section by section using Claude Sonnet.
+
+    The agreement is split into the clauses listed in NDA_SECTIONS. Clauses
+    missing from the clause cache are drafted concurrently and every section
+    is streamed back in document order, so callers can show the preamble
+    while later clauses are still being drafted. Because each clause is cached
+    under only the parameters it depends on, a re-draft after changing one
+    parameter (e.g. the jurisdiction) regenerates only the affected sections.
+    """
+
+    #: Component name reported with each section request's telemetry event
+    component = "nda_generator"
 
     def __init__(
         self,
         model: str = "claude-sonnet-4-5-20250929",
         api_key: str | None = None,
         temperature: float = 0.3,
+        backend: LLMBackend | None = None,
+        cache: ClauseCache | None = None,
+        max_section_tokens: int = 1200,
     ):
         """Initialize NDA generator.
 
@@ -103,19 +140,34 @@ class NDAGenerator:
             model: Claude model to use for generation
             api_key: Anthropic API key (defaults to IBDM_API_KEY env var)
             temperature: LLM temperature (0.3 for more consistent legal text)
+            backend: Transport for requests. Defaults to the process-wide backend
+                (see set_default_backend), else live LiteLLM.
+            cache: Clause cache. Defaults to the process-wide cache, so
+                generators created per request still reuse earlier clauses.
+            max_section_tokens: Maximum tokens per drafted section
         """
         self.model = model
         self.api_key = api_key or os.getenv("IBDM_API_KEY")
         self.temperature = temperature
-
-        if not self.api_key:
-            raise ValueError(
-                "API key required. Set IBDM_API_KEY environment variable or pass api_key parameter."
-            )
+        self.max_section_tokens = max_section_tokens
+        self.cache = cache if cache is not None else get_clause_cache()
+
+        backend = backend or get_default_backend()
+        if backend is None or backend.requires_api_key:
+            if not self.api_key:
+                raise ValueError(
+                    "API key required. Set IBDM_API_KEY environment variable "
+                    "or pass api_key parameter."
+                )
+        if backend is None:
+            backend = LiteLLMBackend(cast(str, self.api_key))
+        self.backend: LLMBackend = backend
 
     def generate_nda(self, params: NDAParameters) -> str:
         """Generate complete NDA document from parameters.
 
+        Must not be called from a running event loop; use agenerate_nda() there.
+
         Args:
             params: NDA parameters extracted from dialogue
 
@@ -126,118 +178,146 @@ class NDAGenerator:
             ValueError: If required parameters are missing
             Exception: If LLM generation fails
         """
-        # Validate required parameters
-        if not params.parties or len(params.parties) < 2:
-            raise ValueError("At least two parties required for NDA")
-
-        # Build prompt
-        prompt = self._build_generation_prompt(params)
+        self._validate(params)
 
-        # Call LLM
         try:
-            response = litellm.completion(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are a legal document drafting assistant specializing "
-                            "in Non-Disclosure Agreements. Generate professional, "
-                            "legally sound NDAs based on provided parameters. "
-                            "Use clear, precise legal language and standard NDA structure."
-                        ),
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                api_key=self.api_key,
-                temperature=self.temperature,
-                max_tokens=4000,
-            )
-
-            generated_text = response.choices[0].message.content
-            if not generated_text:
-                raise ValueError("LLM returned empty response")
-
-            return generated_text
-
+            return asyncio.run(self.agenerate_nda(params))
         except Exception as e:
             raise Exception(f"NDA generation failed: {str(e)}") from e
 
-    def _build_generation_prompt(self, params: NDAParameters) -> str:
-        """Build LLM prompt for NDA generation.
+    async def agenerate_nda(self, params: NDAParameters) -> str:
+        """Generate the complete NDA document asynchronously.
 
         Args:
-            params: NDA parameters
+            params: NDA parameters extracted from dialogue
 
         Returns:
-            Formatted prompt string
+            Generated NDA document text (markdown format)
+        """
+        sections = [section async for section in self.astream_nda(params)]
+        return assemble_document(sections)
+
+    def stream_nda(self, params: NDAParameters) -> Iterator[GeneratedSection]:
+        """Yield drafted sections in document order as they become available.
+
+        Runs its own event loop, so it must not be called from a running one;
+        use astream_nda() there.
+
+        Args:
+            params: NDA parameters extracted from dialogue
+
+        Yields:
+            GeneratedSection for each included section, in document order
+
+        Raises:
+            ValueError: If required parameters are missing
+        """
+        self._validate(params)
+
+        loop = asyncio.new_event_loop()
+        sections = self.astream_nda(params)
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(anext(sections))
+                except StopAsyncIteration:
+                    return
+        finally:
+            loop.run_until_complete(sections.aclose())
+            loop.close()
+
+    async def astream_nda(self, params: NDAParameters) -> AsyncGenerator[GeneratedSection, None]:
+        """Draft the sections concurrently and yield them in document order.
+
+        Cached clauses are yielded without a request. Every cache miss is
+        started at once; the stream then waits on each section in turn, so a
+        slow late section never delays an earlier one.
+
+        Args:
+            params: NDA parameters extracted from dialogue
+
+        Yields:
+            GeneratedSection for each included section, in document order
+
+        Raises:
+            ValueError: If required parameters are missing
         """
-        # Format parties list
-        if len(params.parties) == 2:
-            parties_text = f'"{params.parties[0]}" and "{params.parties[1]}"'
-        else:
-            parties_list = '", "'.join(params.parties[:-1])
-            parties_text = f'"{parties_list}", and "{params.parties[-1]}"'
-
-        # Determine NDA type description
-        if params.nda_type.lower() in ["mutual", "bilateral"]:
-            nda_type_desc = "mutual (both parties may disclose confidential information)"
-        else:
-            nda_type_desc = "one-way (only one party discloses confidential information)"
-
-        prompt = f"""Generate a professional Non-Disclosure Agreement (NDA)
-with the following specifications:
-
-**Parties:**
-- {parties_text}
-
-**NDA Type:**
-- {nda_type_desc}
-
-**Effective Date:**
-- {params.effective_date}
-
-**Confidentiality Period:**
-- {params.duration} from the date of disclosure
-
-**Governing Law:**
-- {params.jurisdiction}
-
-**Requirements:**
-
-1. **Structure**: Include standard NDA sections:
-   - Preamble with parties and effective date
-   - Recitals (WHEREAS clauses)
-   - Definitions (Confidential Information, Disclosing Party, Receiving Party)
-   - Confidentiality Obligations
-   - Permitted Disclosures and Exclusions (standard 5 exceptions)
-   - Term and Termination
-   - Remedies
-   - General Provisions (governing law, entire agreement, severability)
-   - Signature blocks
-
-2. **Legal Quality**:
-   - Use precise legal language
-   - Include standard exclusions (public domain, independently developed, etc.)
-   - Specify {params.duration} confidentiality period
-   - Reference {params.jurisdiction} as governing jurisdiction
-   - Include appropriate remedies (injunctive relief, damages)
-
-3. **Format**:
-   - Use markdown format
-   - Number sections clearly (1, 1.1, 1.2, etc.)
-   - Use proper legal formatting conventions
-   - Include placeholder signature blocks
-
-4. **Completeness**:
-   - This should be a production-ready NDA
-   - Include all necessary legal provisions
-   - Make it approximately 3-4 pages when printed
-
-Generate the complete NDA document now. Use professional legal language
-appropriate for a binding contract."""
-
-        return prompt
+        self._validate(params)
+
+        sections = [section for section in NDA_SECTIONS if section.included(params)]
+        keys = [section.cache_key(params, self.model, self.temperature) for section in sections]
+        cached = [self.cache.get(key) for key in keys]
+        tasks: dict[str, asyncio.Task[LLMResponse]] = {
+            section.name: asyncio.create_task(self._draft_section(section, params))
+            for section, text in zip(sections, cached, strict=True)
+            if text is None
+        }
+
+        try:
+            for section, key, text in zip(sections, keys, cached, strict=True):
+                if text is not None:
+                    yield GeneratedSection(section=section, text=text, cached=True)
+                    continue
+
+                response = await tasks[section.name]
+                if not response.content.strip():
+                    raise ValueError(f"LLM returned empty response for section {section.name}")
+                self.cache.put(key, response.content)
+                yield GeneratedSection(
+                    section=section, text=response.content, tokens_used=response.tokens_used
+                )
+        finally:
+            # Cancel drafts the caller no longer needs and retrieve every failure
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    async def _draft_section(self, section: NDASection, params: NDAParameters) -> LLMResponse:
+        request = LLMRequest(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": SECTION_SYSTEM_PROMPT},
+                {"role": "user", "content": section.build_prompt(params)},
+            ],
+            temperature=self.temperature,
+            max_tokens=self.max_section_tokens,
+            # Every section shares the system prompt, so it is the cacheable prefix
+            cache_breakpoint=(0, len(SECTION_SYSTEM_PROMPT)),
+        )
+        telemetry = get_telemetry()
+        if telemetry is None:
+            return await self.backend.acomplete(request)
+
+        start_time = time.perf_counter()
+        try:
+            with telemetry.track_call():
+                response = await self.backend.acomplete(request)
+        except Exception as e:
+            telemetry.record(
+                LLMCallEvent(
+                    component=self.component,
+                    model=request.model,
+                    latency=time.perf_counter() - start_time,
+                    error=str(e),
+                )
+            )
+            raise
+        telemetry.record(
+            LLMCallEvent(
+                component=self.component,
+                model=response.model,
+                prompt_tokens=response.prompt_tokens,
+                completion_tokens=response.completion_tokens,
+                cached_tokens=response.cached_tokens,
+                latency=time.perf_counter() - start_time,
+            )
+        )
+        return response
+
+    @staticmethod
+    def _validate(params: NDAParameters) -> None:
+        if not params.parties or len(params.parties) < 2:
+            raise ValueError("At least two parties required for NDA")
 
     def generate_nda_from_commitments(self, commitments: set[str]) -> str:
         """Convenience method to generate NDA directly from commitments.
@@ -280,3 +360,17 @@ def generate_nda_from_dialogue_state(state: Any) -> str:
     """
     generator = NDAGenerator()
     return generator.generate_nda_from_commitments(state.shared.commitments)
+
+
+def stream_nda_from_dialogue_state(state: Any) -> Iterator[GeneratedSection]:
+    """Stream the NDA for a dialogue information state section by section.
+
+    Args:
+        state: InformationState object with commitments
+
+    Yields:
+        GeneratedSection for each section, in document order
+    """
+    generator = NDAGenerator()
+    params = NDAParameters.from_commitments(state.shared.commitments)
+    yield from generator.stream_nda(params)
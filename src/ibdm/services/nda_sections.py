@@ -0,0 +1,414 @@
+"""Clause-level NDA drafting: section specs and the clause cache.
+
+An NDA is drafted as independent sections (definitions, obligations, term,
+governing law, ...) rather than one monolithic completion. Each NDASection
+declares which NDAParameters fields its text depends on; its prompt shows the
+model only those fields, and its ClauseCache key hashes only those fields. A
+re-draft after changing the jurisdiction therefore misses the cache for the
+governing-law section alone and every other clause is reused.
+
+NDAGenerator (ibdm.services.nda_generator) drafts the cache misses
+concurrently and streams the sections back in document order.
+
+Example:
+    >>> cache = ClauseCache()
+    >>> section = get_section("governing_law")
+    >>> section.depends_on
+    ('jurisdiction',)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ibdm.services.nda_generator import NDAParameters
+
+#: Title of the assembled document
+DOCUMENT_TITLE = "# Non-Disclosure Agreement"
+
+#: System prompt shared by every section request
+SECTION_SYSTEM_PROMPT = (
+    "You are a legal document drafting assistant specializing in Non-Disclosure "
+    "Agreements. You draft one section of an NDA at a time; the sections are "
+    "assembled into a single agreement. Use clear, precise legal language. "
+    "Outside the preamble, recitals and signature blocks, refer to the parties only "
+    'by the defined terms "Disclosing Party" and "Receiving Party" and to the '
+    'agreement as "this Agreement". Return only the body of the requested section '
+    "in markdown, without its heading and without commentary."
+)
+
+
+def format_parties(parties: list[str]) -> str:
+    """Format a party list for a prompt ('"A" and "B"', '"A", "B", and "C"')."""
+    if len(parties) == 2:
+        return f'"{parties[0]}" and "{parties[1]}"'
+    parties_list = '", "'.join(parties[:-1])
+    return f'"{parties_list}", and "{parties[-1]}"'
+
+
+def describe_nda_type(nda_type: str) -> str:
+    """Describe an NDA type for a prompt."""
+    if nda_type.lower() in ["mutual", "bilateral"]:
+        return "mutual (both parties may disclose confidential information)"
+    return "one-way (only one party discloses confidential information)"
+
+
+def _describe_parameter(name: str, params: NDAParameters) -> str:
+    if name == "parties":
+        return f"Parties: {format_parties(params.parties)}"
+    if name == "nda_type":
+        return f"NDA type: {describe_nda_type(params.nda_type)}"
+    if name == "effective_date":
+        return f"Effective date: {params.effective_date}"
+    if name == "duration":
+        return f"Confidentiality period: {params.duration} from the date of disclosure"
+    if name == "jurisdiction":
+        return f"Governing law: {params.jurisdiction}"
+    if name == "additional_terms":
+        return f"Additional terms: {json.dumps(params.additional_terms, sort_keys=True)}"
+    raise ValueError(f"Unknown NDA parameter: {name}")
+
+
+@dataclass(frozen=True)
+class NDASection:
+    """One independently drafted section of an NDA.
+
+    Attributes:
+        name: Section identifier (e.g. "governing_law")
+        title: Heading text
+        number: Section number in the agreement, or None for unnumbered parts
+            (preamble, recitals, signatures)
+        depends_on: NDAParameters fields the section's text depends on
+        instructions: Drafting instructions for the model
+        applies: Predicate deciding whether the section is included (default: always)
+    """
+
+    name: str
+    title: str
+    number: int | None
+    depends_on: tuple[str, ...]
+    instructions: str
+    applies: Callable[[NDAParameters], bool] | None = None
+
+    @property
+    def heading(self) -> str | None:
+        """Markdown heading, or None for the preamble."""
+        if self.name == "preamble":
+            return None
+        if self.number is None:
+            return f"## {self.title}"
+        return f"## {self.number}. {self.title}"
+
+    def included(self, params: NDAParameters) -> bool:
+        """Whether the section belongs in an agreement with these parameters."""
+        return self.applies is None or self.applies(params)
+
+    def relevant_values(self, params: NDAParameters) -> dict[str, Any]:
+        """The parameter values the section depends on."""
+        return {name: getattr(params, name) for name in self.depends_on}
+
+    def build_prompt(self, params: NDAParameters) -> str:
+        """Build the user prompt for drafting this section.
+
+        Only the fields in depends_on appear, so the prompt (and the clause)
+        is identical for every parameter set that agrees on them.
+
+        Args:
+            params: NDA parameters
+
+        Returns:
+            Prompt text
+        """
+        where = f"section {self.number}" if self.number is not None else "an unnumbered part"
+        lines = [
+            f"Draft the {self.title} of a Non-Disclosure Agreement ({where}).",
+            "",
+        ]
+        facts = [_describe_parameter(name, params) for name in self.depends_on]
+        if facts:
+            lines.extend(["**Specifications:**", *(f"- {fact}" for fact in facts), ""])
+        lines.append(f"**Requirements:** {self.instructions}")
+        if self.number is not None:
+            lines.append(f"Number subsections {self.number}.1, {self.number}.2, and so on.")
+        return "\n".join(lines)
+
+    def cache_key(self, params: NDAParameters, model: str, temperature: float) -> str:
+        """Hash of everything that determines this section's text.
+
+        Args:
+            params: NDA parameters (only the depends_on fields are used)
+            model: Model identifier
+            temperature: Sampling temperature
+
+        Returns:
+            Hex digest
+        """
+        payload = json.dumps(
+            {
+                "section": self.name,
+                "values": self.relevant_values(params),
+                "instructions": self.instructions,
+                "model": model,
+                "temperature": temperature,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _has_additional_terms(params: NDAParameters) -> bool:
+    return bool(params.additional_terms)
+
+
+#: Sections of a generated NDA in document order
+NDA_SECTIONS: tuple[NDASection, ...] = (
+    NDASection(
+        name="preamble",
+        title="Preamble",
+        number=None,
+        depends_on=("parties", "effective_date", "nda_type"),
+        instructions=(
+            "State that this Agreement is entered into as of the effective date by and "
+            "between the parties, each with a placeholder address, and identify it as a "
+            "mutual or one-way agreement as specified."
+        ),
+    ),
+    NDASection(
+        name="recitals",
+        title="Recitals",
+        number=None,
+        depends_on=("parties", "nda_type"),
+        instructions=(
+            "Write two or three WHEREAS clauses explaining that the parties wish to "
+            "explore a business relationship requiring disclosure of confidential "
+            "information, followed by a NOW, THEREFORE clause."
+        ),
+    ),
+    NDASection(
+        name="definitions",
+        title="Definitions",
+        number=1,
+        depends_on=("nda_type",),
+        instructions=(
+            'Define "Confidential Information", "Disclosing Party", "Receiving Party" '
+            'and "Representatives", consistent with the NDA type.'
+        ),
+    ),
+    NDASection(
+        name="obligations",
+        title="Confidentiality Obligations",
+        number=2,
+        depends_on=("nda_type",),
+        instructions=(
+            "Oblige the Receiving Party to hold Confidential Information in strict "
+            "confidence, use it only to evaluate the business relationship, limit access "
+            "to Representatives who need to know, and protect it with at least reasonable "
+            "care."
+        ),
+    ),
+    NDASection(
+        name="exclusions",
+        title="Permitted Disclosures and Exclusions",
+        number=3,
+        depends_on=(),
+        instructions=(
+            "Include the standard five exclusions (public domain, already known, "
+            "independently developed, received from a third party without restriction, "
+            "required by law with prompt notice to the Disclosing Party)."
+        ),
+    ),
+    NDASection(
+        name="term",
+        title="Term and Termination",
+        number=4,
+        depends_on=("duration",),
+        instructions=(
+            "Specify the confidentiality period, how either party may terminate this "
+            "Agreement, that obligations survive termination for the confidentiality "
+            "period, and the return or destruction of materials on request."
+        ),
+    ),
+    NDASection(
+        name="remedies",
+        title="Remedies",
+        number=5,
+        depends_on=(),
+        instructions=(
+            "Provide for injunctive relief without the need to post bond, in addition to "
+            "any damages and other remedies available at law or in equity."
+        ),
+    ),
+    NDASection(
+        name="governing_law",
+        title="Governing Law and Jurisdiction",
+        number=6,
+        depends_on=("jurisdiction",),
+        instructions=(
+            "Choose the governing law and submit the parties to the courts of that "
+            "jurisdiction for any dispute arising out of this Agreement."
+        ),
+    ),
+    NDASection(
+        name="general",
+        title="General Provisions",
+        number=7,
+        depends_on=(),
+        instructions=(
+            "Cover entire agreement, severability, amendment and waiver, assignment, "
+            "notices and counterparts."
+        ),
+    ),
+    NDASection(
+        name="additional_terms",
+        title="Additional Terms",
+        number=8,
+        depends_on=("additional_terms",),
+        instructions="Express each additional term as a numbered provision.",
+        applies=_has_additional_terms,
+    ),
+    NDASection(
+        name="signatures",
+        title="Signatures",
+        number=None,
+        depends_on=("parties",),
+        instructions=(
+            "Write an IN WITNESS WHEREOF clause and a signature block for each party "
+            "with placeholders for signature, name, title and date."
+        ),
+    ),
+)
+
+
+def get_section(name: str) -> NDASection:
+    """Look up a section spec by name.
+
+    Args:
+        name: Section identifier
+
+    Returns:
+        The section
+
+    Raises:
+        KeyError: If no section has that name
+    """
+    for section in NDA_SECTIONS:
+        if section.name == name:
+            return section
+    raise KeyError(name)
+
+
+@dataclass(frozen=True)
+class GeneratedSection:
+    """A drafted NDA section.
+
+    Attributes:
+        section: The section spec
+        text: Drafted body text
+        cached: Whether the text came from the clause cache
+        tokens_used: Tokens spent drafting it (0 when cached)
+    """
+
+    section: NDASection
+    text: str
+    cached: bool = False
+    tokens_used: int = 0
+
+    @property
+    def name(self) -> str:
+        """Section identifier."""
+        return self.section.name
+
+    def render(self) -> str:
+        """Markdown for the section, heading included."""
+        heading = self.section.heading
+        body = self.text.strip()
+        return body if heading is None else f"{heading}\n\n{body}"
+
+
+def assemble_document(sections: list[GeneratedSection]) -> str:
+    """Join drafted sections into the full agreement.
+
+    Args:
+        sections: Sections in document order
+
+    Returns:
+        Markdown document
+    """
+    return "\n\n".join([DOCUMENT_TITLE, *(section.render() for section in sections)]) + "\n"
+
+
+class ClauseCache:
+    """Bounded LRU cache of drafted clause texts keyed by NDASection.cache_key()."""
+
+    def __init__(self, max_entries: int = 512):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Clauses kept before the least recently used is evicted
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> str | None:
+        """Get a cached clause.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Clause text, or None on a miss
+        """
+        text = self._entries.get(key)
+        if text is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """Store a drafted clause.
+
+        Args:
+            key: Cache key
+            text: Clause text
+        """
+        self._entries[key] = text
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every clause and reset the statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> dict[str, int]:
+        """Cache statistics (hits, misses, size, maxsize)."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.max_entries,
+        }
+
+
+_default_clause_cache = ClauseCache()
+
+
+def get_clause_cache() -> ClauseCache:
+    """Get the process-wide clause cache shared by NDAGenerator instances."""
+    return _default_clause_cache
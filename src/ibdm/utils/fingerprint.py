@@ -0,0 +1,90 @@
+"""Stable content digests of functions and plain values.
+
+Used by RuleSet.fingerprint() and DomainModel.fingerprint(). A function's
+digest covers its name, bytecode, constants, referenced names, defaults and
+closure values, but not line numbers, so reformatting or moving a function
+leaves it unchanged while editing its body does not. Functions it calls are
+covered by name only. Digests are stable across processes for the same
+Python version (set and frozenset contents are sorted, object identities
+never enter).
+"""
+
+import functools
+import hashlib
+from collections.abc import Iterable, Mapping
+from types import CodeType
+from typing import Any, cast
+
+_SCALARS = (type(None), bool, int, float, complex, str, bytes)
+
+
+def code_digest(func: Any) -> str:
+    """Digest of a callable's code.
+
+    Args:
+        func: Function, method, functools.partial or callable object
+
+    Returns:
+        Hex digest
+    """
+    return hashlib.sha256(_token(func, set()).encode("utf-8")).hexdigest()
+
+
+def _token(value: Any, seen: set[int]) -> str:
+    """Stable string form of a value, recursing into containers and code."""
+    if isinstance(value, _SCALARS):
+        return repr(value)
+    key = id(value)
+    if key in seen:
+        return "<cycle>"
+    seen.add(key)
+    try:
+        if isinstance(value, CodeType):
+            return _code_token(value, seen)
+        if isinstance(value, tuple | list):
+            items = cast(Iterable[Any], value)
+            return f"{type(items).__name__}({','.join(_token(item, seen) for item in items)})"
+        if isinstance(value, set | frozenset):
+            members = cast(Iterable[Any], value)
+            return f"set({','.join(sorted(_token(member, seen) for member in members))})"
+        if isinstance(value, dict):
+            entries = cast(Mapping[Any, Any], value)
+            pairs = sorted(f"{_token(k, seen)}:{_token(v, seen)}" for k, v in entries.items())
+            return f"dict({','.join(pairs)})"
+        if isinstance(value, functools.partial):
+            partial = cast("functools.partial[Any]", value)
+            return (
+                f"partial({_token(partial.func, seen)},{_token(partial.args, seen)},"
+                f"{_token(partial.keywords, seen)})"
+            )
+        code = getattr(value, "__code__", None)
+        if isinstance(code, CodeType):
+            cells = getattr(value, "__closure__", None) or ()
+            closure = [_token(cell.cell_contents, seen) for cell in cells]
+            return (
+                f"function({getattr(value, '__qualname__', '')},{_code_token(code, seen)},"
+                f"{_token(getattr(value, '__defaults__', None), seen)},"
+                f"{_token(getattr(value, '__kwdefaults__', None), seen)},{','.join(closure)})"
+            )
+        bound = getattr(value, "__func__", None)
+        if bound is not None:
+            owner = type(getattr(value, "__self__", None)).__qualname__
+            return f"method({owner},{_token(bound, seen)})"
+        if isinstance(value, type):
+            return f"class({value.__module__}.{value.__qualname__})"
+        if callable(value):
+            call = getattr(type(value), "__call__", None)
+            return f"callable({type(value).__qualname__},{_token(call, seen)})"
+        # Other objects: their type only (reprs may embed memory addresses)
+        return f"object({type(value).__module__}.{type(value).__qualname__})"
+    finally:
+        seen.discard(key)
+
+
+def _code_token(code: CodeType, seen: set[int]) -> str:
+    """Stable string form of a code object and the code objects nested in it."""
+    return (
+        f"code({code.co_name},{code.co_code.hex()},{code.co_argcount},"
+        f"{code.co_kwonlyargcount},{code.co_flags},{','.join(code.co_names)},"
+        f"{','.join(code.co_varnames)},{_token(code.co_consts, seen)})"
+    )
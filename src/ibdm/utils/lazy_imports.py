@@ -0,0 +1,52 @@
+"""Lazy package exports (PEP 562).
+
+Package ``__init__`` modules re-export names from their submodules. Importing
+every submodule eagerly means ``from ibdm.engine import DialogueMoveEngine``
+also loads the NLU stack and, through it, litellm. Packages declare their
+exports here instead, and each submodule is imported the first time one of
+its names is accessed.
+
+Example (in a package ``__init__``):
+    >>> from typing import TYPE_CHECKING
+    >>> if TYPE_CHECKING:
+    ...     from ibdm.nlu.nlu_engine import NLUEngine
+    >>> __getattr__, __dir__ = lazy_exports(__name__, {"NLUEngine": "ibdm.nlu.nlu_engine"})
+
+The ``TYPE_CHECKING`` imports keep static type checkers and IDEs seeing the
+real definitions.
+"""
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module-level ``__getattr__`` and ``__dir__`` for lazy exports.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Public name -> defining module, or "module:attribute" when the
+            export is an alias (e.g. "ibdm.nlu.answer_parser:create_parser")
+
+    Returns:
+        Tuple of (__getattr__, __dir__) to assign at module level
+    """
+
+    def module_getattr(name: str) -> Any:
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module_name, _, attribute = target.partition(":")
+        value = getattr(importlib.import_module(module_name), attribute or name)
+        # Cache on the package so later lookups bypass __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def module_dir() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return module_getattr, module_dir
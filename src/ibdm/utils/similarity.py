@@ -0,0 +1,230 @@
+"""Character n-gram TF-IDF similarity for short texts.
+
+Texts become sparse vectors of character bigram and trigram counts, weighted
+by inverse document frequency over a candidate set and L2-normalized, so
+cosine similarity is a dot product. A SimilarityIndex stores its candidates'
+vectors column-wise (n-gram -> [(candidate, weight)]), so scoring one answer
+against every candidate is a single sparse matrix-vector product that only
+touches the answer's n-grams.
+
+Used for answer-to-alternative matching (typos and spelling variants such as
+"one way" for "one-way") and for lexical comparison of scripted and generated
+utterances, all on CPU and without an LLM call.
+
+Example:
+    >>> index = SimilarityIndex(["mutual", "one-way"])
+    >>> index.match("mutal")
+    'mutual'
+    >>> pairwise_similarity([("Which parties?", "Which parties are involved?")])
+    [0.65...]
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import re
+from collections.abc import Iterable, Sequence
+
+#: Character n-gram sizes used for vectors
+NGRAM_SIZES = (2, 3)
+
+#: Minimum cosine similarity for SimilarityIndex.match() to accept a candidate
+MATCH_THRESHOLD = 0.5
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+SparseVector = dict[str, float]
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and replace punctuation runs with single spaces.
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        Normalized text ("One-Way!" -> "one way")
+    """
+    return " ".join(_NON_ALNUM_RE.sub(" ", text.lower()).split())
+
+
+def char_ngrams(text: str) -> dict[str, int]:
+    """Count the character n-grams of normalized, space-padded text.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        N-gram -> count
+    """
+    padded = f" {normalize_text(text)} "
+    counts: dict[str, int] = {}
+    for size in NGRAM_SIZES:
+        for start in range(len(padded) - size + 1):
+            gram = padded[start : start + size]
+            counts[gram] = counts.get(gram, 0) + 1
+    return counts
+
+
+def _unit(weights: SparseVector) -> SparseVector:
+    norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+    if norm == 0.0:
+        return {}
+    return {gram: weight / norm for gram, weight in weights.items()}
+
+
+def _dot(a: SparseVector, b: SparseVector) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    return min(1.0, sum(weight * b.get(gram, 0.0) for gram, weight in a.items()))
+
+
+class _IdfWeights:
+    """Smoothed inverse document frequencies over a collection of texts."""
+
+    def __init__(self, counts: Sequence[dict[str, int]]):
+        total = len(counts)
+        frequencies: dict[str, int] = {}
+        for grams in counts:
+            for gram in grams:
+                frequencies[gram] = frequencies.get(gram, 0) + 1
+        self.idf = {
+            gram: math.log((1 + total) / (1 + df)) + 1.0 for gram, df in frequencies.items()
+        }
+        # N-grams no text in the collection has are the most informative
+        self.unseen = math.log(1 + total) + 1.0
+
+    def vector(self, counts: dict[str, int]) -> SparseVector:
+        idf, unseen = self.idf, self.unseen
+        return _unit({gram: tf * idf.get(gram, unseen) for gram, tf in counts.items()})
+
+
+class SimilarityIndex:
+    """Candidate strings vectorized once, scored against answers by cosine similarity."""
+
+    def __init__(self, candidates: Iterable[str]):
+        """Vectorize the candidates.
+
+        Args:
+            candidates: Strings to match against (e.g. alternatives, sort individuals)
+        """
+        self.candidates = list(candidates)
+        counts = [char_ngrams(candidate) for candidate in self.candidates]
+        self._weights = _IdfWeights(counts)
+        self._columns: dict[str, list[tuple[int, float]]] = {}
+        for position, grams in enumerate(counts):
+            for gram, weight in self._weights.vector(grams).items():
+                self._columns.setdefault(gram, []).append((position, weight))
+
+    def vectorize(self, text: str) -> SparseVector:
+        """Vectorize text with the candidates' IDF weights.
+
+        Args:
+            text: Text to vectorize
+
+        Returns:
+            Unit-length sparse vector
+        """
+        return self._weights.vector(char_ngrams(text))
+
+    def scores(self, text: str) -> list[float]:
+        """Cosine similarity of text to every candidate.
+
+        Args:
+            text: Answer or utterance
+
+        Returns:
+            One score in [0, 1] per candidate, in candidate order
+        """
+        result = [0.0] * len(self.candidates)
+        for gram, weight in self.vectorize(text).items():
+            for position, candidate_weight in self._columns.get(gram, ()):
+                result[position] += weight * candidate_weight
+        return [min(1.0, score) for score in result]
+
+    def score_batch(self, texts: Iterable[str]) -> list[list[float]]:
+        """Score many texts against the candidates.
+
+        Args:
+            texts: Answers or utterances
+
+        Returns:
+            One score list per text (see scores())
+        """
+        return [self.scores(text) for text in texts]
+
+    def best_match(self, text: str) -> tuple[str, float] | None:
+        """Find the candidate most similar to text.
+
+        Args:
+            text: Answer or utterance
+
+        Returns:
+            Tuple of (candidate, score), or None if there are no candidates
+        """
+        if not self.candidates:
+            return None
+        scores = self.scores(text)
+        position = max(range(len(scores)), key=scores.__getitem__)
+        return self.candidates[position], scores[position]
+
+    def match(self, text: str, threshold: float = MATCH_THRESHOLD) -> str | None:
+        """Find the candidate text refers to, if it is similar enough.
+
+        Args:
+            text: Answer or utterance
+            threshold: Minimum cosine similarity to accept
+
+        Returns:
+            Best candidate scoring at least threshold, else None
+        """
+        best = self.best_match(text)
+        if best is None or best[1] < threshold:
+            return None
+        return best[0]
+
+
+@functools.lru_cache(maxsize=1024)
+def similarity_index(candidates: tuple[str, ...]) -> SimilarityIndex:
+    """Get a shared SimilarityIndex for a candidate tuple, building it once.
+
+    Args:
+        candidates: Candidate strings
+
+    Returns:
+        Cached SimilarityIndex
+    """
+    return SimilarityIndex(candidates)
+
+
+def pairwise_similarity(pairs: Sequence[tuple[str, str]]) -> list[float]:
+    """Cosine similarity of many text pairs in one batch.
+
+    IDF weights come from every text in the batch and each distinct text is
+    vectorized once.
+
+    Args:
+        pairs: (text, text) pairs
+
+    Returns:
+        One score in [0, 1] per pair, in order
+    """
+    texts = list(dict.fromkeys(text for pair in pairs for text in pair))
+    counts = {text: char_ngrams(text) for text in texts}
+    weights = _IdfWeights(list(counts.values()))
+    vectors = {text: weights.vector(grams) for text, grams in counts.items()}
+    return [_dot(vectors[left], vectors[right]) for left, right in pairs]
+
+
+def text_similarity(left: str, right: str) -> float:
+    """Cosine similarity of two texts.
+
+    Args:
+        left: First text
+        right: Second text
+
+    Returns:
+        Score in [0, 1]
+    """
+    return pairwise_similarity([(left, right)])[0]
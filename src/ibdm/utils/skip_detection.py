@@ -1,10 +1,11 @@
 """Utility for detecting when users want to skip/override questions.
 
 This module provides pattern matching for user utterances that indicate
-they want to proceed without answering the current question.
+they want to proceed without answering the current question. The skip phrases
+are the "skip" and "skip_reply" classes of the shared utterance lexicon.
 """
 
-import re
+from ibdm.utils.utterance_features import extract_features
 
 
 def is_skip_request(utterance: str) -> bool:
@@ -32,27 +33,9 @@ def is_skip_request(utterance: str) -> bool:
         >>> is_skip_request("Paris")
         False
     """
-    if not utterance:
-        return False
-
-    # Normalize to lowercase for matching
-    text = utterance.lower().strip()
-
-    # Skip patterns
-    skip_patterns = [
-        r"\b(skip|pass)\b",  # "skip", "pass"
-        r"\bdon'?t\s+(have|know)\b",  # "don't have", "don't know"
-        r"\b(not|no)\s+available\b",  # "not available", "no available"
-        r"\bmove\s+on\b",  # "move on"
-        r"\bproceed\s+(anyway|without)\b",  # "proceed anyway", "proceed without"
-        r"\bcan'?t\s+provide\b",  # "can't provide"
-        r"\bno\s+info(rmation)?\b",  # "no info", "no information"
-        r"^(idk|dunno)$",  # "idk", "dunno"
-    ]
-
-    # Check if any pattern matches
-    for pattern in skip_patterns:
-        if re.search(pattern, text):
-            return True
-
-    return False
+    features = extract_features(utterance)
+    if features.has("skip"):
+        return True
+
+    # "idk", "dunno" only as the whole reply
+    return features.word_count == 1 and features.has("skip_reply")
@@ -0,0 +1,246 @@
+"""One-pass surface features of an utterance.
+
+The rule-based interpretation preconditions and skip detection all look at
+the same few surface cues: the first word, a trailing question mark, the
+length, and whether the utterance contains a greeting, a yes/no word, a
+request phrase and so on. extract_features() computes all of them in one pass:
+the utterance is lowercased and tokenized once, and a compiled Lexicon maps
+every keyword phrase of every class to its token sequence so a single scan
+over the tokens finds all matches.
+
+Matching is on whole tokens, so "this" no longer matches the greeting "hi"
+and "however" is not a wh-question. Apostrophes split tokens ("don't" is
+"don", "t"); lexicon phrases are tokenized the same way, so "don't know" and
+"dont know" are listed separately only because they tokenize differently.
+
+Results are cached per utterance text; every rule evaluating the same
+utterance reads the same UtteranceFeatures record.
+
+Example:
+    >>> features = extract_features("Hi, can you draft an NDA?")
+    >>> features.first_token, features.is_question
+    ('hi', True)
+    >>> sorted(features.classes)
+    ['auxiliary', 'greeting', 'request']
+    >>> features.spans("request")
+    [(4, 11), (12, 17)]
+"""
+
+import functools
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+#: Keyword classes and their phrases
+KEYWORD_CLASSES: dict[str, tuple[str, ...]] = {
+    "greeting": ("hello", "hi", "hey", "greetings", "good morning", "good afternoon"),
+    "quit": ("quit", "exit", "bye", "goodbye", "see you"),
+    "wh": ("what", "where", "when", "who", "why", "how", "which"),
+    "auxiliary": (
+        "is",
+        "are",
+        "was",
+        "were",
+        "do",
+        "does",
+        "did",
+        "can",
+        "could",
+        "will",
+        "would",
+        "should",
+        "may",
+        "might",
+    ),
+    "yes": ("yes", "yeah", "yep", "true"),
+    "no": ("no", "nope", "nah", "false"),
+    "disjunction": ("or",),
+    "request": (
+        "i need to",
+        "i want to",
+        "i'd like to",
+        "can you",
+        "could you",
+        "please",
+        "help me",
+        "draft",
+        "drafts",
+        "drafted",
+        "drafting",
+        "create",
+        "creates",
+        "created",
+        "creating",
+        "prepare",
+        "prepares",
+        "prepared",
+        "preparing",
+        "make",
+        "makes",
+        "made",
+        "making",
+    ),
+    "skip": (
+        "skip",
+        "pass",
+        "don't have",
+        "dont have",
+        "don't know",
+        "dont know",
+        "not available",
+        "no available",
+        "move on",
+        "proceed anyway",
+        "proceed without",
+        "can't provide",
+        "cant provide",
+        "no info",
+        "no information",
+    ),
+    "skip_reply": ("idk", "dunno"),
+}
+
+
+def tokenize(text: str) -> list[tuple[str, int, int]]:
+    """Lowercase word tokens with their character spans.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        (token, start, end) triples
+    """
+    return [(match.group(), match.start(), match.end()) for match in _TOKEN_RE.finditer(text)]
+
+
+@dataclass(frozen=True)
+class KeywordMatch:
+    """One lexicon phrase found in an utterance.
+
+    Attributes:
+        keyword_class: Class the phrase belongs to
+        phrase: The phrase as listed in the lexicon
+        token: Index of the phrase's first token
+        start: Character offset where the phrase starts
+        end: Character offset where the phrase ends
+    """
+
+    keyword_class: str
+    phrase: str
+    token: int
+    start: int
+    end: int
+
+
+class Lexicon:
+    """Keyword phrases of several classes compiled for a single token scan."""
+
+    def __init__(self, classes: Mapping[str, Iterable[str]]):
+        """Compile the lexicon.
+
+        Args:
+            classes: Keyword class name -> phrases
+        """
+        self._phrases: dict[tuple[str, ...], list[tuple[str, str]]] = {}
+        for keyword_class, phrases in classes.items():
+            for phrase in phrases:
+                key = tuple(token for token, _, _ in tokenize(phrase.lower()))
+                self._phrases.setdefault(key, []).append((keyword_class, phrase))
+        self._max_length = max((len(key) for key in self._phrases), default=0)
+
+    def scan(self, tokens: list[tuple[str, int, int]]) -> list[KeywordMatch]:
+        """Find every lexicon phrase in a token sequence.
+
+        Overlapping phrases of different classes are all reported.
+
+        Args:
+            tokens: Output of tokenize()
+
+        Returns:
+            Matches in order of position
+        """
+        words = [token for token, _, _ in tokens]
+        matches: list[KeywordMatch] = []
+        for index in range(len(words)):
+            for length in range(1, min(self._max_length, len(words) - index) + 1):
+                entries = self._phrases.get(tuple(words[index : index + length]))
+                if entries is None:
+                    continue
+                start, end = tokens[index][1], tokens[index + length - 1][2]
+                matches.extend(
+                    KeywordMatch(keyword_class, phrase, index, start, end)
+                    for keyword_class, phrase in entries
+                )
+        return matches
+
+
+DEFAULT_LEXICON = Lexicon(KEYWORD_CLASSES)
+
+
+@dataclass(frozen=True)
+class UtteranceFeatures:
+    """Surface features of one utterance.
+
+    Attributes:
+        text: The utterance, stripped
+        tokens: Lowercase word tokens
+        word_count: Whitespace-separated words
+        is_question: Whether the utterance ends with a question mark
+        matches: Lexicon phrases found, in order of position
+        classes: Keyword classes with at least one match
+    """
+
+    text: str
+    tokens: tuple[str, ...]
+    word_count: int
+    is_question: bool
+    matches: tuple[KeywordMatch, ...]
+    classes: frozenset[str]
+
+    @property
+    def first_token(self) -> str:
+        """The first word token, or "" for an empty utterance."""
+        return self.tokens[0] if self.tokens else ""
+
+    def has(self, *keyword_classes: str) -> bool:
+        """Whether any of the keyword classes matched."""
+        return not self.classes.isdisjoint(keyword_classes)
+
+    def starts_with(self, keyword_class: str) -> bool:
+        """Whether the utterance opens with a phrase of the class."""
+        return any(
+            match.token == 0 and match.keyword_class == keyword_class for match in self.matches
+        )
+
+    def spans(self, keyword_class: str) -> list[tuple[int, int]]:
+        """Character spans of the class's matches (offsets into text)."""
+        return [
+            (match.start, match.end)
+            for match in self.matches
+            if match.keyword_class == keyword_class
+        ]
+
+
+@functools.lru_cache(maxsize=1024)
+def extract_features(utterance: str) -> UtteranceFeatures:
+    """Tokenize an utterance once and match it against the default lexicon.
+
+    Args:
+        utterance: Utterance text
+
+    Returns:
+        Cached UtteranceFeatures for the text
+    """
+    text = utterance.strip()
+    tokens = tokenize(text.lower())
+    matches = DEFAULT_LEXICON.scan(tokens)
+    return UtteranceFeatures(
+        text=text,
+        tokens=tuple(token for token, _, _ in tokens),
+        word_count=len(text.split()),
+        is_question=text.endswith("?"),
+        matches=tuple(matches),
+        classes=frozenset(match.keyword_class for match in matches),
+    )
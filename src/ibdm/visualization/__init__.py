@@ -9,13 +9,64 @@ Key Components:
 - RuleTrace: Record of rule execution (preconditions, effects, selected rule)
 - DiffEngine: Computes diffs between states
 - TerminalRenderer: Beautiful Rich-based terminal rendering
+- SessionAggregator/Dashboard: Aggregate view over all sessions in a process
+- TimelineWriter: Incremental, paginated HTML timeline for long sessions
+
+Exports are imported on first access (PEP 562), so state snapshots and diffs can
+be used without loading Rich for the terminal renderer.
 """
 
-from ibdm.visualization.diff_engine import DiffEngine, compute_diff
-from ibdm.visualization.rule_trace import RuleEvaluation, RuleTrace
-from ibdm.visualization.state_diff import ChangedField, ChangeType, StateDiff
-from ibdm.visualization.state_snapshot import StateSnapshot
-from ibdm.visualization.terminal_renderer import TerminalRenderer
+from typing import TYPE_CHECKING
+
+from ibdm.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from ibdm.visualization.dashboard import (
+        Dashboard,
+        DashboardSnapshot,
+        SessionAggregator,
+        get_session_aggregator,
+        set_session_aggregator,
+    )
+    from ibdm.visualization.diff_engine import (
+        DiffEngine,
+        compute_diff,
+        snapshot_patch,
+    )
+    from ibdm.visualization.rule_trace import (
+        RuleEvaluation,
+        RuleTrace,
+    )
+    from ibdm.visualization.state_diff import (
+        ChangedField,
+        ChangeType,
+        StateDiff,
+    )
+    from ibdm.visualization.state_snapshot import StateSnapshot
+    from ibdm.visualization.terminal_renderer import TerminalRenderer
+    from ibdm.visualization.timeline_writer import TimelineWriter
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Dashboard": "ibdm.visualization.dashboard",
+        "DashboardSnapshot": "ibdm.visualization.dashboard",
+        "SessionAggregator": "ibdm.visualization.dashboard",
+        "get_session_aggregator": "ibdm.visualization.dashboard",
+        "set_session_aggregator": "ibdm.visualization.dashboard",
+        "DiffEngine": "ibdm.visualization.diff_engine",
+        "compute_diff": "ibdm.visualization.diff_engine",
+        "snapshot_patch": "ibdm.visualization.diff_engine",
+        "RuleEvaluation": "ibdm.visualization.rule_trace",
+        "RuleTrace": "ibdm.visualization.rule_trace",
+        "ChangedField": "ibdm.visualization.state_diff",
+        "ChangeType": "ibdm.visualization.state_diff",
+        "StateDiff": "ibdm.visualization.state_diff",
+        "StateSnapshot": "ibdm.visualization.state_snapshot",
+        "TerminalRenderer": "ibdm.visualization.terminal_renderer",
+        "TimelineWriter": "ibdm.visualization.timeline_writer",
+    },
+)
 
 __all__ = [
     "StateSnapshot",
@@ -26,5 +77,12 @@ __all__ = [
     "RuleTrace",
     "DiffEngine",
     "compute_diff",
+    "snapshot_patch",
     "TerminalRenderer",
+    "TimelineWriter",
+    "SessionAggregator",
+    "DashboardSnapshot",
+    "Dashboard",
+    "get_session_aggregator",
+    "set_session_aggregator",
 ]
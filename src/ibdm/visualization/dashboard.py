@@ -0,0 +1,475 @@
+"""Aggregate monitoring dashboard for many concurrent dialogue sessions.
+
+StateMonitor, TerminalRenderer and HtmlExporter show one session's
+InformationState. SessionAggregator keeps running totals over every session
+in the process instead: sessions per pipeline phase and per active plan type,
+the QUD depth distribution, the pending action queue, turn latency
+percentiles and the turn error rate. It is fed by the engine's
+instrumentation (the Burr application reports every pipeline step through
+SessionMonitorHook, and DialogueStateMachine reports turn boundaries), and
+the dashboard adds LLM calls in flight and LLM errors from the LLMTelemetry
+hub.
+
+Every event updates a fixed number of counters, so its cost does not grow
+with the number of sessions. Sessions idle for longer than session_ttl are
+dropped, oldest first, as new events arrive.
+
+Example:
+    >>> aggregator = SessionAggregator()
+    >>> set_session_aggregator(aggregator)
+    >>> # ... serve dialogues ...
+    >>> Dashboard(aggregator).run(html_path="dashboard.html")
+"""
+
+import html
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from dataclasses import field as dataclass_field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ibdm.nlu.llm_telemetry import LLMTelemetry, get_telemetry
+from ibdm.nlu.validation.metrics import LatencyHistogram
+
+if TYPE_CHECKING:
+    from rich.console import Console, RenderableType
+
+#: Plan type of a session without an active plan
+NO_PLAN = "none"
+
+#: QUD depths at or above this share one bucket
+MAX_QUD_BUCKET = 5
+
+
+def _qud_bucket(depth: int) -> str:
+    return f"{MAX_QUD_BUCKET}+" if depth >= MAX_QUD_BUCKET else str(depth)
+
+
+def _shift(table: dict[str, int], old: str | None, new: str | None) -> None:
+    """Move one count from old to new, dropping keys that reach zero."""
+    if old == new:
+        return
+    if old is not None:
+        table[old] -= 1
+        if table[old] == 0:
+            del table[old]
+    if new is not None:
+        table[new] = table.get(new, 0) + 1
+
+
+@dataclass
+class _SessionView:
+    """What the aggregator last saw of one session."""
+
+    phase: str = "idle"
+    plan_type: str = NO_PLAN
+    qud_depth: int = 0
+    action_depth: int = 0
+    last_seen: float = 0.0
+    turn_start: float | None = None
+
+
+@dataclass
+class DashboardSnapshot:
+    """Point-in-time view of all sessions.
+
+    Attributes:
+        sessions: Sessions seen within the TTL
+        by_phase: Sessions per pipeline phase ("waiting" between turns)
+        by_plan_type: Sessions per active plan type
+        qud_depth: Sessions per QUD depth bucket
+        action_queue: Pending actions summed over sessions
+        turns: Completed turns
+        turn_errors: Turns that raised
+        step_errors: Pipeline steps that raised
+        turn_latency: Turn latency histogram
+        llm_in_flight: LLM requests waiting for the backend
+        llm_calls: LLM calls reported to the telemetry hub
+        llm_errors: LLM calls that failed
+    """
+
+    sessions: int = 0
+    by_phase: dict[str, int] = dataclass_field(default_factory=lambda: {})
+    by_plan_type: dict[str, int] = dataclass_field(default_factory=lambda: {})
+    qud_depth: dict[str, int] = dataclass_field(default_factory=lambda: {})
+    action_queue: int = 0
+    turns: int = 0
+    turn_errors: int = 0
+    step_errors: int = 0
+    turn_latency: LatencyHistogram = dataclass_field(default_factory=LatencyHistogram)
+    llm_in_flight: int = 0
+    llm_calls: int = 0
+    llm_errors: int = 0
+
+    @property
+    def turn_error_rate(self) -> float:
+        """Fraction of turns that raised."""
+        return self.turn_errors / self.turns if self.turns else 0.0
+
+    @property
+    def llm_error_rate(self) -> float:
+        """Fraction of LLM calls that failed."""
+        return self.llm_errors / self.llm_calls if self.llm_calls else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "sessions": self.sessions,
+            "by_phase": dict(self.by_phase),
+            "by_plan_type": dict(self.by_plan_type),
+            "qud_depth": dict(self.qud_depth),
+            "action_queue": self.action_queue,
+            "turns": self.turns,
+            "turn_errors": self.turn_errors,
+            "turn_error_rate": self.turn_error_rate,
+            "step_errors": self.step_errors,
+            "turn_latency": self.turn_latency.to_dict(),
+            "llm_in_flight": self.llm_in_flight,
+            "llm_calls": self.llm_calls,
+            "llm_errors": self.llm_errors,
+            "llm_error_rate": self.llm_error_rate,
+        }
+
+
+class SessionAggregator:
+    """Running totals over all dialogue sessions, updated in O(1) per event."""
+
+    def __init__(self, session_ttl: float = 3600.0):
+        """Initialize the aggregator.
+
+        Args:
+            session_ttl: Seconds without events after which a session is dropped
+        """
+        self.session_ttl = session_ttl
+        self._sessions: OrderedDict[str, _SessionView] = OrderedDict()
+        self._by_phase: dict[str, int] = {}
+        self._by_plan_type: dict[str, int] = {}
+        self._qud_depth: dict[str, int] = {}
+        self._action_queue = 0
+        self._turns = 0
+        self._turn_errors = 0
+        self._step_errors = 0
+        self._turn_latency = LatencyHistogram()
+        self._lock = threading.Lock()
+
+    def enter_phase(self, session_id: str, phase: str) -> None:
+        """Record that a session started a pipeline step.
+
+        Args:
+            session_id: Dialogue session (Burr application id)
+            phase: Pipeline step name
+        """
+        with self._lock:
+            view = self._touch(session_id)
+            _shift(self._by_phase, view.phase, phase)
+            view.phase = phase
+
+    def observe_state(self, session_id: str, information_state: Mapping[str, Any]) -> None:
+        """Update a session's plan type, QUD depth and action queue.
+
+        Args:
+            session_id: Dialogue session
+            information_state: InformationState.to_dict() form, as kept in Burr state
+        """
+        private: Mapping[str, Any] = information_state.get("private", {})
+        shared: Mapping[str, Any] = information_state.get("shared", {})
+        plans: list[Mapping[str, Any]] = private.get("plan", [])
+        plan_type = next(
+            (plan["plan_type"] for plan in plans if plan.get("status", "active") == "active"),
+            NO_PLAN,
+        )
+        qud_depth = len(shared.get("qud", []))
+        action_depth = len(private.get("actions", []))
+
+        with self._lock:
+            view = self._touch(session_id)
+            _shift(self._by_plan_type, view.plan_type, plan_type)
+            _shift(self._qud_depth, _qud_bucket(view.qud_depth), _qud_bucket(qud_depth))
+            self._action_queue += action_depth - view.action_depth
+            view.plan_type, view.qud_depth, view.action_depth = plan_type, qud_depth, action_depth
+
+    def turn_started(self, session_id: str) -> None:
+        """Record the start of a turn."""
+        with self._lock:
+            self._touch(session_id).turn_start = time.monotonic()
+
+    def turn_finished(self, session_id: str, error: bool = False) -> None:
+        """Record the end of a turn; the session waits for input afterwards.
+
+        Args:
+            session_id: Dialogue session
+            error: Whether the turn raised
+        """
+        with self._lock:
+            view = self._touch(session_id)
+            if view.turn_start is not None:
+                self._turn_latency.record(time.monotonic() - view.turn_start)
+                view.turn_start = None
+            self._turns += 1
+            self._turn_errors += error
+            _shift(self._by_phase, view.phase, "waiting")
+            view.phase = "waiting"
+
+    def step_failed(self, session_id: str) -> None:
+        """Record a pipeline step that raised."""
+        with self._lock:
+            self._touch(session_id)
+            self._step_errors += 1
+
+    def end_session(self, session_id: str) -> None:
+        """Stop counting a session."""
+        with self._lock:
+            view = self._sessions.pop(session_id, None)
+            if view is not None:
+                self._forget(view)
+
+    def snapshot(self, telemetry: LLMTelemetry | None = None) -> DashboardSnapshot:
+        """Current totals.
+
+        Args:
+            telemetry: Hub to read LLM figures from (defaults to the installed one)
+
+        Returns:
+            Copy of the totals
+        """
+        with self._lock:
+            self._expire(time.monotonic())
+            latency = LatencyHistogram()
+            latency.merge(self._turn_latency)
+            snapshot = DashboardSnapshot(
+                sessions=len(self._sessions),
+                by_phase=dict(self._by_phase),
+                by_plan_type=dict(self._by_plan_type),
+                qud_depth=dict(self._qud_depth),
+                action_queue=self._action_queue,
+                turns=self._turns,
+                turn_errors=self._turn_errors,
+                step_errors=self._step_errors,
+                turn_latency=latency,
+            )
+        telemetry = telemetry if telemetry is not None else get_telemetry()
+        if telemetry is not None:
+            snapshot.llm_in_flight = telemetry.in_flight
+            for aggregate in telemetry.by_component().values():
+                snapshot.llm_calls += aggregate.calls
+                snapshot.llm_errors += aggregate.errors
+        return snapshot
+
+    def _touch(self, session_id: str) -> _SessionView:
+        """Get or create a session's view and mark it recently seen (lock held)."""
+        now = time.monotonic()
+        view = self._sessions.get(session_id)
+        if view is None:
+            view = _SessionView()
+            self._sessions[session_id] = view
+            _shift(self._by_phase, None, view.phase)
+            _shift(self._by_plan_type, None, view.plan_type)
+            _shift(self._qud_depth, None, _qud_bucket(view.qud_depth))
+        else:
+            self._sessions.move_to_end(session_id)
+        view.last_seen = now
+        self._expire(now)
+        return view
+
+    def _expire(self, now: float) -> None:
+        """Drop sessions idle for longer than the TTL, oldest first (lock held)."""
+        while self._sessions:
+            session_id, view = next(iter(self._sessions.items()))
+            if now - view.last_seen < self.session_ttl:
+                return
+            del self._sessions[session_id]
+            self._forget(view)
+
+    def _forget(self, view: _SessionView) -> None:
+        """Remove a session's contribution to the totals (lock held)."""
+        _shift(self._by_phase, view.phase, None)
+        _shift(self._by_plan_type, view.plan_type, None)
+        _shift(self._qud_depth, _qud_bucket(view.qud_depth), None)
+        self._action_queue -= view.action_depth
+
+
+_aggregator: SessionAggregator | None = None
+
+
+def set_session_aggregator(aggregator: SessionAggregator | None) -> SessionAggregator | None:
+    """Install the process-wide aggregator the engine instrumentation reports to.
+
+    Args:
+        aggregator: Aggregator to install, or None to stop collecting
+
+    Returns:
+        The previously installed aggregator
+    """
+    global _aggregator
+    previous = _aggregator
+    _aggregator = aggregator
+    return previous
+
+
+def get_session_aggregator() -> SessionAggregator | None:
+    """Return the process-wide aggregator, if any."""
+    return _aggregator
+
+
+def _latency_row(snapshot: DashboardSnapshot) -> str:
+    latency = snapshot.turn_latency
+    return (
+        f"{latency.percentile(0.5) * 1000:.0f} / {latency.percentile(0.95) * 1000:.0f} / "
+        f"{latency.percentile(0.99) * 1000:.0f} ms"
+    )
+
+
+def _summary_rows(snapshot: DashboardSnapshot) -> list[tuple[str, str]]:
+    return [
+        ("Sessions", str(snapshot.sessions)),
+        ("Turns", str(snapshot.turns)),
+        ("Turn latency p50/p95/p99", _latency_row(snapshot)),
+        ("Turn error rate", f"{snapshot.turn_error_rate:.1%}"),
+        ("Step errors", str(snapshot.step_errors)),
+        ("Action queue", str(snapshot.action_queue)),
+        ("LLM calls in flight", str(snapshot.llm_in_flight)),
+        ("LLM error rate", f"{snapshot.llm_error_rate:.1%} of {snapshot.llm_calls}"),
+    ]
+
+
+def _distributions(snapshot: DashboardSnapshot) -> list[tuple[str, list[tuple[str, int]]]]:
+    def by_count(table: dict[str, int]) -> list[tuple[str, int]]:
+        return sorted(table.items(), key=lambda item: (-item[1], item[0]))
+
+    return [
+        ("Phase", by_count(snapshot.by_phase)),
+        ("Plan type", by_count(snapshot.by_plan_type)),
+        ("QUD depth", sorted(snapshot.qud_depth.items())),
+    ]
+
+
+def render_dashboard(snapshot: DashboardSnapshot) -> "RenderableType":
+    """Render a snapshot with Rich.
+
+    Args:
+        snapshot: Totals to show
+
+    Returns:
+        Rich renderable
+    """
+    from rich.columns import Columns
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+
+    summary = Table(show_header=False, box=None, expand=True)
+    for label, value in _summary_rows(snapshot):
+        summary.add_row(label, value)
+
+    tables: list[Table] = []
+    for title, rows in _distributions(snapshot):
+        table = Table(title=title, show_header=False, box=None)
+        for key, count in rows or [("(none)", 0)]:
+            table.add_row(key, str(count))
+        tables.append(table)
+
+    return Panel(
+        Group(summary, Columns(tables, expand=True)),
+        title="IBDM Sessions",
+        border_style="blue",
+    )
+
+
+def dashboard_html(snapshot: DashboardSnapshot, refresh_seconds: float = 2.0) -> str:
+    """Render a snapshot as a self-refreshing HTML page.
+
+    Args:
+        snapshot: Totals to show
+        refresh_seconds: Reload interval of the page
+
+    Returns:
+        Complete HTML document string
+    """
+    summary = "".join(
+        f"<tr><th>{html.escape(label)}</th><td>{html.escape(value)}</td></tr>"
+        for label, value in _summary_rows(snapshot)
+    )
+    sections: list[str] = []
+    for title, rows in _distributions(snapshot):
+        body = "".join(
+            f"<tr><td>{html.escape(key)}</td><td>{count}</td></tr>" for key, count in rows
+        )
+        sections.append(f"<div><h3>{html.escape(title)}</h3><table>{body}</table></div>")
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <meta http-equiv="refresh" content="{refresh_seconds:g}">
+    <title>IBDM Sessions</title>
+    <style>
+    body {{ font-family: sans-serif; margin: 20px; background: #f5f5f7; color: #333; }}
+    table {{ border-collapse: collapse; }}
+    th, td {{ text-align: left; padding: 2px 12px 2px 0; }}
+    .grid {{ display: flex; gap: 40px; }}
+    </style>
+</head>
+<body>
+    <h1>IBDM Sessions</h1>
+    <table>{summary}</table>
+    <div class="grid">{"".join(sections)}</div>
+</body>
+</html>"""
+
+
+class Dashboard:
+    """Renders a SessionAggregator to the terminal and/or an HTML file."""
+
+    def __init__(self, aggregator: SessionAggregator, telemetry: LLMTelemetry | None = None):
+        """Initialize the dashboard.
+
+        Args:
+            aggregator: Totals to show
+            telemetry: Hub to read LLM figures from (defaults to the installed one)
+        """
+        self.aggregator = aggregator
+        self.telemetry = telemetry
+
+    def snapshot(self) -> DashboardSnapshot:
+        """Current totals."""
+        return self.aggregator.snapshot(self.telemetry)
+
+    def write_html(self, path: str | Path, refresh_seconds: float = 2.0) -> None:
+        """Write the HTML page, replacing it atomically.
+
+        Args:
+            path: Output file
+            refresh_seconds: Reload interval of the page
+        """
+        target = Path(path)
+        partial = target.with_suffix(target.suffix + ".tmp")
+        partial.write_text(dashboard_html(self.snapshot(), refresh_seconds), encoding="utf-8")
+        partial.replace(target)
+
+    def run(
+        self,
+        interval: float = 1.0,
+        html_path: str | Path | None = None,
+        console: "Console | None" = None,
+    ) -> None:
+        """Refresh the terminal view (and HTML page) until interrupted.
+
+        Args:
+            interval: Seconds between refreshes
+            html_path: Also rewrite this HTML page on every refresh
+            console: Rich console to draw on
+        """
+        from rich.live import Live
+
+        with Live(render_dashboard(self.snapshot()), console=console, auto_refresh=False) as live:
+            try:
+                while True:
+                    snapshot = self.snapshot()
+                    live.update(render_dashboard(snapshot), refresh=True)
+                    if html_path is not None:
+                        self.write_html(html_path, refresh_seconds=interval)
+                    time.sleep(interval)
+            except KeyboardInterrupt:
+                pass
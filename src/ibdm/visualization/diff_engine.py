@@ -255,3 +255,23 @@ def compute_diff(before: StateSnapshot, after: StateSnapshot) -> StateDiff:
     """
     engine = DiffEngine()
     return engine.compute_diff(before, after)
+
+
+def snapshot_patch(before: dict[str, Any], after: dict[str, Any]) -> dict[str, Any]:
+    """Compute the fields of a serialized snapshot that changed.
+
+    Unlike compute_diff(), which compares live objects by identity, this
+    compares the serialized form from StateSnapshot.to_dict(), so it also
+    catches objects mutated in place and works across processes. Applying
+    the patch with ``before.update(patch)`` yields ``after``.
+
+    Args:
+        before: Previously serialized snapshot
+        after: Current serialized snapshot
+
+    Returns:
+        Changed fields with their new values
+    """
+    return {
+        name: value for name, value in after.items() if name not in before or before[name] != value
+    }
@@ -349,16 +349,49 @@ class HtmlExporter:
 </body>
 </html>"""
 
+    #: Snapshot panel -> snapshot fields it displays
+    PANEL_FIELDS: dict[str, tuple[str, ...]] = {
+        "qud": ("qud",),
+        "commitments": ("commitments",),
+        "agenda": ("agenda",),
+        "plan": ("plan",),
+        "issues": ("issues",),
+        "beliefs": ("beliefs",),
+        "last_move": ("last_move",),
+    }
+
+    def render_panels(
+        self, snapshot: StateSnapshot, changed: set[str] | None = None
+    ) -> dict[str, str]:
+        """Render the panels of a snapshot view as HTML fragments.
+
+        A live view can swap in just the fragments for the fields that changed
+        instead of regenerating the whole page.
+
+        Args:
+            snapshot: The state snapshot to render
+            changed: Names of changed snapshot fields (None renders every panel)
+
+        Returns:
+            Panel name -> HTML fragment, for the panels showing changed fields
+        """
+        renderers = {
+            "qud": lambda: self._render_section("QUD (Questions Under Discussion)", snapshot.qud),
+            "commitments": lambda: self._render_section("Commitments", snapshot.commitments),
+            "agenda": lambda: self._render_section("Agenda", snapshot.agenda),
+            "plan": lambda: self._render_section("Plan", snapshot.plan),
+            "issues": lambda: self._render_section("Private Issues", snapshot.issues),
+            "beliefs": lambda: self._render_dict_section("Beliefs", snapshot.beliefs),
+            "last_move": lambda: self._render_last_move(snapshot.last_move),
+        }
+        return {
+            name: renderers[name]()
+            for name, fields in self.PANEL_FIELDS.items()
+            if changed is None or not changed.isdisjoint(fields)
+        }
+
     def _render_snapshot(self, snapshot: StateSnapshot) -> str:
         """Render a snapshot as an HTML component."""
-        qud_section = self._render_section("QUD (Questions Under Discussion)", snapshot.qud)
-        commitments_section = self._render_section("Commitments", snapshot.commitments)
-        agenda_section = self._render_section("Agenda", snapshot.agenda)
-        plan_section = self._render_section("Plan", snapshot.plan)
-        issues_section = self._render_section("Private Issues", snapshot.issues)
-        beliefs_section = self._render_dict_section("Beliefs", snapshot.beliefs)
-        last_move = self._render_last_move(snapshot.last_move)
-
         return f"""
         <div class="snapshot">
             <div class="header">
@@ -368,7 +401,32 @@ class HtmlExporter:
                     <span class="agent">Agent: {html.escape(snapshot.agent_id)}</span>
                 </div>
             </div>
+            {self.render_snapshot_body(snapshot)}
+        </div>
+        """
+
+    def render_snapshot_body(self, snapshot: StateSnapshot) -> str:
+        """Render the state panels of a snapshot, without its label or timestamp.
+
+        Identical states render to identical HTML, so the result can be
+        deduplicated by content (see TimelineWriter).
+
+        Args:
+            snapshot: The state snapshot to render
 
+        Returns:
+            HTML fragment with the state grid and last move
+        """
+        panels = self.render_panels(snapshot)
+        qud_section = panels["qud"]
+        commitments_section = panels["commitments"]
+        agenda_section = panels["agenda"]
+        plan_section = panels["plan"]
+        issues_section = panels["issues"]
+        beliefs_section = panels["beliefs"]
+        last_move = panels["last_move"]
+
+        return f"""
             <div class="grid">
                 <!-- Shared State -->
                 <div class="column">
@@ -388,7 +446,6 @@ class HtmlExporter:
             <div class="footer">
                 {last_move}
             </div>
-        </div>
         """
 
     def _render_diff(self, diff: StateDiff) -> str:
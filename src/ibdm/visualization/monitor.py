@@ -1,29 +1,157 @@
 """Real-time monitor for IBDM dialogue state.
 
-Provides infrastructure for publishing state updates to a file and monitoring
-those updates in a separate process/terminal.
+StatePublisher pushes state updates over a local Unix-domain socket to any
+number of subscribers; StateMonitor is a subscriber that shows the state in a
+terminal, typically in a separate process.
+
+Messages are newline-delimited compact JSON. Subscribers receive a "full"
+message with every field of StateSnapshot.to_dict(), then "patch" messages
+carrying only the fields that changed (see diff_engine.snapshot_patch), so
+views can re-render just the affected panels. Each subscriber has a bounded
+queue drained by its own writer thread: when a slow subscriber falls
+queue_size messages behind, its backlog is dropped and replaced by one full
+message, so it skips ahead to the current state and never blocks the
+publisher. While nobody is subscribed, publish() only keeps a reference to
+the snapshot and serializes nothing.
+
+Unix-domain sockets are not available on Windows.
 """
 
+import atexit
 import json
 import os
+import socket
+import threading
 import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from typing import Any
 
 from rich.console import Console
+from rich.live import Live
 
+from ibdm.visualization.diff_engine import snapshot_patch
 from ibdm.visualization.state_snapshot import StateSnapshot
 from ibdm.visualization.terminal import TerminalVisualizer
 
+DEFAULT_SOCKET_PATH = ".ibdm_monitor.sock"
+
+
+def encode_message(kind: str, seq: int, fields: dict[str, Any]) -> bytes:
+    """Encode one monitor message as a compact JSON line.
+
+    Args:
+        kind: "full" or "patch"
+        seq: Publish sequence number
+        fields: Snapshot fields carried by the message
+
+    Returns:
+        UTF-8 encoded line
+    """
+    message = {"kind": kind, "seq": seq, "fields": fields}
+    return (json.dumps(message, separators=(",", ":"), default=str) + "\n").encode("utf-8")
+
+
+class _Subscription:
+    """One connected subscriber and its bounded outgoing queue."""
+
+    def __init__(self, connection: socket.socket, queue_size: int):
+        self.connection = connection
+        self.queue_size = queue_size
+        self.dropped = 0
+        self.closed = False
+        self._queue: deque[bytes] = deque()
+        self._ready = threading.Condition()
+
+    def offer(self, message: bytes, resync: Callable[[], bytes]) -> None:
+        """Queue a message; on overflow replace the backlog with resync()."""
+        with self._ready:
+            if len(self._queue) >= self.queue_size:
+                self.dropped += len(self._queue)
+                self._queue.clear()
+                message = resync()
+            self._queue.append(message)
+            self._ready.notify()
+
+    def run(self) -> None:
+        """Send queued messages until the connection closes."""
+        while True:
+            with self._ready:
+                while not self._queue and not self.closed:
+                    self._ready.wait()
+                if self.closed:
+                    return
+                message = self._queue.popleft()
+            try:
+                self.connection.sendall(message)
+            except OSError:
+                self.close()
+                return
+
+    def close(self) -> None:
+        """Stop the writer and close the connection."""
+        with self._ready:
+            self.closed = True
+            self._ready.notify()
+        self.connection.close()
+
+
+def _socket_in_use(path: str) -> bool:
+    """Whether a process is accepting connections on the Unix socket at path."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except OSError:
+            return False
+    return True
+
 
 class StatePublisher:
-    """Publishes state updates to a file for monitoring."""
+    """Publishes state updates to monitor subscribers over a Unix-domain socket."""
 
-    def __init__(self, filepath: str = ".ibdm_monitor_state.json"):
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH, queue_size: int = 16):
         """Initialize publisher.
 
         Args:
-            filepath: Path to the state file
+            socket_path: Path of the socket subscribers connect to
+            queue_size: Messages buffered per subscriber before it is resynced
         """
-        self.filepath = filepath
+        self.socket_path = socket_path
+        self.queue_size = queue_size
+        self._server: socket.socket | None = None
+        self._subscriptions: list[_Subscription] = []
+        self._lock = threading.Lock()
+        self._snapshot: StateSnapshot | None = None
+        self._fields: dict[str, Any] | None = None  # last sent state, while subscribed
+        self._seq = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of connected subscribers."""
+        with self._lock:
+            return sum(not subscription.closed for subscription in self._subscriptions)
+
+    def start(self) -> None:
+        """Listen for subscribers (called by the first publish()).
+
+        Raises:
+            FileExistsError: If another publisher is listening on socket_path
+        """
+        if self._server is not None:
+            return
+        if os.path.exists(self.socket_path):
+            if _socket_in_use(self.socket_path):
+                raise FileExistsError(
+                    f"Another publisher is listening on {self.socket_path}; "
+                    "pass a different socket_path"
+                )
+            os.unlink(self.socket_path)  # stale socket from an earlier run
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(self.socket_path)
+        server.listen()
+        self._server = server
+        threading.Thread(target=self._accept_loop, args=(server,), daemon=True).start()
+        atexit.register(self.close)
 
     def publish(self, snapshot: StateSnapshot) -> None:
         """Publish a state snapshot.
@@ -32,68 +160,136 @@ class StatePublisher:
             snapshot: State snapshot to publish
         """
         try:
-            data = snapshot.to_dict()
-            # Write atomically (write to temp then rename)
-            temp_path = f"{self.filepath}.tmp"
-            with open(temp_path, "w") as f:
-                json.dump(data, f, indent=2)
-            os.replace(temp_path, self.filepath)
+            self.start()
+            with self._lock:
+                self._seq += 1
+                self._snapshot = snapshot
+                self._subscriptions = [s for s in self._subscriptions if not s.closed]
+                if not self._subscriptions:
+                    self._fields = None
+                    return
+                current = snapshot.to_dict()
+                if self._fields is None:
+                    kind, fields = "full", current
+                else:
+                    kind, fields = "patch", snapshot_patch(self._fields, current)
+                self._fields = current
+                message = encode_message(kind, self._seq, fields)
+                for subscription in self._subscriptions:
+                    subscription.offer(message, self._full_message)
         except Exception as e:
             # Don't crash the application if monitoring fails
             print(f"[StatePublisher] Failed to publish state: {e}")
 
+    def close(self) -> None:
+        """Disconnect subscribers and remove the socket."""
+        with self._lock:
+            server, self._server = self._server, None
+            subscriptions, self._subscriptions = self._subscriptions, []
+        if server is None:
+            return
+        server.close()
+        for subscription in subscriptions:
+            subscription.close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def _full_message(self) -> bytes:
+        """Message carrying the whole current state (caller holds the lock)."""
+        if self._fields is None and self._snapshot is not None:
+            self._fields = self._snapshot.to_dict()
+        return encode_message("full", self._seq, self._fields or {})
+
+    def _accept_loop(self, server: socket.socket) -> None:
+        """Register incoming subscribers until the server socket is closed."""
+        while True:
+            try:
+                connection, _ = server.accept()
+            except OSError:
+                return
+            subscription = _Subscription(connection, self.queue_size)
+            with self._lock:
+                if self._snapshot is not None:
+                    subscription.offer(self._full_message(), self._full_message)
+                self._subscriptions.append(subscription)
+            threading.Thread(target=subscription.run, daemon=True).start()
+
+
+class StateSubscriber:
+    """Receives state updates from a StatePublisher."""
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH):
+        """Initialize subscriber.
+
+        Args:
+            socket_path: Path of the publisher's socket
+        """
+        self.socket_path = socket_path
+        self.fields: dict[str, Any] = {}
+        self.seq = 0
+
+    def updates(self) -> Iterator[tuple[StateSnapshot, set[str]]]:
+        """Connect and yield each state update until the publisher goes away.
+
+        Yields:
+            The current snapshot and the names of the fields that changed
+
+        Raises:
+            OSError: If the publisher is not running
+        """
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(self.socket_path)
+            with connection.makefile("rb") as stream:
+                for line in stream:
+                    message = json.loads(line)
+                    fields: dict[str, Any] = message["fields"]
+                    changed = {
+                        name for name, value in fields.items() if self.fields.get(name) != value
+                    }
+                    if message["kind"] == "full":
+                        changed.update(set(self.fields) - set(fields))
+                        self.fields = dict(fields)
+                    else:
+                        self.fields.update(fields)
+                    self.seq = message["seq"]
+                    yield StateSnapshot.from_dict(self.fields), changed
+
 
 class StateMonitor:
-    """Monitors a state file and updates the terminal display."""
+    """Subscribes to state updates and keeps a terminal display current."""
 
-    def __init__(self, filepath: str = ".ibdm_monitor_state.json", poll_interval: float = 0.1):
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH, retry_interval: float = 0.5):
         """Initialize monitor.
 
         Args:
-            filepath: Path to the state file
-            poll_interval: Polling interval in seconds
+            socket_path: Path of the publisher's socket
+            retry_interval: Seconds between connection attempts while no publisher runs
         """
-        self.filepath = filepath
-        self.poll_interval = poll_interval
+        self.socket_path = socket_path
+        self.retry_interval = retry_interval
         self.console = Console()
         self.visualizer = TerminalVisualizer(self.console)
-        self.last_timestamp = -1
 
     def start(self) -> None:
         """Start the monitoring loop."""
         self.console.clear()
         self.console.print("[bold blue]IBDM State Monitor[/bold blue]")
-        self.console.print(f"Watching {self.filepath} (Ctrl+C to stop)...")
+        self.console.print(f"Waiting for {self.socket_path} (Ctrl+C to stop)...")
 
         try:
             while True:
-                self._check_and_update()
-                time.sleep(self.poll_interval)
+                try:
+                    self._follow(StateSubscriber(self.socket_path))
+                except OSError:
+                    pass  # publisher not running (yet); retry
+                time.sleep(self.retry_interval)
         except KeyboardInterrupt:
             self.console.print("\n[bold red]Monitor stopped[/bold red]")
 
-    def _check_and_update(self) -> None:
-        """Check file for updates and refresh display if changed."""
-        if not os.path.exists(self.filepath):
-            return
-
-        try:
-            with open(self.filepath) as f:
-                data = json.load(f)
-
-            timestamp = data.get("timestamp", -1)
-
-            if timestamp > self.last_timestamp:
-                self.last_timestamp = timestamp
-                snapshot = StateSnapshot.from_dict(data)
-
-                # Clear and redraw
-                self.console.clear()
-                self.visualizer.render_snapshot(snapshot)
-                self.console.print(f"\n[dim]Last updated: {time.strftime('%H:%M:%S')}[/dim]")
-
-        except (json.JSONDecodeError, OSError):
-            # File might be partially written, ignore
-            pass
-        except Exception as e:
-            self.console.print(f"[red]Error reading state: {e}[/red]")
+    def _follow(self, subscriber: StateSubscriber) -> None:
+        """Render updates from one publisher connection, re-rendering changed panels only."""
+        layout = self.visualizer.build_layout()
+        with Live(layout, console=self.console, auto_refresh=False, screen=True) as live:
+            for snapshot, changed in subscriber.updates():
+                if self.visualizer.update_layout(layout, snapshot, changed):
+                    live.refresh()
@@ -8,6 +8,7 @@ dialogue manager behavior.
 from dataclasses import dataclass, field
 from typing import Any
 
+from ibdm.rules.profiling import PhaseProfile
 from ibdm.visualization.state_diff import StateDiff
 
 
@@ -68,6 +69,54 @@ class RuleTrace:
     diff: StateDiff | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    @classmethod
+    def from_phase_profile(
+        cls, profile: PhaseProfile, timestamp: int, label: str | None = None
+    ) -> "RuleTrace":
+        """Build a trace from a phase recorded by an instrumented RuleSet.
+
+        Every rule whose effects were applied is marked as selected; the
+        first of them becomes ``selected_rule``. Timings and diff sizes are
+        carried in each evaluation's reason and in the trace metadata.
+
+        Args:
+            profile: Phase profile from RuleProfiler
+            timestamp: Timestamp for the trace
+            label: Human-readable label (defaults to "Turn N: phase")
+
+        Returns:
+            RuleTrace populated with the real evaluations
+        """
+        evaluations = [
+            RuleEvaluation(
+                rule_name=record.rule_name,
+                priority=record.priority,
+                preconditions_met=record.preconditions_met,
+                was_selected=record.fired,
+                reason=(
+                    f"pre={record.precondition_time * 1000:.3f}ms "
+                    f"effect={record.effect_time * 1000:.3f}ms "
+                    f"diff={record.state_diff_size}"
+                    if record.fired
+                    else f"pre={record.precondition_time * 1000:.3f}ms"
+                ),
+            )
+            for record in profile.evaluations
+        ]
+        fired = profile.fired_rules
+        return cls(
+            phase=profile.phase,
+            timestamp=timestamp,
+            label=label or f"Turn {profile.turn}: {profile.phase}",
+            evaluations=evaluations,
+            selected_rule=fired[0] if fired else None,
+            metadata={
+                "turn": profile.turn,
+                "fired_rules": fired,
+                "total_time": profile.total_time,
+            },
+        )
+
     def rules_evaluated(self) -> int:
         """Count how many rules were evaluated."""
         return len(self.evaluations)
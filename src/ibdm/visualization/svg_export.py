@@ -1,14 +1,20 @@
 """SVG export for state visualization.
 
 Provides functionality to export state components (like plans) to SVG
-using Graphviz.
+using Graphviz. The graphviz package is imported on first export, not with
+this module.
 """
 
-import graphviz
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 from ibdm.core import Plan
 from ibdm.visualization.state_snapshot import StateSnapshot
 
+if TYPE_CHECKING:
+    import graphviz
+
 
 class SvgExporter:
     """Exports state components to SVG."""
@@ -29,6 +35,8 @@ class SvgExporter:
                 "</svg>"
             )
 
+        import graphviz
+
         dot = graphviz.Digraph(comment="Plan Tree")
         dot.attr(rankdir="TB")
         dot.attr(
@@ -88,6 +96,8 @@ class SvgExporter:
                 "</svg>"
             )
 
+        import graphviz
+
         dot = graphviz.Digraph(comment="QUD Stack")
         dot.attr(rankdir="BT")  # Bottom to Top for stack
         dot.attr("node", shape="note", style="filled", fillcolor="#e6f7ff", fontname="sans-serif")
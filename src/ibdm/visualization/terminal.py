@@ -23,47 +23,86 @@ class TerminalVisualizer:
         """
         self.console = console or Console()
 
-    def render_snapshot(self, snapshot: StateSnapshot) -> None:
-        """Render a state snapshot to the console.
-
-        Args:
-            snapshot: The state snapshot to render
+    #: Layout panel -> snapshot fields it displays
+    PANEL_FIELDS: dict[str, tuple[str, ...]] = {
+        "header": ("label", "timestamp"),
+        "shared": ("qud", "commitments"),
+        "private": ("plan", "agenda", "issues", "beliefs"),
+        "footer": ("last_move",),
+    }
+
+    def build_layout(self) -> Layout:
+        """Create the empty snapshot layout with one slot per panel.
+
+        Returns:
+            Layout with "header", "shared", "private" and "footer" slots
         """
-        # Create main layout
         layout = Layout()
         layout.split_column(
             Layout(name="header", size=3),
             Layout(name="body", ratio=1),
             Layout(name="footer", size=3),
         )
-
-        # Header
-        header_text = Text(
-            f"{snapshot.label} (t={snapshot.timestamp})",
-            style="bold white on blue",
-            justify="center",
-        )
-        layout["header"].update(Panel(header_text, style="blue"))
-
         # Body - Split into Shared and Private
         layout["body"].split_row(Layout(name="shared"), Layout(name="private"))
+        return layout
 
-        # Shared State Column
-        shared_content = self._render_shared_state(snapshot)
-        layout["shared"].update(Panel(shared_content, title="Shared State", border_style="green"))
+    def render_panel(self, name: str, snapshot: StateSnapshot) -> Panel:
+        """Render one panel of the snapshot layout.
 
-        # Private State Column
-        private_content = self._render_private_state(snapshot)
-        layout["private"].update(
-            Panel(private_content, title="Private State", border_style="yellow")
-        )
+        Args:
+            name: Panel name (a key of PANEL_FIELDS)
+            snapshot: The state snapshot to render
 
-        # Footer - Last Move
-        last_move_str = str(snapshot.last_move) if snapshot.last_move else "None"
-        layout["footer"].update(
-            Panel(Text(f"Last Move: {last_move_str}", style="italic"), style="white")
-        )
+        Returns:
+            The panel
+        """
+        if name == "header":
+            header_text = Text(
+                f"{snapshot.label} (t={snapshot.timestamp})",
+                style="bold white on blue",
+                justify="center",
+            )
+            return Panel(header_text, style="blue")
+        if name == "shared":
+            shared_content = self._render_shared_state(snapshot)
+            return Panel(shared_content, title="Shared State", border_style="green")
+        if name == "private":
+            private_content = self._render_private_state(snapshot)
+            return Panel(private_content, title="Private State", border_style="yellow")
+        if name == "footer":
+            last_move_str = str(snapshot.last_move) if snapshot.last_move else "None"
+            return Panel(Text(f"Last Move: {last_move_str}", style="italic"), style="white")
+        raise KeyError(f"Unknown panel: {name}")
+
+    def update_layout(
+        self, layout: Layout, snapshot: StateSnapshot, changed: set[str] | None = None
+    ) -> list[str]:
+        """Re-render the panels showing changed fields.
+
+        Args:
+            layout: Layout from build_layout()
+            snapshot: The state snapshot to render
+            changed: Names of changed snapshot fields (None re-renders everything)
+
+        Returns:
+            Names of the panels that were re-rendered
+        """
+        updated: list[str] = []
+        for name, fields in self.PANEL_FIELDS.items():
+            if changed is None or not changed.isdisjoint(fields):
+                layout[name].update(self.render_panel(name, snapshot))
+                updated.append(name)
+        return updated
+
+    def render_snapshot(self, snapshot: StateSnapshot) -> None:
+        """Render a state snapshot to the console.
 
+        Args:
+            snapshot: The state snapshot to render
+        """
+        layout = self.build_layout()
+        self.update_layout(layout, snapshot)
         self.console.print(layout)
 
     def render_diff(self, diff: StateDiff) -> None:
@@ -0,0 +1,229 @@
+"""Incremental HTML timeline export for long dialogue sessions.
+
+HtmlExporter.export_timeline renders a whole session into one page in
+memory, which is fine for a handful of turns but quadratic when regenerated
+after every turn of a long session. TimelineWriter appends each turn to disk
+as it happens instead:
+
+    <directory>/
+        index.html          page list with turn ranges
+        style.css           shared stylesheet
+        pages/page-0001.html  one collapsible entry per turn, page_size per page
+        bodies/<hash>.html  rendered state panels, one file per distinct state
+
+A turn costs one state render and one appended entry. State bodies are named
+by the hash of their HTML, so a state that recurs (no change, or a return to
+an earlier state) is written once. Entries load their body in a lazy iframe,
+so the browser only fetches the states that are opened or scrolled to; page
+files are left unterminated, which browsers accept, so appending never
+rewrites them.
+
+Example:
+    >>> with TimelineWriter("timeline") as timeline:
+    ...     for snapshot in snapshots:
+    ...         timeline.append(snapshot)
+"""
+
+import hashlib
+import html
+from pathlib import Path
+from types import TracebackType
+from typing import TextIO
+
+from ibdm.visualization.diff_engine import DiffEngine
+from ibdm.visualization.html_export import HtmlExporter
+from ibdm.visualization.state_snapshot import StateSnapshot
+
+TIMELINE_CSS = """
+    iframe.step-body {
+        width: 100%;
+        height: 480px;
+        border: none;
+    }
+    nav.pages { margin-bottom: 20px; }
+    nav.pages a { margin-right: 12px; }
+"""
+
+
+class TimelineWriter:
+    """Appends snapshots to a paginated, content-deduplicated HTML timeline."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        title: str = "Dialogue Timeline",
+        page_size: int = 50,
+        exporter: HtmlExporter | None = None,
+    ):
+        """Initialize the writer and create the directory layout.
+
+        Args:
+            directory: Output directory (created if missing)
+            title: Title of the index and pages
+            page_size: Turns per page
+            exporter: Renderer for state panels
+        """
+        self.directory = Path(directory)
+        self.title = title
+        self.page_size = page_size
+        self.exporter = exporter or HtmlExporter()
+        self.turns = 0
+        self.bodies_written = 0
+        self._diff_engine = DiffEngine()
+        self._previous: StateSnapshot | None = None
+        self._page: TextIO | None = None
+        self._known_bodies: set[str] = set()
+
+        (self.directory / "pages").mkdir(parents=True, exist_ok=True)
+        (self.directory / "bodies").mkdir(exist_ok=True)
+        (self.directory / "style.css").write_text(
+            self.exporter.CSS + TIMELINE_CSS, encoding="utf-8"
+        )
+        self._known_bodies.update(path.stem for path in (self.directory / "bodies").glob("*.html"))
+        self._write_index()
+
+    @property
+    def pages(self) -> int:
+        """Number of pages started."""
+        return (self.turns + self.page_size - 1) // self.page_size
+
+    def append(self, snapshot: StateSnapshot) -> Path:
+        """Add one turn to the timeline.
+
+        Args:
+            snapshot: State after the turn
+
+        Returns:
+            Path of the page the turn was appended to
+        """
+        body_hash = self._write_body(snapshot)
+
+        summary = snapshot.label or f"Step {self.turns + 1}"
+        if self._previous is not None:
+            diff = self._diff_engine.compute_diff(self._previous, snapshot)
+            if diff.has_changes():
+                summary += f" ({diff.summary})"
+        self._previous = snapshot
+
+        page = self._current_page()
+        self.turns += 1
+        page.write(f"""
+<details class="timeline-step">
+    <summary>
+        <div class="step-header">
+            <div class="step-marker">{self.turns}</div>
+            <div class="step-title">{html.escape(summary)}</div>
+        </div>
+        <div class="step-meta">t={snapshot.timestamp}</div>
+    </summary>
+    <iframe class="step-body" loading="lazy" src="../bodies/{body_hash}.html"></iframe>
+</details>
+""")
+        page.flush()
+        return self._page_path(self.pages)
+
+    def close(self) -> None:
+        """Finish the current page and record the final turn ranges in the index."""
+        if self._page is not None:
+            self._page.close()
+            self._page = None
+        self._write_index()
+
+    def __enter__(self) -> "TimelineWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _write_body(self, snapshot: StateSnapshot) -> str:
+        """Write the snapshot's state panels unless identical ones exist; return their hash."""
+        body = self.exporter.render_snapshot_body(snapshot)
+        body_hash = hashlib.sha256(body.encode("utf-8")).hexdigest()[:20]
+        if body_hash not in self._known_bodies:
+            document = (
+                '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+                '<link rel="stylesheet" href="../style.css">\n</head>\n'
+                f'<body>\n<div class="snapshot">{body}</div>\n</body>\n</html>\n'
+            )
+            (self.directory / "bodies" / f"{body_hash}.html").write_text(document, encoding="utf-8")
+            self._known_bodies.add(body_hash)
+            self.bodies_written += 1
+        return body_hash
+
+    def _page_path(self, number: int) -> Path:
+        return self.directory / "pages" / f"page-{number:04d}.html"
+
+    def _current_page(self) -> TextIO:
+        """The page the next turn goes to, starting a new one when full."""
+        if self.turns % self.page_size == 0:
+            self._page = self._start_page(self.turns // self.page_size + 1)
+        elif self._page is None:
+            # Appending again after close()
+            self._page = self._page_path(self.pages).open("a", encoding="utf-8")
+        return self._page
+
+    def _start_page(self, number: int) -> TextIO:
+        """Close the current page, open the next one and list it in the index."""
+        if self._page is not None:
+            self._page.close()
+        previous = (
+            f'<a href="page-{number - 1:04d}.html">&larr; Page {number - 1}</a>'
+            if number > 1
+            else ""
+        )
+        page = self._page_path(number).open("w", encoding="utf-8")
+        # Left open: later turns are appended and browsers close the document
+        page.write(f"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>{html.escape(self.title)} - Page {number}</title>
+    <link rel="stylesheet" href="../style.css">
+</head>
+<body>
+<h1>{html.escape(self.title)} - Page {number}</h1>
+<nav class="pages"><a href="../index.html">Index</a>{previous}</nav>
+""")
+        self._write_index(pages=number, open_page=True)
+        return page
+
+    def _write_index(self, pages: int | None = None, open_page: bool = False) -> None:
+        """Rewrite the index (once per page, so O(1) amortized per turn).
+
+        Args:
+            pages: Pages to list (defaults to the pages started so far)
+            open_page: Whether the last page is still being appended to
+        """
+        pages = self.pages if pages is None else pages
+        items: list[str] = []
+        for number in range(1, pages + 1):
+            first = (number - 1) * self.page_size + 1
+            if number < pages:
+                last = str(number * self.page_size)
+            else:
+                last = "" if open_page else str(self.turns)
+            items.append(
+                f'<li><a href="pages/page-{number:04d}.html">Page {number}</a> '
+                f"(turns {first}&ndash;{last})</li>"
+            )
+        index = f"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>{html.escape(self.title)}</title>
+    <link rel="stylesheet" href="style.css">
+</head>
+<body>
+<h1>{html.escape(self.title)}</h1>
+<ul>{"".join(items) or "<li>No turns yet</li>"}</ul>
+</body>
+</html>
+"""
+        partial = self.directory / "index.html.tmp"
+        partial.write_text(index, encoding="utf-8")
+        partial.replace(self.directory / "index.html")
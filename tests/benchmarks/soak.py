@@ -0,0 +1,516 @@
+"""Property-based soak harness measuring state growth over long dialogues.
+
+Hypothesis generates a move script for a domain -- a list of user moves
+(task requests, answers drawn from the domain's sorts or arbitrary text,
+questions and assertions over its predicates, greetings, quits and ICM
+feedback) -- and an interleaving seed. The harness replays moves from the
+script, chosen by the seeded RNG, through DialogueMoveEngine for the
+requested number of turns, letting the system select, generate and
+integrate its reply after each one. Generating the script rather than every
+turn keeps each example within Hypothesis' data budget while still letting
+it shrink a failure down to the few move kinds that cause it.
+
+A SoakMonitor checks the state after every turn against a SoakBudget:
+    - serialized InformationState size, and its growth per turn
+    - length of SharedIS.moves, QUD depth and plan tree size
+    - number of belief keys, and scratch beliefs (SCRATCH_BELIEFS) that
+      stay set across turns instead of being consumed by the next rule
+    - latency drift (median of the latest turns over the earliest ones)
+
+The run stops at the first turn that exceeds the budget, so a leak fails
+after a few hundred turns rather than after hours of ever slower turns.
+
+Usage:
+    python -m tests.benchmarks.soak
+    python -m tests.benchmarks.soak --domains nda --turns 5000 --examples 3
+    python -m tests.benchmarks.soak --max-moves 200 --no-shrink --seed 0
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from hypothesis import HealthCheck, Phase, given, settings
+from hypothesis import seed as hypothesis_seed
+from hypothesis import strategies as st
+
+from ibdm.core import InformationState
+from ibdm.core.actions import Proposition
+from ibdm.core.answers import Answer
+from ibdm.core.grounding import ActionLevel
+from ibdm.core.moves import DialogueMove, Polarity
+from ibdm.core.plans import Plan
+from ibdm.core.questions import WhQuestion
+from ibdm.engine.image import DIALOGUE_RULE_FACTORIES, EngineImage, build_engine_image
+from ibdm.rules.profiling import percentile
+from tests.benchmarks.turn_latency import DOMAINS, DomainSpec
+
+SCHEMA_VERSION = 1
+DEFAULT_TURNS = 2000
+DEFAULT_OUTPUT_DIR = Path("reports/benchmarks")
+MAX_SCRIPT_MOVES = 40
+
+#: Beliefs rules set for the next rule to consume; set for longer is a leak
+SCRATCH_BELIEFS = ("_reaccommodate_question", "_needs_clarification", "action_result")
+
+MOVE_KINDS = ("request", "answer", "ask", "assert", "greet", "quit", "icm")
+
+
+@dataclass
+class SoakBudget:
+    """Limits a long dialogue must stay within.
+
+    Attributes:
+        max_state_bytes: Serialized InformationState size
+        max_bytes_per_turn: Mean state growth per turn after warm-up
+        max_moves: Length of SharedIS.moves
+        max_qud: QUD depth
+        max_plan_nodes: Plans and subplans in the private plan
+        max_belief_keys: Keys in the private beliefs
+        max_scratch_turns: Consecutive turns a scratch belief may stay set
+        max_latency_drift: Latest-window over earliest-window median latency
+        min_drift_ms: Median latency below which drift is not reported
+        warmup_turns: Turns before growth and drift are measured
+        window: Turns per latency window
+        sample_every: Turns between state-size samples (serializing is O(state))
+    """
+
+    max_state_bytes: int = 256_000
+    max_bytes_per_turn: float = 64.0
+    max_moves: int = 1000
+    max_qud: int = 25
+    max_plan_nodes: int = 100
+    max_belief_keys: int = 50
+    max_scratch_turns: int = 2
+    max_latency_drift: float = 3.0
+    min_drift_ms: float = 1.0
+    warmup_turns: int = 20
+    window: int = 50
+    sample_every: int = 10
+
+
+@dataclass
+class SoakSample:
+    """State measurements after one turn."""
+
+    turn: int
+    latency_ms: float
+    state_bytes: int
+    moves: int
+    qud: int
+    plan_nodes: int
+    belief_keys: int
+
+
+@dataclass(frozen=True)
+class MoveSpec:
+    """A generated user move, bound to the dialogue state when it is played.
+
+    Attributes:
+        kind: One of MOVE_KINDS
+        value: Answer value, predicate name or "level:polarity" for ICM
+    """
+
+    kind: str
+    value: str = ""
+
+    def build(self, spec: DomainSpec, state: InformationState) -> DialogueMove:
+        """Create the dialogue move for the current state.
+
+        Args:
+            spec: Domain being soaked
+            state: Current information state (answers address the top QUD)
+
+        Returns:
+            User dialogue move
+        """
+        if self.kind == "request":
+            return DialogueMove("request", spec.opening, "user")
+        if self.kind == "answer":
+            answer = Answer(content=self.value, question_ref=state.shared.top_qud())
+            return DialogueMove("answer", answer, "user")
+        if self.kind == "ask":
+            return DialogueMove("ask", WhQuestion(variable="x", predicate=self.value), "user")
+        if self.kind == "assert":
+            proposition = Proposition(predicate=self.value, arguments={"value": "x"})
+            return DialogueMove("assert", proposition, "user")
+        if self.kind == "icm":
+            level, polarity = self.value.split(":")
+            return DialogueMove(
+                "icm",
+                "icm",
+                "user",
+                feedback_level=ActionLevel(level),
+                polarity=Polarity(polarity),
+            )
+        return DialogueMove(self.kind, self.kind, "user")
+
+
+def move_specs(spec: DomainSpec) -> st.SearchStrategy[MoveSpec]:
+    """Strategy for user moves in a domain.
+
+    Args:
+        spec: Domain to generate moves for
+
+    Returns:
+        Strategy producing MoveSpec instances of every kind in MOVE_KINDS
+    """
+    domain = spec.factory()
+    predicates = sorted(domain.predicates)
+    individuals = sorted({str(value) for values in domain.sorts.values() for value in values})
+    answers = st.one_of(st.sampled_from(individuals or ["yes"]), st.text(max_size=12))
+    icm = st.sampled_from(
+        [f"{level.value}:{polarity.value}" for level in ActionLevel for polarity in Polarity]
+    )
+    return st.one_of(
+        st.just(MoveSpec("request")),
+        st.builds(MoveSpec, st.just("answer"), answers),
+        st.builds(MoveSpec, st.just("ask"), st.sampled_from(predicates)),
+        st.builds(MoveSpec, st.just("assert"), st.sampled_from(predicates)),
+        st.sampled_from([MoveSpec("greet"), MoveSpec("quit")]),
+        st.builds(MoveSpec, st.just("icm"), icm),
+    )
+
+
+def _plan_nodes(plans: list[Plan]) -> int:
+    """Count plans and their subplans."""
+    count = 0
+    stack = list(plans)
+    while stack:
+        plan = stack.pop()
+        count += 1
+        stack.extend(getattr(plan, "subplans", None) or [])
+    return count
+
+
+def _state_size(state: InformationState) -> int:
+    return len(json.dumps(state.to_dict(), default=str))
+
+
+class SoakMonitor:
+    """Checks the state after every turn against a SoakBudget."""
+
+    def __init__(self, budget: SoakBudget) -> None:
+        self.budget = budget
+        self.turns = 0
+        self.latencies: list[float] = []
+        self.samples: list[SoakSample] = []
+        self._scratch_streaks: dict[str, int] = dict.fromkeys(SCRATCH_BELIEFS, 0)
+        self._warm_bytes: tuple[int, int] | None = None  # (turn, bytes) after warm-up
+
+    def observe(self, state: InformationState, latency: float) -> list[str]:
+        """Record one turn and check it against the budget.
+
+        Args:
+            state: Information state after the turn
+            latency: Seconds the turn took
+
+        Returns:
+            Budget violations (empty while the dialogue is within budget)
+        """
+        budget = self.budget
+        self.turns += 1
+        self.latencies.append(latency)
+        violations: list[str] = []
+
+        moves = len(state.shared.moves)
+        qud = len(state.shared.qud)
+        plan_nodes = _plan_nodes(state.private.plan)
+        beliefs = state.private.beliefs
+        if moves > budget.max_moves:
+            violations.append(f"{moves} moves in SharedIS.moves (budget {budget.max_moves})")
+        if qud > budget.max_qud:
+            violations.append(f"QUD depth {qud} (budget {budget.max_qud})")
+        if plan_nodes > budget.max_plan_nodes:
+            violations.append(f"{plan_nodes} plan nodes (budget {budget.max_plan_nodes})")
+        if len(beliefs) > budget.max_belief_keys:
+            violations.append(f"{len(beliefs)} belief keys (budget {budget.max_belief_keys})")
+        for key in SCRATCH_BELIEFS:
+            self._scratch_streaks[key] = self._scratch_streaks[key] + 1 if beliefs.get(key) else 0
+            if self._scratch_streaks[key] > budget.max_scratch_turns:
+                violations.append(
+                    f"belief {key!r} leaked: set for {self._scratch_streaks[key]} turns "
+                    f"(budget {budget.max_scratch_turns})"
+                )
+
+        if self.turns % budget.sample_every == 0 or violations:
+            state_bytes = _state_size(state)
+            self.samples.append(
+                SoakSample(
+                    turn=self.turns,
+                    latency_ms=latency * 1000,
+                    state_bytes=state_bytes,
+                    moves=moves,
+                    qud=qud,
+                    plan_nodes=plan_nodes,
+                    belief_keys=len(beliefs),
+                )
+            )
+            violations.extend(self._check_size(state_bytes))
+        violations.extend(self._check_drift())
+        return violations
+
+    def _check_size(self, state_bytes: int) -> list[str]:
+        """Check the absolute state size and its growth rate since warm-up."""
+        budget = self.budget
+        violations: list[str] = []
+        if state_bytes > budget.max_state_bytes:
+            violations.append(f"state is {state_bytes} bytes (budget {budget.max_state_bytes})")
+        if self.turns >= budget.warmup_turns and self._warm_bytes is None:
+            self._warm_bytes = (self.turns, state_bytes)
+        elif self._warm_bytes is not None and self.turns - self._warm_bytes[0] >= budget.window:
+            warm_turn, warm_bytes = self._warm_bytes
+            growth = (state_bytes - warm_bytes) / (self.turns - warm_turn)
+            if growth > budget.max_bytes_per_turn:
+                violations.append(
+                    f"state grows {growth:.0f} bytes/turn since turn {warm_turn} "
+                    f"(budget {budget.max_bytes_per_turn:.0f})"
+                )
+        return violations
+
+    def _check_drift(self) -> list[str]:
+        """Compare the latest latency window with the first one after warm-up."""
+        budget = self.budget
+        first = budget.warmup_turns
+        if self.turns < first + 2 * budget.window:
+            return []
+        early = percentile(self.latencies[first : first + budget.window], 50)
+        late = percentile(self.latencies[-budget.window :], 50)
+        if late * 1000 < budget.min_drift_ms or early <= 0:
+            return []
+        drift = late / early
+        if drift > budget.max_latency_drift:
+            return [
+                f"latency drifted {drift:.1f}x: median {late * 1000:.2f}ms over the last "
+                f"{budget.window} turns vs {early * 1000:.2f}ms after warm-up "
+                f"(budget {budget.max_latency_drift:.1f}x)"
+            ]
+        return []
+
+
+@dataclass
+class SoakReport:
+    """Outcome of soaking one move script."""
+
+    domain: str
+    turns: int
+    script: list[MoveSpec]
+    seed: int
+    turns_run: int = 0
+    samples: list[SoakSample] = field(default_factory=lambda: [])
+    violations: list[str] = field(default_factory=lambda: [])
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether every turn stayed within budget."""
+        return not self.violations
+
+    def summary(self) -> str:
+        """Multi-line summary: outcome, last sample, violations and the script."""
+        status = "within budget" if self.ok else f"over budget at turn {self.turns_run}"
+        lines = [
+            f"{self.domain}: {self.turns_run}/{self.turns} turns in {self.seconds:.1f}s, {status}"
+        ]
+        if self.samples:
+            last = self.samples[-1]
+            lines.append(
+                f"    turn {last.turn}: {last.state_bytes} bytes, {last.moves} moves, "
+                f"QUD {last.qud}, {last.plan_nodes} plan nodes, {last.belief_keys} beliefs, "
+                f"{last.latency_ms:.2f}ms"
+            )
+        lines.extend(f"    ✗ {violation}" for violation in self.violations)
+        if not self.ok:
+            moves = ", ".join(f"{m.kind}({m.value})" if m.value else m.kind for m in self.script)
+            lines.append(f"    script (seed {self.seed}): {moves}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return asdict(self) | {"ok": self.ok}
+
+
+class SoakBudgetError(AssertionError):
+    """A soak run went over its budget."""
+
+    def __init__(self, report: SoakReport) -> None:
+        super().__init__(report.summary())
+        self.report = report
+
+
+@cache
+def _engine_image() -> EngineImage:
+    """One engine image per process (moves are built directly, so no interpretation rules)."""
+    return build_engine_image(DIALOGUE_RULE_FACTORIES)
+
+
+def run_soak(
+    domain: str,
+    script: list[MoveSpec],
+    turns: int,
+    budget: SoakBudget | None = None,
+    seed: int = 0,
+) -> SoakReport:
+    """Play moves from a script through the engine until the budget is exceeded.
+
+    Args:
+        domain: Domain name (key of DOMAINS)
+        script: Moves to choose from each turn
+        turns: User turns to play
+        budget: Limits to check after every turn (default: SoakBudget())
+        seed: Seed for choosing the move of each turn
+
+    Returns:
+        Report of the run, stopped at the first turn over budget
+    """
+    spec = DOMAINS[domain]
+    image = _engine_image()
+    engine = image.create_engine()
+    state = image.create_initial_state(spec.task)
+    model = image.domain(spec.task)
+    monitor = SoakMonitor(budget or SoakBudget())
+    rng = random.Random(seed)
+    report = SoakReport(domain=domain, turns=turns, script=list(script), seed=seed)
+
+    started = time.perf_counter()
+    for _ in range(turns):
+        move_spec = rng.choice(script)
+        if move_spec.kind == "request" and spec.seed_plan:
+            # No integration rule forms this domain's task plan (see DomainSpec)
+            state.private.plan.append(model.get_plan(spec.task, {}))
+        move = move_spec.build(spec, state)
+
+        turn_started = time.perf_counter()
+        state = engine.integrate(move, state)
+        response, state = engine.select_action(state)
+        if response is not None:
+            engine.generate(response, state)
+            state = engine.integrate(response, state)
+        violations = monitor.observe(state, time.perf_counter() - turn_started)
+
+        if violations:
+            report.violations = violations
+            break
+    report.turns_run = monitor.turns
+    report.samples = monitor.samples
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def soak_search(
+    domain: str,
+    turns: int = DEFAULT_TURNS,
+    budget: SoakBudget | None = None,
+    examples: int = 5,
+    shrink: bool = True,
+    seed: int | None = None,
+) -> list[SoakReport]:
+    """Soak Hypothesis-generated move scripts, failing on the first one over budget.
+
+    Args:
+        domain: Domain name (key of DOMAINS)
+        turns: User turns per script
+        budget: Limits to check after every turn (default: SoakBudget())
+        examples: Scripts to generate
+        shrink: Shrink a failing script to a minimal one before raising
+        seed: Hypothesis seed, for reproducible runs
+
+    Returns:
+        Reports of every script soaked, all within budget
+
+    Raises:
+        SoakBudgetError: A script went over budget (the shrunk one, if shrinking)
+    """
+    spec = DOMAINS[domain]
+    reports: list[SoakReport] = []
+    phases = (Phase.explicit, Phase.generate, *((Phase.shrink,) if shrink else ()))
+
+    @settings(
+        max_examples=examples,
+        deadline=None,
+        database=None,
+        phases=phases,
+        suppress_health_check=[HealthCheck.too_slow],
+    )
+    @given(
+        script=st.lists(move_specs(spec), min_size=1, max_size=MAX_SCRIPT_MOVES),
+        rng_seed=st.integers(min_value=0, max_value=2**32 - 1),
+    )
+    def soak(script: list[MoveSpec], rng_seed: int) -> None:
+        report = run_soak(domain, script, turns, budget, rng_seed)
+        if not report.ok:
+            raise SoakBudgetError(report)
+        reports.append(report)
+
+    if seed is not None:
+        soak = hypothesis_seed(seed)(soak)
+    soak()
+    return reports
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the soak harness from the command line."""
+    defaults = SoakBudget()
+    parser = argparse.ArgumentParser(description="IBDM property-based soak harness")
+    parser.add_argument("--domains", nargs="+", choices=sorted(DOMAINS), default=list(DOMAINS))
+    parser.add_argument("--turns", type=int, default=DEFAULT_TURNS, help="User turns per script")
+    parser.add_argument("--examples", type=int, default=5, help="Scripts per domain")
+    parser.add_argument("--seed", type=int, help="Hypothesis seed")
+    parser.add_argument(
+        "--no-shrink", action="store_true", help="Report the first failing script as found"
+    )
+    parser.add_argument("--output", type=Path, help="JSON output path")
+    parser.add_argument("--max-state-bytes", type=int, default=defaults.max_state_bytes)
+    parser.add_argument("--max-bytes-per-turn", type=float, default=defaults.max_bytes_per_turn)
+    parser.add_argument("--max-moves", type=int, default=defaults.max_moves)
+    parser.add_argument("--max-qud", type=int, default=defaults.max_qud)
+    parser.add_argument("--max-plan-nodes", type=int, default=defaults.max_plan_nodes)
+    parser.add_argument("--max-latency-drift", type=float, default=defaults.max_latency_drift)
+    args = parser.parse_args(argv)
+
+    budget = SoakBudget(
+        max_state_bytes=args.max_state_bytes,
+        max_bytes_per_turn=args.max_bytes_per_turn,
+        max_moves=args.max_moves,
+        max_qud=args.max_qud,
+        max_plan_nodes=args.max_plan_nodes,
+        max_latency_drift=args.max_latency_drift,
+    )
+    results: list[dict[str, Any]] = []
+    failed = False
+    for domain in args.domains:
+        try:
+            reports = soak_search(
+                domain, args.turns, budget, args.examples, not args.no_shrink, args.seed
+            )
+        except SoakBudgetError as e:
+            reports = [e.report]
+            failed = True
+        for report in reports:
+            print(report.summary())
+            results.append(report.to_dict())
+
+    output: Path = args.output or DEFAULT_OUTPUT_DIR / (
+        f"soak_{time.strftime('%Y-%m-%d_%H%M%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(
+            {"schema_version": SCHEMA_VERSION, "budget": asdict(budget), "results": results},
+            indent=2,
+        )
+    )
+    print(f"\nReport written to {output}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
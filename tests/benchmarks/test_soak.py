@@ -0,0 +1,103 @@
+"""Smoke tests for the property-based soak harness."""
+
+import json
+
+import pytest
+
+from ibdm.core import InformationState
+from tests.benchmarks.soak import (
+    MoveSpec,
+    SoakBudget,
+    SoakBudgetError,
+    SoakMonitor,
+    main,
+    run_soak,
+    soak_search,
+)
+
+
+class TestSoakHarness:
+    """Short soak runs and budget checks."""
+
+    def test_short_run_within_budget(self):
+        """A short cooperative run stays within the default budget."""
+        script = [MoveSpec("request"), MoveSpec("answer", "yes"), MoveSpec("greet")]
+        report = run_soak("nda", script, turns=10)
+
+        assert report.ok, report.summary()
+        assert report.turns_run == 10
+        assert [sample.turn for sample in report.samples] == [10]
+        assert report.samples[0].moves > 0
+
+    def test_tight_budget_fails_fast(self):
+        """The run stops at the first turn over budget."""
+        script = [MoveSpec("request"), MoveSpec("answer", "yes")]
+        report = run_soak("travel", script, turns=200, budget=SoakBudget(max_moves=5))
+
+        assert not report.ok
+        assert report.turns_run < 200
+        assert "SharedIS.moves" in report.violations[0]
+        # A sample is taken at the failing turn for the report
+        assert report.samples[-1].turn == report.turns_run
+
+    def test_scratch_belief_leak_detected(self):
+        """A scratch belief left set across turns is reported as a leak."""
+        monitor = SoakMonitor(SoakBudget(max_scratch_turns=2))
+        state = InformationState(agent_id="system")
+        state.private.beliefs["_needs_clarification"] = False
+
+        state.private.beliefs["_reaccommodate_question"] = "?x.parties(x)"
+        assert monitor.observe(state, 0.001) == []
+        assert monitor.observe(state, 0.001) == []
+        violations = monitor.observe(state, 0.001)
+        assert len(violations) == 1
+        assert "'_reaccommodate_question' leaked" in violations[0]
+
+        del state.private.beliefs["_reaccommodate_question"]
+        assert monitor.observe(state, 0.001) == []
+
+    def test_latency_drift_detected(self):
+        """Latest-window median latency far above the first window is reported."""
+        monitor = SoakMonitor(SoakBudget(warmup_turns=0, window=2, max_latency_drift=3.0))
+        state = InformationState(agent_id="system")
+
+        for latency in (0.01, 0.01, 0.05):
+            assert monitor.observe(state, latency) == []
+        violations = monitor.observe(state, 0.05)
+        assert len(violations) == 1
+        assert "latency drifted 5.0x" in violations[0]
+
+    def test_search_shrinks_failing_script(self):
+        """Hypothesis shrinks a script over budget and raises it."""
+        with pytest.raises(SoakBudgetError) as excinfo:
+            soak_search("legal", turns=20, budget=SoakBudget(max_plan_nodes=3), seed=0)
+
+        report = excinfo.value.report
+        assert not report.ok
+        assert "plan nodes" in report.violations[0]
+        assert [move.kind for move in report.script] == ["request"]
+
+    def test_cli_writes_json(self, tmp_path, capsys):
+        """The CLI writes a machine-readable report."""
+        output = tmp_path / "soak.json"
+        exit_code = main(
+            [
+                "--domains",
+                "travel",
+                "--turns",
+                "5",
+                "--examples",
+                "2",
+                "--seed",
+                "0",
+                "--output",
+                str(output),
+            ]
+        )
+
+        assert exit_code == 0
+        report = json.loads(output.read_text())
+        assert report["schema_version"] == 1
+        assert [result["domain"] for result in report["results"]] == ["travel", "travel"]
+        assert all(result["ok"] for result in report["results"])
+        assert "travel: 5/5 turns" in capsys.readouterr().out
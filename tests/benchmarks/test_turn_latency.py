@@ -0,0 +1,76 @@
+"""Smoke tests for the turn-latency benchmark suite."""
+
+import copy
+import json
+
+import pytest
+
+from tests.benchmarks.turn_latency import (
+    DOMAINS,
+    DRIVERS,
+    PHASES,
+    compare_reports,
+    main,
+    run_benchmark,
+    run_suite,
+)
+
+
+class TestTurnLatencyBenchmark:
+    """Short runs of every driver and domain."""
+
+    @pytest.mark.parametrize("driver", DRIVERS)
+    @pytest.mark.parametrize("domain", sorted(DOMAINS))
+    def test_driver_runs_offline(self, driver, domain):
+        """Each driver completes a few turns and reports every phase."""
+        result = run_benchmark(driver, domain, turns=3, measure_allocations=False)
+
+        assert result["turns"] == 3
+        assert set(result["phases"]) == set(PHASES)
+        assert result["turn"]["p50_ms"] > 0
+        assert len(result["state_bytes"]["per_turn"]) == 3
+        # The dialogue advances even on turns where no system move is selected
+        assert result["state_bytes"]["last"] > result["state_bytes"]["first"]
+        assert "allocations" not in result
+
+    def test_allocation_pass(self):
+        """The tracemalloc pass reports per-turn allocation."""
+        result = run_benchmark("engine", "nda", turns=2)
+
+        allocations = result["allocations"]
+        assert allocations["mean_bytes_per_turn"] > 0
+        assert allocations["peak_traced_bytes"] >= allocations["max_bytes_per_turn"]
+
+    def test_compare_reports_flags_regressions(self):
+        """A slower p50 beyond the threshold is reported as a regression."""
+        baseline = run_suite([2], ["nda"], ["engine"], measure_allocations=False)
+        current = copy.deepcopy(baseline)
+        assert compare_reports(current, baseline, threshold=0.2) == []
+
+        current["results"][0]["turn"]["p50_ms"] = baseline["results"][0]["turn"]["p50_ms"] * 2
+        regressions = compare_reports(current, baseline, threshold=0.2)
+        assert len(regressions) == 1
+        assert "engine/nda/2 turn" in regressions[0]
+
+    def test_cli_writes_json(self, tmp_path, capsys):
+        """The CLI writes a machine-readable report."""
+        output = tmp_path / "report.json"
+        exit_code = main(
+            [
+                "--turns",
+                "2",
+                "--domains",
+                "travel",
+                "--drivers",
+                "engine",
+                "--no-alloc",
+                "--output",
+                str(output),
+            ]
+        )
+
+        assert exit_code == 0
+        report = json.loads(output.read_text())
+        assert report["schema_version"] == 1
+        assert [r["domain"] for r in report["results"]] == ["travel"]
+        assert "engine" in capsys.readouterr().out
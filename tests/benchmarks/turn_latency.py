@@ -0,0 +1,650 @@
+"""Turn-latency benchmark suite for the IBDM control loop.
+
+Drives the three entry points that run a dialogue turn -- DialogueMoveEngine,
+the Burr DialogueStateMachine and the demo ScenarioRunner -- through synthetic
+multi-turn dialogues in the NDA, travel and legal domains. Everything runs
+offline: user input is interpreted by MockNLUService and system output is
+produced by the rule-based / template generators, so no LLM is called.
+
+For each (driver, domain, turns) run the suite reports:
+    - per-phase latency (interpret / integrate / select / generate)
+    - total turn latency
+    - bytes allocated per turn and peak traced memory (tracemalloc pass)
+    - peak RSS of the process
+    - serialized InformationState size per turn
+
+Usage:
+    python -m tests.benchmarks.turn_latency
+    python -m tests.benchmarks.turn_latency --turns 10 100 --domains nda travel
+    python -m tests.benchmarks.turn_latency --compare reports/benchmarks/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from ibdm.core import InformationState
+from ibdm.core.questions import WhQuestion
+from ibdm.domains.legal_domain import get_legal_domain
+from ibdm.domains.nda_domain import get_nda_domain
+from ibdm.domains.travel_domain import get_travel_domain
+from ibdm.engine.dialogue_engine import DialogueMoveEngine
+from ibdm.nlu.nlu_result import NLUResult
+from ibdm.rules import (
+    RuleSet,
+    create_action_integration_rules,
+    create_action_selection_rules,
+    create_generation_rules,
+    create_integration_rules,
+    create_negotiation_rules,
+    create_negotiation_selection_rules,
+    create_selection_rules,
+)
+from ibdm.rules.profiling import percentile
+from tests.mocks.mock_nlu_service import MockNLUService
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+SCHEMA_VERSION = 1
+PHASES = ("interpret", "integrate", "select", "generate")
+DRIVERS = ("engine", "state_machine", "scenario_runner")
+DEFAULT_TURNS = (10, 100, 1000)
+DEFAULT_OUTPUT_DIR = Path("reports/benchmarks")
+
+
+@dataclass(frozen=True)
+class DomainSpec:
+    """How to start a task in a benchmark domain.
+
+    Attributes:
+        name: Short domain name used on the command line
+        factory: Returns the DomainModel
+        task: Plan name the opening request starts
+        opening: User utterance that opens the task
+        seed_plan: Push the task plan explicitly (no integration rule forms it)
+    """
+
+    name: str
+    factory: Callable[[], Any]
+    task: str
+    opening: str
+    seed_plan: bool = False
+
+
+DOMAINS: dict[str, DomainSpec] = {
+    "nda": DomainSpec("nda", get_nda_domain, "nda_drafting", "I need to draft an NDA"),
+    "travel": DomainSpec("travel", get_travel_domain, "travel_booking", "I want to book a trip"),
+    "legal": DomainSpec(
+        "legal",
+        get_legal_domain,
+        "legal_consultation",
+        "I need help with a contract question",
+        seed_plan=True,
+    ),
+}
+
+
+def build_rules() -> RuleSet:
+    """Build the full rule set used by the demo ScenarioRunner."""
+    rules = RuleSet()
+    for factory in (
+        create_integration_rules,
+        create_action_integration_rules,
+        create_negotiation_rules,
+        create_selection_rules,
+        create_action_selection_rules,
+        create_negotiation_selection_rules,
+        create_generation_rules,
+    ):
+        for rule in factory():
+            rules.add_rule(rule)
+    return rules
+
+
+class SyntheticUser:
+    """Deterministic user that opens a task and answers every question.
+
+    Answers are drawn from the domain's sorts so that they pass the
+    domain's resolution checks and the plan keeps progressing. When the
+    QUD is empty the user re-opens the task, so long runs cycle through
+    the plan repeatedly.
+    """
+
+    def __init__(self, spec: DomainSpec) -> None:
+        self.spec = spec
+        self.domain = spec.factory()
+
+    def next_utterance(self, state: InformationState) -> tuple[str, str]:
+        """Choose the next user utterance.
+
+        Args:
+            state: Current information state (the plan is seeded into it for
+                domains without an integration path to their task)
+
+        Returns:
+            Tuple of (utterance, move_type) where move_type is "request" or "answer"
+        """
+        top = state.shared.top_qud()
+        if top is None:
+            if self.spec.seed_plan:
+                state.private.plan.append(self.domain.get_plan(self.spec.task, {}))
+            return self.spec.opening, "request"
+        return self._answer_for(top), "answer"
+
+    def _answer_for(self, question: Any) -> str:
+        if isinstance(question, WhQuestion):
+            predicate = self.domain.predicates.get(question.predicate)
+            if predicate is not None and predicate.arg_types:
+                individuals = self.domain.sorts.get(predicate.arg_types[0])
+                if individuals:
+                    return str(individuals[0])
+        return "yes"
+
+
+def _mock_nlu(spec: DomainSpec) -> MockNLUService:
+    nlu = MockNLUService()
+    nlu.configure_response(spec.opening, "request")
+    return nlu
+
+
+def _state_size(state_dict: dict[str, Any]) -> int:
+    return len(json.dumps(state_dict, default=str))
+
+
+@dataclass
+class TurnSample:
+    """Measurements for one user turn plus the system's reply."""
+
+    phase_times: dict[str, float] = field(default_factory=lambda: dict.fromkeys(PHASES, 0.0))
+    total_time: float = 0.0
+    state_bytes: int = 0
+    responded: bool = False
+
+
+class TurnDriver:
+    """Runs one turn at a time through a particular entry point."""
+
+    name = ""
+
+    def __init__(self, spec: DomainSpec) -> None:
+        self.spec = spec
+        self.user = SyntheticUser(spec)
+
+    def run_turn(self) -> TurnSample:
+        """Run one user turn and the system reply, timing each phase."""
+        raise NotImplementedError
+
+
+class EngineDriver(TurnDriver):
+    """Calls DialogueMoveEngine phases directly (the tightest loop)."""
+
+    name = "engine"
+
+    def __init__(self, spec: DomainSpec) -> None:
+        super().__init__(spec)
+        self.engine = DialogueMoveEngine(agent_id="system", rules=build_rules())
+        self.nlu = _mock_nlu(spec)
+        self.state = self.engine.create_initial_state()
+
+    def run_turn(self) -> TurnSample:
+        sample = TurnSample()
+        times = sample.phase_times
+        utterance, _ = self.user.next_utterance(self.state)
+        start = time.perf_counter()
+
+        t0 = time.perf_counter()
+        move = self.nlu.process(utterance, "user", self.state)
+        t1 = time.perf_counter()
+        times["interpret"] += t1 - t0
+
+        self.state = self.engine.integrate(move, self.state)
+        t2 = time.perf_counter()
+        times["integrate"] += t2 - t1
+
+        response, self.state = self.engine.select_action(self.state)
+        t3 = time.perf_counter()
+        times["select"] += t3 - t2
+
+        if response is not None:
+            self.engine.generate(response, self.state)
+            t4 = time.perf_counter()
+            times["generate"] += t4 - t3
+            self.state = self.engine.integrate(response, self.state)
+            times["integrate"] += time.perf_counter() - t4
+            sample.responded = True
+
+        sample.total_time = time.perf_counter() - start
+        sample.state_bytes = _state_size(self.state.to_dict())
+        return sample
+
+
+class _MockNLUEngine:
+    """Adapts MockNLUService to the NLUEngine.process() signature used by Burr."""
+
+    _ACTS = {"ask": "question", "greet": "greeting", "request": "command"}
+
+    def __init__(self, nlu: MockNLUService) -> None:
+        self.nlu = nlu
+
+    def process(
+        self, utterance: str, speaker: str, state: InformationState, context: Any
+    ) -> tuple[NLUResult, Any]:
+        act, confidence = self.nlu.classify_dialogue_act(utterance, state)
+        act = self._ACTS.get(act, act)
+        result = NLUResult(
+            dialogue_act=act,
+            confidence=confidence,
+            intent=utterance if act == "command" else None,
+            answer_content={"content": utterance} if act == "answer" else None,
+        )
+        return result, context
+
+
+class StateMachineDriver(TurnDriver):
+    """Runs the Burr six-stage pipeline with a mock NLU and template NLG."""
+
+    name = "state_machine"
+
+    _PHASE_OF_ACTION = {
+        "nlu": "interpret",
+        "interpret": "interpret",
+        "integrate": "integrate",
+        "select": "select",
+        "nlg": "generate",
+        "generate": "generate",
+    }
+
+    def __init__(self, spec: DomainSpec) -> None:
+        from ibdm.burr_integration import DialogueStateMachine
+        from ibdm.nlg import NLGEngine, NLGEngineConfig
+
+        super().__init__(spec)
+        self.machine = DialogueStateMachine(
+            rules=build_rules(),
+            nlu_engine=_MockNLUEngine(_mock_nlu(spec)),  # type: ignore[arg-type]
+            nlg_engine=NLGEngine(NLGEngineConfig(default_strategy="template")),
+        )
+        self.machine.initialize()
+
+    def _run(self, sample: TurnSample, halt_after: str, inputs: dict[str, Any] | None) -> Any:
+        state = None
+        last = time.perf_counter()
+        for action, _, state in self.machine.app.iterate(halt_after=[halt_after], inputs=inputs):
+            now = time.perf_counter()
+            sample.phase_times[self._PHASE_OF_ACTION[action.name]] += now - last
+            last = now
+        return state
+
+    def run_turn(self) -> TurnSample:
+        sample = TurnSample()
+        info_state = self.machine.get_information_state()
+        assert info_state is not None
+        plans_before = len(info_state.private.plan)
+        utterance, _ = self.user.next_utterance(info_state)
+        if len(info_state.private.plan) != plans_before:
+            # Seeding mutates a deserialized copy; write it back into Burr state
+            self.machine.app.update_state(
+                self.machine.app.state.update(information_state=info_state.to_dict())
+            )
+
+        start = time.perf_counter()
+        state = self._run(sample, "select", {"utterance": utterance, "speaker": "user"})
+        if state.get("has_response", False):
+            state = self._run(sample, "generate", None)
+            sample.responded = True
+        sample.total_time = time.perf_counter() - start
+        sample.state_bytes = _state_size(state["information_state"])
+        return sample
+
+
+class _PhaseTimer:
+    """Times calls to a callable, adding elapsed time to a sample's phase."""
+
+    def __init__(self, func: Callable[..., Any], phase: str) -> None:
+        self.func = func
+        self.phase = phase
+        self.sample: TurnSample | None = None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return self.func(*args, **kwargs)
+        finally:
+            if self.sample is not None:
+                self.sample.phase_times[self.phase] += time.perf_counter() - start
+
+
+class ScenarioRunnerDriver(TurnDriver):
+    """Feeds generated turns through ScenarioRunner._display_turn.
+
+    Uses REPLAY mode (no delays) and a quiet console, so the measured cost is
+    the runner's engine orchestration plus its mock NLU, not terminal output.
+    """
+
+    name = "scenario_runner"
+
+    def __init__(self, spec: DomainSpec) -> None:
+        from rich.console import Console
+
+        from ibdm.demo.execution_controller import ExecutionController, ExecutionMode
+        from ibdm.demo.scenario_loader import Scenario, ScenarioMetadata
+        from ibdm.demo.scenario_runner import ScenarioRunner
+
+        super().__init__(spec)
+        metadata = ScenarioMetadata(
+            scenario_id=f"benchmark_{spec.name}",
+            title=f"Benchmark ({spec.name})",
+            description="Synthetic benchmark dialogue",
+            business_narrative="",
+            larsson_algorithms=[],
+            expected_outcomes={},
+            confidence_mode="optimistic",
+            metrics={},
+        )
+        self.runner = ScenarioRunner(
+            Scenario(metadata=metadata, turns=[]),
+            controller=ExecutionController(mode=ExecutionMode.REPLAY),
+            console=Console(file=io.StringIO(), quiet=True),
+            nlg_mode="off",
+            show_explanations=False,
+            show_state_changes=False,
+            show_larsson_rules=False,
+            show_metrics=False,
+            show_engine_state=False,
+        )
+        self.runner.state.private.beliefs["domain_model"] = self.user.domain
+
+        engine = self.runner.orchestrator.engine
+        self._timers = [
+            _PhaseTimer(self.runner._create_user_dialogue_move, "interpret"),  # type: ignore[attr-defined]
+            _PhaseTimer(engine.integrate, "integrate"),
+            _PhaseTimer(engine.select_action, "select"),
+            _PhaseTimer(engine.generate, "generate"),
+        ]
+        self.runner._create_user_dialogue_move = self._timers[0]  # type: ignore[method-assign]
+        engine.integrate = self._timers[1]  # type: ignore[method-assign]
+        engine.select_action = self._timers[2]  # type: ignore[method-assign]
+        engine.generate = self._timers[3]  # type: ignore[method-assign]
+        self._turn = 0
+
+    def _make_turn(self, speaker: str, utterance: str, move_type: str) -> Any:
+        from ibdm.demo.scenario_loader import ScenarioTurn
+
+        self._turn += 1
+        return ScenarioTurn(
+            turn=self._turn,
+            speaker=speaker,
+            utterance=utterance,
+            move_type=move_type,
+            business_explanation="",
+            larsson_rule="",
+            state_changes={},
+        )
+
+    def run_turn(self) -> TurnSample:
+        sample = TurnSample()
+        for timer in self._timers:
+            timer.sample = sample
+        utterance, move_type = self.user.next_utterance(self.runner.state)
+
+        start = time.perf_counter()
+        self.runner._display_turn(self._make_turn("user", utterance, move_type))  # type: ignore[attr-defined]
+        if self.runner.orchestrator.pending_system_move is not None:
+            self.runner._display_turn(self._make_turn("system", "", "ask"))  # type: ignore[attr-defined]
+            sample.responded = True
+        sample.total_time = time.perf_counter() - start
+
+        for timer in self._timers:
+            timer.sample = None
+        sample.state_bytes = _state_size(self.runner.state.to_dict())
+        return sample
+
+
+DRIVER_CLASSES: dict[str, type[TurnDriver]] = {
+    EngineDriver.name: EngineDriver,
+    StateMachineDriver.name: StateMachineDriver,
+    ScenarioRunnerDriver.name: ScenarioRunnerDriver,
+}
+
+
+def _latency_stats(samples: list[float]) -> dict[str, float]:
+    """Summarize latency samples (seconds) in milliseconds."""
+    if not samples:
+        return {"mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "total_ms": 0.0}
+    total = sum(samples)
+    return {
+        "mean_ms": total / len(samples) * 1000,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "total_ms": total * 1000,
+    }
+
+
+def _peak_rss_kb() -> int | None:
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return usage // 1024 if sys.platform == "darwin" else usage
+
+
+def _measure_allocations(driver_name: str, spec: DomainSpec, turns: int) -> dict[str, Any]:
+    """Replay the same dialogue under tracemalloc and record per-turn allocation."""
+    driver = DRIVER_CLASSES[driver_name](spec)
+    per_turn: list[int] = []
+    peak = retained = 0
+    tracemalloc.start()
+    try:
+        for _ in range(turns):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            driver.run_turn()
+            after, turn_peak = tracemalloc.get_traced_memory()
+            per_turn.append(turn_peak - before)
+            peak = max(peak, turn_peak)
+            retained = after
+    finally:
+        tracemalloc.stop()
+    return {
+        "mean_bytes_per_turn": sum(per_turn) / len(per_turn) if per_turn else 0,
+        "max_bytes_per_turn": max(per_turn, default=0),
+        "peak_traced_bytes": peak,
+        "retained_bytes": retained,
+    }
+
+
+def run_benchmark(
+    driver_name: str, domain: str, turns: int, measure_allocations: bool = True
+) -> dict[str, Any]:
+    """Run one benchmark configuration.
+
+    Args:
+        driver_name: One of DRIVERS
+        domain: One of DOMAINS
+        turns: Number of user turns to run
+        measure_allocations: Also replay the dialogue under tracemalloc
+
+    Returns:
+        Dictionary of latency, memory and state-size measurements
+    """
+    spec = DOMAINS[domain]
+    driver = DRIVER_CLASSES[driver_name](spec)
+    samples = [driver.run_turn() for _ in range(turns)]
+
+    state_bytes = [s.state_bytes for s in samples]
+    result: dict[str, Any] = {
+        "driver": driver_name,
+        "domain": domain,
+        "turns": turns,
+        "responses": sum(1 for s in samples if s.responded),
+        "turn": _latency_stats([s.total_time for s in samples]),
+        "phases": {
+            phase: _latency_stats([s.phase_times[phase] for s in samples]) for phase in PHASES
+        },
+        "state_bytes": {
+            "first": state_bytes[0] if state_bytes else 0,
+            "last": state_bytes[-1] if state_bytes else 0,
+            "max": max(state_bytes, default=0),
+            "per_turn": state_bytes,
+        },
+        "peak_rss_kb": _peak_rss_kb(),
+    }
+    if measure_allocations:
+        result["allocations"] = _measure_allocations(driver_name, spec, turns)
+    return result
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_suite(
+    turns: list[int],
+    domains: list[str],
+    drivers: list[str],
+    measure_allocations: bool = True,
+    progress: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """Run every (driver, domain, turns) combination.
+
+    Args:
+        turns: Turn counts to run
+        domains: Domain names
+        drivers: Driver names
+        measure_allocations: Also replay each dialogue under tracemalloc
+        progress: Optional callback invoked with each result as it completes
+
+    Returns:
+        Report dictionary with environment metadata and a results list
+    """
+    results: list[dict[str, Any]] = []
+    for driver_name in drivers:
+        for domain in domains:
+            for count in turns:
+                result = run_benchmark(driver_name, domain, count, measure_allocations)
+                results.append(result)
+                if progress is not None:
+                    progress(result)
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "generated_at": datetime.now().isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare_reports(
+    current: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Find p50 latency regressions against a baseline report.
+
+    Args:
+        current: Report from run_suite
+        baseline: Earlier report from run_suite
+        threshold: Allowed relative slowdown (0.2 = 20%)
+
+    Returns:
+        Human-readable descriptions of each regression (empty if none)
+    """
+    previous = {(r["driver"], r["domain"], r["turns"]): r for r in baseline.get("results", [])}
+    regressions: list[str] = []
+    for result in current["results"]:
+        key = (result["driver"], result["domain"], result["turns"])
+        old = previous.get(key)
+        if old is None:
+            continue
+        metrics = [("turn", result["turn"], old["turn"])]
+        metrics += [(p, result["phases"][p], old["phases"][p]) for p in PHASES]
+        for name, new_stats, old_stats in metrics:
+            before, after = old_stats["p50_ms"], new_stats["p50_ms"]
+            if before > 0 and after > before * (1 + threshold):
+                regressions.append(
+                    f"{'/'.join(map(str, key))} {name} p50 {before:.3f}ms -> {after:.3f}ms "
+                    f"(+{(after / before - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def _print_result(result: dict[str, Any]) -> None:
+    phases = "  ".join(f"{p}={result['phases'][p]['p50_ms']:.3f}" for p in PHASES)
+    print(
+        f"{result['driver']:<16} {result['domain']:<7} {result['turns']:>5} turns  "
+        f"turn p50={result['turn']['p50_ms']:.3f}ms p99={result['turn']['p99_ms']:.3f}ms  "
+        f"[{phases}]  state={result['state_bytes']['last']}B"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark suite from the command line."""
+    parser = argparse.ArgumentParser(description="IBDM turn-latency benchmarks")
+    parser.add_argument("--turns", type=int, nargs="+", default=list(DEFAULT_TURNS))
+    parser.add_argument("--domains", nargs="+", choices=sorted(DOMAINS), default=list(DOMAINS))
+    parser.add_argument("--drivers", nargs="+", choices=DRIVERS, default=list(DRIVERS))
+    parser.add_argument("--output", type=Path, help="JSON output path")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON report to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed relative p50 slowdown before --compare fails (default: 0.2)",
+    )
+    parser.add_argument(
+        "--no-alloc", action="store_true", help="Skip the tracemalloc allocation pass"
+    )
+    args = parser.parse_args(argv)
+
+    report = run_suite(
+        args.turns,
+        args.domains,
+        args.drivers,
+        measure_allocations=not args.no_alloc,
+        progress=_print_result,
+    )
+
+    output: Path = args.output or DEFAULT_OUTPUT_DIR / (
+        f"turn_latency_{datetime.now().strftime('%Y-%m-%d_%H%M%S')}_{report['git_commit']}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\nReport written to {output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare_reports(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) vs {args.compare}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions vs {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""Tests for speculative NLU of replies to the system's own questions."""
+
+from typing import Any
+
+from burr.core import State
+
+from ibdm.burr_integration import create_dialogue_application
+from ibdm.burr_integration.actions import nlu, prefetch
+from ibdm.core import AltQuestion, DialogueMove, DomainModel, InformationState, WhQuestion
+from ibdm.core.questions import YNQuestion
+from ibdm.nlu.answer_prefetch import AnswerPrefetch
+from ibdm.nlu.nlu_context import NLUContext
+from ibdm.nlu.nlu_result import NLUResult
+
+NDA_TYPE = AltQuestion(alternatives=["mutual", "one-way"], predicate="nda_type")
+
+
+class CountingNLUEngine:
+    """NLU engine stand-in that records the utterances it is asked to process."""
+
+    def __init__(self):
+        self.utterances: list[str] = []
+
+    def process(
+        self, utterance: str, speaker: str, state: InformationState, nlu_context: NLUContext
+    ) -> tuple[NLUResult, NLUContext]:
+        self.utterances.append(utterance)
+        return NLUResult(dialogue_act="question", confidence=0.8), nlu_context
+
+
+def asked(question: Any) -> "State[Any]":
+    """Burr state right after the system asked a question."""
+    return State(
+        {
+            "response_move": DialogueMove(
+                move_type="ask", content=question, speaker="system"
+            ).to_dict(),
+            "information_state": InformationState(agent_id="system").to_dict(),
+        }
+    )
+
+
+class TestAnswerPrefetch:
+    """Tests for reply prediction and matching."""
+
+    def test_alternative_replies_match(self) -> None:
+        """Replies built from the reply templates map to their alternative."""
+        prefetch_table = AnswerPrefetch.for_question(NDA_TYPE)
+
+        result = prefetch_table.match("The one-way one.")
+
+        assert result is not None
+        assert result.dialogue_act == "answer"
+        assert result.answer_content == {"content": "one-way", "answer_type": "direct"}
+        assert result.tokens_used == 0
+        assert prefetch_table.match("What's the difference?") is None
+
+    def test_yes_no_and_sort_values(self) -> None:
+        """Yes/no questions and wh-questions over a sort get predictions."""
+        domain = DomainModel(name="test")
+        domain.add_predicate("jurisdiction", arity=1, arg_types=["us_state"])
+        domain.add_sort("us_state", ["California", "Delaware"])
+
+        yes_no = AnswerPrefetch.for_question(YNQuestion(proposition="confirm_nda"))
+        states = AnswerPrefetch.for_question(
+            WhQuestion(variable="x", predicate="jurisdiction"), domain
+        )
+        open_ended = AnswerPrefetch.for_question(WhQuestion(variable="x", predicate="parties"))
+
+        match = yes_no.match("Yep")
+        assert match is not None and match.answer_content == {
+            "content": "yes",
+            "answer_type": "direct",
+        }
+        assert [answer.content for answer in states.answers()] == ["California", "Delaware"]
+        assert states.answers()[0].question_ref == WhQuestion(
+            variable="x", predicate="jurisdiction"
+        )
+        assert open_ended.predictions == {}
+
+    def test_round_trips_through_dict(self) -> None:
+        """A prefetch survives Burr state serialization."""
+        prefetch_table = AnswerPrefetch.for_question(NDA_TYPE)
+
+        assert AnswerPrefetch.from_dict(prefetch_table.to_dict()) == prefetch_table
+
+
+class TestPrefetchStage:
+    """Tests for the prefetch stage between generate and nlu."""
+
+    def test_predicted_reply_skips_nlu_engine(self) -> None:
+        """An expected reply is answered from the prefetch, once."""
+        engine = CountingNLUEngine()
+        result, state = prefetch(asked(NDA_TYPE))
+        state = state.update(nlu_engine=engine)
+
+        assert result["predictions"] > 0
+        result, state = nlu(state, utterance="Mutual, please", speaker="user")
+
+        assert result["speculative"] is True
+        assert state["nlu_result"]["answer_content"]["content"] == "mutual"
+        assert state["nlu_prefetch"] is None
+        assert engine.utterances == []
+
+        nlu(state, utterance="mutual", speaker="user")
+        assert engine.utterances == ["mutual"]
+
+    def test_unexpected_reply_falls_through(self) -> None:
+        """Replies outside the prediction go to the NLU engine."""
+        engine = CountingNLUEngine()
+        _, state = prefetch(asked(NDA_TYPE))
+
+        result, _ = nlu(
+            state.update(nlu_engine=engine), utterance="Which do you suggest?", speaker="user"
+        )
+
+        assert result["speculative"] is False
+        assert engine.utterances == ["Which do you suggest?"]
+
+    def test_no_prefetch_for_other_moves(self) -> None:
+        """Moves other than questions leave nothing to prefetch."""
+        state = asked(NDA_TYPE).update(
+            response_move=DialogueMove(move_type="greet", content="Hi", speaker="system").to_dict()
+        )
+
+        _, state = prefetch(state)
+
+        assert state["nlu_prefetch"] is None
+
+    def test_application_includes_stage_when_enabled(self) -> None:
+        """The prefetch action is only part of the graph with speculative_nlu."""
+        enabled = create_dialogue_application(speculative_nlu=True)
+        disabled = create_dialogue_application()
+
+        assert "prefetch" in [action.name for action in enabled.graph.actions]
+        assert "prefetch" not in [action.name for action in disabled.graph.actions]
@@ -0,0 +1,82 @@
+"""Tests for the token-budgeted context builder."""
+
+from ibdm.core.information_state import InformationState
+from ibdm.core.moves import DialogueMove
+from ibdm.core.questions import WhQuestion
+from ibdm.nlu.context_builder import ContextBudget, ContextBuilder, estimate_tokens
+
+
+def long_session(turns: int = 200) -> InformationState:
+    """A state with many moves and commitments and a question on the QUD."""
+    state = InformationState()
+    for turn in range(turns):
+        state.shared.moves.append(
+            DialogueMove(move_type="answer", content=f"value number {turn}", speaker="user")
+        )
+        state.shared.commitments.add(f"fact_{turn:03d}(value {turn})")
+    state.shared.commitments.add("jurisdiction(Delaware)")
+    state.shared.qud.append(WhQuestion(variable="x", predicate="jurisdiction"))
+    return state
+
+
+class TestEstimateTokens:
+    """Tests for the local token estimator."""
+
+    def test_words_and_punctuation(self) -> None:
+        """Short words and punctuation marks count one token each."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("What is the date?") == 5
+        assert estimate_tokens("internationalization") == 5
+
+
+class TestContextBuilder:
+    """Tests for ranking, packing and fragment caching."""
+
+    def test_context_stays_within_budget(self) -> None:
+        """A long session is packed into the configured budget."""
+        builder = ContextBuilder(ContextBudget(max_tokens=120))
+
+        context = builder.build(long_session())
+
+        assert 0 < context.tokens <= 120
+        assert context.dropped > 0
+        assert len(context.texts("move")) <= builder.budget.max_moves
+
+    def test_top_qud_and_focus_commitments_rank_first(self) -> None:
+        """The top QUD and commitments on its predicate survive a tight budget."""
+        builder = ContextBuilder(ContextBudget(max_tokens=35))
+
+        context = builder.build(long_session())
+
+        assert context.focus == frozenset({"jurisdiction"})
+        assert context.texts("qud") == ["?x.jurisdiction"]
+        assert context.texts("commitment") == ["jurisdiction(Delaware)"]
+        assert context.text.startswith("Current questions under discussion:")
+
+    def test_sections_render_in_fixed_order(self) -> None:
+        """With room to spare, history precedes the QUD and commitments."""
+        state = InformationState()
+        state.shared.moves.append(DialogueMove(move_type="greet", content="Hi", speaker="user"))
+        state.shared.qud.append(WhQuestion(variable="x", predicate="city"))
+        state.shared.commitments.add("weather(sunny)")
+
+        text = ContextBuilder().build(state).text
+
+        assert text == (
+            "Dialogue history:\n1. User: greet - Hi\n\n"
+            "Current questions under discussion: ?x.city\n\n"
+            "Relevant commitments: weather(sunny)"
+        )
+
+    def test_fragments_are_reused_across_turns(self) -> None:
+        """Only moves and commitments added since the last turn are rendered."""
+        builder = ContextBuilder()
+        state = long_session(turns=5)
+        builder.build(state)
+        misses = builder.cache_info()["misses"]
+
+        state.shared.moves.append(DialogueMove(move_type="ask", content="Next?", speaker="system"))
+        builder.build(state.clone())
+
+        assert builder.cache_info()["misses"] == misses + 1
+        assert builder.cache_info()["hits"] > 0
@@ -88,10 +88,32 @@ def test_adapter_call_with_system_prompt(adapter, mock_completion_response):
         messages = mock_call.call_args[1]["messages"]
         assert len(messages) == 2
         assert messages[0]["role"] == "system"
-        assert messages[0]["content"] == "You are a helpful assistant"
+        assert messages[0]["content"] == [
+            {
+                "type": "text",
+                "text": "You are a helpful assistant",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
         assert messages[1]["role"] == "user"
 
 
+def test_adapter_reports_cached_tokens(adapter, mock_completion_response):
+    """Provider cache reads and writes are surfaced on the response."""
+    mock_completion_response.usage.cache_read_input_tokens = 40
+    mock_completion_response.usage.cache_creation_input_tokens = 5
+    with patch(
+        "ibdm.nlu.llm_adapter.completion", return_value=mock_completion_response
+    ) as mock_call:
+        response = adapter.call("Input: hi", system_prompt="System", prompt_prefix="Task")
+
+    user = mock_call.call_args[1]["messages"][1]["content"]
+    assert [block["text"] for block in user] == ["Task", "\nInput: hi"]
+    assert "cache_control" in user[0]
+    assert response.cached_tokens == 40
+    assert response.cache_creation_tokens == 5
+
+
 def test_adapter_call_with_overrides(adapter, mock_completion_response):
     """Test call with temperature and max_tokens overrides."""
     with patch(
@@ -252,6 +274,29 @@ async def test_adapter_acall_structured_success(adapter):
         assert result.confidence == 0.95
 
 
+def test_abandoned_stream_closes_provider_stream(adapter):
+    """Stopping a stream early closes the HTTP stream behind the LiteLLM wrapper."""
+
+    def delta(text):
+        chunk = Mock()
+        chunk.choices = [Mock()]
+        chunk.choices[0].delta.content = text
+        chunk.usage = None
+        return chunk
+
+    wrapper = Mock()
+    wrapper.__iter__ = Mock(
+        return_value=iter([delta('{"confidence": "high", '), delta('"answer": "x"}')])
+    )
+
+    with patch("ibdm.nlu.llm_adapter.completion", return_value=wrapper) as completion:
+        with pytest.raises(LLMParsingError, match="confidence"):
+            adapter.stream_structured("Test prompt", SampleResponse)
+
+    assert completion.call_args.kwargs["stream_options"] == {"include_usage": True}
+    wrapper.completion_stream.close.assert_called_once()
+
+
 def test_create_adapter_sonnet(mock_env):
     """Test convenience function creates Sonnet adapter."""
     adapter = create_adapter("sonnet")
@@ -0,0 +1,273 @@
+"""Tests for record/replay LLM backends and the load generator."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from ibdm.nlu import llm_adapter
+from ibdm.nlu.llm_adapter import (
+    LLMAdapter,
+    LLMBackend,
+    LLMConfig,
+    LLMRequest,
+    LLMResponse,
+    ModelType,
+    get_default_backend,
+    set_default_backend,
+)
+from ibdm.nlu.llm_cassette import (
+    Cassette,
+    CassetteMissError,
+    RecordingBackend,
+    ReplayBackend,
+    ReplayConfig,
+)
+from ibdm.nlu.llm_load import run_load_test
+
+
+class EchoBackend(LLMBackend):
+    """Stand-in live backend that echoes the prompt."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def complete(self, request: LLMRequest) -> LLMResponse:
+        self.calls += 1
+        prompt = request.messages[-1]["content"]
+        return LLMResponse(
+            content=f"echo {prompt} #{self.calls}",
+            model=request.model,
+            tokens_used=30,
+            prompt_tokens=10,
+            completion_tokens=20,
+        )
+
+
+@pytest.fixture(autouse=True)
+def no_default_backend():
+    """Keep the process-wide backend isolated per test."""
+    previous = set_default_backend(None)
+    yield
+    set_default_backend(previous)
+
+
+def _recorded_cassette(tmp_path, prompts):
+    cassette = Cassette(tmp_path / "cassette.jsonl")
+    adapter = LLMAdapter(
+        LLMConfig(model=ModelType.HAIKU),
+        backend=RecordingBackend(cassette, inner=EchoBackend()),
+    )
+    for prompt in prompts:
+        adapter.call(prompt)
+    return cassette
+
+
+@pytest.fixture
+def offline_env():
+    """Environment with no API key."""
+    with patch.dict(os.environ, {}, clear=True):
+        yield
+
+
+class TestCassette:
+    """Tests for recording and loading cassettes."""
+
+    def test_record_appends_jsonl(self, tmp_path):
+        """Each exchange is appended to the cassette file as it happens."""
+        cassette = _recorded_cassette(tmp_path, ["a", "b"])
+
+        lines = (tmp_path / "cassette.jsonl").read_text().splitlines()
+        assert len(lines) == 2
+        assert len(cassette) == 2
+
+        loaded = Cassette.load(tmp_path / "cassette.jsonl")
+        assert len(loaded) == 2
+
+    def test_request_key_ignores_timeout(self):
+        """Timeout does not change the response, so it does not change the key."""
+        messages = [{"role": "user", "content": "hi"}]
+        a = LLMRequest(model="m", messages=messages, timeout=10)
+        b = LLMRequest(model="m", messages=messages, timeout=60)
+        c = LLMRequest(model="m", messages=messages, temperature=0.1)
+        assert a.key() == b.key()
+        assert a.key() != c.key()
+
+
+class TestReplayBackend:
+    """Tests for deterministic offline replay."""
+
+    def test_replay_without_api_key(self, tmp_path, offline_env):
+        """Replay serves recorded content and needs no API key."""
+        _recorded_cassette(tmp_path, ["hello"])
+        backend = ReplayBackend(Cassette.load(tmp_path / "cassette.jsonl"))
+
+        adapter = LLMAdapter(LLMConfig(model=ModelType.HAIKU), backend=backend)
+        response = adapter.call("hello")
+
+        assert response.content == "echo hello #1"
+        assert response.tokens_used == 30
+        assert backend.calls == 1
+
+    def test_repeated_requests_cycle(self, tmp_path):
+        """Repeated identical requests replay in recorded order, then wrap."""
+        _recorded_cassette(tmp_path, ["same", "same"])
+        backend = ReplayBackend(Cassette.load(tmp_path / "cassette.jsonl"))
+        adapter = LLMAdapter(LLMConfig(model=ModelType.HAIKU), backend=backend)
+
+        contents = [adapter.call("same").content for _ in range(3)]
+        assert contents == ["echo same #1", "echo same #2", "echo same #1"]
+
+    def test_miss_is_not_retried(self, tmp_path):
+        """A cassette miss raises immediately instead of retrying with backoff."""
+        backend = ReplayBackend(_recorded_cassette(tmp_path, ["known"]))
+        adapter = LLMAdapter(LLMConfig(model=ModelType.HAIKU), backend=backend)
+
+        with patch("time.sleep") as sleep:
+            with pytest.raises(CassetteMissError):
+                adapter.call("unknown")
+        sleep.assert_not_called()
+        assert backend.misses == 1
+
+    def test_synthetic_latency_and_tokens(self, tmp_path):
+        """Latency and token counts follow the replay configuration."""
+        config = ReplayConfig(latency=0.5, latency_per_token=0.01, completion_tokens=100)
+        backend = ReplayBackend(_recorded_cassette(tmp_path, ["x"]), config)
+        adapter = LLMAdapter(LLMConfig(model=ModelType.HAIKU), backend=backend)
+
+        with patch("ibdm.nlu.llm_cassette.time.sleep") as sleep:
+            response = adapter.call("x")
+
+        sleep.assert_called_once_with(pytest.approx(1.5))
+        assert response.completion_tokens == 100
+        assert response.tokens_used == 110
+
+    @pytest.mark.asyncio
+    async def test_async_replay(self, tmp_path):
+        """The async path replays too."""
+        backend = ReplayBackend(_recorded_cassette(tmp_path, ["p1", "p2"]))
+        adapter = LLMAdapter(LLMConfig(model=ModelType.HAIKU), backend=backend)
+
+        responses = await adapter.batch_call(["p1", "p2"])
+        assert [r.content for r in responses] == ["echo p1 #1", "echo p2 #2"]
+
+
+class TestPromptCaching:
+    """Tests for the static-prefix layout and replayed prompt-cache usage."""
+
+    def test_prefix_is_marked_and_key_unchanged(self):
+        """The static prefix ends at the cache marker; the request key ignores it."""
+        adapter = LLMAdapter(LLMConfig(model=ModelType.HAIKU), backend=EchoBackend())
+        request = adapter._build_request("Input: hi", "System", "Task and examples", None, None)
+        plain = LLMRequest(model=request.model, messages=request.messages)
+
+        user = request.wire_messages()[1]["content"]
+        assert user[0] == {
+            "type": "text",
+            "text": "Task and examples",
+            "cache_control": {"type": "ephemeral"},
+        }
+        assert user[1] == {"type": "text", "text": "\nInput: hi"}
+        assert request.prefix_text() == "SystemTask and examples"
+        assert request.key() == plain.key()
+
+    def test_replay_reports_cached_prefix_tokens(self, tmp_path):
+        """Replaying calls that share a prefix reports cache writes, then reads."""
+        cassette = Cassette(tmp_path / "cassette.jsonl")
+        recorder = LLMAdapter(
+            LLMConfig(model=ModelType.HAIKU),
+            backend=RecordingBackend(cassette, inner=EchoBackend()),
+        )
+        for prompt in ("first", "second"):
+            recorder.call(prompt, system_prompt="Stable system prompt", prompt_prefix="Examples")
+
+        backend = ReplayBackend(Cassette.load(tmp_path / "cassette.jsonl"))
+        adapter = LLMAdapter(LLMConfig(model=ModelType.HAIKU), backend=backend)
+        first, second = (
+            adapter.call(prompt, system_prompt="Stable system prompt", prompt_prefix="Examples")
+            for prompt in ("first", "second")
+        )
+
+        assert first.cached_tokens == 0 and first.cache_creation_tokens > 0
+        assert second.cached_tokens == first.cache_creation_tokens
+        assert second.cache_creation_tokens == 0
+        assert backend.cached_tokens_served == second.cached_tokens
+
+    def test_caching_can_be_disabled(self, tmp_path):
+        """Without prompt caching no marker is sent and nothing is reported cached."""
+        backend = ReplayBackend(_recorded_cassette(tmp_path, ["x"]))
+        config = LLMConfig(model=ModelType.HAIKU, prompt_caching=False)
+        adapter = LLMAdapter(config, backend=backend)
+
+        request = adapter._build_request("x", "System", None, None, None)
+
+        assert request.cache_breakpoint is None
+        assert request.wire_messages() == request.messages
+        assert adapter.call("x").cache_creation_tokens == 0
+
+
+class TestDefaultBackend:
+    """Tests for process-wide backend selection."""
+
+    def test_adapters_use_default_backend(self, tmp_path, offline_env):
+        """Adapters built without a backend pick up the installed default."""
+        backend = ReplayBackend(_recorded_cassette(tmp_path, ["q"]))
+        set_default_backend(backend)
+
+        assert LLMAdapter(LLMConfig(model=ModelType.HAIKU)).backend is backend
+
+    def test_backend_from_env(self, tmp_path):
+        """IBDM_LLM_MODE=replay loads the cassette once and shares it."""
+        _recorded_cassette(tmp_path, ["q"])
+        env = {"IBDM_LLM_MODE": "replay", "IBDM_LLM_CASSETTE": str(tmp_path / "cassette.jsonl")}
+        with patch.dict(os.environ, env, clear=True):
+            backend = get_default_backend()
+            assert isinstance(backend, ReplayBackend)
+            assert get_default_backend() is backend
+
+    def test_live_default_requires_key(self, offline_env):
+        """Without a backend the live default still requires IBDM_API_KEY."""
+        assert llm_adapter.get_default_backend() is None
+        with pytest.raises(ValueError, match="IBDM_API_KEY not found"):
+            LLMAdapter()
+
+
+class TestLoadGenerator:
+    """Tests for concurrent load generation."""
+
+    def test_concurrent_sessions(self, tmp_path):
+        """Sessions run concurrently and report throughput and latency."""
+        prompts = ["turn 1", "turn 2", "turn 3"]
+        backend = ReplayBackend(_recorded_cassette(tmp_path, prompts), ReplayConfig(latency=0.01))
+
+        def session(index: int) -> list[float]:
+            adapter = LLMAdapter(LLMConfig(model=ModelType.HAIKU), backend=backend)
+            latencies = []
+            for prompt in prompts:
+                response = adapter.call(prompt)
+                latencies.append(0.01)
+                assert response.content.startswith("echo")
+            return latencies
+
+        result = run_load_test(session, sessions=8, concurrency=4, backend=backend)
+
+        assert result.turns == 24
+        assert not result.errors
+        assert result.throughput > 0
+        assert result.backend_stats["calls"] == 24
+        assert result.backend_stats["tokens_served"] == 24 * 30
+        # 8 sessions x 3 calls x 10ms, four at a time
+        assert result.wall_time < 8 * 3 * 0.01
+
+    def test_session_errors_are_counted(self):
+        """A failing session is reported, not raised."""
+
+        def session(index: int) -> list[float]:
+            if index == 1:
+                raise RuntimeError("boom")
+            return [0.001]
+
+        result = run_load_test(session, sessions=3, concurrency=2)
+        assert result.turns == 2
+        assert result.errors == ["RuntimeError: boom"]
+        assert result.to_dict()["errors"] == 1
@@ -0,0 +1,186 @@
+"""Tests for per-call LLM telemetry."""
+
+import json
+import time
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+from ibdm.nlu.llm_adapter import (
+    LLMAdapter,
+    LLMAPIError,
+    LLMBackend,
+    LLMConfig,
+    LLMRequest,
+    LLMResponse,
+)
+from ibdm.nlu.llm_telemetry import (
+    JSONLSink,
+    LLMCallEvent,
+    LLMTelemetry,
+    MemorySink,
+    PrometheusSink,
+    set_telemetry,
+    telemetry_session,
+)
+
+
+class Verdict(BaseModel):
+    """Structured reply used by the tests."""
+
+    verdict: str
+
+
+class ScriptedBackend(LLMBackend):
+    """Backend replying from a script; a None entry raises a transient error."""
+
+    def __init__(self, replies: list[str | None]):
+        self.replies = replies
+
+    def complete(self, request: LLMRequest) -> LLMResponse:
+        reply = self.replies.pop(0)
+        if reply is None:
+            raise ConnectionError("connection reset")
+        return LLMResponse(
+            content=reply,
+            model=request.model,
+            tokens_used=30,
+            prompt_tokens=20,
+            completion_tokens=10,
+            cached_tokens=12,
+        )
+
+
+@pytest.fixture
+def memory() -> Generator[MemorySink, None, None]:
+    """Install a telemetry hub with a memory sink for the duration of a test."""
+    sink = MemorySink()
+    previous = set_telemetry(LLMTelemetry([sink]))
+    yield sink
+    set_telemetry(previous)
+
+
+def adapter(replies: list[str | None], component: str = "classifier") -> LLMAdapter:
+    return LLMAdapter(
+        LLMConfig(max_retries=2), backend=ScriptedBackend(replies), component=component
+    )
+
+
+class TestAdapterEvents:
+    """Tests for the events the adapter emits."""
+
+    def test_call_emits_event_with_session(self, memory: MemorySink) -> None:
+        """A plain call reports tokens, cache use and the enclosing session."""
+        with telemetry_session("session-1"):
+            adapter(["hello"]).call("Hi")
+
+        [event] = memory.events()
+        assert event.component == "classifier"
+        assert (event.prompt_tokens, event.completion_tokens, event.cached_tokens) == (20, 10, 12)
+        assert event.cache_hit and event.retries == 0 and event.validation is None
+        assert event.session_id == "session-1"
+
+    def test_structured_call_reports_validation(self, memory: MemorySink) -> None:
+        """Each parse attempt of a structured call reports its outcome."""
+        adapter(["not json", '{"verdict": "ok"}']).call_structured("Judge", Verdict)
+
+        assert [event.validation for event in memory.events()] == ["invalid", "valid"]
+
+    def test_retries_and_failures(
+        self, memory: MemorySink, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Transport retries are counted and a failed call is still reported."""
+        monkeypatch.setattr("ibdm.nlu.llm_adapter.time.sleep", lambda _: None)
+
+        adapter([None, "recovered"]).call("Hi")
+        with pytest.raises(LLMAPIError):
+            adapter([None, None]).call("Hi")
+
+        recovered, failed = memory.events()
+        assert recovered.retries == 1 and recovered.error is None
+        assert failed.retries == 1 and failed.error is not None
+
+    def test_streamed_call_reports_backend_usage(self, memory: MemorySink) -> None:
+        """A stream run to the end reports the usage the backend returned."""
+        result = adapter(['{"verdict": "ok"}']).stream_structured("Judge", Verdict)
+
+        assert result.verdict == "ok"
+        [event] = memory.events()
+        assert (event.prompt_tokens, event.completion_tokens, event.cached_tokens) == (20, 10, 12)
+        assert event.validation == "valid"
+
+    def test_streamed_call_without_usage_is_estimated(self, memory: MemorySink) -> None:
+        """A stream reporting no usage is reported with estimated token counts."""
+
+        class ChunkBackend(ScriptedBackend):
+            def stream(self, request: LLMRequest) -> Generator[str, None, LLMResponse | None]:
+                yield from ('{"verdict": ', '"ok"}')
+                return None
+
+        streaming = LLMAdapter(backend=ChunkBackend([]), component="judge")
+        streaming.stream_structured("Judge the following statement carefully", Verdict)
+
+        [event] = memory.events()
+        assert event.component == "judge"
+        assert event.prompt_tokens > 0 and event.completion_tokens > 0
+        assert streaming.last_response is not None
+        assert streaming.last_response.content == '{"verdict": "ok"}'
+
+    def test_no_hub_installed(self) -> None:
+        """Without telemetry the adapter works as before."""
+        set_telemetry(None)
+
+        assert adapter(["hello"]).call("Hi").content == "hello"
+
+
+class TestTelemetryHub:
+    """Tests for aggregation and the sinks."""
+
+    def test_aggregates_per_session_and_component(self) -> None:
+        """Totals are kept per session id and per component."""
+        telemetry = LLMTelemetry()
+        telemetry.record(LLMCallEvent("nlg", "m", prompt_tokens=5, latency=0.2, session_id="a"))
+        telemetry.record(LLMCallEvent("nlg", "m", cached_tokens=3, latency=0.4, session_id="b"))
+        telemetry.record(LLMCallEvent("parser", "m", error="boom", session_id="a"))
+
+        nlg = telemetry.by_component()["nlg"]
+        assert nlg.calls == 2
+        assert nlg.mean_latency == pytest.approx(0.3)
+        assert nlg.cache_hit_rate == 0.5
+        assert telemetry.by_session()["a"].errors == 1
+        assert set(telemetry.report()["sessions"]) == {"a", "b"}
+
+    def test_idle_sessions_are_dropped(self) -> None:
+        """Session aggregates past the TTL are evicted as new events arrive."""
+        telemetry = LLMTelemetry(session_ttl=0.2)
+        telemetry.record(LLMCallEvent("nlg", "m", session_id="old"))
+        time.sleep(0.25)
+        telemetry.record(LLMCallEvent("nlg", "m", session_id="new"))
+
+        assert set(telemetry.by_session()) == {"new"}
+        assert telemetry.by_component()["nlg"].calls == 2
+
+    def test_memory_sink_is_bounded(self) -> None:
+        """The ring buffer keeps only the newest events."""
+        sink = MemorySink(capacity=2)
+        for index in range(3):
+            sink.emit(LLMCallEvent(f"c{index}", "m"))
+
+        assert [event.component for event in sink.events()] == ["c1", "c2"]
+
+    def test_jsonl_and_prometheus_sinks(self, tmp_path: Path) -> None:
+        """Events are written as JSON lines and rendered as Prometheus counters."""
+        jsonl = JSONLSink(tmp_path / "calls.jsonl")
+        prometheus = PrometheusSink()
+        telemetry = LLMTelemetry([jsonl, prometheus])
+
+        telemetry.record(LLMCallEvent("nlg", "haiku", prompt_tokens=7, retries=2))
+        telemetry.close()
+
+        [line] = (tmp_path / "calls.jsonl").read_text().splitlines()
+        assert json.loads(line)["prompt_tokens"] == 7
+        text = prometheus.render()
+        assert "# TYPE ibdm_llm_calls_total counter" in text
+        assert 'ibdm_llm_retries_total{component="nlg",model="haiku"} 2' in text
@@ -0,0 +1,132 @@
+"""Tests for adaptive fast/strong model routing."""
+
+import pytest
+
+from ibdm.nlu.dialogue_act_classifier import (
+    DialogueActClassifier,
+    DialogueActClassifierConfig,
+    DialogueActResult,
+)
+from ibdm.nlu.llm_adapter import (
+    LLMAdapter,
+    LLMBackend,
+    LLMConfig,
+    LLMRequest,
+    LLMResponse,
+    set_default_backend,
+)
+from ibdm.nlu.model_router import ModelRouter, RoutingPolicy
+from ibdm.nlu.nlu_engine import NLUEngine, NLUEngineConfig
+from ibdm.nlu.validation import ValidationMetrics
+
+FAST = RoutingPolicy().fast_model.value
+STRONG = RoutingPolicy().strong_model.value
+
+
+class ModelBackend(LLMBackend):
+    """Stand-in backend replying per model and recording which models were called."""
+
+    def __init__(self, replies: dict[str, str]):
+        self.replies = replies
+        self.models: list[str] = []
+
+    def complete(self, request: LLMRequest) -> LLMResponse:
+        self.models.append(request.model)
+        return LLMResponse(
+            content=self.replies[request.model],
+            model=request.model,
+            tokens_used=10,
+            prompt_tokens=8,
+            completion_tokens=2,
+        )
+
+
+def act(confidence: float) -> str:
+    return f'{{"act": "question", "confidence": {confidence}}}'
+
+
+def classifier(backend: ModelBackend, router: ModelRouter) -> DialogueActClassifier:
+    previous = set_default_backend(backend)
+    try:
+        config = DialogueActClassifierConfig(llm_config=LLMConfig(router=router))
+        return DialogueActClassifier(config)
+    finally:
+        set_default_backend(previous)
+
+
+class TestModelRouter:
+    """Tests for escalation decisions and per-task statistics."""
+
+    def test_confident_fast_reply_is_kept(self) -> None:
+        """A valid, confident fast reply never reaches the strong model."""
+        backend = ModelBackend({FAST: f"```json\n{act(0.9)}\n```", STRONG: act(0.95)})
+        router = ModelRouter()
+
+        result = classifier(backend, router).classify("Is it raining?")
+
+        assert result.confidence == 0.9
+        assert backend.models == [FAST]
+        assert router.escalation_rates() == {"DialogueActResult": 0.0}
+
+    @pytest.mark.parametrize(
+        ("fast_reply", "reason"),
+        [(act(0.4), "low_confidence"), ('{"act": "question"}', "validation")],
+    )
+    def test_escalates_unsure_or_invalid_replies(self, fast_reply: str, reason: str) -> None:
+        """Low confidence and failed validation escalate to the strong model."""
+        backend = ModelBackend({FAST: fast_reply, STRONG: act(0.95)})
+        metrics = ValidationMetrics()
+        router = ModelRouter(metrics=metrics)
+
+        result = classifier(backend, router).classify("Is it raining?")
+
+        assert result.confidence == 0.95
+        assert backend.models == [FAST, STRONG]
+        assert router.report()["DialogueActResult"]["reasons"] == {reason: 1}
+        assert metrics.get_stats().total_attempts == 1
+
+    def test_complex_input_goes_straight_to_strong_model(self) -> None:
+        """Long, multi-sentence inputs skip the fast model."""
+        backend = ModelBackend({FAST: act(0.9), STRONG: act(0.95)})
+        router = ModelRouter(RoutingPolicy(max_fast_sentences=1))
+
+        classifier(backend, router).classify("I see. But why? And when? Tell me.")
+
+        assert backend.models == [STRONG]
+        assert router.report()["DialogueActResult"]["reasons"] == {"complex": 1}
+
+    def test_escalation_rate_per_task(self) -> None:
+        """Escalation rates are tracked across calls of the same task."""
+        backend = ModelBackend({FAST: act(0.9), STRONG: act(0.95)})
+        router = ModelRouter()
+        routed = classifier(backend, router)
+
+        routed.classify("Hello")
+        backend.replies[FAST] = act(0.2)
+        routed.classify("Hmm")
+
+        assert router.escalation_rates() == {"DialogueActResult": 0.5}
+        router.reset()
+        assert router.report() == {}
+
+    def test_explicit_model_bypasses_router(self) -> None:
+        """Calls naming a model are sent to that model unrouted."""
+        backend = ModelBackend({FAST: act(0.1), STRONG: act(0.95)})
+        router = ModelRouter()
+        adapter = LLMAdapter(LLMConfig(router=router), backend=backend)
+
+        adapter.call_structured("Input: hi", DialogueActResult, model=RoutingPolicy().fast_model)
+
+        assert backend.models == [FAST]
+        assert router.report() == {}
+
+    def test_nlu_engine_shares_one_router(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """With adaptive routing, every NLU component routes through one router."""
+        monkeypatch.setenv("IBDM_API_KEY", "test-key")
+
+        engine = NLUEngine(NLUEngineConfig(adaptive_routing=True))
+
+        assert engine.router is not None
+        assert engine.context_interpreter is not None
+        assert engine.context_interpreter.llm.config.router is engine.router
+        assert NLUEngine(NLUEngineConfig()).router is None
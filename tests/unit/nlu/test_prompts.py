@@ -143,6 +143,21 @@ def test_prompt_template_format_without_examples():
     assert "actual input" in user
 
 
+def test_prompt_template_render_splits_static_prefix():
+    """Test that only the input varies between rendered prompts."""
+    template = create_dialogue_act_template()
+
+    first = template.render("Hello there")
+    second = template.render("Close the door")
+
+    assert first.system == second.system
+    assert first.prefix == second.prefix
+    assert "## Examples" in first.prefix
+    assert "Hello there" not in first.prefix
+    assert "Input: Hello there" in first.suffix
+    assert template.format("Hello there") == (first.system, first.user)
+
+
 def test_dialogue_act_template():
     """Test dialogue act classification template."""
     template = create_dialogue_act_template()
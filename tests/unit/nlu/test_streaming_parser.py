@@ -0,0 +1,126 @@
+"""Tests for incremental parsing of streamed structured responses."""
+
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+
+from ibdm.nlu.context_interpreter import ContextualInterpretation
+from ibdm.nlu.llm_adapter import (
+    LLMAdapter,
+    LLMBackend,
+    LLMParsingError,
+    LLMRequest,
+    LLMResponse,
+)
+from ibdm.nlu.validation import StreamingJSONParser, StreamingValidator
+
+INTERPRETATION = (
+    "```json\n"
+    '{"dialogue_act": "answer", "confidence": 0.9, "utterance": "say \\"yes\\"", '
+    '"semantic_parse": {"value": "mutual", "notes": ["a } inside", {"x": 1}]}}\n'
+    "```"
+)
+
+
+def chunked(text: str, size: int = 5) -> list[str]:
+    return [text[index : index + size] for index in range(0, len(text), size)]
+
+
+class StreamingBackend(LLMBackend):
+    """Backend streaming a fixed completion and counting the chunks consumed."""
+
+    def __init__(self, content: str):
+        self.content = content
+        self.consumed = 0
+
+    def complete(self, request: LLMRequest) -> LLMResponse:
+        raise AssertionError("stream_structured must not wait for the full completion")
+
+    def stream(self, request: LLMRequest) -> Generator[str, None, LLMResponse | None]:
+        for chunk in chunked(self.content):
+            self.consumed += 1
+            yield chunk
+
+
+class TestStreamingJSONParser:
+    """Tests for the incremental parser."""
+
+    def test_fields_complete_in_stream_order(self) -> None:
+        """Each field is reported by the chunk that completes it."""
+        parser = StreamingJSONParser()
+        arrivals: list[tuple[int, str]] = []
+
+        for index, chunk in enumerate(chunked(INTERPRETATION)):
+            arrivals.extend((index, name) for name, _ in parser.feed(chunk))
+
+        assert [name for _, name in arrivals] == [
+            "dialogue_act",
+            "confidence",
+            "utterance",
+            "semantic_parse",
+        ]
+        assert arrivals[0][0] < len(chunked(INTERPRETATION)) // 3
+        assert parser.done and not parser.failed
+        assert parser.fields["utterance"] == 'say "yes"'
+        assert parser.fields["semantic_parse"]["notes"] == ["a } inside", {"x": 1}]
+
+    def test_malformed_stream_fails_early(self) -> None:
+        """A syntax error is reported as soon as it is seen."""
+        parser = StreamingJSONParser()
+
+        parser.feed('{"act": "greet", oops')
+
+        assert parser.failed
+        assert parser.feed('"more": 1}') == []
+
+
+class TestStreamingValidator:
+    """Tests for progressive validation."""
+
+    def test_invalid_field_stops_validation(self) -> None:
+        """A field violating its constraints fails before the object is complete."""
+        validator = StreamingValidator(ContextualInterpretation)
+
+        assert validator.feed('{"dialogue_act": "ask", ') == [("dialogue_act", "ask")]
+        assert validator.feed('"confidence": 1.5, "utterance"') == []
+        assert validator.error is not None and "confidence" in validator.error
+
+    def test_result_requires_complete_object(self) -> None:
+        """The final model is only built from a closed object."""
+        validator = StreamingValidator(ContextualInterpretation)
+        validator.feed('{"dialogue_act": "ask"')
+
+        with pytest.raises(ValueError, match="ended before"):
+            validator.result()
+
+
+class TestStreamStructured:
+    """Tests for LLMAdapter.stream_structured."""
+
+    def test_fields_reach_callback_before_completion(self) -> None:
+        """The callback sees the dialogue act while the rest is still streaming."""
+        backend = StreamingBackend(INTERPRETATION)
+        adapter = LLMAdapter(backend=backend)
+        seen: list[tuple[str, Any, int]] = []
+
+        result = adapter.stream_structured(
+            "Interpret",
+            ContextualInterpretation,
+            on_field=lambda name, value: seen.append((name, value, backend.consumed)),
+        )
+
+        assert result.dialogue_act == "answer"
+        assert seen[0][:2] == ("dialogue_act", "answer")
+        assert seen[0][2] < backend.consumed
+
+    def test_invalid_stream_is_abandoned(self) -> None:
+        """Streaming stops at the first invalid field."""
+        content = '{"confidence": 7, "semantic_parse": {' + '"k": 1, ' * 200 + '"z": 0}}'
+        backend = StreamingBackend(content)
+        adapter = LLMAdapter(backend=backend)
+
+        with pytest.raises(LLMParsingError, match="confidence"):
+            adapter.stream_structured("Interpret", ContextualInterpretation)
+
+        assert backend.consumed < len(chunked(content)) // 10
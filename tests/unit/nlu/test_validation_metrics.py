@@ -0,0 +1,156 @@
+"""Tests for thread-safe, bounded validation metrics."""
+
+import threading
+import time
+
+from ibdm.nlu.llm_telemetry import PrometheusSink
+from ibdm.nlu.validation import (
+    LatencyHistogram,
+    ParseFormat,
+    ParseResult,
+    ValidationMetrics,
+    ValidationResult,
+)
+from ibdm.nlu.validation.metrics import OTHER_KEY
+
+
+def record(
+    metrics: ValidationMetrics,
+    code: str | None = None,
+    validation_id: str | None = None,
+    retry_count: int = 0,
+) -> None:
+    result = ValidationResult(valid=code is None)
+    if code is not None:
+        result.add_error("failed", code=code)
+    parse_result = ParseResult(success=True, format=ParseFormat.JSON)
+    metrics.record_validation(parse_result, result, validation_id, retry_count)
+
+
+class TestLatencyHistogram:
+    """Tests for the log-bucketed histogram."""
+
+    def test_percentiles_within_bucket_error(self) -> None:
+        """Percentiles are within one bucket (~19%) above the true value."""
+        histogram = LatencyHistogram()
+        for millis in range(1, 1001):
+            histogram.record(millis / 1000)
+
+        assert histogram.count == 1000
+        assert 0.5 <= histogram.percentile(0.5) <= 0.5 * 1.19
+        assert 0.95 <= histogram.percentile(0.95) <= 0.95 * 1.19
+        assert histogram.percentile(0.99) <= histogram.max == 1.0
+
+    def test_merge(self) -> None:
+        """Merging adds counts and keeps the larger maximum."""
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(0.01)
+        second.record(2.0)
+
+        first.merge(second)
+
+        assert first.count == 2
+        assert first.max == 2.0
+        assert first.percentile(0.5) < 0.02
+
+
+class TestValidationMetricsConcurrency:
+    """Tests for sharded recording."""
+
+    def test_concurrent_threads_lose_no_updates(self) -> None:
+        """Counts from many threads add up exactly."""
+        metrics = ValidationMetrics()
+
+        def work() -> None:
+            for _ in range(500):
+                validation_id = metrics.start_validation()
+                record(metrics, validation_id=validation_id, retry_count=1)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = metrics.get_stats()
+        assert stats.total_attempts == 4000
+        assert stats.successful == 4000
+        assert stats.retries == 4000
+        assert stats.latency.count == 4000
+        assert stats.formats == {"json": 4000}
+        assert metrics.pending() == 0
+
+    def test_reset_clears_all_shards(self) -> None:
+        """Reset applies to shards of other threads too."""
+        metrics = ValidationMetrics()
+        thread = threading.Thread(target=record, args=(metrics,))
+        thread.start()
+        thread.join()
+        record(metrics)
+
+        metrics.reset()
+
+        assert metrics.stats.total_attempts == 0
+
+    def test_exited_threads_fold_into_one_total(self) -> None:
+        """Shards of finished threads are merged away instead of kept per thread."""
+        metrics = ValidationMetrics()
+        for _ in range(20):
+            thread = threading.Thread(target=record, args=(metrics, "E1"))
+            thread.start()
+            thread.join()
+        record(metrics)
+
+        stats = metrics.get_stats()
+        assert stats.total_attempts == 21
+        assert stats.error_codes == {"E1": 20}
+        assert len(metrics._shards) == 1  # type: ignore[reportPrivateUsage]
+
+        metrics.reset()
+        assert metrics.stats.total_attempts == 0
+
+
+class TestValidationMetricsBounds:
+    """Tests for bounded tables and pending-validation expiry."""
+
+    def test_error_table_is_bounded(self) -> None:
+        """Error codes beyond the limit are counted under OTHER_KEY."""
+        metrics = ValidationMetrics(max_table_keys=3)
+        for index in range(10):
+            record(metrics, code=f"code_{index}")
+
+        error_codes = metrics.stats.error_codes
+        assert len(error_codes) == 4
+        assert error_codes[OTHER_KEY] == 7
+        assert sum(error_codes.values()) == 10
+
+    def test_abandoned_validations_expire(self) -> None:
+        """Validations never recorded are dropped after the TTL and counted."""
+        metrics = ValidationMetrics(pending_ttl=0.2, max_pending=2)
+        metrics.start_validation("a")
+        metrics.start_validation("b")
+        metrics.start_validation("c")  # evicts "a"
+
+        assert metrics.pending() == 2
+        time.sleep(0.25)
+
+        assert metrics.pending() == 0
+        assert metrics.stats.abandoned == 3
+        assert "Abandoned Validations: 3" in metrics.summary()
+
+
+class TestValidationMetricsExport:
+    """Tests for exporting through the telemetry sinks."""
+
+    def test_prometheus_sink_renders_registered_metrics(self) -> None:
+        """A registered tracker is rendered after the LLM call counters."""
+        metrics = ValidationMetrics()
+        record(metrics, validation_id=metrics.start_validation())
+        sink = PrometheusSink()
+        sink.register(metrics)
+
+        text = sink.render()
+
+        assert "ibdm_validation_attempts_total 1" in text
+        assert 'ibdm_validation_latency_seconds{quantile="0.99"}' in text
+        assert "ibdm_validation_latency_seconds_count 1" in text
@@ -189,6 +189,16 @@ class TestDomainModel:
         assert "sorts=1" in repr_str
         assert "plan_builders=1" in repr_str
 
+    def test_state_clone_shares_domain(self):
+        """Test that cloning a state holding the domain does not copy the domain."""
+        from ibdm.core.information_state import InformationState
+
+        domain = DomainModel(name="test_domain")
+        state = InformationState(agent_id="system")
+        state.private.beliefs["domain"] = domain
+
+        assert state.clone().private.beliefs["domain"] is domain
+
 
 class TestDomainTypeChecking:
     """Tests for domain type checking functionality."""
@@ -423,3 +433,45 @@ class TestDomainDominance:
 
         repr_str = repr(domain)
         assert "dominance_functions=2" in repr_str
+
+
+def _plan_for(context: dict) -> Plan:
+    return Plan(plan_type="task", content=context.get("topic"))
+
+
+def _other_plan(context: dict) -> Plan:
+    return Plan(plan_type="other", content=None)
+
+
+class TestDomainFingerprint:
+    """Tests for DomainModel.fingerprint()."""
+
+    def build(self, builder=_plan_for) -> DomainModel:
+        domain = DomainModel(name="test")
+        domain.add_predicate("parties", arity=1, arg_types=["legal_entities"])
+        domain.add_sort("nda_kind", ["mutual", "one-way"])
+        domain.add_dependency("price", ["destination", "date"])
+        domain.register_plan_builder("task", builder)
+        return domain
+
+    def test_equal_domains_have_equal_fingerprints(self):
+        """Domains built the same way match; dependency order does not matter."""
+        other = self.build()
+        other.add_dependency("price", ["date"])
+
+        assert self.build().fingerprint() == other.fingerprint()
+
+    def test_registered_function_code_is_covered(self):
+        """A plan builder with different code gives a different fingerprint."""
+        assert self.build().fingerprint() != self.build(builder=_other_plan).fingerprint()
+
+    def test_mutation_invalidates(self):
+        """add_* and register_* calls recompute the fingerprint."""
+        domain = self.build()
+        before = domain.fingerprint()
+
+        domain.add_sort("nda_kind", ["mutual"])
+        after_sort = domain.fingerprint()
+        domain.register_dominance_function("hotel", lambda p1, p2: True)
+
+        assert len({before, after_sort, domain.fingerprint()}) == 3
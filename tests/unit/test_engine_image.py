@@ -0,0 +1,166 @@
+"""Tests for the prebuilt engine image, frozen rule sets and the prefork worker pool."""
+
+from __future__ import annotations
+
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from ibdm.domains import nda_domain
+from ibdm.domains.registry import get_domain, list_domains
+from ibdm.engine.image import (
+    DEFAULT_RULE_FACTORIES,
+    EngineImage,
+    build_engine_image,
+    build_rule_set,
+)
+from ibdm.engine.prefork import WorkerPool, run_dialogue
+from ibdm.rules import FrozenRuleSet, RuleSet
+
+DIALOGUES = [
+    ("nda_drafting", ["I need to draft an NDA", "Acme Corp and Smith Inc"]),
+    ("travel_booking", ["I want to book a flight"]),
+    ("legal_consultation", ["I have a question about a contract"]),
+]
+
+
+@pytest.fixture(scope="module")
+def image() -> EngineImage:
+    return build_engine_image()
+
+
+class TestRuleSetBuilding:
+    """Tests for bulk rule loading and freezing."""
+
+    def test_add_rules_matches_add_rule_order(self) -> None:
+        """add_rules() produces the same per-phase order as repeated add_rule()."""
+        one_by_one = RuleSet()
+        for factory in DEFAULT_RULE_FACTORIES:
+            for rule in factory():
+                one_by_one.add_rule(rule)
+
+        bulk = build_rule_set(DEFAULT_RULE_FACTORIES)
+
+        assert bulk.rule_count() == one_by_one.rule_count()
+        for rule_type, rules in one_by_one.rules.items():
+            assert [r.name for r in bulk.get_rules(rule_type)] == [r.name for r in rules]
+
+    def test_frozen_rule_set_rejects_mutation(self) -> None:
+        """Frozen rule sets raise TypeError on every mutation."""
+        frozen = build_rule_set().freeze()
+        rule = next(iter(frozen.rules.values()))[0]
+
+        assert isinstance(frozen, FrozenRuleSet)
+        assert frozen.freeze() is frozen
+        with pytest.raises(TypeError, match="immutable"):
+            frozen.add_rule(rule)
+        with pytest.raises(TypeError, match="immutable"):
+            frozen.add_rules([rule])
+        with pytest.raises(TypeError, match="immutable"):
+            frozen.remove_rule(rule.name)
+        with pytest.raises(TypeError, match="immutable"):
+            frozen.clear_rules()
+
+    def test_frozen_rules_are_read_only(self) -> None:
+        """The per-phase rules cannot be edited in place, so the fingerprint stays valid."""
+        frozen = build_rule_set().freeze()
+        fingerprint = frozen.fingerprint()
+        rules = frozen.rules["integration"]
+
+        with pytest.raises(AttributeError):
+            rules.append(rules[0])  # type: ignore[attr-defined]
+        with pytest.raises(TypeError):
+            frozen.rules["integration"] = ()  # type: ignore[index]
+
+        restored = pickle.loads(pickle.dumps(frozen))
+        with pytest.raises(TypeError):
+            restored.rules["integration"] = ()  # type: ignore[index]
+        assert restored.fingerprint() == fingerprint
+
+    def test_freeze_copies_rules(self) -> None:
+        """Mutating the source RuleSet after freeze() leaves the frozen copy alone."""
+        source = build_rule_set()
+        frozen = source.freeze()
+        count = frozen.rule_count()
+
+        source.clear_rules()
+
+        assert frozen.rule_count() == count
+
+
+class TestEngineImage:
+    """Tests for building, pickling and installing engine images."""
+
+    def test_image_contains_all_domains(self, image: EngineImage) -> None:
+        """The default image holds every built-in domain singleton."""
+        assert sorted(image.domains) == list_domains()
+        assert image.domain("nda_drafting") is get_domain("nda_drafting")
+        with pytest.raises(KeyError, match="not in engine image"):
+            image.domain("unknown")
+
+    def test_unknown_registry_domain(self) -> None:
+        """The registry rejects names that are not built-in domains."""
+        with pytest.raises(ValueError, match="Unknown domain"):
+            get_domain("unknown")
+
+    def test_pickled_image_serves_dialogues(self, image: EngineImage) -> None:
+        """An unpickled image runs dialogues exactly like the original."""
+        copy = pickle.loads(pickle.dumps(image))
+
+        assert copy.rules.rule_count() == image.rules.rule_count()
+        for job in DIALOGUES:
+            original = run_dialogue(image, job)
+            restored = run_dialogue(copy, job)
+            assert restored.responses == original.responses
+            assert restored.commitments == original.commitments
+
+    def test_fingerprint_is_stable_across_processes(self, image: EngineImage) -> None:
+        """A pickled image and a fresh interpreter's image have the same fingerprint."""
+        script = "from ibdm.engine.image import build_engine_image as b; print(b().fingerprint())"
+        fresh = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+
+        assert pickle.loads(pickle.dumps(image)).fingerprint() == image.fingerprint()
+        assert fresh.stdout.strip() == image.fingerprint()
+
+    def test_install_replaces_domain_singleton(self, image: EngineImage) -> None:
+        """install() makes the image's domains the process singletons."""
+        original = nda_domain.get_nda_domain()
+        copy = pickle.loads(pickle.dumps(image))
+        try:
+            copy.install()
+            assert nda_domain.get_nda_domain() is copy.domain("nda_drafting")
+        finally:
+            nda_domain._nda_domain = original  # type: ignore[attr-defined]
+
+    def test_nlu_image_precomputes_schemas(self) -> None:
+        """Images built with NLU carry templates and structured-output schemas."""
+        from ibdm.nlg.nlg_result import StructuredNLGResponse
+        from ibdm.nlu.llm_adapter import schema_instruction
+
+        nlu_image = build_engine_image(domains=["nda_drafting"], include_nlu=True)
+
+        assert list(nlu_image.domains) == ["nda_drafting"]
+        assert nlu_image.templates
+        assert nlu_image.schemas["StructuredNLGResponse"] == schema_instruction(
+            StructuredNLGResponse
+        )
+
+
+class TestWorkerPool:
+    """Tests for serving dialogues from worker processes."""
+
+    @pytest.mark.parametrize("start_method", ["fork", "spawn"])
+    def test_pool_matches_in_process(self, image: EngineImage, start_method: str) -> None:
+        """Workers produce the same results as running in-process."""
+        expected = [run_dialogue(image, job) for job in DIALOGUES]
+
+        with WorkerPool(image, workers=2, start_method=start_method) as pool:
+            results = pool.run_dialogues(DIALOGUES)
+
+        assert pool.spin_up_seconds > 0
+        assert [r.responses for r in results] == [r.responses for r in expected]
+        assert [r.commitments for r in results] == [r.commitments for r in expected]
@@ -0,0 +1,71 @@
+"""Cold-start import budget for the core packages.
+
+Each check runs a fresh interpreter with ``-X importtime`` so module caches
+from the test session do not hide slow imports.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time budget per package, in microseconds. Cold start is
+# ~20-30ms on a laptop; the budget leaves headroom for slow CI machines while
+# still catching an accidental litellm import (seconds).
+IMPORT_BUDGET_US = {
+    "ibdm.core": 500_000,
+    "ibdm.rules": 500_000,
+    "ibdm.engine": 500_000,
+}
+
+# Heavy optional dependencies the core engine must not load
+HEAVY_MODULES = ("litellm", "openai", "rich", "graphviz", "burr")
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Import a module in a fresh interpreter and return cumulative times (us)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestImportTime:
+    """Tests that core packages start fast and stay free of heavy dependencies."""
+
+    @pytest.mark.parametrize("module", sorted(IMPORT_BUDGET_US))
+    def test_cold_start_within_budget(self, module: str) -> None:
+        """Cold import of each core package stays within its budget."""
+        times = _import_times(module)
+        assert times[module] < IMPORT_BUDGET_US[module], (
+            f"import {module} took {times[module] / 1000:.0f}ms "
+            f"(budget {IMPORT_BUDGET_US[module] / 1000:.0f}ms)"
+        )
+
+    @pytest.mark.parametrize("module", sorted(IMPORT_BUDGET_US))
+    def test_no_heavy_dependencies(self, module: str) -> None:
+        """Core packages do not import litellm, rich, graphviz or burr."""
+        loaded = {name.split(".")[0] for name in _import_times(module)}
+        assert not loaded & set(HEAVY_MODULES)
+
+    def test_lazy_exports_resolve(self) -> None:
+        """Lazily exported names resolve to their defining objects."""
+        import ibdm.engine
+        import ibdm.nlu
+        from ibdm.engine.nlu_engine import NLUDialogueEngine
+        from ibdm.nlu.answer_parser import create_parser
+
+        assert ibdm.engine.NLUDialogueEngine is NLUDialogueEngine
+        assert ibdm.nlu.create_answer_parser is create_parser
+        assert "NLUDialogueEngine" in dir(ibdm.engine)
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            _ = ibdm.nlu.missing  # type: ignore[attr-defined]
@@ -0,0 +1,53 @@
+"""Tests for the interactive scenario explorer CLI."""
+
+import builtins
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from ibdm.demo.interactive_explorer import InteractiveExplorerCLI
+
+
+class TestInteractiveExplorerCLI:
+    """Tests for running chosen moves through the profiled engine."""
+
+    def test_step_records_real_rule_evaluations(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A user move runs the engine and its rule traces reach the explorer."""
+        # Incremental Questioning, first choice, continue, then quit
+        answers: Iterator[str] = iter(["1", "1", "", "/quit"])
+        monkeypatch.setattr(builtins, "input", lambda prompt="": next(answers))
+
+        cli = InteractiveExplorerCLI()
+        cli.run()
+
+        explorer = cli.explorer
+        assert explorer is not None and cli.engine is not None
+        assert explorer.profiler is cli.engine.rules.profiler is not None
+        assert explorer.state is cli.state
+        # "I need to draft an NDA" was integrated by the real rules
+        assert cli.state is not None
+        assert [str(q) for q in cli.state.shared.qud] == ["?parties.legal_entities"]
+        traces = [t for t in explorer.rule_traces if t.label.startswith("After user move")]
+        assert {t.phase for t in traces} >= {"interpretation", "integration"}
+        assert all(t.evaluations for t in traces)
+        assert any(t.selected_rule for t in traces)
+
+    def test_reports_go_to_report_dir_and_are_closed(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """HTML reports are written under report_dir and the timeline is finished on exit."""
+        answers: Iterator[str] = iter(["1", "/state", "/state", "/quit"])
+        monkeypatch.setattr(builtins, "input", lambda prompt="": next(answers))
+        workdir = tmp_path / "cwd"
+        workdir.mkdir()
+        monkeypatch.chdir(workdir)
+
+        cli = InteractiveExplorerCLI(report_dir=tmp_path / "reports")
+        cli.run()
+
+        assert not (workdir / "ibdm_timeline").exists()
+        assert not list(workdir.glob("*.html"))
+        index = (tmp_path / "reports" / "timeline" / "index.html").read_text()
+        assert "turns 1&ndash;2" in index
+        assert list((tmp_path / "reports").glob("trace_turn_*.html"))
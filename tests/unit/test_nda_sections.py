@@ -0,0 +1,168 @@
+"""Tests for sectioned, clause-cached NDA generation."""
+
+import asyncio
+from dataclasses import replace
+
+import pytest
+
+from ibdm.nlu.llm_adapter import LLMBackend, LLMRequest, LLMResponse
+from ibdm.nlu.llm_telemetry import LLMTelemetry, MemorySink, set_telemetry, telemetry_session
+from ibdm.services.nda_generator import NDAGenerator, NDAParameters
+from ibdm.services.nda_sections import NDA_SECTIONS, ClauseCache, get_section
+
+PARAMS = NDAParameters(
+    parties=["Acme Corp", "Global Industries"],
+    nda_type="mutual",
+    effective_date="February 1, 2025",
+    duration="3 years",
+    jurisdiction="Delaware",
+)
+
+
+class SectionBackend(LLMBackend):
+    """Stand-in backend that drafts each section after a delay, later sections first."""
+
+    def __init__(self):
+        self.prompts: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def complete(self, request: LLMRequest) -> LLMResponse:
+        raise AssertionError("sections must be drafted asynchronously")
+
+    async def acomplete(self, request: LLMRequest) -> LLMResponse:
+        prompt = request.messages[-1]["content"]
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001 * (len(NDA_SECTIONS) - len(self.prompts)))
+        self.in_flight -= 1
+        return LLMResponse(
+            content=f"Clause for: {prompt.splitlines()[0]}",
+            model=request.model,
+            tokens_used=10,
+            prompt_tokens=6,
+            completion_tokens=4,
+        )
+
+
+@pytest.fixture
+def backend() -> SectionBackend:
+    return SectionBackend()
+
+
+@pytest.fixture
+def generator(backend: SectionBackend) -> NDAGenerator:
+    return NDAGenerator(backend=backend, cache=ClauseCache())
+
+
+class TestSectionSpecs:
+    """Tests for section prompts and cache keys."""
+
+    def test_prompt_shows_only_relevant_parameters(self) -> None:
+        """A section prompt mentions the parameters it depends on and no others."""
+        prompt = get_section("governing_law").build_prompt(PARAMS)
+
+        assert "Delaware" in prompt
+        assert "3 years" not in prompt
+        assert "Acme Corp" not in prompt
+
+    def test_cache_key_depends_only_on_relevant_parameters(self) -> None:
+        """Changing the jurisdiction changes the governing-law key only."""
+        moved = replace(PARAMS, jurisdiction="California")
+
+        changed = [
+            section.name
+            for section in NDA_SECTIONS
+            if section.cache_key(PARAMS, "m", 0.3) != section.cache_key(moved, "m", 0.3)
+        ]
+
+        assert changed == ["governing_law"]
+
+
+class TestSectionedGeneration:
+    """Tests for concurrent drafting, in-order streaming and clause reuse."""
+
+    def test_sections_stream_in_document_order(
+        self, generator: NDAGenerator, backend: SectionBackend
+    ) -> None:
+        """Sections are drafted concurrently but yielded in document order."""
+        sections = list(generator.stream_nda(PARAMS))
+
+        expected = [section.name for section in NDA_SECTIONS if section.included(PARAMS)]
+        assert [section.name for section in sections] == expected
+        assert backend.max_in_flight == len(expected)
+        assert sections[0].render().startswith("Clause for: Draft the Preamble")
+        assert sections[2].render().startswith("## 1. Definitions\n\n")
+
+    def test_generate_nda_assembles_document(self, generator: NDAGenerator) -> None:
+        """The full document has a title and every section heading."""
+        document = generator.generate_nda(PARAMS)
+
+        assert document.startswith("# Non-Disclosure Agreement\n\n")
+        assert "## 6. Governing Law and Jurisdiction" in document
+        assert "Additional Terms" not in document
+        assert document.rstrip().endswith(
+            "Signatures of a Non-Disclosure Agreement (an unnumbered part)."
+        )
+
+    def test_redraft_regenerates_changed_clause_only(
+        self, generator: NDAGenerator, backend: SectionBackend
+    ) -> None:
+        """After a jurisdiction change only the governing-law section is requested."""
+        generator.generate_nda(PARAMS)
+        drafted = len(backend.prompts)
+
+        moved = replace(PARAMS, jurisdiction="California")
+        sections = list(generator.stream_nda(moved))
+
+        assert len(backend.prompts) == drafted + 1
+        assert "California" in backend.prompts[-1]
+        assert [section.name for section in sections if not section.cached] == ["governing_law"]
+        assert generator.cache.info()["hits"] == len(sections) - 1
+
+    def test_additional_terms_section(self, generator: NDAGenerator) -> None:
+        """Additional terms add their own numbered section."""
+        params = replace(PARAMS, additional_terms={"non_solicit": True})
+
+        names = [section.name for section in generator.stream_nda(params)]
+
+        assert names[-2:] == ["additional_terms", "signatures"]
+
+    def test_validation_and_failures(self, backend: SectionBackend) -> None:
+        """Missing parties raise ValueError; drafting failures are wrapped."""
+        generator = NDAGenerator(backend=backend, cache=ClauseCache())
+        with pytest.raises(ValueError, match="two parties"):
+            generator.generate_nda(replace(PARAMS, parties=["Acme"]))
+
+        async def fail(request: LLMRequest) -> LLMResponse:
+            raise RuntimeError("timeout")
+
+        backend.acomplete = fail  # type: ignore[method-assign]
+        with pytest.raises(Exception, match="NDA generation failed: timeout"):
+            generator.generate_nda(PARAMS)
+
+    def test_section_requests_report_telemetry(self, backend: SectionBackend) -> None:
+        """Every drafted section, and every failed one, is an nda_generator event."""
+        generator = NDAGenerator(backend=backend, cache=ClauseCache())
+        telemetry = LLMTelemetry([MemorySink()])
+        previous = set_telemetry(telemetry)
+        try:
+            with telemetry_session("nda-1"):
+                sections = list(generator.stream_nda(PARAMS))
+
+            drafted = telemetry.by_component()["nda_generator"]
+            assert drafted.calls == len(sections)
+            assert drafted.prompt_tokens == 6 * len(sections)
+            assert drafted.completion_tokens == 4 * len(sections)
+            assert telemetry.by_session()["nda-1"].calls == len(sections)
+
+            async def fail(request: LLMRequest) -> LLMResponse:
+                raise RuntimeError("timeout")
+
+            backend.acomplete = fail  # type: ignore[method-assign]
+            with pytest.raises(Exception, match="timeout"):
+                generator.generate_nda(replace(PARAMS, jurisdiction="California"))
+            assert telemetry.by_component()["nda_generator"].errors == 1
+        finally:
+            set_telemetry(previous)
@@ -159,8 +159,8 @@ class TestDialogueHistoryInPrompts:
         config = NLGEngineConfig(default_strategy="template")
         return NLGEngine(config)
 
-    def test_system_prompt_includes_dialogue_history(self, engine):
-        """Test that system prompt includes dialogue history."""
+    def test_context_includes_dialogue_history(self, engine):
+        """Test that the prompt context includes dialogue history."""
         # Create state with dialogue history
         moves = [
             DialogueMove(move_type="greet", content="Hello", speaker="user"),
@@ -171,37 +171,31 @@ class TestDialogueHistoryInPrompts:
             shared=SharedIS(moves=moves),
         )
 
-        # Create a move to generate
-        move = DialogueMove(
-            move_type="ask", content=WhQuestion(variable="x", predicate="name"), speaker="system"
-        )
-
         # Build prompt
-        prompt = engine._build_nlg_system_prompt(move, state)
+        prompt = engine._build_nlg_context(state)
 
         # Should include dialogue history section
         assert "Dialogue history:" in prompt
         assert "User: greet" in prompt
         assert "System: greet" in prompt
 
-    def test_system_prompt_without_dialogue_history(self, engine):
-        """Test system prompt when there's no dialogue history."""
+    def test_context_without_dialogue_history(self, engine):
+        """Test prompt context when there's no dialogue history."""
         # Create state without dialogue history
         state = InformationState(
             private=PrivateIS(),
             shared=SharedIS(moves=[]),
         )
 
-        move = DialogueMove(move_type="greet", content="Hello", speaker="system")
-
         # Build prompt
-        prompt = engine._build_nlg_system_prompt(move, state)
+        prompt = engine._build_nlg_context(state)
 
         # Should NOT include dialogue history section
         assert "Dialogue history:" not in prompt
+        assert prompt == ""
 
-    def test_system_prompt_includes_all_context(self, engine):
-        """Test that system prompt includes dialogue history + QUD + plans."""
+    def test_context_includes_all_context(self, engine):
+        """Test that prompt context includes dialogue history + QUD + plans."""
         # Create comprehensive state
         moves = [
             DialogueMove(move_type="greet", content="Hello", speaker="user"),
@@ -215,15 +209,19 @@ class TestDialogueHistoryInPrompts:
             shared=SharedIS(moves=moves, qud=qud),
         )
 
-        move = DialogueMove(
-            move_type="ask", content=WhQuestion(variable="y", predicate="date"), speaker="system"
-        )
-
         # Build prompt
-        prompt = engine._build_nlg_system_prompt(move, state)
+        prompt = engine._build_nlg_context(state)
 
         # Should include all context
         assert "Dialogue history:" in prompt
         assert "Current questions under discussion:" in prompt
         assert "Active plans:" in prompt
         assert "nda_drafting" in prompt
+
+    def test_system_prompt_is_static(self, engine):
+        """Test that dialogue state stays out of the cacheable system prompt."""
+        system_prompt = engine._build_nlg_system_prompt()
+
+        assert "natural language generation" in system_prompt
+        assert "Dialogue history:" not in system_prompt
+        assert system_prompt == engine._build_nlg_system_prompt()
@@ -0,0 +1,247 @@
+"""Tests for PathExplorer beam search, transposition table, frontier and engine simulation."""
+
+from __future__ import annotations
+
+import pytest
+
+from ibdm.demo.path_explorer import (
+    BoundedFrontier,
+    PathExplorer,
+    PathNode,
+    generate_exploration_report,
+)
+from ibdm.demo.path_simulation import EngineSimulator, decode_state, encode_state
+from ibdm.demo.scenario_explorer import ChoiceOption, MoveCategory
+from ibdm.demo.scenarios import get_scenario
+from ibdm.domains.nda_domain import get_nda_domain
+
+
+def _node(score: float = 0.0, commitments: set[str] | None = None) -> PathNode:
+    return PathNode(
+        depth=1,
+        step_index=2,
+        user_turn_index=1,
+        choice_made=_choice(1),
+        state_snapshot={"commitments": commitments or set(), "qud_size": 0, "issues_size": 0},
+        parent=None,
+        path_id="1",
+        score=score,
+    )
+
+
+def _choice(choice_id: int) -> ChoiceOption:
+    return ChoiceOption(
+        id=choice_id,
+        category=MoveCategory.EXPECTED,
+        utterance=f"choice {choice_id}",
+        description="",
+        expected_trajectory="",
+    )
+
+
+class TestBoundedFrontier:
+    """Tests for the incremental bounded frontier."""
+
+    def test_pops_best_first(self) -> None:
+        """Nodes come out in descending score order."""
+        frontier = BoundedFrontier(capacity=10)
+        for score in [3.0, 1.0, 5.0, 2.0]:
+            frontier.push(_node(score), score)
+
+        assert [frontier.pop().score for _ in range(4)] == [5.0, 3.0, 2.0, 1.0]
+        assert len(frontier) == 0
+
+    def test_evicts_worst_when_full(self) -> None:
+        """Pushing past capacity evicts the lowest-scoring entries."""
+        frontier = BoundedFrontier(capacity=2)
+        evicted = sum(frontier.push(_node(score), score) for score in [1.0, 4.0, 3.0, 0.5])
+
+        assert evicted == 2
+        assert len(frontier) == 2
+        assert sorted(node.score for node in frontier) == [3.0, 4.0]
+        assert frontier.pop().score == 4.0
+
+    def test_repush_replaces_entry(self) -> None:
+        """Re-pushing a queued node updates its priority without a duplicate entry."""
+        frontier = BoundedFrontier(capacity=2)
+        improved, other = _node(1.0), _node(2.0)
+        frontier.push(improved, 1.0)
+        frontier.push(other, 2.0)
+
+        assert frontier.push(improved, 3.0) == 0
+        assert len(frontier) == 2
+        assert frontier.pop() is improved
+        assert frontier.pop() is other
+        with pytest.raises(IndexError):
+            frontier.pop()
+
+    def test_pop_empty_raises(self) -> None:
+        """Popping an empty frontier raises IndexError."""
+        with pytest.raises(IndexError):
+            BoundedFrontier(capacity=1).pop()
+
+
+class TestPathNode:
+    """Tests for PathNode signatures and merging."""
+
+    def test_signature_is_cached(self) -> None:
+        """The state signature is computed once."""
+        node = _node(commitments={"a"})
+        assert node.get_state_signature() is node.get_state_signature()
+
+    def test_merge_keeps_best_score(self) -> None:
+        """A better converging path becomes primary before expansion."""
+        parent_a, parent_b = _node(), _node()
+        node = _node(score=10.0)
+        node.parent = parent_a
+
+        assert not node.merge(parent_b, _choice(2), 5.0, "2")
+        assert node.score == 10.0 and node.parent is parent_a
+
+        assert node.merge(parent_b, _choice(3), 20.0, "3")
+        assert node.score == 20.0 and node.parent is parent_b and node.path_id == "3"
+        assert node.path_count == 3
+
+    def test_merge_after_expansion_only_records(self) -> None:
+        """Once expanded, better paths are recorded but do not replace the primary."""
+        node = _node(score=10.0)
+        node.parent = _node()
+        node.expanded = True
+
+        assert not node.merge(_node(), _choice(2), 50.0, "2")
+        assert node.score == 10.0
+        assert node.merged_parents[-1][2] == 50.0
+
+
+class TestPathExplorer:
+    """Tests for beam search over the scenario DAG."""
+
+    def test_converged_states_expanded_once(self) -> None:
+        """Each (position, depth, state) is expanded at most once."""
+        explorer = PathExplorer(get_scenario("incremental"), get_nda_domain())
+        result = explorer.explore_paths(max_depth=5)
+
+        all_nodes = [node for nodes in result.paths_by_depth.values() for node in nodes]
+        keys = [node.transposition_key() for node in all_nodes]
+        assert len(keys) == len(set(keys))
+
+        metrics = result.beam_metrics
+        assert metrics["total_merged"] > 0
+        assert metrics["total_generated"] == result.total_paths - 1 + metrics["total_merged"]
+        assert sum(len(node.merged_parents) for node in all_nodes) == metrics["total_merged"]
+
+    def test_deep_exploration(self) -> None:
+        """Exploring to depth 10 stays small and reaches every user turn."""
+        scenario = get_scenario("incremental")
+        user_turns = sum(1 for step in scenario.steps if step.speaker == "user")
+
+        result = PathExplorer(scenario, get_nda_domain()).explore_paths(max_depth=10)
+
+        assert max(result.paths_by_depth) == user_turns
+        assert result.beam_metrics["total_generated"] < 1000
+
+    def test_coverage_counts_merged_choices(self) -> None:
+        """Coverage includes choices whose paths were merged."""
+        result = PathExplorer(get_scenario("incremental"), get_nda_domain()).explore_paths(
+            max_depth=3
+        )
+        assert result.coverage_metrics["total_choices"] == result.beam_metrics["total_generated"]
+
+    def test_report_mentions_merges(self) -> None:
+        """The text report includes transposition statistics."""
+        result = PathExplorer(get_scenario("incremental"), get_nda_domain()).explore_paths(
+            max_depth=3
+        )
+        report = generate_exploration_report(result)
+        assert "Paths merged (converged)" in report
+        assert "paths converge" in report
+
+
+def _explored(result) -> list[tuple[str, float, frozenset[tuple[str, object]]]]:
+    return [
+        (node.path_id, node.score, node.get_state_signature())
+        for depth in sorted(result.paths_by_depth)
+        for node in result.paths_by_depth[depth]
+    ]
+
+
+class TestEngineSimulation:
+    """Tests for exploring with the real dialogue engine."""
+
+    def test_state_encoding_round_trip(self) -> None:
+        """Encoded states decode to the same dialogue state with the domain re-attached."""
+        simulator = EngineSimulator("nda_drafting")
+        encoded, _ = simulator.simulate(simulator.initial_state(), "I need to draft an NDA")
+
+        state = decode_state(encoded)
+        assert state.private.beliefs["domain"] is get_nda_domain()
+        assert [str(q) for q in state.shared.qud] == ["?parties.legal_entities"]
+        assert encode_state(state) == encoded
+
+    def test_simulator_follows_scenario(self) -> None:
+        """Running the expected utterances fills the NDA plan through the real rules."""
+        simulator = EngineSimulator("nda_drafting")
+        state = simulator.initial_state()
+        snapshot: dict[str, object] = {}
+        for step in get_scenario("incremental").steps:
+            if step.speaker == "user":
+                state, snapshot = simulator.simulate(state, step.utterance)
+
+        assert "jurisdiction(California)" in snapshot["commitments"]  # type: ignore[operator]
+        assert snapshot["qud_size"] == 0 and snapshot["issues_size"] == 0
+
+    def test_engine_mode_tracks_real_state(self) -> None:
+        """Engine-mode nodes carry encoded states and real QUD/issue counts."""
+        explorer = PathExplorer(
+            get_scenario("incremental"), get_nda_domain(), simulation="engine", expected_only=True
+        )
+        result = explorer.explore_paths(max_depth=2)
+
+        node = result.paths_by_depth[2][0]
+        assert node.engine_state is not None
+        assert node.state_snapshot["commitments"] == {"legal_entities(Acme Corp and Smith Inc)"}
+        assert node.state_snapshot["issues_size"] == 3
+        assert result.beam_metrics["simulation"] == "engine"
+        assert result.beam_metrics["avg_state_bytes"] > 0
+
+    def test_engine_mode_records_rule_traces(self) -> None:
+        """In-process simulation feeds the explorer real rule evaluations per choice."""
+        explorer = PathExplorer(
+            get_scenario("incremental"), get_nda_domain(), simulation="engine", expected_only=True
+        )
+        explorer.explore_paths(max_depth=1)
+
+        assert explorer.explorer is not None
+        traces = [t for t in explorer.explorer.rule_traces if t.label.startswith("root → ")]
+        assert {t.phase for t in traces} >= {"interpretation", "integration"}
+        assert all(t.evaluations for t in traces)
+        assert any(t.selected_rule for t in traces)
+        assert all(t.state_before is not None and t.state_before.label == "root" for t in traces)
+
+    def test_trace_rules_off_leaves_engine_unprofiled(self) -> None:
+        """Rule tracing can be turned off for faster in-process exploration."""
+        explorer = PathExplorer(
+            get_scenario("incremental"),
+            get_nda_domain(),
+            simulation="engine",
+            expected_only=True,
+            trace_rules=False,
+        )
+        explorer.explore_paths(max_depth=1)
+
+        assert explorer.explorer is not None and explorer.explorer.profiler is None
+        assert all(not t.evaluations for t in explorer.explorer.rule_traces)
+
+    def test_process_pool_matches_in_process(self) -> None:
+        """Worker processes produce the same tree as in-process simulation."""
+        scenario, domain = get_scenario("incremental"), get_nda_domain()
+        serial = PathExplorer(scenario, domain, simulation="engine").explore_paths(max_depth=2)
+        parallel = PathExplorer(scenario, domain, simulation="engine", workers=2).explore_paths(
+            max_depth=2
+        )
+        assert _explored(parallel) == _explored(serial)
+
+    def test_unknown_simulation_mode(self) -> None:
+        """Unknown simulation modes are rejected."""
+        with pytest.raises(ValueError, match="Unknown simulation mode"):
+            PathExplorer(get_scenario("incremental"), get_nda_domain(), simulation="llm")
@@ -0,0 +1,124 @@
+"""Tests for headless regression runs against golden traces."""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from ibdm.demo import regression
+from ibdm.demo.regression import (
+    ERROR,
+    FAILED,
+    MISSING,
+    PASSED,
+    SKIPPED,
+    UPDATED,
+    read_trace,
+    run_regression,
+    source_fingerprint,
+)
+from ibdm.demo.scenario_loader import ScenarioLoader
+
+
+def copy_scenarios(directory: Path, *scenario_ids: str) -> Path:
+    scenarios = directory / "scenarios"
+    scenarios.mkdir()
+    for scenario_id in scenario_ids:
+        shutil.copy(ScenarioLoader().scenarios_dir / f"{scenario_id}.json", scenarios)
+    return scenarios
+
+
+class TestRunRegression:
+    """Tests for golden comparison and green-run caching."""
+
+    def test_golden_round_trip_and_mismatch(self, tmp_path: Path) -> None:
+        """Recorded traces pass; an edited golden trace is reported turn by turn."""
+        scenarios = copy_scenarios(tmp_path, "nda_basic", "nda_volunteer")
+        golden = tmp_path / "golden"
+        options = {"scenarios_dir": scenarios, "golden_dir": golden, "cache_path": None}
+
+        recorded = run_regression(update_golden=True, workers=2, **options)
+        passed = run_regression(workers=2, **options)
+
+        assert [o.status for o in recorded.outcomes] == [UPDATED, UPDATED]
+        assert passed.ok and passed.count(PASSED) == 2
+
+        trace = read_trace(golden / "nda_basic.jsonl")
+        trace[0]["qud_top"] = "something else"
+        (golden / "nda_basic.jsonl").write_text("\n".join(json.dumps(r) for r in trace))
+        (golden / "nda_volunteer.jsonl").unlink()
+
+        report = run_regression(workers=1, **options)
+
+        assert not report.ok
+        assert [o.status for o in report.outcomes] == [FAILED, MISSING]
+        assert report.outcomes[0].mismatches[0].startswith("turn 1: qud_top is")
+        assert "nda_basic (failed)" in report.summary()
+
+    def test_unchanged_inputs_are_skipped(self, tmp_path: Path) -> None:
+        """Green scenarios are skipped until their scenario file changes."""
+        scenarios = copy_scenarios(tmp_path, "nda_basic", "nda_volunteer")
+        options = {
+            "scenarios_dir": scenarios,
+            "golden_dir": tmp_path / "golden",
+            "cache_path": tmp_path / "cache.json",
+            "workers": 1,
+        }
+        run_regression(update_golden=True, **options)
+
+        assert run_regression(**options).count(SKIPPED) == 2
+
+        path = scenarios / "nda_volunteer.json"
+        path.write_text(path.read_text().replace('"turn": 1', '"turn": 1, "extra": 1', 1))
+        rerun = run_regression(**options)
+
+        assert [o.status for o in rerun.outcomes] == [SKIPPED, PASSED]
+
+    def test_engine_source_change_reruns_scenarios(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Editing engine code outside the rules and domains invalidates green runs."""
+        scenarios = copy_scenarios(tmp_path, "nda_basic")
+        options = {
+            "scenarios_dir": scenarios,
+            "golden_dir": tmp_path / "golden",
+            "cache_path": tmp_path / "cache.json",
+            "workers": 1,
+        }
+        run_regression(update_golden=True, **options)
+        assert run_regression(**options).count(SKIPPED) == 1
+
+        monkeypatch.setattr(regression, "source_fingerprint", lambda: "edited helper")
+
+        assert run_regression(**options).count(PASSED) == 1
+
+    def test_source_fingerprint_covers_every_module(self, tmp_path: Path) -> None:
+        """The source digest changes when any module in the package changes."""
+        package = tmp_path / "package"
+        (package / "nlu").mkdir(parents=True)
+        (package / "__init__.py").write_text("")
+        helper = package / "nlu" / "features.py"
+        helper.write_text("def extract_features(text):\n    return text.split()\n")
+        before = source_fingerprint(package)
+
+        assert source_fingerprint(package) == before
+        helper.write_text("def extract_features(text):\n    return text.lower().split()\n")
+        assert source_fingerprint(package) != before
+
+    def test_broken_scenario_is_an_error(self, tmp_path: Path) -> None:
+        """A scenario that fails to load is reported and never cached as green."""
+        scenarios = tmp_path / "scenarios"
+        scenarios.mkdir()
+        (scenarios / "broken.json").write_text("{")
+        options = {
+            "scenarios_dir": scenarios,
+            "golden_dir": tmp_path / "golden",
+            "cache_path": tmp_path / "cache.json",
+        }
+
+        report = run_regression(**options)
+
+        assert report.outcomes[0].status == ERROR
+        assert "Invalid JSON" in (report.outcomes[0].error or "")
+        assert json.loads((tmp_path / "cache.json").read_text()) == {}
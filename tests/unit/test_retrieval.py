@@ -0,0 +1,205 @@
+"""Tests for the BM25 retrieval index, document loading and the retrieval device."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ibdm.core import InformationState
+from ibdm.core.actions import Action, ActionType
+from ibdm.domains.legal_domain import create_legal_rag_device
+from ibdm.domains.nda_domain import create_nda_rag_device, execute_nda_rag_query
+from ibdm.interfaces import ActionStatus
+from ibdm.retrieval import (
+    BM25Index,
+    Document,
+    build_index,
+    load_documents,
+    relevance_ranked,
+    tokenize,
+)
+from ibdm.rules.action_rules import _execute_action  # type: ignore[reportPrivateUsage]
+
+DOCUMENTS = [
+    Document("d0", "Confidentiality period", "The confidentiality period lasts five years."),
+    Document("d1", "Governing law", "Delaware law governs this agreement.", {"tags": ["law"]}),
+    Document("d2", "Exclusions", "Public information is excluded from confidentiality."),
+]
+
+
+def _guidance_action(topic: str) -> Action:
+    return Action(
+        action_type=ActionType.GET, name="query_nda_guidance", parameters={"topic": topic}
+    )
+
+
+class TestBM25Index:
+    """Tests for tokenizing, ranking, caching and the on-disk format."""
+
+    def test_tokenize(self) -> None:
+        """Tokens are lowercased, split on underscores, stopword-free and singular."""
+        assert tokenize("The governing_law Exclusions") == ["governing", "law", "exclusion"]
+
+    def test_ranking(self) -> None:
+        """Documents are ranked by BM25 and non-matching documents are omitted."""
+        index = BM25Index.from_documents(DOCUMENTS)
+
+        hits = index.search("confidentiality period")
+
+        assert [hit.document.doc_id for hit in hits] == ["d0", "d2"]
+        assert hits[0].score > hits[1].score
+        assert [hit.rank for hit in hits] == [0, 1]
+        assert index.search("governing law", top_k=1)[0].document.doc_id == "d1"
+        assert index.search("unrelated words") == []
+
+    def test_relevance_requires_query_coverage(self) -> None:
+        """Hits matching too few query terms score zero instead of normalizing to 1.0."""
+        index = BM25Index.from_documents(DOCUMENTS)
+
+        hits = index.search("confidentiality period")
+        assert [hit.coverage for hit in hits] == [1.0, 0.5]
+        assert [doc["relevance_score"] for doc in relevance_ranked(hits, 1.0)] == [1.0, 0.0]
+
+        unrelated = index.search("controlling law statute")
+        assert [doc["relevance_score"] for doc in relevance_ranked(unrelated)] == [1.0]
+        assert [doc["relevance_score"] for doc in relevance_ranked(unrelated, 0.5)] == [0.0]
+
+    def test_query_cache(self) -> None:
+        """Repeated queries are served from the LRU cache."""
+        index = BM25Index.from_documents(DOCUMENTS, cache_size=1)
+
+        first = index.search("confidentiality")
+        assert index.search("Confidentiality!") == first
+        index.search("law")
+        index.search("confidentiality")
+
+        assert index.cache_info() == {"hits": 1, "misses": 3, "size": 1, "maxsize": 1}
+
+    def test_save_and_load_memory_mapped(self, tmp_path: Path) -> None:
+        """A saved index loads memory-mapped and ranks identically."""
+        index = BM25Index.from_documents(DOCUMENTS)
+        path = tmp_path / "docs.bm25"
+        index.save(path)
+
+        with BM25Index.load(path) as loaded:
+            for query in ("confidentiality period", "law", "public information"):
+                expected = [(h.document, h.score) for h in index.search(query)]
+                assert [(h.document, h.score) for h in loaded.search(query)] == expected
+
+    def test_load_rejects_other_files(self, tmp_path: Path) -> None:
+        """Loading a file that is not an index raises ValueError."""
+        path = tmp_path / "not_an_index"
+        path.write_bytes(b"\0" * 64)
+
+        with pytest.raises(ValueError, match="not a BM25 index"):
+            BM25Index.load(path)
+
+
+class TestDocumentLoading:
+    """Tests for building indexes from document directories."""
+
+    def test_load_markdown_and_json(self, tmp_path: Path) -> None:
+        """Markdown splits into heading sections; JSON records keep their metadata."""
+        (tmp_path / "guide.md").write_text("# Duration\nTwo years.\n\n## Scope\nAll data.\n")
+        clauses = [{"doc_id": "C1", "title": "Term", "content": "Five years.", "tags": ["term"]}]
+        (tmp_path / "clauses.json").write_text(json.dumps({"documents": clauses}))
+
+        documents = load_documents(tmp_path)
+
+        assert [doc.doc_id for doc in documents] == ["C1", "guide.md#0", "guide.md#1"]
+        assert documents[0].metadata == {"source": "clauses.json", "tags": ["term"]}
+        assert [doc.title for doc in documents[1:]] == ["Duration", "Scope"]
+
+    def test_build_index_from_thesis(self, tmp_path: Path) -> None:
+        """The thesis notes index offline and answer queries from the saved file."""
+        thesis = Path(__file__).parents[2] / "docs" / "larsson_thesis"
+        path = tmp_path / "thesis.bm25"
+
+        index = build_index(thesis, path)
+
+        with BM25Index.load(path) as loaded:
+            assert len(loaded) == len(index) > 0
+            assert loaded.search("question accommodation", top_k=3)
+
+
+class TestRetrievalDevice:
+    """Tests for serving the RAG actions through DeviceInterface."""
+
+    def test_nda_guidance_ranks_topic(self) -> None:
+        """The NDA guidance query returns the topic's document as relevant."""
+        result = execute_nda_rag_query(_guidance_action("exclusions"), None)
+
+        assert [doc["doc_id"] for doc in result["relevant_documents"]] == ["NDA_BP_004"]
+        assert result["retrieved_documents"][0]["relevance_score"] == 1.0
+
+    def test_legal_query_filters_jurisdiction(self) -> None:
+        """Legal authorities from other jurisdictions are not relevant."""
+        state = InformationState()
+        state.shared.commitments.update(
+            {"contract_type(nda)", "jurisdiction(California)", "legal_question(governing_law)"}
+        )
+        action = Action(
+            action_type=ActionType.GET,
+            name="query_legal_database",
+            parameters={
+                "contract_type": "nda",
+                "jurisdiction": "California",
+                "legal_question": "governing_law",
+            },
+        )
+
+        result = create_legal_rag_device().execute_action(action, state)
+
+        assert result.is_successful()
+        relevant = [doc["doc_id"] for doc in result.return_value["relevant_documents"]]
+        assert relevant == ["CAL_CIVIL_CODE_1646", "RESTATEMENT_2D_CONTRACTS_187"]
+        assert result.postconditions
+
+    def test_unrelated_legal_query_finds_nothing(self) -> None:
+        """A question sharing only a common word with the collection has no relevant docs."""
+        state = InformationState()
+        state.shared.commitments.update(
+            {"contract_type(nda)", "jurisdiction(California)", "legal_question(controlling_law)"}
+        )
+        action = Action(
+            action_type=ActionType.GET,
+            name="query_legal_database",
+            parameters={
+                "contract_type": "nda",
+                "jurisdiction": "California",
+                "legal_question": "What is the controlling law?",
+            },
+        )
+
+        result = create_legal_rag_device().execute_action(action, state)
+
+        assert result.is_successful(), result.error_message
+        found = result.return_value
+        assert found["retrieved_documents"]
+        assert found["relevant_documents"] == []
+        assert "could not find sufficient legal authority" in found["synthesized_answer"]
+
+    def test_precondition_failure(self) -> None:
+        """Missing parameters yield PRECONDITION_FAILED with the domain's message."""
+        action = Action(action_type=ActionType.GET, name="query_nda_guidance", parameters={})
+
+        result = create_nda_rag_device().execute_action(action, InformationState())
+
+        assert result.status == ActionStatus.PRECONDITION_FAILED
+        assert "topic" in result.error_message
+
+    def test_execute_action_rule_uses_device(self) -> None:
+        """The ExecuteAction rule runs retrieval through the installed device."""
+        state = InformationState()
+        state.private.beliefs["device_interface"] = create_nda_rag_device()
+        state.private.actions.append(_guidance_action("duration"))
+
+        new_state = _execute_action(state)
+
+        result = new_state.private.beliefs["action_result"]
+        assert result.is_successful()
+        assert result.return_value["relevant_documents"][0]["doc_id"] == "NDA_BP_001"
+        device = state.private.beliefs["device_interface"]
+        assert new_state.private.beliefs["device_interface"] is device
@@ -0,0 +1,216 @@
+"""Unit tests for opt-in RuleSet profiling."""
+
+import json
+import logging
+
+import pytest
+
+from ibdm.core import DialogueMove, InformationState, WhQuestion
+from ibdm.engine import DialogueMoveEngine
+from ibdm.rules import RuleProfiler, RuleSet, UpdateRule
+from ibdm.rules.profiling import percentile
+
+
+def _push_question(state: InformationState) -> InformationState:
+    state.shared.push_qud(WhQuestion(variable="x", predicate="destination"))
+    state.private.beliefs["pushed"] = True
+    return state
+
+
+def _make_ruleset() -> RuleSet:
+    ruleset = RuleSet()
+    ruleset.add_rule(
+        UpdateRule(
+            name="push_question",
+            preconditions=lambda s: not s.shared.qud,
+            effects=_push_question,
+            priority=10,
+        )
+    )
+    ruleset.add_rule(
+        UpdateRule(
+            name="never_fires",
+            preconditions=lambda s: False,
+            effects=lambda s: s,
+            priority=5,
+        )
+    )
+    return ruleset
+
+
+class TestPercentile:
+    """Tests for the nearest-rank percentile helper."""
+
+    def test_empty(self):
+        """Empty samples give 0.0."""
+        assert percentile([], 50) == 0.0
+
+    def test_nearest_rank(self):
+        """Nearest-rank percentiles over 1..100."""
+        samples = [float(i) for i in range(100, 0, -1)]
+        assert percentile(samples, 50) == 50.0
+        assert percentile(samples, 99) == 99.0
+        assert percentile(samples, 100) == 100.0
+
+
+class TestRuleSetProfiling:
+    """Tests for RuleSet.enable_profiling and RuleProfiler."""
+
+    def test_disabled_by_default(self):
+        """No profiler is attached unless requested."""
+        assert RuleSet().profiler is None
+
+    def test_apply_rules_records_phase(self):
+        """apply_rules records every evaluation with timings and diff size."""
+        ruleset = _make_ruleset()
+        profiler = ruleset.enable_profiling()
+
+        ruleset.apply_rules("integration", InformationState())
+
+        assert profiler.phase_count == 1
+        phase = profiler.phases[-1]
+        assert phase.phase == "integration"
+        assert not phase.first_match_only
+        assert [e.rule_name for e in phase.evaluations] == ["push_question", "never_fires"]
+        assert phase.fired_rules == ["push_question"]
+
+        fired = phase.evaluations[0]
+        assert fired.preconditions_met
+        assert fired.precondition_time >= 0.0
+        assert fired.effect_time >= 0.0
+        # One QUD push plus one new belief
+        assert fired.state_diff_size == 2
+
+        skipped = phase.evaluations[1]
+        assert not skipped.fired
+        assert skipped.effect_time == 0.0
+
+    def test_diff_size_ignores_cloned_elements(self):
+        """An effect that clones the state counts only what it changed."""
+
+        def add_belief(state: InformationState) -> InformationState:
+            new_state = state.clone()
+            new_state.private.beliefs["checked"] = True
+            return new_state
+
+        ruleset = RuleSet()
+        ruleset.add_rule(
+            UpdateRule(name="add_belief", preconditions=lambda s: True, effects=add_belief)
+        )
+        profiler = ruleset.enable_profiling()
+        state = InformationState()
+        for index in range(20):
+            state.shared.push_qud(WhQuestion(variable="x", predicate=f"p{index}"))
+        state.shared.moves.append(DialogueMove(move_type="greet", content="hi", speaker="user"))
+        state.private.beliefs["existing"] = {"nested": [1, 2]}
+
+        ruleset.apply_rules("integration", state)
+
+        assert profiler.phases[-1].evaluations[0].state_diff_size == 1
+
+    def test_profiling_keeps_rule_logging(self, caplog: pytest.LogCaptureFixture):
+        """Profiled and plain application log the same rule lines."""
+        logger = "ibdm.rules.update_rules"
+
+        def logged(ruleset: RuleSet) -> list[str]:
+            caplog.clear()
+            with caplog.at_level(logging.DEBUG, logger=logger):
+                ruleset.apply_rules("integration", InformationState())
+                ruleset.apply_first_matching("integration", InformationState())
+            return [r.getMessage() for r in caplog.records if r.name == logger]
+
+        plain = logged(_make_ruleset())
+        profiled_rules = _make_ruleset()
+        profiled_rules.enable_profiling()
+
+        assert "  ✗ never_fires (priority=5)" in plain
+        assert logged(profiled_rules) == plain
+
+    def test_apply_first_matching_records_until_match(self):
+        """apply_first_matching stops recording at the first firing rule."""
+        ruleset = _make_ruleset()
+        profiler = ruleset.enable_profiling()
+
+        _, rule = ruleset.apply_first_matching("integration", InformationState())
+
+        assert rule is not None and rule.name == "push_question"
+        phase = profiler.phases[-1]
+        assert phase.first_match_only
+        assert len(phase.evaluations) == 1
+
+    def test_histogram_aggregates(self):
+        """Per-rule stats aggregate calls and fire rate across phases."""
+        ruleset = _make_ruleset()
+        profiler = ruleset.enable_profiling()
+
+        state = InformationState()
+        state = ruleset.apply_rules("integration", state)
+        ruleset.apply_rules("integration", state)  # QUD no longer empty
+
+        stats = {s.rule_name: s for s in profiler.histogram()}
+        assert stats["push_question"].calls == 2
+        assert stats["push_question"].fired == 1
+        assert stats["push_question"].fire_rate == 0.5
+        assert stats["never_fires"].fire_rate == 0.0
+
+    def test_export_json(self, tmp_path):
+        """The histogram exports as JSON with percentile fields."""
+        ruleset = _make_ruleset()
+        profiler = ruleset.enable_profiling()
+        ruleset.apply_rules("integration", InformationState())
+
+        path = tmp_path / "profile.json"
+        profiler.export_json(path, include_phases=True)
+
+        data = json.loads(path.read_text())
+        assert data["phases_recorded"] == 1
+        names = {r["rule_name"] for r in data["rules"]}
+        assert names == {"push_question", "never_fires"}
+        assert {"calls", "fire_rate", "p50_time", "p99_time"} <= set(data["rules"][0])
+        assert data["phases"][0]["fired_rules"] == ["push_question"]
+
+    def test_disable_profiling(self):
+        """Detaching the profiler stops recording."""
+        ruleset = _make_ruleset()
+        profiler = ruleset.enable_profiling()
+        assert ruleset.disable_profiling() is profiler
+
+        ruleset.apply_rules("integration", InformationState())
+        assert profiler.phase_count == 0
+
+    def test_profiling_preserves_results(self):
+        """Instrumented application produces the same state as the plain path."""
+        plain = _make_ruleset().apply_rules("integration", InformationState())
+
+        profiled_rules = _make_ruleset()
+        profiled_rules.enable_profiling()
+        profiled = profiled_rules.apply_rules("integration", InformationState())
+
+        assert len(plain.shared.qud) == len(profiled.shared.qud) == 1
+        assert plain.private.beliefs == profiled.private.beliefs
+
+    def test_bounded_phase_history(self):
+        """Only the most recent phases are retained, but stats cover all."""
+        ruleset = _make_ruleset()
+        profiler = ruleset.enable_profiling(RuleProfiler(max_phases=2))
+
+        for _ in range(5):
+            ruleset.apply_rules("integration", InformationState())
+
+        assert len(profiler.phases) == 2
+        assert profiler.phase_count == 5
+        assert profiler.stats[("integration", "push_question")].calls == 5
+
+    def test_engine_advances_turns(self):
+        """DialogueMoveEngine.process_input starts a new profiler turn."""
+        ruleset = _make_ruleset()
+        profiler = ruleset.enable_profiling()
+        engine = DialogueMoveEngine(agent_id="system", rules=ruleset)
+
+        state = engine.create_initial_state()
+        state.private.agenda.append(DialogueMove(move_type="greet", content="hi", speaker="system"))
+        engine.process_input("hello", "user", state)
+
+        assert profiler.turn == 1
+        assert profiler.phases_for_turn(1)
+        assert all(p.turn == 1 for p in profiler.phases)
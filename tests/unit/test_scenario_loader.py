@@ -1,5 +1,9 @@
 """Tests for unified scenario loader."""
 
+import json
+import os
+import time
+
 import pytest
 
 from ibdm.demo.scenario_loader import (
@@ -318,3 +322,77 @@ def test_ibis2_scenarios_complete():
 
     for scenario_id in expected:
         assert scenario_id in ibis2, f"Expected IBiS-2 scenario '{scenario_id}' not found"
+
+
+def write_scenario(directory, scenario_id, title="Test scenario", age=10.0, **fields):
+    """Write a minimal scenario file, backdated by age seconds."""
+    data = {
+        "scenario_id": scenario_id,
+        "title": title,
+        "description": "A test scenario",
+        "business_narrative": "Shows the catalog",
+        "larsson_algorithms": ["Question Accommodation (Rule 4.1)"],
+        "expected_outcomes": {"turns": 2},
+        "turns": [
+            {"turn": 1, "speaker": "user", "utterance": "hi", "move_type": "greet"},
+            {"turn": 2, "speaker": "system", "utterance": "hello", "move_type": "greet"},
+        ],
+        **fields,
+    }
+    path = directory / f"{scenario_id}.json"
+    path.write_text(json.dumps(data))
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+    os.utime(directory, (stamp, stamp))
+    return path
+
+
+def test_parsed_scenarios_are_cached_until_file_changes(tmp_path):
+    """Unchanged files are served from the cache; a modified file is re-parsed."""
+    write_scenario(tmp_path, "cached")
+    loader = ScenarioLoader(tmp_path)
+
+    first = loader.load_scenario("cached")
+    assert loader.load_scenario("cached") is first
+
+    write_scenario(tmp_path, "cached", title="Edited title", age=5.0)
+    reloaded = loader.load_scenario("cached")
+    assert reloaded is not first
+    assert reloaded.title == "Edited title"
+
+
+def test_recently_written_files_are_not_cached(tmp_path):
+    """A file modified within the timestamp granularity window is re-read every time."""
+    write_scenario(tmp_path, "fresh", age=0.0)
+    loader = ScenarioLoader(tmp_path)
+
+    assert loader.load_scenario("fresh") is not loader.load_scenario("fresh")
+
+
+def test_search_index_follows_directory_changes(tmp_path):
+    """Added, edited and removed scenarios are reflected in search results."""
+    write_scenario(tmp_path, "alpha", title="Grounding demo")
+    loader = ScenarioLoader(tmp_path)
+    assert loader.search_scenarios("ground") == ["alpha"]
+
+    write_scenario(tmp_path, "beta", title="Clarification demo", age=5.0)
+    write_scenario(tmp_path, "alpha", title="Rollback demo", age=5.0)
+    assert loader.search_scenarios("ground") == []
+    assert loader.search_scenarios("demo") == ["alpha", "beta"]
+
+    (tmp_path / "beta.json").unlink()
+    os.utime(tmp_path, (time.time() - 2, time.time() - 2))
+    assert loader.search_scenarios("demo") == ["alpha"]
+    assert loader.list_scenarios() == ["alpha"]
+
+
+def test_search_matches_substrings_across_words(tmp_path):
+    """Index candidates are verified against the full query, punctuation included."""
+    write_scenario(tmp_path, "ibis3_rules")
+    write_scenario(tmp_path, "other", larsson_algorithms=["Rule 4 - accommodation"])
+    loader = ScenarioLoader(tmp_path)
+
+    assert loader.search_scenarios("rule 4.1") == ["ibis3_rules"]
+    assert loader.search_scenarios("ACCOMMODATION") == ["ibis3_rules", "other"]
+    assert loader.search_scenarios("(") == ["ibis3_rules"]
+    assert loader.search_scenarios("s3_r") == ["ibis3_rules"]
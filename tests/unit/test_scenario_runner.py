@@ -353,6 +353,36 @@ class TestScenarioRunner:
             assert len(output_text) > 0  # Should produce output
 
 
+class TestCompareSemanticSimilarity:
+    """Test the compare-mode similarity verdicts."""
+
+    def test_near_identical_text_skips_judge(self, minimal_scenario: Scenario) -> None:
+        """Near-identical wording is judged locally by n-gram similarity."""
+        runner = ScenarioRunner(minimal_scenario)
+
+        with patch("litellm.completion") as completion:
+            result = runner._compare_semantic_similarity(  # type: ignore[reportPrivateUsage]
+                "What are the parties?", "What are the parties?"
+            )
+
+        completion.assert_not_called()
+        assert result["similarity"] == "equivalent"
+        assert result["method"] == "ngram"
+
+    def test_judge_failure_is_labelled_heuristic(self, minimal_scenario: Scenario) -> None:
+        """A verdict from the lexical fallback is not reported as a judge result."""
+        runner = ScenarioRunner(minimal_scenario)
+
+        with patch("litellm.completion", side_effect=RuntimeError("no network")):
+            result = runner._compare_semantic_similarity(  # type: ignore[reportPrivateUsage]
+                "What are the parties?", "Please name the effective date."
+            )
+
+        assert result["method"] == "heuristic"
+        assert result["confidence"] == "low"
+        assert "no network" in result["error"]
+
+
 class TestRunScenarioFunction:
     """Test run_scenario convenience function."""
 
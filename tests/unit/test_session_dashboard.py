@@ -0,0 +1,133 @@
+"""Tests for the aggregate multi-session dashboard."""
+
+import time
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from rich.console import Console
+
+from ibdm.burr_integration import DialogueStateMachine
+from ibdm.core import InformationState, Plan, WhQuestion
+from ibdm.nlu.llm_telemetry import LLMCallEvent, LLMTelemetry
+from ibdm.visualization.dashboard import (
+    NO_PLAN,
+    Dashboard,
+    SessionAggregator,
+    dashboard_html,
+    render_dashboard,
+    set_session_aggregator,
+)
+
+
+def state_dict(plan_type: str | None = None, qud: int = 0) -> dict[str, Any]:
+    state = InformationState(agent_id="system")
+    if plan_type is not None:
+        state.private.plan.append(Plan(plan_type=plan_type, content="task"))
+    for index in range(qud):
+        state.shared.qud.append(WhQuestion(variable="x", predicate=f"p{index}"))
+    return state.to_dict()
+
+
+@pytest.fixture
+def installed() -> Iterator[SessionAggregator]:
+    aggregator = SessionAggregator()
+    previous = set_session_aggregator(aggregator)
+    yield aggregator
+    set_session_aggregator(previous)
+
+
+class TestSessionAggregator:
+    """Tests for O(1) running totals."""
+
+    def test_counts_move_between_buckets(self) -> None:
+        """A session is counted once, in its latest phase, plan type and QUD depth."""
+        aggregator = SessionAggregator()
+        aggregator.enter_phase("a", "integrate")
+        aggregator.observe_state("a", state_dict("nda_drafting", qud=2))
+        aggregator.enter_phase("b", "nlu")
+        aggregator.observe_state("a", state_dict("nda_drafting", qud=7))
+        aggregator.enter_phase("a", "select")
+
+        snapshot = aggregator.snapshot(LLMTelemetry())
+
+        assert snapshot.sessions == 2
+        assert snapshot.by_phase == {"select": 1, "nlu": 1}
+        assert snapshot.by_plan_type == {"nda_drafting": 1, NO_PLAN: 1}
+        assert snapshot.qud_depth == {"5+": 1, "0": 1}
+
+    def test_turns_and_errors(self) -> None:
+        """Turn latency and error rate are tracked; finished sessions wait for input."""
+        aggregator = SessionAggregator()
+        for error in (False, True):
+            aggregator.turn_started("a")
+            aggregator.turn_finished("a", error=error)
+
+        snapshot = aggregator.snapshot(LLMTelemetry())
+
+        assert snapshot.turns == 2
+        assert snapshot.turn_error_rate == 0.5
+        assert snapshot.turn_latency.count == 2
+        assert snapshot.by_phase == {"waiting": 1}
+
+    def test_idle_and_ended_sessions_are_dropped(self) -> None:
+        """Sessions past the TTL or ended no longer contribute."""
+        aggregator = SessionAggregator(session_ttl=0.2)
+        aggregator.observe_state("old", state_dict("nda_drafting"))
+        time.sleep(0.25)
+        aggregator.enter_phase("new", "nlu")
+        aggregator.enter_phase("gone", "nlu")
+        aggregator.end_session("gone")
+
+        snapshot = aggregator.snapshot(LLMTelemetry())
+
+        assert snapshot.sessions == 1
+        assert snapshot.by_plan_type == {NO_PLAN: 1}
+
+    def test_llm_figures_come_from_telemetry(self) -> None:
+        """Calls in flight and LLM errors are read from the telemetry hub."""
+        telemetry = LLMTelemetry()
+        telemetry.record(LLMCallEvent(component="nlu", model="m", error="timeout"))
+        telemetry.record(LLMCallEvent(component="nlg", model="m"))
+
+        with telemetry.track_call():
+            snapshot = SessionAggregator().snapshot(telemetry)
+
+        assert snapshot.llm_in_flight == 1
+        assert snapshot.llm_error_rate == 0.5
+        assert telemetry.in_flight == 0
+
+
+class TestDashboardRendering:
+    """Tests for the terminal and HTML views."""
+
+    def test_terminal_and_html(self, tmp_path: Any) -> None:
+        """Both views show the totals; the HTML page refreshes itself."""
+        aggregator = SessionAggregator()
+        aggregator.observe_state("a", state_dict("nda_drafting"))
+        snapshot = aggregator.snapshot(LLMTelemetry())
+        console = Console(record=True, width=120)
+
+        console.print(render_dashboard(snapshot))
+        page = dashboard_html(snapshot, refresh_seconds=5)
+
+        assert "nda_drafting" in console.export_text()
+        assert '<meta http-equiv="refresh" content="5">' in page
+        path = tmp_path / "dashboard.html"
+        Dashboard(aggregator, LLMTelemetry()).write_html(path)
+        assert "nda_drafting" in path.read_text()
+
+
+class TestEngineInstrumentation:
+    """Tests for the Burr hook feeding the aggregator."""
+
+    def test_state_machine_reports_steps(self, installed: SessionAggregator) -> None:
+        """Running the pipeline registers the session with the aggregator."""
+        machine = DialogueStateMachine(agent_id="system")
+        machine.initialize()
+
+        snapshot = installed.snapshot(LLMTelemetry())
+
+        assert snapshot.sessions == 1
+        assert snapshot.by_phase == {"initialize": 1}
+        assert snapshot.qud_depth == {"0": 1}
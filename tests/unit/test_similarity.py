@@ -0,0 +1,96 @@
+"""Tests for character n-gram similarity and answer-to-alternative matching."""
+
+import pytest
+
+from ibdm.core import Answer, DomainModel
+from ibdm.core.questions import AltQuestion
+from ibdm.utils.similarity import (
+    SimilarityIndex,
+    normalize_text,
+    pairwise_similarity,
+    similarity_index,
+    text_similarity,
+)
+
+
+class TestSimilarityIndex:
+    """Tests for the sparse TF-IDF similarity index."""
+
+    def test_normalize_text(self) -> None:
+        """Case and punctuation differences disappear."""
+        assert normalize_text("  One-Way!  NDA ") == "one way nda"
+
+    def test_scores_rank_candidates(self) -> None:
+        """An answer scores highest against the candidate it refers to."""
+        index = SimilarityIndex(["California", "Delaware", "New York"])
+
+        scores = index.scores("Delawere")
+
+        assert scores.index(max(scores)) == 1
+        assert all(0.0 <= score <= 1.0 for score in scores)
+        assert index.scores("new-york")[2] == pytest.approx(1.0)
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [("mutal", "mutual"), ("one way", "one-way"), ("juice", None), ("yes", None)],
+    )
+    def test_match_threshold(self, text: str, expected: str | None) -> None:
+        """Typos and spelling variants match; unrelated answers do not."""
+        assert SimilarityIndex(["mutual", "one-way"]).match(text) == expected
+
+    def test_batch_scoring(self) -> None:
+        """Batched scores equal one-at-a-time scores."""
+        index = SimilarityIndex(["tea", "coffee"])
+        texts = ["cofee", "tea please", "juice"]
+
+        assert index.score_batch(texts) == [index.scores(text) for text in texts]
+        assert SimilarityIndex([]).best_match("tea") is None
+
+    def test_pairwise_similarity(self) -> None:
+        """Identical pairs score 1.0 and paraphrases outscore unrelated text."""
+        same, paraphrase, unrelated = pairwise_similarity(
+            [
+                ("Which parties?", "which parties"),
+                ("Which parties?", "Which parties are involved?"),
+                ("Which parties?", "The NDA is ready."),
+            ]
+        )
+
+        assert same == pytest.approx(1.0)
+        assert paraphrase > unrelated
+        assert text_similarity("Which parties?", "which parties") == pytest.approx(1.0)
+
+    def test_index_cache(self) -> None:
+        """Indexes for the same candidate tuple are built once."""
+        assert similarity_index(("tea", "coffee")) is similarity_index(("tea", "coffee"))
+
+
+class TestAnswerMatching:
+    """Tests for similarity-backed alternative and sort matching."""
+
+    def test_alt_question_resolves_with_typo(self) -> None:
+        """Misspelled alternatives resolve an alternative question."""
+        question = AltQuestion(alternatives=["mutual", "one-way"], predicate="nda_type")
+
+        assert question.resolves_with(Answer(content="mutal"))
+        assert question.match_alternative("I think one way is best") is None
+        assert question.match_alternative("one way") == "one-way"
+        assert not question.resolves_with(Answer(content="juice"))
+
+    def test_domain_check_types_accepts_spelling_variant(self) -> None:
+        """Domain type checking accepts alternatives with spelling variants."""
+        domain = DomainModel(name="test")
+        question = AltQuestion(alternatives=["Delaware", "California"])
+
+        assert domain.resolves(Answer(content="Deleware"), question)
+        assert not domain.resolves(Answer(content="pizza"), question)
+
+    def test_match_individual(self) -> None:
+        """Free-text values map to the sort individual they refer to."""
+        domain = DomainModel(name="test")
+        domain.add_sort("us_state", ["California", "Delaware", "New York"])
+
+        assert domain.match_individual("us_state", "california") == "California"
+        assert domain.match_individual("us_state", "Californa") == "California"
+        assert domain.match_individual("us_state", "Texas") is None
+        assert domain.match_individual("unknown_sort", "Texas") is None
@@ -0,0 +1,90 @@
+"""Tests for turn handling in the Burr dialogue state machine."""
+
+from ibdm.burr_integration import DialogueStateMachine
+from ibdm.core import InformationState
+from ibdm.engine.image import build_rule_set
+from ibdm.nlg import NLGEngine, NLGEngineConfig
+from ibdm.nlu.nlu_context import NLUContext
+from ibdm.nlu.nlu_result import NLUResult
+
+#: Dialogue acts of the scripted user turns: greetings get a reply, acknowledgements none
+ACTS = {
+    "Hello": "greeting",
+    "okay": "acknowledgement",
+    "Hi again": "greeting",
+    "sure": "acknowledgement",
+}
+
+
+class ScriptedNLUEngine:
+    """NLU engine stand-in classifying utterances from ACTS and recording them."""
+
+    def __init__(self):
+        self.utterances: list[str] = []
+
+    def process(
+        self, utterance: str, speaker: str, state: InformationState, nlu_context: NLUContext
+    ) -> tuple[NLUResult, NLUContext]:
+        self.utterances.append(utterance)
+        return NLUResult(dialogue_act=ACTS[utterance], confidence=0.9), nlu_context
+
+
+def machine(nlu_engine: ScriptedNLUEngine) -> DialogueStateMachine:
+    state_machine = DialogueStateMachine(
+        agent_id="system",
+        rules=build_rule_set(),
+        nlu_engine=nlu_engine,  # type: ignore[arg-type]
+        nlg_engine=NLGEngine(NLGEngineConfig(default_strategy="template")),
+    )
+    state_machine.initialize()
+    return state_machine
+
+
+class TestProcessUtterance:
+    """Tests for the response and no-response paths through select."""
+
+    def test_turns_alternate_between_paths(self) -> None:
+        """Each turn halts at select or generate and the next one starts at nlu."""
+        nlu_engine = ScriptedNLUEngine()
+        state_machine = machine(nlu_engine)
+        app = state_machine.app
+
+        steps: list[tuple[str, bool, str, int]] = []
+        for utterance in ACTS:
+            before = app.sequence_id or 0
+            result = state_machine.process_utterance(utterance)
+            next_action = app.get_next_action()
+            assert next_action is not None
+            steps.append(
+                (
+                    utterance,
+                    result["has_response"],
+                    next_action.name,
+                    (app.sequence_id or 0) - before,
+                )
+            )
+            assert bool(result["utterance_text"]) is result["has_response"]
+
+        # nlu → interpret → integrate → select, plus nlg → generate with a response
+        assert steps == [
+            ("Hello", True, "nlu", 6),
+            ("okay", False, "nlu", 4),
+            ("Hi again", True, "nlu", 6),
+            ("sure", False, "nlu", 4),
+        ]
+        assert nlu_engine.utterances == list(ACTS)
+
+    def test_silent_turns_do_not_reuse_inputs(self) -> None:
+        """After turns without a response the next utterance reaches nlu as a new input."""
+        nlu_engine = ScriptedNLUEngine()
+        state_machine = machine(nlu_engine)
+
+        assert state_machine.process_utterance("Hello")["has_response"] is True
+        assert state_machine.process_utterance("okay")["has_response"] is False
+        assert state_machine.process_utterance("sure")["has_response"] is False
+        result = state_machine.process_utterance("Hi again")
+
+        assert result["has_response"] is True
+        assert result["utterance_text"]
+        assert nlu_engine.utterances == ["Hello", "okay", "sure", "Hi again"]
+        assert state_machine.app.state["utterance"] == "Hi again"
@@ -0,0 +1,125 @@
+"""Tests for the push-based state monitor."""
+
+import socket
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+from ibdm.core import InformationState, WhQuestion
+from ibdm.visualization import StateSnapshot, snapshot_patch
+from ibdm.visualization.html_export import HtmlExporter
+from ibdm.visualization.monitor import (
+    StatePublisher,
+    StateSubscriber,
+    _Subscription,  # pyright: ignore[reportPrivateUsage]
+)
+from ibdm.visualization.terminal import TerminalVisualizer
+
+
+def snapshot(timestamp: int, beliefs: dict[str, str] | None = None) -> StateSnapshot:
+    state = InformationState(agent_id="system")
+    state.shared.qud.append(WhQuestion(variable="x", predicate="city"))
+    state.private.beliefs.update(beliefs or {})
+    return StateSnapshot.from_state(state, timestamp, f"Turn {timestamp}")
+
+
+class TestSnapshotPatch:
+    """Tests for serialized snapshot patches."""
+
+    def test_patch_contains_changed_fields_only(self) -> None:
+        """Unchanged fields are left out and applying the patch restores the state."""
+        before = snapshot(1).to_dict()
+        after = snapshot(2, {"city": "Paris"}).to_dict()
+
+        patch = snapshot_patch(before, after)
+
+        assert set(patch) == {"timestamp", "label", "beliefs"}
+        before.update(patch)
+        assert before == after
+
+
+class TestStatePublisher:
+    """Tests for publishing over the monitor socket."""
+
+    def test_subscribers_get_full_state_then_patches(self, tmp_path: Path) -> None:
+        """A subscriber starts from a full snapshot and then receives only changes."""
+        publisher = StatePublisher(str(tmp_path / "monitor.sock"))
+        try:
+            publisher.publish(snapshot(1))
+            first, second = (
+                StateSubscriber(publisher.socket_path),
+                StateSubscriber(publisher.socket_path),
+            )
+            first_updates, second_updates = first.updates(), second.updates()
+
+            initial, changed = next(first_updates)
+            next(second_updates)
+            assert initial.timestamp == 1
+            assert "qud" in changed
+            assert publisher.subscriber_count == 2
+
+            publisher.publish(snapshot(2, {"city": "Paris"}))
+
+            for updates in (first_updates, second_updates):
+                current, changed = next(updates)
+                assert current.beliefs == {"city": "Paris"}
+                assert changed == {"timestamp", "label", "beliefs"}
+        finally:
+            publisher.close()
+
+    def test_live_socket_is_not_replaced(self, tmp_path: Path) -> None:
+        """A second publisher refuses a socket another publisher is listening on."""
+        path = str(tmp_path / "monitor.sock")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(path)
+        stale.close()
+
+        owner, intruder = StatePublisher(path), StatePublisher(path)
+        try:
+            owner.start()
+            with pytest.raises(FileExistsError):
+                intruder.start()
+            intruder.close()
+
+            owner.publish(snapshot(1))
+            initial, _ = next(StateSubscriber(path).updates())
+            assert initial.timestamp == 1
+        finally:
+            owner.close()
+
+    def test_slow_subscriber_is_resynced(self) -> None:
+        """A full queue is replaced by one full message instead of blocking."""
+        left, right = socket.socketpair()
+        subscription = _Subscription(left, queue_size=2)
+
+        for index in range(3):
+            subscription.offer(f"patch {index}".encode(), lambda: b"full")
+
+        assert list(subscription._queue) == [b"full"]  # pyright: ignore[reportPrivateUsage]
+        assert subscription.dropped == 2
+        subscription.close()
+        right.close()
+
+
+class TestPanelRendering:
+    """Tests for re-rendering only changed panels."""
+
+    def test_terminal_updates_changed_panels(self) -> None:
+        """A belief change re-renders the private panel and header only."""
+        visualizer = TerminalVisualizer(Console(file=None, force_terminal=False))
+        layout = visualizer.build_layout()
+
+        assert len(visualizer.update_layout(layout, snapshot(1))) == 4
+        updated = visualizer.update_layout(
+            layout, snapshot(2, {"city": "Paris"}), {"timestamp", "label", "beliefs"}
+        )
+
+        assert updated == ["header", "private"]
+
+    def test_html_fragments_for_changed_panels(self) -> None:
+        """HTML panels are rendered per changed field."""
+        panels = HtmlExporter().render_panels(snapshot(2, {"city": "Paris"}), {"beliefs"})
+
+        assert list(panels) == ["beliefs"]
+        assert "Paris" in panels["beliefs"]
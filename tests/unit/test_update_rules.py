@@ -556,3 +556,54 @@ class TestRuleSet:
         assert "RuleSet" in s
         assert "integration=1" in s
         assert "selection=1" in s
+
+
+def _accept(state: InformationState) -> bool:
+    return True
+
+
+def _reject(state: InformationState) -> bool:
+    return False
+
+
+def _keep(state: InformationState) -> InformationState:
+    return state
+
+
+class TestRuleSetFingerprint:
+    """Tests for RuleSet.fingerprint()."""
+
+    def build(self, precond=_accept) -> RuleSet:
+        ruleset = RuleSet()
+        ruleset.add_rules(
+            [
+                UpdateRule(name="a", preconditions=precond, effects=_keep, priority=2),
+                UpdateRule(name="b", preconditions=_accept, effects=_keep, rule_type="selection"),
+            ]
+        )
+        return ruleset
+
+    def test_equal_rules_have_equal_fingerprints(self):
+        """Separately built sets of the same rules match, frozen or not."""
+        ruleset = self.build()
+
+        assert ruleset.fingerprint() == self.build().fingerprint()
+        assert ruleset.freeze().fingerprint() == ruleset.fingerprint()
+
+    def test_function_code_is_covered(self):
+        """Swapping a precondition for one with different code changes the fingerprint."""
+        assert self.build().fingerprint() != self.build(precond=_reject).fingerprint()
+
+    def test_mutation_invalidates(self):
+        """Adding, removing and clearing rules recompute the fingerprint."""
+        ruleset = self.build()
+        seen = {ruleset.fingerprint()}
+
+        ruleset.add_rule(UpdateRule(name="c", preconditions=_accept, effects=_keep))
+        seen.add(ruleset.fingerprint())
+        ruleset.remove_rule("c")
+        assert ruleset.fingerprint() in seen
+        ruleset.clear_rules("selection")
+        seen.add(ruleset.fingerprint())
+
+        assert len(seen) == 3
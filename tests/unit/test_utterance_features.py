@@ -0,0 +1,92 @@
+"""Tests for one-pass utterance feature extraction."""
+
+from ibdm.core import InformationState, WhQuestion
+from ibdm.rules.interpretation_rules import (
+    _is_alt_question,
+    _is_answer,
+    _is_command_request,
+    _is_greeting,
+    _is_wh_question,
+    _is_yn_answer,
+    _is_yn_question,
+)
+from ibdm.utils.utterance_features import Lexicon, extract_features, tokenize
+
+
+def state_for(utterance: str, with_qud: bool = False) -> InformationState:
+    state = InformationState()
+    state.private.beliefs["_temp_utterance"] = utterance
+    if with_qud:
+        state.shared.qud.append(WhQuestion(variable="x", predicate="city"))
+    return state
+
+
+class TestExtractFeatures:
+    """Tests for the feature record."""
+
+    def test_record_fields(self) -> None:
+        """One pass yields first token, question mark, length and matches with spans."""
+        features = extract_features("  Hi, can you draft an NDA?  ")
+
+        assert features.text == "Hi, can you draft an NDA?"
+        assert features.first_token == "hi"
+        assert features.is_question
+        assert features.word_count == 6
+        assert features.has("greeting", "quit")
+        assert features.spans("request") == [(4, 11), (12, 17)]
+
+    def test_whole_token_matching(self) -> None:
+        """Keywords match whole tokens, not substrings."""
+        assert not extract_features("Is this one ok").has("greeting")
+        assert not extract_features("however you like").starts_with("wh")
+        assert not extract_features("not sure").has("yes", "no")
+        assert extract_features("What's the deadline?").starts_with("wh")
+
+    def test_overlapping_classes_are_all_reported(self) -> None:
+        """A phrase inside a longer phrase of another class still matches."""
+        features = extract_features("no information")
+
+        assert features.has("no") and features.has("skip")
+
+    def test_features_are_cached(self) -> None:
+        """Repeated extraction of the same text returns the same record."""
+        assert extract_features("Paris") is extract_features("Paris")
+
+    def test_custom_lexicon(self) -> None:
+        """Lexicons tokenize their phrases the same way as utterances."""
+        lexicon = Lexicon({"negation": ["don't", "not"]})
+
+        matches = lexicon.scan(tokenize("i don't think so"))
+
+        assert [(match.phrase, match.start, match.end) for match in matches] == [("don't", 2, 7)]
+
+
+class TestInterpretationPreconditions:
+    """Tests for the interpretation rules reading the shared features."""
+
+    def test_question_types(self) -> None:
+        """Wh, yes/no and alternative questions are told apart."""
+        assert _is_wh_question(state_for("Where is the office?"))
+        assert _is_yn_question(state_for("Is it open today?"))
+        assert not _is_yn_question(state_for("Is it open today"))
+        assert _is_alt_question(state_for("Mutual or one-way?"))
+
+    def test_greeting_false_positive_fixed(self) -> None:
+        """Words containing a greeting are not greetings."""
+        assert _is_greeting(state_for("Hi there"))
+        assert not _is_greeting(state_for("This is my answer"))
+
+    def test_past_participle_requests(self) -> None:
+        """Requests phrased with a past participle are still requests."""
+        assert _is_command_request(state_for("I need an NDA prepared"))
+        assert _is_command_request(state_for("I'd like a contract created by Friday"))
+        assert _is_command_request(state_for("Can I get one made for our vendor"))
+        assert _is_command_request(state_for("An agreement drafted for Acme"))
+
+    def test_answers(self) -> None:
+        """Short yes/no replies and plain answers under a QUD."""
+        assert _is_yn_answer(state_for("Yes please"))
+        assert not _is_yn_answer(state_for("Nothing to add"))
+        assert _is_answer(state_for("Paris", with_qud=True))
+        assert not _is_answer(state_for("Yes", with_qud=True))
+        assert not _is_answer(state_for("Paris"))
@@ -0,0 +1,17 @@
+"""Tests for automated scenario validation."""
+
+from ibdm.demo.validate_scenarios import generate_validation_report, validate_all_scenarios
+
+
+class TestValidateAllScenarios:
+    """Tests for validating the scenario library across worker processes."""
+
+    def test_parallel_matches_serial(self) -> None:
+        """A process pool yields the same results, in the same order, as a serial run."""
+        serial = validate_all_scenarios(workers=1)
+        parallel = validate_all_scenarios(workers=2)
+
+        assert parallel == serial
+        assert [r.category for r in serial][0] == "IBiS-3"
+        report = generate_validation_report(parallel)
+        assert f"Total Scenarios:      {len(serial)}" in report
@@ -251,6 +251,30 @@ class TestRuleTrace:
         assert trace.diff.has_changes()
         assert "qud" in trace.diff.changed_field_names()
 
+    def test_rule_trace_from_phase_profile(self):
+        """Test building a trace from a profiled RuleSet phase."""
+        from ibdm.rules import RuleSet, UpdateRule
+
+        ruleset = RuleSet()
+        ruleset.add_rule(
+            UpdateRule(name="fires", preconditions=lambda s: True, effects=lambda s: s, priority=2)
+        )
+        ruleset.add_rule(
+            UpdateRule(name="skips", preconditions=lambda s: False, effects=lambda s: s, priority=1)
+        )
+        profiler = ruleset.enable_profiling()
+        profiler.begin_turn()
+        ruleset.apply_rules("integration", InformationState())
+
+        trace = RuleTrace.from_phase_profile(profiler.phases[-1], timestamp=3)
+
+        assert trace.phase == "integration"
+        assert trace.label == "Turn 1: integration"
+        assert trace.selected_rule == "fires"
+        assert trace.rules_evaluated() == 2
+        assert trace.rules_with_met_preconditions() == 1
+        assert trace.metadata["fired_rules"] == ["fires"]
+
 
 class TestVisualizationIntegration:
     """Test integration of visualization components."""
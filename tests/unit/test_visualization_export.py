@@ -12,6 +12,7 @@ from ibdm.visualization.diff_engine import compute_diff
 from ibdm.visualization.html_export import HtmlExporter
 from ibdm.visualization.state_snapshot import StateSnapshot
 from ibdm.visualization.svg_export import SvgExporter
+from ibdm.visualization.timeline_writer import TimelineWriter
 
 
 class TestHtmlExporter:
@@ -111,6 +112,48 @@ class TestHtmlExporter:
         assert "Selected" in html
 
 
+class TestTimelineWriter:
+    """Test incremental timeline export."""
+
+    def test_turns_are_paginated_and_deduplicated(self, tmp_path):
+        """Turns are appended to pages and repeated states share one body file."""
+        question = WhQuestion(predicate="destination", variable="city")
+        asked = InformationState(shared=SharedIS(qud=[question]))
+        idle = InformationState()
+        states = [idle, asked, asked, idle, asked]
+
+        with TimelineWriter(tmp_path, page_size=2) as timeline:
+            for turn, state in enumerate(states):
+                timeline.append(StateSnapshot.from_state(state, turn, f"Turn {turn}"))
+
+        assert timeline.turns == 5
+        assert timeline.pages == 3
+        assert timeline.bodies_written == 2
+        assert len(list((tmp_path / "bodies").glob("*.html"))) == 2
+        last_page = (tmp_path / "pages" / "page-0003.html").read_text()
+        assert "Turn 4" in last_page
+        assert 'loading="lazy"' in last_page
+        index = (tmp_path / "index.html").read_text()
+        assert "page-0003.html" in index
+        assert "turns 5&ndash;5" in index
+
+    def test_append_only_writes_new_content(self, tmp_path):
+        """Earlier pages and bodies are not rewritten by later turns."""
+        timeline = TimelineWriter(tmp_path, page_size=1)
+        timeline.append(StateSnapshot.from_state(InformationState(), 0, "Turn 0"))
+        first_page = tmp_path / "pages" / "page-0001.html"
+        written = first_page.stat().st_mtime_ns
+
+        plan = Plan(plan_type="nda_drafting", content="task")
+        timeline.append(
+            StateSnapshot.from_state(InformationState(private=PrivateIS(plan=[plan])), 1, "T1")
+        )
+        timeline.close()
+
+        assert first_page.stat().st_mtime_ns == written
+        assert "nda_drafting" not in first_page.read_text()
+
+
 class TestSvgExporter:
     """Test SVG export functionality."""
 